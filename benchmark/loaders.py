@@ -0,0 +1,90 @@
+"""
+Times loading a League from responses recorded with ResponseFixtures, so League Loader settings can be compared offline.
+
+Record the responses for a League once (this makes requests to the platform):
+    python -m benchmark.loaders record sleeper 123456789 2021 2022 --fixtures fixtures
+Then time loading it again from the recorded responses with different maxWorkers and latencies:
+    python -m benchmark.loaders replay sleeper 123456789 2021 2022 --fixtures fixtures --max-workers 1 4 8 --latency 0.05
+
+Any other keyword arguments the League Loader needs can be given as JSON (i.e. --kwargs '{"espnS2": "...", "swid": "..."}').
+Replayed responses wait --latency seconds each, or as long as they took when they were recorded if --latency is not given.
+"""
+
+import argparse
+import json
+import time
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.league_loader.bulk import PLATFORM_TO_LEAGUE_LOADER_MAP
+from leeger.league_loader.fixture import ResponseFixtures
+
+# every League Loader that makes all of its requests through ResponseFixtures
+PLATFORMS = ["espn", "fleaflicker", "myfantasyleague", "sleeper"]
+
+
+def loadLeague(
+    platform: str,
+    leagueId: str,
+    years: list[int],
+    responseFixtures: ResponseFixtures,
+    **kwargs,
+) -> dict:
+    leagueLoader = PLATFORM_TO_LEAGUE_LOADER_MAP[platform](
+        leagueId, years, responseFixtures=responseFixtures, **kwargs
+    )
+    start = time.perf_counter()
+    league = leagueLoader.loadLeague()
+    seconds = time.perf_counter() - start
+    loadReport = leagueLoader.getLoadReport()
+    return {
+        "seconds": seconds,
+        "weeks": sum(len(year.weeks) for year in league.years),
+        "requests": loadReport.requestCount,
+        "phaseTimings": loadReport.phaseTimings,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("platform", choices=PLATFORMS)
+    parser.add_argument("leagueId")
+    parser.add_argument("years", nargs="+", type=int)
+    parser.add_argument("--fixtures", default="fixtures")
+    parser.add_argument("--max-workers", nargs="+", type=int, default=[1, 4, 8])
+    parser.add_argument("--latency", type=float, default=None)
+    parser.add_argument("--kwargs", type=json.loads, default=dict())
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        result = loadLeague(
+            args.platform,
+            args.leagueId,
+            args.years,
+            ResponseFixtures(args.fixtures, FixtureMode.RECORD),
+            **args.kwargs,
+        )
+        print(
+            f"recorded {result['requests']} responses to {args.fixtures} in {result['seconds']:.3f}s"
+        )
+    else:
+        responseFixtures = ResponseFixtures(
+            args.fixtures, FixtureMode.REPLAY, latencySeconds=args.latency
+        )
+        for maxWorkers in args.max_workers:
+            result = loadLeague(
+                args.platform,
+                args.leagueId,
+                args.years,
+                responseFixtures,
+                **(args.kwargs | {"maxWorkers": maxWorkers}),
+            )
+            phases = " ".join(
+                f"{phaseName}={seconds:.3f}s"
+                for phaseName, seconds in result["phaseTimings"].items()
+            )
+            print(
+                f"maxWorkers={maxWorkers:<3} {result['seconds']:>8.3f}s "
+                f"{result['requests']} requests {result['weeks']} weeks {phases}",
+                flush=True,
+            )
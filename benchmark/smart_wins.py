@@ -0,0 +1,75 @@
+"""
+Times all-time Smart Wins as the number of Years in a League grows.
+
+Compares counting the scores each score beats and ties with a ScoreIndex (sort once + binary search)
+against scanning every score in the League for every score in the League, which is how Smart Wins used to count them.
+Also times the full SmartWinsAllTimeCalculator.getSmartWins() call.
+
+Usage:
+    python -m benchmark.smart_wins
+"""
+
+import time
+
+from leeger.calculator.all_time_calculator import SmartWinsAllTimeCalculator
+from leeger.model.league import League
+from leeger.util.index import ScoreIndex
+from leeger.util.navigator import LeagueNavigator
+from leeger.util.synthetic import generateLeague
+
+NUMBER_OF_TEAMS = 12
+NUMBER_OF_WEEKS = 14
+NUMBER_OF_YEARS = (1, 5, 10, 25)
+
+
+def getLeague(numberOfYears: int) -> League:
+    return generateLeague(
+        numberOfYears=numberOfYears,
+        numberOfTeams=NUMBER_OF_TEAMS,
+        numberOfRegularSeasonWeeks=NUMBER_OF_WEEKS,
+        numberOfPlayoffTeams=0,
+        seed=numberOfYears,
+    )
+
+
+def countByScanningEveryScore(allScores: list[float | int]) -> list[tuple[int, int]]:
+    # how Smart Wins counted the scores beat and tied before scores were sorted
+    scoresBeatAndTied = list()
+    for score in allScores:
+        scoresBeat = len([s for s in allScores if score > s])
+        scoresTied = len([s for s in allScores if score == s]) - 1
+        scoresBeatAndTied.append((scoresBeat, scoresTied))
+    return scoresBeatAndTied
+
+
+def countWithScoreIndex(allScores: list[float | int]) -> list[tuple[int, int]]:
+    return ScoreIndex(allScores).getNumberOfScoresBeatAndTied(allScores)
+
+
+def timeIt(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(
+        f"{'years':>5} {'scores':>7} {'scan (s)':>10} {'sorted (s)':>11} {'speedup':>8} {'getSmartWins (s)':>17}"
+    )
+    for numberOfYears in NUMBER_OF_YEARS:
+        league = getLeague(numberOfYears)
+        allScores = LeagueNavigator.getAllScoresInLeague(
+            league, simplifyMultiWeekMatchups=True
+        )
+        assert countByScanningEveryScore(allScores) == countWithScoreIndex(allScores)
+
+        scanSeconds = timeIt(countByScanningEveryScore, allScores)
+        sortedSeconds = timeIt(countWithScoreIndex, allScores)
+        # skip validation so only the Smart Wins calculation is timed
+        smartWinsSeconds = timeIt(
+            lambda: SmartWinsAllTimeCalculator.getSmartWins(league, validate=False)
+        )
+        print(
+            f"{numberOfYears:>5} {len(allScores):>7} {scanSeconds:>10.3f} {sortedSeconds:>11.3f} "
+            f"{scanSeconds / sortedSeconds:>7.0f}x {smartWinsSeconds:>17.3f}"
+        )
@@ -0,0 +1,240 @@
+"""
+Times leeger on synthetic Leagues of different sizes and writes the results to a JSON file, so releases can be compared.
+
+Times:
+    - Every *YearCalculator method (called for every Year in the League)
+    - Every *AllTimeCalculator method
+    - leagueStatSheet() and yearStatSheet() (called for every Year in the League)
+    - League validation
+    - League.toJson() and League.fromJson()
+    - Selecting the Matchups of every Year with and without MatchupSelectionCache
+    - leagueToExcel()
+
+Calculators and stat sheets are called with validate=False, so validation is only timed on its own.
+Each benchmark is run --repeat times on the same League.
+"first" includes building anything that is kept between calls, "min" and "median" are what repeated calls cost.
+
+Usage:
+    python -m benchmark.suite
+    python -m benchmark.suite --tiers small medium --repeat 5 --output results.json --only AWAL
+    python -m benchmark.suite --compare before.json after.json
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from leeger import __version__
+from leeger.calculator import all_time_calculator, year_calculator
+from leeger.model.filter import YearFilters
+from leeger.model.league import League
+from leeger.util.excel import leagueToExcel
+from leeger.util.index import MatchupSelectionCache
+from leeger.util.navigator import YearNavigator
+from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
+from leeger.util.synthetic import generateLeague
+from leeger.validate import leagueValidation, yearValidation
+
+TIERS: dict[str, dict[str, Any]] = {
+    "small": {
+        "numberOfYears": 1,
+        "numberOfTeams": 8,
+        "numberOfRegularSeasonWeeks": 13,
+        "numberOfPlayoffTeams": 4,
+    },
+    "medium": {
+        "numberOfYears": 5,
+        "numberOfTeams": 10,
+        "numberOfRegularSeasonWeeks": 13,
+        "numberOfPlayoffTeams": 4,
+        "numberOfDivisions": 2,
+        "numberOfLeagueMedianYears": 2,
+        "multiWeekPlayoffs": True,
+    },
+    "large": {
+        "numberOfYears": 20,
+        "numberOfTeams": 14,
+        "numberOfRegularSeasonWeeks": 14,
+        "numberOfPlayoffTeams": 8,
+        "numberOfDivisions": 2,
+        "numberOfLeagueMedianYears": 10,
+        "multiWeekPlayoffs": True,
+    },
+}
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+
+def getCalculatorMethods(module, parameterName: str) -> dict[str, Callable]:
+    """
+    Returns every public calculator method in the given module that only takes a Year or League (named parameterName) and kwargs.
+    """
+    methods = dict()
+    for className, calculatorClass in sorted(vars(module).items()):
+        if not className.endswith("Calculator") or not inspect.isclass(calculatorClass):
+            continue
+        for methodName, method in inspect.getmembers(calculatorClass, inspect.ismethod):
+            if not methodName.startswith("get"):
+                continue
+            parameters = list(inspect.signature(method).parameters.values())
+            if (
+                len(parameters) == 2
+                and parameters[0].name == parameterName
+                and parameters[1].kind == inspect.Parameter.VAR_KEYWORD
+            ):
+                methods[f"{className}.{methodName}"] = method
+    return methods
+
+
+def getBenchmarks(league: League) -> dict[str, Callable[[], Any]]:
+    benchmarks: dict[str, Callable[[], Any]] = dict()
+    for name, method in getCalculatorMethods(year_calculator, "year").items():
+        benchmarks[name] = lambda method=method: [
+            method(year, validate=False) for year in league.years
+        ]
+    for name, method in getCalculatorMethods(all_time_calculator, "league").items():
+        benchmarks[name] = lambda method=method: method(league, validate=False)
+
+    benchmarks["leagueStatSheet"] = lambda: leagueStatSheet(league, validate=False)
+    benchmarks["yearStatSheet"] = lambda: [
+        yearStatSheet(year, validate=False) for year in league.years
+    ]
+
+    yearFilters = [YearFilters.getForYear(year) for year in league.years]
+
+    def selectMatchups() -> None:
+        for year, filters in zip(league.years, yearFilters):
+            YearNavigator.getMatchupSelection(year, filters)
+
+    def selectMatchupsUncached() -> None:
+        MatchupSelectionCache.clear()
+        selectMatchups()
+
+    # the first run keeps every selection, so "min" and "median" of the hit benchmark only find kept selections
+    benchmarks["MatchupSelectionCache.hit"] = selectMatchups
+    benchmarks["MatchupSelectionCache.miss"] = selectMatchupsUncached
+
+    def validateLeague() -> None:
+        # validation results are cached, so clear them to time validating
+        leagueValidation.runAllChecks.cache_clear()
+        yearValidation.runAllChecks.cache_clear()
+        leagueValidation.runAllChecks(league)
+
+    benchmarks["leagueValidation.runAllChecks"] = validateLeague
+
+    leagueJson = league.toJson()
+    benchmarks["League.toJson"] = league.toJson
+    benchmarks["League.fromJson"] = lambda: League.fromJson(leagueJson)
+
+    def toExcel() -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            leagueToExcel(
+                league, os.path.join(directory, "league.xlsx"), validate=False
+            )
+
+    benchmarks["leagueToExcel"] = toExcel
+    return benchmarks
+
+
+def runBenchmark(benchmark: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    seconds = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            benchmark()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        seconds.append(time.perf_counter() - start)
+    return {
+        "first": seconds[0],
+        "min": min(seconds),
+        "median": statistics.median(seconds),
+        "max": max(seconds),
+    }
+
+
+def runSuite(tierNames: list[str], repeat: int, only: list[str]) -> dict[str, Any]:
+    results = list()
+    for tierName in tierNames:
+        league = generateLeague(**TIERS[tierName], seed=0)
+        for name, benchmark in getBenchmarks(league).items():
+            if only and not any(substring in name for substring in only):
+                continue
+            result = runBenchmark(benchmark, repeat)
+            results.append({"tier": tierName, "name": name, **result})
+            print(
+                f"{tierName:>7} {name:<70} "
+                + (
+                    result["error"]
+                    if "error" in result
+                    else f"{result['median']:>10.4f}s"
+                ),
+                flush=True,
+            )
+    return {
+        "leegerVersion": __version__,
+        "pythonVersion": platform.python_version(),
+        "platform": platform.platform(),
+        "createdAt": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "repeat": repeat,
+        "tiers": {tierName: TIERS[tierName] for tierName in tierNames},
+        "results": results,
+    }
+
+
+def compare(beforeFilePath: str, afterFilePath: str) -> None:
+    """
+    Prints how the median time of each benchmark in both result files changed.
+    """
+    with open(beforeFilePath) as beforeFile, open(afterFilePath) as afterFile:
+        before, after = json.load(beforeFile), json.load(afterFile)
+    beforeMedians = {
+        (result["tier"], result["name"]): result.get("median")
+        for result in before["results"]
+    }
+    print(
+        f"before: {before['leegerVersion']} ({before['createdAt']})\n"
+        f"after:  {after['leegerVersion']} ({after['createdAt']})"
+    )
+    for result in after["results"]:
+        beforeMedian = beforeMedians.get((result["tier"], result["name"]))
+        afterMedian = result.get("median")
+        if beforeMedian is None or afterMedian is None:
+            continue
+        print(
+            f"{result['tier']:>7} {result['name']:<70} {beforeMedian:>10.4f}s {afterMedian:>10.4f}s "
+            f"{beforeMedian / afterMedian:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--tiers", nargs="+", choices=TIERS, default=list(TIERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        default=list(),
+        help="only run benchmarks with any of these in their name",
+    )
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    suiteResults = runSuite(args.tiers, args.repeat, args.only)
+    with open(args.output, "w") as outputFile:
+        json.dump(suiteResults, outputFile, indent=2)
+    print(f"wrote {len(suiteResults['results'])} results to {args.output}")
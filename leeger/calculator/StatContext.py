@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import contextvars
+import copy
+from typing import Any, Callable, Optional
+
+from leeger.model.league.League import League
+from leeger.model.league.Year import Year
+
+
+class StatContext:
+    """
+    Keeps the results of calculator methods, so a calculator method called again with the same Year or League and kwargs is not calculated again.
+
+    A StatContext is used by:
+        - Passing it as the "statContext" kwarg to any calculator method
+        - Calling calculator methods inside a "with StatContext():" block
+    If neither is done, nothing is kept and every calculator method call is calculated.
+
+    Results are kept by method, by the Year or League object and its fingerprint, and by kwargs.
+    The fingerprint of a Year or League that has not changed is cached, so finding a kept result does not walk the Year or League.
+    A Year or League that changes after a result is kept will be calculated again.
+    """
+
+    __CURRENT: contextvars.ContextVar[Optional[StatContext]] = contextvars.ContextVar(
+        "statContext", default=None
+    )
+
+    def __init__(self):
+        # (method, Year/League object ID, Year/League fingerprint, kwargs key) -> (Year/League, result)
+        self.__results: dict[tuple, tuple[Year | League, Any]] = dict()
+        self.__tokens: list[contextvars.Token] = list()
+        self.hits = 0
+        self.misses = 0
+
+    def __deepcopy__(self, memo: dict) -> StatContext:
+        # kwargs are copied when filters are made, and every copy should keep results in the same place
+        return self
+
+    def __enter__(self) -> StatContext:
+        self.__tokens.append(self.__CURRENT.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__CURRENT.reset(self.__tokens.pop())
+
+    @classmethod
+    def getCurrent(cls) -> Optional[StatContext]:
+        """
+        Returns the StatContext of the "with StatContext():" block being run, if there is one.
+        """
+        return cls.__CURRENT.get()
+
+    def getResult(
+        self,
+        method: Callable,
+        yearOrLeague: Year | League,
+        kwargs: dict,
+        calculate: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the kept result of the given method for the given Year or League and kwargs.
+        If there is no kept result, calculate() is called and what it returns is kept.
+        A copy of the result is returned, so changing it does not change the kept result.
+        """
+        key = (
+            method,
+            id(yearOrLeague),
+            yearOrLeague.fingerprint,
+            self.__getKwargsKey(kwargs),
+        )
+        found = self.__results.get(key)
+        if found is not None and found[0] is yearOrLeague:
+            self.hits += 1
+            return copy.copy(found[1])
+        self.misses += 1
+        result = calculate()
+        self.__results[key] = (yearOrLeague, copy.copy(result))
+        return result
+
+    # kwargs that don't change what a calculator method returns
+    __IGNORED_KWARGS = frozenset(["statContext", "yearIndex", "leagueIndex"])
+
+    @classmethod
+    def __getKwargsKey(cls, kwargs: dict) -> tuple:
+        kwargsKey = list()
+        for name, value in sorted(kwargs.items()):
+            if name in cls.__IGNORED_KWARGS:
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                # values that can't be hashed are kept by object
+                value = ("id", id(value))
+            kwargsKey.append((name, value))
+        return tuple(kwargsKey)
@@ -2,6 +2,7 @@ from typing import Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -15,6 +16,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getAWAL(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -43,6 +45,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
         return cls._addAndCombineResults(league, AWALYearCalculator.getAWAL, **kwargs)
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getAWALPerGame(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -63,6 +66,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
             league,
             AllTimeFilters.getForLeague(league, **kwargs),
             countLeagueMedianGamesAsTwoGames=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndAWALPerGame = dict()
@@ -78,6 +82,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndAWALPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentAWAL(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -97,6 +102,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentAWALPerGame(
         cls, league: League, **kwargs
@@ -119,6 +125,7 @@ class AWALAllTimeCalculator(AllTimeCalculator):
             league,
             AllTimeFilters.getForLeague(league, **kwargs),
             countLeagueMedianGamesAsTwoGames=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndOpponentAWALPerGame = dict()
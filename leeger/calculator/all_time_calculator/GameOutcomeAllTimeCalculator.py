@@ -4,6 +4,7 @@ from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
     GameOutcomeYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -13,6 +14,7 @@ from leeger.util.navigator.LeagueNavigator import LeagueNavigator
 
 class GameOutcomeAllTimeCalculator(AllTimeCalculator):
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getWins(cls, league: League, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -32,6 +34,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getLosses(cls, league: League, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -51,6 +54,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getTies(cls, league: League, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -70,6 +74,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getWinPercentage(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -117,6 +122,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
                     filters,
                     countMultiWeekMatchupsAsOneGame=True,
                     countLeagueMedianGamesAsTwoGames=True,
+                    leagueIndex=cls._getLeagueIndex(league, **kwargs),
                 )[ownerId]
                 totalWins = numberOfWins + numberOfLeagueMedianWins
                 ownerIdAndWinPercentage[ownerId] = (
@@ -126,6 +132,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndWinPercentage
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getWAL(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -166,6 +173,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndWAL
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getWALPerGame(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -186,6 +194,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
             AllTimeFilters.getForLeague(league, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
             countLeagueMedianGamesAsTwoGames=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndWALPerGame = dict()
@@ -201,6 +210,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndWALPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getLeagueMedianWins(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -222,6 +232,7 @@ class GameOutcomeAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentLeagueMedianWins(
         cls, league: League, **kwargs
@@ -4,6 +4,7 @@ from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.PlusMinusYearCalculator import (
     PlusMinusYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.league.League import League
 from leeger.util.Deci import Deci
@@ -15,6 +16,7 @@ class PlusMinusAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getPlusMinus(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
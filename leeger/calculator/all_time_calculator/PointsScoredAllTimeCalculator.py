@@ -4,6 +4,7 @@ from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
     PointsScoredYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -17,6 +18,7 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getPointsScored(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -36,6 +38,7 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getPointsScoredPerGame(
         cls, league: League, **kwargs
@@ -54,7 +57,9 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
 
         ownerIdAndPointsScored = cls.getPointsScored(league, **kwargs)
         ownerIdAndNumberOfGamesPlayed = LeagueNavigator.getNumberOfGamesPlayed(
-            league, AllTimeFilters.getForLeague(league, **kwargs)
+            league,
+            AllTimeFilters.getForLeague(league, **kwargs),
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndPointsScoredPerGame = dict()
@@ -71,6 +76,7 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndPointsScoredPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentPointsScored(
         cls, league: League, **kwargs
@@ -92,6 +98,7 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentPointsScoredPerGame(
         cls, league: League, **kwargs
@@ -111,7 +118,9 @@ class PointsScoredAllTimeCalculator(AllTimeCalculator):
 
         ownerIdAndOpponentPointsScored = cls.getOpponentPointsScored(league, **kwargs)
         ownerIdAndNumberOfGamesPlayed = LeagueNavigator.getNumberOfGamesPlayed(
-            league, AllTimeFilters.getForLeague(league, **kwargs)
+            league,
+            AllTimeFilters.getForLeague(league, **kwargs),
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndOpponentPointsScoredPerGame = dict()
@@ -2,6 +2,7 @@ from typing import Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -28,6 +29,7 @@ class SSLAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getAdjustedTeamScore(
         cls, league: League, **kwargs
@@ -102,6 +104,7 @@ class SSLAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndAdjustedTeamScore
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getAdjustedTeamSuccess(
         cls, league: League, **kwargs
@@ -185,6 +188,7 @@ class SSLAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndAdjustedTeamSuccess
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getAdjustedTeamLuck(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
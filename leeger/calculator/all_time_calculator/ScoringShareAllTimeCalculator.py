@@ -5,6 +5,7 @@ from leeger.calculator.all_time_calculator.PointsScoredAllTimeCalculator import
 )
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator import ScoringShareYearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.league.League import League
 from leeger.util.Deci import Deci
@@ -18,6 +19,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getScoringShare(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -63,6 +65,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentScoringShare(
         cls, league: League, **kwargs
@@ -104,6 +107,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndOpponentScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getMaxScoringShare(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -170,6 +174,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndMaxScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getMinScoringShare(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -3,6 +3,7 @@ from typing import Optional
 import numpy
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -16,6 +17,7 @@ class ScoringStandardDeviationAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getScoringStandardDeviation(
         cls, league: League, **kwargs
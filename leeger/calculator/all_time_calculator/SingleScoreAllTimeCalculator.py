@@ -1,6 +1,7 @@
 from typing import Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
@@ -13,6 +14,7 @@ class SingleScoreAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getMaxScore(cls, league: League, **kwargs) -> dict[str, Optional[float | int]]:
         """
@@ -50,6 +52,7 @@ class SingleScoreAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndMaxScore
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getMinScore(cls, league: League, **kwargs) -> dict[str, Optional[float | int]]:
         """
@@ -1,10 +1,12 @@
 from typing import Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
 from leeger.util.Deci import Deci
+from leeger.util.index import ScoreIndex
 from leeger.util.navigator.LeagueNavigator import LeagueNavigator
 
 
@@ -14,6 +16,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getSmartWins(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -38,26 +41,6 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = AllTimeFilters.getForLeague(league, **kwargs)
 
         # get all scores we want to include in our smart wins calculation
@@ -72,15 +55,21 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             ownerIdsAndScores.append((teamB.ownerId, matchup.teamBScore))
 
         allScores = LeagueNavigator.getAllScoresInLeague(
-            league, simplifyMultiWeekMatchups=True
+            league,
+            simplifyMultiWeekMatchups=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
         ownerIdAndSmartWins = dict()
         allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
         for ownerId in allOwnerIds:
             ownerIdAndSmartWins[ownerId] = None
 
-        for ownerId, score in ownerIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
+        scoresBeatAndTied = ScoreIndex(allScores).getNumberOfScoresBeatAndTied(
+            [score for _, score in ownerIdsAndScores]
+        )
+        for (ownerId, _), (scoresBeat, scoresTied) in zip(
+            ownerIdsAndScores, scoresBeatAndTied
+        ):
             smartWins = (scoresBeat + (scoresTied / Deci(2))) / (
                 len(allScores) - Deci(1)
             )
@@ -92,6 +81,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndSmartWins
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getSmartWinsPerGame(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -112,6 +102,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             league,
             AllTimeFilters.getForLeague(league, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndSmartWinsPerGame = dict()
@@ -128,6 +119,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndSmartWinsPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentSmartWins(
         cls, league: League, **kwargs
@@ -145,26 +137,6 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = AllTimeFilters.getForLeague(league, **kwargs)
 
         # get all scores we want to include in our smart wins calculation
@@ -179,17 +151,21 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             ownerIdsAndOpponentScores.append((teamB.ownerId, matchup.teamAScore))
 
         allScores = LeagueNavigator.getAllScoresInLeague(
-            league, simplifyMultiWeekMatchups=True
+            league,
+            simplifyMultiWeekMatchups=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
         ownerIdAndOpponentSmartWins = dict()
         allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
         for ownerId in allOwnerIds:
             ownerIdAndOpponentSmartWins[ownerId] = None
 
-        for ownerId, opponentScore in ownerIdsAndOpponentScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(
-                opponentScore, allScores
-            )
+        scoresBeatAndTied = ScoreIndex(allScores).getNumberOfScoresBeatAndTied(
+            [opponentScore for _, opponentScore in ownerIdsAndOpponentScores]
+        )
+        for (ownerId, _), (scoresBeat, scoresTied) in zip(
+            ownerIdsAndOpponentScores, scoresBeatAndTied
+        ):
             smartWins = (scoresBeat + (scoresTied / Deci(2))) / (
                 len(allScores) - Deci(1)
             )
@@ -201,6 +177,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
         return ownerIdAndOpponentSmartWins
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getOpponentSmartWinsPerGame(
         cls, league: League, **kwargs
@@ -223,6 +200,7 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             league,
             AllTimeFilters.getForLeague(league, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
+            leagueIndex=cls._getLeagueIndex(league, **kwargs),
         )
 
         ownerIdAndOpponentSmartWinsPerGame = dict()
@@ -2,12 +2,14 @@ from typing import Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator import TeamSummaryYearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateLeague
 from leeger.model.league.League import League
 
 
 class TeamSummaryAllTimeCalculator(AllTimeCalculator):
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getGamesPlayed(cls, league: League, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -26,6 +28,7 @@ class TeamSummaryAllTimeCalculator(AllTimeCalculator):
         )
 
     @classmethod
+    @memoizeInStatContext
     @validateLeague
     def getTotalGames(cls, league: League, **kwargs) -> dict[str, Optional[int]]:
         """
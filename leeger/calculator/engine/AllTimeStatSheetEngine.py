@@ -0,0 +1,680 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.engine.StatSheetEngine import StatSheetEngine
+from leeger.calculator.engine.YearStatSheetEngine import YearStatSheetEngine
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter.AllTimeFilters import AllTimeFilters
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.index import LeagueIndex, ScoreIndex
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.Numeric import Numeric
+
+
+class AllTimeStatSheetEngine(StatSheetEngine):
+    """
+    Calculates the stats in an AllTimeStatSheet for a League.
+
+    Each Year in the filtered range gets a YearStatSheetEngine, so the filtered matchups in each Year are walked once.
+    All-time stats are then combined from the Year engines by Owner.
+    This gives the same results as calling each AllTimeCalculator method with the same kwargs.
+    """
+
+    DEPENDENCIES = {
+        # building blocks
+        "numberOfGamesPlayed": (),
+        "numberOfGamesPlayedMultiWeekMatchupsAsOneGame": (),
+        "numberOfGamesPlayedLeagueMedianGamesAsTwoGames": (),
+        "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames": (),
+        "simplifiedMatchups": (),
+        "allScoresInLeague": (),
+        "scoreIndex": ("allScoresInLeague",),
+        # Team Summary
+        "gamesPlayed": (),
+        "totalGames": (),
+        # Game Outcome
+        "wins": (),
+        "losses": (),
+        "ties": (),
+        "leagueMedianWins": (),
+        "opponentLeagueMedianWins": (),
+        "winPercentage": (
+            "wins",
+            "losses",
+            "ties",
+            "leagueMedianWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames",
+        ),
+        "wal": ("wins", "ties", "leagueMedianWins"),
+        "walPerGame": (
+            "wal",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames",
+        ),
+        # AWAL
+        "awal": (),
+        "awalPerGame": ("awal", "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"),
+        "opponentAWAL": (),
+        "opponentAWALPerGame": (
+            "opponentAWAL",
+            "numberOfGamesPlayedLeagueMedianGamesAsTwoGames",
+        ),
+        # Smart Wins
+        "smartWins": ("simplifiedMatchups", "scoreIndex"),
+        "smartWinsPerGame": (
+            "smartWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        ),
+        "opponentSmartWins": ("simplifiedMatchups", "scoreIndex"),
+        "opponentSmartWinsPerGame": (
+            "opponentSmartWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        ),
+        # Points Scored
+        "pointsScored": (),
+        "pointsScoredPerGame": ("pointsScored", "numberOfGamesPlayed"),
+        "opponentPointsScored": (),
+        "opponentPointsScoredPerGame": ("opponentPointsScored", "numberOfGamesPlayed"),
+        # Scoring Share
+        "scoringShare": ("pointsScored",),
+        "opponentScoringShare": ("opponentPointsScored",),
+        "maxScoringShare": (),
+        "minScoringShare": (),
+        # Single Score
+        "maxScore": (),
+        "minScore": (),
+        # Scoring Standard Deviation
+        "scoringStandardDeviation": ("simplifiedMatchups",),
+        # Plus Minus
+        "plusMinus": (),
+        # SSL
+        "adjustedTeamScore": (),
+        "adjustedTeamSuccess": (),
+        "adjustedTeamLuck": ("adjustedTeamScore", "adjustedTeamSuccess"),
+    }
+
+    # the stats that are always in an AllTimeStatSheet
+    STAT_SHEET_STATS: tuple[str, ...] = (
+        "gamesPlayed",
+        "wins",
+        "losses",
+        "ties",
+        "winPercentage",
+        "wal",
+        "walPerGame",
+        "awal",
+        "awalPerGame",
+        "opponentAWAL",
+        "opponentAWALPerGame",
+        "smartWins",
+        "smartWinsPerGame",
+        "opponentSmartWins",
+        "opponentSmartWinsPerGame",
+        "pointsScored",
+        "pointsScoredPerGame",
+        "opponentPointsScored",
+        "opponentPointsScoredPerGame",
+        "scoringShare",
+        "opponentScoringShare",
+        "maxScoringShare",
+        "minScoringShare",
+        "maxScore",
+        "minScore",
+        "scoringStandardDeviation",
+        "plusMinus",
+        "adjustedTeamScore",
+        "adjustedTeamSuccess",
+        "adjustedTeamLuck",
+    )
+    # the stats that are only in an AllTimeStatSheet when any Year has league median games on
+    LEAGUE_MEDIAN_STATS: tuple[str, ...] = (
+        "totalGames",
+        "leagueMedianWins",
+        "opponentLeagueMedianWins",
+    )
+
+    @validateLeague
+    def __init__(self, league: League, **kwargs):
+        super().__init__(Numeric.getNumericMode(**kwargs))
+        self.league = league
+        self.filters = AllTimeFilters.getForLeague(
+            league, **self._getFilterKwargs(kwargs)
+        )
+        leagueIndex = kwargs.get("leagueIndex")
+        self.__leagueIndex: Optional[LeagueIndex] = (
+            leagueIndex
+            if isinstance(leagueIndex, LeagueIndex) and leagueIndex.isIndexFor(league)
+            else None
+        )
+        self.__allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
+
+        # the League is already validated, so the Year engines do not need to validate again
+        self.yearEngines: list[YearStatSheetEngine] = list()
+        for (
+            year,
+            weekNumberStart,
+            weekNumberEnd,
+        ) in LeagueNavigator.getYearsAndWeekNumberRanges(league, self.filters):
+            yearIndexKwargs = (
+                {"yearIndex": self.__leagueIndex.getYearIndex(year.yearNumber)}
+                if self.__leagueIndex is not None
+                else dict()
+            )
+            self.yearEngines.append(
+                YearStatSheetEngine(
+                    year,
+                    onlyChampionship=self.filters.onlyChampionship,
+                    onlyPostSeason=self.filters.onlyPostSeason,
+                    onlyRegularSeason=self.filters.onlyRegularSeason,
+                    weekNumberStart=weekNumberStart,
+                    weekNumberEnd=weekNumberEnd,
+                    validate=False,
+                    numericMode=self.numericMode,
+                    **yearIndexKwargs,
+                )
+            )
+
+    def getStatNames(self) -> list[str]:
+        """
+        Returns the name of each stat that belongs in the AllTimeStatSheet for *this* League.
+        """
+        statNames = list(self.STAT_SHEET_STATS)
+        for year in self.league.years:
+            if year.yearSettings.leagueMedianGames is True:
+                statNames += list(self.LEAGUE_MEDIAN_STATS)
+                break
+        return statNames
+
+    ####################
+    # Helper functions #
+    ####################
+
+    def __getOwnerId(self, teamId: str) -> str:
+        return LeagueNavigator.getOwnerIdByTeamId(self.league, teamId)
+
+    def __addAndCombineResults(
+        self, yearStatName: str
+    ) -> dict[str, Optional[int | float | Deci]]:
+        """
+        Sums the given stat from each Year engine by Owner, the same way AllTimeCalculator._addAndCombineResults() does.
+        If ALL results for an Owner are None, the response will have None for that Owner.
+        """
+        # this will keep track of whether an Owner has had a non-None result
+        ownerIdAndWhetherOwnerHasHadAValidResult: dict[str, bool] = dict()
+
+        result: dict[str, int | float | Deci] = dict()
+        for ownerId in self.__allOwnerIds:
+            result[ownerId] = 0
+            ownerIdAndWhetherOwnerHasHadAValidResult[ownerId] = False
+
+        for yearEngine in self.yearEngines:
+            resultDict = yearEngine.get(yearStatName)
+            for teamId in resultDict.keys():
+                # check if this is a valid result
+                if resultDict[teamId] is None:
+                    continue
+                ownerId = self.__getOwnerId(teamId)
+                result[ownerId] += resultDict[teamId]
+                ownerIdAndWhetherOwnerHasHadAValidResult[ownerId] = True
+
+        # set None for each Owner that did not have a single valid result
+        for ownerId in ownerIdAndWhetherOwnerHasHadAValidResult:
+            if not ownerIdAndWhetherOwnerHasHadAValidResult[ownerId]:
+                result[ownerId] = None
+        return result
+
+    def __getNumberOfGamesPlayed(self, yearStatName: str) -> dict[str, int]:
+        ownerIdAndNumberOfGamesPlayed = dict()
+        for ownerId in self.__allOwnerIds:
+            ownerIdAndNumberOfGamesPlayed[ownerId] = 0
+        for yearEngine in self.yearEngines:
+            resultDict = yearEngine.get(yearStatName)
+            for teamId in resultDict.keys():
+                ownerIdAndNumberOfGamesPlayed[self.__getOwnerId(teamId)] += resultDict[
+                    teamId
+                ]
+        return ownerIdAndNumberOfGamesPlayed
+
+    def __getPerGame(
+        self, ownerIdAndStat: dict, numberOfGamesPlayedStatName: str
+    ) -> dict[str, Optional[Deci]]:
+        ownerIdAndNumberOfGamesPlayed = self.get(numberOfGamesPlayedStatName)
+        ownerIdAndStatPerGame = dict()
+        for ownerId in self.__allOwnerIds:
+            if ownerIdAndNumberOfGamesPlayed[ownerId] == 0:
+                ownerIdAndStatPerGame[ownerId] = None
+            else:
+                ownerIdAndStatPerGame[ownerId] = (
+                    ownerIdAndStat[ownerId] / ownerIdAndNumberOfGamesPlayed[ownerId]
+                )
+        return ownerIdAndStatPerGame
+
+    ###################
+    # Building blocks #
+    ###################
+
+    def _calculateNumberOfGamesPlayed(self) -> dict[str, int]:
+        return self.__getNumberOfGamesPlayed("numberOfGamesPlayed")
+
+    def _calculateNumberOfGamesPlayedMultiWeekMatchupsAsOneGame(self) -> dict[str, int]:
+        return self.__getNumberOfGamesPlayed(
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame"
+        )
+
+    def _calculateNumberOfGamesPlayedLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__getNumberOfGamesPlayed(
+            "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"
+        )
+
+    def _calculateNumberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__getNumberOfGamesPlayed(
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames"
+        )
+
+    def _calculateSimplifiedMatchups(self) -> list[Matchup]:
+        # non multi-week matchups first, then one simplified matchup per multi-week matchup
+        simplifiedMatchups: list[Matchup] = list()
+        multiWeekMatchupIdToMatchupsMap: dict[str, list[Matchup]] = dict()
+        for yearEngine in self.yearEngines:
+            simplifiedMatchups += yearEngine.singleWeekMatchups
+            for mwmid, matchupList in yearEngine.multiWeekMatchups.items():
+                multiWeekMatchupIdToMatchupsMap.setdefault(mwmid, list()).extend(
+                    matchupList
+                )
+        for matchupList in multiWeekMatchupIdToMatchupsMap.values():
+            simplifiedMatchups.append(
+                MatchupNavigator.simplifyMultiWeekMatchups(matchupList)
+            )
+        return simplifiedMatchups
+
+    def _calculateAllScoresInLeague(self) -> list[float | int]:
+        return LeagueNavigator.getAllScoresInLeague(
+            self.league, simplifyMultiWeekMatchups=True, leagueIndex=self.__leagueIndex
+        )
+
+    def _calculateScoreIndex(self) -> ScoreIndex:
+        return ScoreIndex(self.get("allScoresInLeague"))
+
+    ################
+    # Team Summary #
+    ################
+
+    def _calculateGamesPlayed(self) -> dict[str, Optional[int]]:
+        return self.__addAndCombineResults("gamesPlayed")
+
+    def _calculateTotalGames(self) -> dict[str, Optional[int]]:
+        return self.__addAndCombineResults("totalGames")
+
+    ################
+    # Game Outcome #
+    ################
+
+    def _calculateWins(self) -> dict[str, Optional[int]]:
+        return self.__addAndCombineResults("wins")
+
+    def _calculateLosses(self) -> dict[str, Optional[int]]:
+        return self.__addAndCombineResults("losses")
+
+    def _calculateTies(self) -> dict[str, Optional[int]]:
+        return self.__addAndCombineResults("ties")
+
+    def _calculateLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("leagueMedianWins")
+
+    def _calculateOpponentLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("opponentLeagueMedianWins")
+
+    def _calculateWinPercentage(self) -> dict[str, Optional[Deci]]:
+        ownerIdAndWins = self.get("wins")
+        ownerIdAndLosses = self.get("losses")
+        ownerIdAndTies = self.get("ties")
+        ownerIdAndLeagueMedianWins = self.get("leagueMedianWins")
+        ownerIdAndNumberOfGamesPlayed = self.get(
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames"
+        )
+
+        ownerIdAndWinPercentage = dict()
+        for ownerId in self.__allOwnerIds:
+            numberOfWins = ownerIdAndWins[ownerId]
+            numberOfLosses = ownerIdAndLosses[ownerId]
+            numberOfTies = ownerIdAndTies[ownerId]
+            numberOfLeagueMedianWins = ownerIdAndLeagueMedianWins[ownerId]
+            if None in (
+                numberOfWins,
+                numberOfLosses,
+                numberOfTies,
+                numberOfLeagueMedianWins,
+            ):
+                ownerIdAndWinPercentage[ownerId] = None
+            else:
+                totalWins = numberOfWins + numberOfLeagueMedianWins
+                ownerIdAndWinPercentage[ownerId] = (
+                    self._toNumber(totalWins)
+                    + (self._toNumber("0.5") * self._toNumber(numberOfTies))
+                ) / self._toNumber(ownerIdAndNumberOfGamesPlayed[ownerId])
+        return ownerIdAndWinPercentage
+
+    def _calculateWal(self) -> dict[str, Optional[Deci]]:
+        ownerIdAndWins = self.get("wins")
+        ownerIdAndTies = self.get("ties")
+        ownerIdAndLeagueMedianWins = self.get("leagueMedianWins")
+
+        ownerIdAndWAL = dict()
+        for ownerId in self.__allOwnerIds:
+            wins = ownerIdAndWins[ownerId]
+            ties = ownerIdAndTies[ownerId]
+            leagueMedianWins = ownerIdAndLeagueMedianWins[ownerId]
+            if None in (wins, ties):
+                ownerIdAndWAL[ownerId] = None
+            else:
+                ownerIdAndWAL[ownerId] = self._toNumber(wins) + (
+                    self._toNumber("0.5") * self._toNumber(ties)
+                )
+                if leagueMedianWins is not None:
+                    ownerIdAndWAL[ownerId] += self._toNumber(leagueMedianWins)
+        return ownerIdAndWAL
+
+    def _calculateWalPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("wal"),
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames",
+        )
+
+    ########
+    # AWAL #
+    ########
+
+    def _calculateAwal(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("awal")
+
+    def _calculateAwalPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("awal"), "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"
+        )
+
+    def _calculateOpponentAWAL(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("opponentAWAL")
+
+    def _calculateOpponentAWALPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentAWAL"), "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"
+        )
+
+    ##############
+    # Smart Wins #
+    ##############
+
+    def __getSmartWins(self, opponentScores: bool) -> dict[str, Optional[Deci]]:
+        # get all scores we want to include in our smart wins calculation
+        ownerIdsAndScores: list[tuple] = list()
+        for matchup in self.get("simplifiedMatchups"):
+            ownerAId = self.__getOwnerId(matchup.teamAId)
+            ownerBId = self.__getOwnerId(matchup.teamBId)
+            if opponentScores:
+                ownerIdsAndScores.append((ownerAId, matchup.teamBScore))
+                ownerIdsAndScores.append((ownerBId, matchup.teamAScore))
+            else:
+                ownerIdsAndScores.append((ownerAId, matchup.teamAScore))
+                ownerIdsAndScores.append((ownerBId, matchup.teamBScore))
+
+        ownerIdAndSmartWins = dict()
+        for ownerId in self.__allOwnerIds:
+            ownerIdAndSmartWins[ownerId] = None
+
+        scoreIndex = self.get("scoreIndex")
+        scoresBeatAndTied = scoreIndex.getNumberOfScoresBeatAndTied(
+            [score for _, score in ownerIdsAndScores]
+        )
+        for (ownerId, _), (scoresBeat, scoresTied) in zip(
+            ownerIdsAndScores, scoresBeatAndTied
+        ):
+            smartWins = (scoresBeat + (scoresTied / self._toNumber(2))) / (
+                scoreIndex.numberOfScores - self._toNumber(1)
+            )
+            if ownerIdAndSmartWins[ownerId] is None:
+                ownerIdAndSmartWins[ownerId] = smartWins
+            else:
+                ownerIdAndSmartWins[ownerId] += smartWins
+        return ownerIdAndSmartWins
+
+    def _calculateSmartWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getSmartWins(opponentScores=False)
+
+    def _calculateSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("smartWins"), "numberOfGamesPlayedMultiWeekMatchupsAsOneGame"
+        )
+
+    def _calculateOpponentSmartWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getSmartWins(opponentScores=True)
+
+    def _calculateOpponentSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentSmartWins"),
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        )
+
+    #################
+    # Points Scored #
+    #################
+
+    def _calculatePointsScored(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("pointsScored")
+
+    def _calculatePointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(self.get("pointsScored"), "numberOfGamesPlayed")
+
+    def _calculateOpponentPointsScored(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("opponentPointsScored")
+
+    def _calculateOpponentPointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentPointsScored"), "numberOfGamesPlayed"
+        )
+
+    #################
+    # Scoring Share #
+    #################
+
+    def __getScoringShare(
+        self, ownerIdAndPointsScored: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        allScores = GeneralUtil.filter(
+            value=None, list_=ownerIdAndPointsScored.values()
+        )
+        totalPointsScoredInLeague = sum(allScores)
+        ownerIdAndScoringShare = dict()
+        for ownerId in self.__allOwnerIds:
+            if len(allScores) == 0 or ownerIdAndPointsScored[ownerId] is None:
+                ownerIdAndScoringShare[ownerId] = None
+            # avoid division by 0
+            elif totalPointsScoredInLeague == 0:
+                ownerIdAndScoringShare[ownerId] = self._toNumber("0")
+            else:
+                ownerIdAndScoringShare[ownerId] = (
+                    ownerIdAndPointsScored[ownerId] / totalPointsScoredInLeague
+                ) * self._toNumber("100")
+        return ownerIdAndScoringShare
+
+    def _calculateScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShare(self.get("pointsScored"))
+
+    def _calculateOpponentScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShare(self.get("opponentPointsScored"))
+
+    def __getScoringShareExtreme(
+        self, yearStatName: str, extremeFunction: callable
+    ) -> dict[str, Optional[Deci]]:
+        # swap out team IDs for owner IDs
+        scoringSharesByYear = dict()
+        for yearEngine in self.yearEngines:
+            scoringSharesByOwnerId = dict()
+            for teamId, scoringShare in yearEngine.get(yearStatName).items():
+                scoringSharesByOwnerId[self.__getOwnerId(teamId)] = scoringShare
+            scoringSharesByYear[yearEngine.year.yearNumber] = scoringSharesByOwnerId
+
+        ownerIdAndScoringShares: dict[str, list] = dict()
+        for scoringSharesByOwnerId in scoringSharesByYear.values():
+            for ownerId in self.__allOwnerIds:
+                ownerIdAndScoringShares.setdefault(ownerId, list()).append(
+                    scoringSharesByOwnerId[ownerId]
+                )
+
+        ownerIdAndScoringShare = dict()
+        for ownerId in self.__allOwnerIds:
+            # remove all None values from list
+            scoringShares = [
+                i for i in ownerIdAndScoringShares.get(ownerId, list()) if i is not None
+            ]
+            if len(scoringShares) > 0:
+                ownerIdAndScoringShare[ownerId] = extremeFunction(scoringShares)
+            else:
+                ownerIdAndScoringShare[ownerId] = None
+        return ownerIdAndScoringShare
+
+    def _calculateMaxScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShareExtreme("maxScoringShare", max)
+
+    def _calculateMinScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShareExtreme("minScoringShare", min)
+
+    ################
+    # Single Score #
+    ################
+
+    def _calculateMaxScore(self) -> dict[str, Optional[float | int]]:
+        ownerIdAndMaxScore = dict()
+        for ownerId in self.__allOwnerIds:
+            ownerIdAndMaxScore[ownerId] = None
+        for yearEngine in self.yearEngines:
+            for matchup in yearEngine.filteredMatchups:
+                aOwnerId = self.__getOwnerId(matchup.teamAId)
+                aPreviousMaxScore = ownerIdAndMaxScore[aOwnerId]
+                if aPreviousMaxScore is None or matchup.teamAScore > aPreviousMaxScore:
+                    ownerIdAndMaxScore[aOwnerId] = matchup.teamAScore
+
+                bOwnerId = self.__getOwnerId(matchup.teamBId)
+                bPreviousMaxScore = ownerIdAndMaxScore[bOwnerId]
+                if bPreviousMaxScore is None or matchup.teamBScore > bPreviousMaxScore:
+                    ownerIdAndMaxScore[bOwnerId] = matchup.teamBScore
+        return ownerIdAndMaxScore
+
+    def _calculateMinScore(self) -> dict[str, Optional[float | int]]:
+        ownerIdAndMinScore = dict()
+        for ownerId in self.__allOwnerIds:
+            ownerIdAndMinScore[ownerId] = None
+        for yearEngine in self.yearEngines:
+            for matchup in yearEngine.filteredMatchups:
+                aOwnerId = self.__getOwnerId(matchup.teamAId)
+                aPreviousMinScore = ownerIdAndMinScore[aOwnerId]
+                if aPreviousMinScore is None or matchup.teamAScore < aPreviousMinScore:
+                    ownerIdAndMinScore[aOwnerId] = matchup.teamAScore
+
+                bOwnerId = self.__getOwnerId(matchup.teamBId)
+                bPreviousMinScore = ownerIdAndMinScore[bOwnerId]
+                if bPreviousMinScore is None or matchup.teamBScore < bPreviousMinScore:
+                    ownerIdAndMinScore[bOwnerId] = matchup.teamBScore
+        return ownerIdAndMinScore
+
+    ##############################
+    # Scoring Standard Deviation #
+    ##############################
+
+    def _calculateScoringStandardDeviation(self) -> dict[str, Optional[Deci]]:
+        ownerIdAndScores = dict()
+        for ownerId in self.__allOwnerIds:
+            ownerIdAndScores[ownerId] = list()
+        for matchup in self.get("simplifiedMatchups"):
+            ownerIdAndScores[self.__getOwnerId(matchup.teamAId)].append(
+                self._toNumber(matchup.teamAScore)
+            )
+            ownerIdAndScores[self.__getOwnerId(matchup.teamBId)].append(
+                self._toNumber(matchup.teamBScore)
+            )
+
+        ownerIdAndScoringStandardDeviation = dict()
+        for ownerId in self.__allOwnerIds:
+            if len(ownerIdAndScores[ownerId]) > 0:
+                ownerIdAndScoringStandardDeviation[ownerId] = self._toNumber(
+                    numpy.std(ownerIdAndScores[ownerId])
+                )
+            else:
+                ownerIdAndScoringStandardDeviation[ownerId] = None
+        return ownerIdAndScoringStandardDeviation
+
+    ##############
+    # Plus Minus #
+    ##############
+
+    def _calculatePlusMinus(self) -> dict[str, Optional[Deci]]:
+        return self.__addAndCombineResults("plusMinus")
+
+    #######
+    # SSL #
+    #######
+
+    def __getAdjustedSSLStat(self, yearStatName: str) -> dict[str, Optional[Deci]]:
+        # {"someOwnerId": [(self._toNumber("101.5"), 4), (self._toNumber("109.4), 5)]}
+        ownerIdToStatAndGamesPlayedListMap: dict[str, list[tuple[Deci, int]]] = dict()
+        for yearEngine in self.yearEngines:
+            teamIdAndGamesPlayed = yearEngine.get("gamesPlayed")
+            for teamId, stat in yearEngine.get(yearStatName).items():
+                ownerIdToStatAndGamesPlayedListMap.setdefault(
+                    self.__getOwnerId(teamId), list()
+                ).append((stat, teamIdAndGamesPlayed[teamId]))
+
+        # adjust stats by games played
+        ownerIdAndAdjustedStat: dict[str, Optional[Deci]] = dict()
+        for (
+            ownerId,
+            statAndGamesPlayedList,
+        ) in ownerIdToStatAndGamesPlayedListMap.items():
+            totalGamesPlayed = sum([sagp[1] for sagp in statAndGamesPlayedList])
+            if totalGamesPlayed > 0:
+                for stat, gamesPlayed in statAndGamesPlayedList:
+                    if stat is not None:
+                        percentageOfGamesPlayed = self._toNumber(
+                            gamesPlayed / totalGamesPlayed
+                        )
+                        adjustedStat = self._toNumber(stat * percentageOfGamesPlayed)
+                        if ownerId in ownerIdAndAdjustedStat:
+                            ownerIdAndAdjustedStat[ownerId] += adjustedStat
+                        else:
+                            ownerIdAndAdjustedStat[ownerId] = adjustedStat
+
+        # set to None if ownerId not in response dict
+        for ownerId in self.__allOwnerIds:
+            if ownerId not in ownerIdAndAdjustedStat:
+                ownerIdAndAdjustedStat[ownerId] = None
+        return ownerIdAndAdjustedStat
+
+    def _calculateAdjustedTeamScore(self) -> dict[str, Optional[Deci]]:
+        return self.__getAdjustedSSLStat("teamScore")
+
+    def _calculateAdjustedTeamSuccess(self) -> dict[str, Optional[Deci]]:
+        return self.__getAdjustedSSLStat("teamSuccess")
+
+    def _calculateAdjustedTeamLuck(self) -> dict[str, Optional[Deci]]:
+        ownerIdAndAdjustedTeamScore = self.get("adjustedTeamScore")
+        ownerIdAndAdjustedTeamSuccess = self.get("adjustedTeamSuccess")
+        ownerIdAndAdjustedTeamLuck: dict[str, Optional[Deci]] = dict()
+        for ownerId in self.__allOwnerIds:
+            adjustedTeamScore = ownerIdAndAdjustedTeamScore[ownerId]
+            adjustedTeamSuccess = ownerIdAndAdjustedTeamSuccess[ownerId]
+            if adjustedTeamScore is not None and adjustedTeamSuccess is not None:
+                ownerIdAndAdjustedTeamLuck[ownerId] = self._toNumber(
+                    adjustedTeamSuccess - adjustedTeamScore
+                )
+            else:
+                ownerIdAndAdjustedTeamLuck[ownerId] = None
+        return ownerIdAndAdjustedTeamLuck
@@ -0,0 +1,84 @@
+from typing import Any
+
+from leeger.enum.NumericMode import NumericMode
+from leeger.util.Numeric import Numeric
+
+
+class StatSheetEngine:
+    """
+    Should be inherited by all stat sheet engines.
+
+    A stat sheet engine calculates many stats for the same filtered matchups at once.
+    Each stat is a node in a dependency graph (DEPENDENCIES) and is calculated by the method named "_calculate<StatName>".
+    Stats are calculated at most once and shared by every stat that depends on them.
+    Numbers in stats are created with _toNumber(), so the same engine can calculate with Deci or floats (see Numeric).
+    """
+
+    # stat name -> names of the stats it is calculated from
+    DEPENDENCIES: dict[str, tuple[str, ...]] = dict()
+
+    def __init__(self, numericMode: NumericMode = NumericMode.EXACT):
+        self.__results: dict[str, Any] = dict()
+        self.numericMode = numericMode
+        self._toNumber = Numeric.getNumberType(numericMode)
+
+    @staticmethod
+    def _getFilterKwargs(kwargs: dict) -> dict:
+        """
+        Returns the given kwargs without "numericMode".
+        Only stat sheet engines use it, so filters warn that it is unused.
+        """
+        return {name: value for name, value in kwargs.items() if name != "numericMode"}
+
+    def plan(self, statNames: list[str]) -> list[str]:
+        """
+        Returns the given stats and every stat they depend on.
+        Stats are ordered so each stat comes after all of the stats it depends on.
+        """
+        orderedStatNames: list[str] = list()
+        visitedStatNames: set[str] = set()
+
+        def visit(statName: str, path: tuple[str, ...]) -> None:
+            if statName in visitedStatNames:
+                return
+            if statName in path:
+                raise ValueError(f"Circular dependency found for stat '{statName}'.")
+            if statName not in self.DEPENDENCIES:
+                raise ValueError(f"'{statName}' is not a stat that can be calculated.")
+            for dependency in self.DEPENDENCIES[statName]:
+                visit(dependency, path + (statName,))
+            visitedStatNames.add(statName)
+            orderedStatNames.append(statName)
+
+        for statName in statNames:
+            visit(statName, tuple())
+        return orderedStatNames
+
+    def calculate(self, statNames: list[str]) -> dict[str, Any]:
+        """
+        Calculates each given stat and returns them by stat name.
+        Numbers calculated with floats are returned as Deci.
+        """
+        for statName in self.plan(statNames):
+            self.get(statName)
+        return {statName: self.__toDeci(self.get(statName)) for statName in statNames}
+
+    def get(self, statName: str) -> Any:
+        """
+        Returns the given stat, calculating it if it has not been calculated yet.
+        """
+        if statName not in self.__results:
+            if statName not in self.DEPENDENCIES:
+                raise ValueError(f"'{statName}' is not a stat that can be calculated.")
+            calculateFunction = getattr(
+                self, f"_calculate{statName[0].upper()}{statName[1:]}"
+            )
+            self.__results[statName] = calculateFunction()
+        return self.__results[statName]
+
+    def __toDeci(self, result: Any) -> Any:
+        if self.numericMode != NumericMode.FLOAT:
+            return result
+        if isinstance(result, dict):
+            return {key: Numeric.toDeci(value) for key, value in result.items()}
+        return Numeric.toDeci(result)
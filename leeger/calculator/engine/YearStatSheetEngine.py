@@ -0,0 +1,837 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.engine.StatSheetEngine import StatSheetEngine
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+from leeger.decorator.validators import validateYear
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.index import ScoreIndex, YearIndex
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.Numeric import Numeric
+
+
+class YearStatSheetEngine(StatSheetEngine):
+    """
+    Calculates the stats in a YearStatSheet for a Year.
+
+    The filtered matchups in the Year are walked once when the engine is created.
+    Every stat is then calculated from what was collected in that walk.
+    This gives the same results as calling each YearCalculator method with the same kwargs.
+    """
+
+    DEPENDENCIES = {
+        # building blocks
+        "numberOfGamesPlayed": (),
+        "numberOfGamesPlayedMultiWeekMatchupsAsOneGame": (),
+        "numberOfGamesPlayedLeagueMedianGamesAsTwoGames": (),
+        "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames": (),
+        "simplifiedMatchups": (),
+        "allScoresInYear": (),
+        "scoreIndex": ("allScoresInYear",),
+        "yearIndex": (),
+        # Team Summary
+        "gamesPlayed": ("simplifiedMatchups",),
+        "totalGames": ("numberOfGamesPlayedLeagueMedianGamesAsTwoGames",),
+        # Game Outcome
+        "wins": ("simplifiedMatchups", "numberOfGamesPlayed"),
+        "losses": ("simplifiedMatchups", "numberOfGamesPlayed"),
+        "ties": ("simplifiedMatchups", "numberOfGamesPlayed"),
+        "leagueMedianWins": ("numberOfGamesPlayed",),
+        "opponentLeagueMedianWins": ("numberOfGamesPlayed",),
+        "winPercentage": (
+            "wins",
+            "losses",
+            "ties",
+            "leagueMedianWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames",
+        ),
+        "wal": ("wins", "ties", "leagueMedianWins"),
+        "walPerGame": (
+            "wal",
+            "numberOfGamesPlayed",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames",
+        ),
+        # AWAL
+        "awal": ("yearIndex", "leagueMedianWins", "numberOfGamesPlayed"),
+        "awalPerGame": ("awal", "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"),
+        "opponentAWAL": (
+            "yearIndex",
+            "opponentLeagueMedianWins",
+            "numberOfGamesPlayed",
+        ),
+        "opponentAWALPerGame": (
+            "opponentAWAL",
+            "numberOfGamesPlayedLeagueMedianGamesAsTwoGames",
+        ),
+        # Smart Wins
+        "smartWins": ("simplifiedMatchups", "scoreIndex", "numberOfGamesPlayed"),
+        "smartWinsPerGame": (
+            "smartWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        ),
+        "opponentSmartWins": (
+            "simplifiedMatchups",
+            "scoreIndex",
+            "numberOfGamesPlayed",
+        ),
+        "opponentSmartWinsPerGame": (
+            "opponentSmartWins",
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        ),
+        # Points Scored
+        "pointsScored": ("numberOfGamesPlayed",),
+        "pointsScoredPerGame": ("pointsScored", "numberOfGamesPlayed"),
+        "opponentPointsScored": ("numberOfGamesPlayed",),
+        "opponentPointsScoredPerGame": ("opponentPointsScored", "numberOfGamesPlayed"),
+        # Scoring Share
+        "scoringShare": ("pointsScored",),
+        "opponentScoringShare": ("opponentPointsScored",),
+        "maxScoringShare": ("numberOfGamesPlayed",),
+        "minScoringShare": ("numberOfGamesPlayed",),
+        # Single Score
+        "maxScore": (),
+        "minScore": (),
+        # Scoring Standard Deviation
+        "scoringStandardDeviation": ("simplifiedMatchups",),
+        # Plus Minus
+        "plusMinus": ("pointsScored", "opponentPointsScored"),
+        # SSL
+        "teamScore": ("awalPerGame", "scoringShare", "maxScore", "minScore"),
+        "teamSuccess": ("walPerGame", "scoringShare", "maxScore", "minScore"),
+        "teamLuck": ("teamScore", "teamSuccess"),
+    }
+
+    # the stats that are always in a YearStatSheet
+    STAT_SHEET_STATS: tuple[str, ...] = (
+        "gamesPlayed",
+        "wins",
+        "losses",
+        "ties",
+        "winPercentage",
+        "wal",
+        "walPerGame",
+        "awal",
+        "awalPerGame",
+        "opponentAWAL",
+        "opponentAWALPerGame",
+        "smartWins",
+        "smartWinsPerGame",
+        "opponentSmartWins",
+        "opponentSmartWinsPerGame",
+        "pointsScored",
+        "pointsScoredPerGame",
+        "opponentPointsScored",
+        "opponentPointsScoredPerGame",
+        "scoringShare",
+        "opponentScoringShare",
+        "maxScoringShare",
+        "minScoringShare",
+        "maxScore",
+        "minScore",
+        "scoringStandardDeviation",
+        "plusMinus",
+        "teamScore",
+        "teamSuccess",
+        "teamLuck",
+    )
+    # the stats that are only in a YearStatSheet when league median games are on
+    LEAGUE_MEDIAN_STATS: tuple[str, ...] = (
+        "totalGames",
+        "leagueMedianWins",
+        "opponentLeagueMedianWins",
+    )
+
+    @validateYear
+    def __init__(self, year: Year, **kwargs):
+        super().__init__(Numeric.getNumericMode(**kwargs))
+        self.year = year
+        self.filters = YearFilters.getForYear(year, **self._getFilterKwargs(kwargs))
+        yearIndex = kwargs.get("yearIndex")
+        self.__yearIndex: Optional[YearIndex] = (
+            yearIndex
+            if isinstance(yearIndex, YearIndex) and yearIndex.isIndexFor(year)
+            else None
+        )
+        self.__leagueMedianGames = bool(year.yearSettings.leagueMedianGames)
+        self.__allTeamIds = YearNavigator.getAllTeamIds(year)
+        self.__traverse()
+
+    def getStatNames(self) -> list[str]:
+        """
+        Returns the name of each stat that belongs in the YearStatSheet for *this* Year.
+        """
+        statNames = list(self.STAT_SHEET_STATS)
+        if self.year.yearSettings.leagueMedianGames is True:
+            statNames += list(self.LEAGUE_MEDIAN_STATS)
+        return statNames
+
+    def __traverse(self) -> None:
+        """
+        Walks every filtered matchup in the Year once and keeps everything the stats are calculated from.
+        """
+        includeMatchupTypes = self.filters.includeMatchupTypes
+
+        # all filtered matchups, in order
+        self.filteredMatchups: list[Matchup] = list()
+        # filtered non multi-week matchups, in order
+        self.singleWeekMatchups: list[Matchup] = list()
+        # filtered multi-week matchups, by multi-week matchup ID in the order they are first found
+        self.multiWeekMatchups: dict[str, list[Matchup]] = dict()
+        # each Week in the range with its filtered matchups
+        self.__weeksAndMatchups: list[tuple[Week, list[Matchup]]] = list()
+
+        self.__pointsScored: dict[str, Deci] = dict()
+        self.__opponentPointsScored: dict[str, Deci] = dict()
+        self.__numberOfGamesPlayed: dict[str, int] = dict()
+        self.__numberOfGamesPlayedMultiWeekAsOne: dict[str, int] = dict()
+        self.__numberOfGamesPlayedMedianAsTwo: dict[str, int] = dict()
+        self.__numberOfGamesPlayedMultiWeekAsOneMedianAsTwo: dict[str, int] = dict()
+        for teamId in self.__allTeamIds:
+            self.__pointsScored[teamId] = self._toNumber(0)
+            self.__opponentPointsScored[teamId] = self._toNumber(0)
+            self.__numberOfGamesPlayed[teamId] = 0
+            self.__numberOfGamesPlayedMultiWeekAsOne[teamId] = 0
+            self.__numberOfGamesPlayedMedianAsTwo[teamId] = 0
+            self.__numberOfGamesPlayedMultiWeekAsOneMedianAsTwo[teamId] = 0
+
+        for i in range(self.filters.weekNumberStart - 1, self.filters.weekNumberEnd):
+            week = self.year.weeks[i]
+            weekMatchups = list()
+            for matchup in week.matchups:
+                if matchup.matchupType not in includeMatchupTypes:
+                    continue
+                weekMatchups.append(matchup)
+                self.filteredMatchups.append(matchup)
+
+                mwmid = matchup.multiWeekMatchupId
+                isFirstGameOfMatchup = True
+                if mwmid is None:
+                    self.singleWeekMatchups.append(matchup)
+                elif mwmid in self.multiWeekMatchups:
+                    self.multiWeekMatchups[mwmid].append(matchup)
+                    isFirstGameOfMatchup = False
+                else:
+                    self.multiWeekMatchups[mwmid] = [matchup]
+
+                # count regular season games in league median years as 2 games
+                numberOfGames = (
+                    2
+                    if self.__leagueMedianGames
+                    and matchup.matchupType == MatchupType.REGULAR_SEASON
+                    else 1
+                )
+                for teamId in (matchup.teamAId, matchup.teamBId):
+                    self.__numberOfGamesPlayed[teamId] += 1
+                    self.__numberOfGamesPlayedMedianAsTwo[teamId] += numberOfGames
+                    if isFirstGameOfMatchup:
+                        self.__numberOfGamesPlayedMultiWeekAsOne[teamId] += 1
+                        self.__numberOfGamesPlayedMultiWeekAsOneMedianAsTwo[teamId] += (
+                            numberOfGames
+                        )
+
+                self.__pointsScored[matchup.teamAId] += self._toNumber(
+                    matchup.teamAScore
+                )
+                self.__pointsScored[matchup.teamBId] += self._toNumber(
+                    matchup.teamBScore
+                )
+                self.__opponentPointsScored[matchup.teamAId] += self._toNumber(
+                    matchup.teamBScore
+                )
+                self.__opponentPointsScored[matchup.teamBId] += self._toNumber(
+                    matchup.teamAScore
+                )
+            self.__weeksAndMatchups.append((week, weekMatchups))
+
+    ####################
+    # Helper functions #
+    ####################
+
+    def __setToNoneIfNoGamesPlayed(self, responseDict: dict) -> dict:
+        numberOfGamesPlayed = self.get("numberOfGamesPlayed")
+        for teamId in responseDict:
+            if numberOfGamesPlayed[teamId] == 0:
+                responseDict[teamId] = None
+        return responseDict
+
+    def __checkMultiWeekMatchupsAreIncluded(self) -> None:
+        if not self.filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
+
+    def __getPerGame(
+        self, teamIdAndStat: dict, numberOfGamesPlayedStatName: str
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndNumberOfGamesPlayed = self.get(numberOfGamesPlayedStatName)
+        teamIdAndStatPerGame = dict()
+        for teamId in self.__allTeamIds:
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                teamIdAndStatPerGame[teamId] = None
+            else:
+                teamIdAndStatPerGame[teamId] = (
+                    teamIdAndStat[teamId] / teamIdAndNumberOfGamesPlayed[teamId]
+                )
+        return teamIdAndStatPerGame
+
+    @staticmethod
+    def __getWeekScores(
+        weekMatchups: list[Matchup], opponentScores: bool
+    ) -> dict[str, float | int]:
+        # same as WeekNavigator.getTeamIdsAndScores() / WeekNavigator.getTeamIdsAndOpponentScores()
+        teamIdAndScores = dict()
+        for matchup in weekMatchups:
+            if opponentScores:
+                teamIdAndScores[matchup.teamAId] = matchup.teamBScore
+                teamIdAndScores[matchup.teamBId] = matchup.teamAScore
+            else:
+                teamIdAndScores[matchup.teamAId] = matchup.teamAScore
+                teamIdAndScores[matchup.teamBId] = matchup.teamBScore
+        return teamIdAndScores
+
+    ###################
+    # Building blocks #
+    ###################
+
+    def _calculateNumberOfGamesPlayed(self) -> dict[str, int]:
+        return self.__numberOfGamesPlayed
+
+    def _calculateNumberOfGamesPlayedMultiWeekMatchupsAsOneGame(self) -> dict[str, int]:
+        return self.__numberOfGamesPlayedMultiWeekAsOne
+
+    def _calculateNumberOfGamesPlayedLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__numberOfGamesPlayedMedianAsTwo
+
+    def _calculateNumberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__numberOfGamesPlayedMultiWeekAsOneMedianAsTwo
+
+    def _calculateSimplifiedMatchups(self) -> list[Matchup]:
+        # non multi-week matchups first, then one simplified matchup per multi-week matchup
+        simplifiedMatchups = list(self.singleWeekMatchups)
+        for matchupList in self.multiWeekMatchups.values():
+            simplifiedMatchups.append(
+                MatchupNavigator.simplifyMultiWeekMatchups(matchupList)
+            )
+        return simplifiedMatchups
+
+    def _calculateAllScoresInYear(self) -> list[float | int]:
+        # the filtered matchups are every matchup in the Year when the default filters are used
+        if self.filters == YearFilters.getForYear(self.year):
+            simplifiedMatchups = self.get("simplifiedMatchups")
+            return [matchup.teamAScore for matchup in simplifiedMatchups] + [
+                matchup.teamBScore for matchup in simplifiedMatchups
+            ]
+        return YearNavigator.getAllScoresInYear(
+            self.year, simplifyMultiWeekMatchups=True, yearIndex=self.__yearIndex
+        )
+
+    def _calculateYearIndex(self) -> YearIndex:
+        return (
+            self.__yearIndex if self.__yearIndex is not None else YearIndex(self.year)
+        )
+
+    def _calculateScoreIndex(self) -> ScoreIndex:
+        return ScoreIndex(self.get("allScoresInYear"))
+
+    ################
+    # Team Summary #
+    ################
+
+    def _calculateGamesPlayed(self) -> dict[str, int]:
+        self.__checkMultiWeekMatchupsAreIncluded()
+        teamIdAndGamesPlayed = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndGamesPlayed[teamId] = 0
+        for matchup in self.get("simplifiedMatchups"):
+            teamIdAndGamesPlayed[matchup.teamAId] += 1
+            teamIdAndGamesPlayed[matchup.teamBId] += 1
+        return teamIdAndGamesPlayed
+
+    def _calculateTotalGames(self) -> dict[str, int]:
+        return dict(self.get("numberOfGamesPlayedLeagueMedianGamesAsTwoGames"))
+
+    ################
+    # Game Outcome #
+    ################
+
+    def _calculateWins(self) -> dict[str, Optional[int]]:
+        teamIdAndWins = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndWins[teamId] = 0
+        for matchup in self.get("simplifiedMatchups"):
+            winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+            if winnerTeamId is not None:
+                teamIdAndWins[winnerTeamId] += 1
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndWins)
+
+    def _calculateLosses(self) -> dict[str, Optional[int]]:
+        teamIdAndLosses = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndLosses[teamId] = 0
+        for matchup in self.get("simplifiedMatchups"):
+            winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+            if winnerTeamId is not None:
+                loserTeamId = (
+                    matchup.teamAId
+                    if winnerTeamId == matchup.teamBId
+                    else matchup.teamBId
+                )
+                teamIdAndLosses[loserTeamId] += 1
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndLosses)
+
+    def _calculateTies(self) -> dict[str, Optional[int]]:
+        teamIdAndTies = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndTies[teamId] = 0
+        for matchup in self.get("simplifiedMatchups"):
+            if MatchupNavigator.getTeamIdOfMatchupWinner(matchup) is None:
+                teamIdAndTies[matchup.teamAId] += 1
+                teamIdAndTies[matchup.teamBId] += 1
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndTies)
+
+    def __getLeagueMedianWins(self, opponentScores: bool) -> dict[str, Optional[Deci]]:
+        teamIdAndLeagueMedianWins = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndLeagueMedianWins[teamId] = self._toNumber("0")
+
+        if not self.year.yearSettings.leagueMedianGames:
+            return teamIdAndLeagueMedianWins
+
+        for week, weekMatchups in self.__weeksAndMatchups:
+            if len(weekMatchups) > 0 and week.isRegularSeasonWeek:
+                leagueMedianScore = MatchupNavigator.getMedianScore(weekMatchups)
+                teamIdAndScoreList: list[tuple[str, float | int]] = list()
+                for matchup in weekMatchups:
+                    if opponentScores:
+                        teamIdAndScoreList.append((matchup.teamAId, matchup.teamBScore))
+                        teamIdAndScoreList.append((matchup.teamBId, matchup.teamAScore))
+                    else:
+                        teamIdAndScoreList.append((matchup.teamAId, matchup.teamAScore))
+                        teamIdAndScoreList.append((matchup.teamBId, matchup.teamBScore))
+                # sort by score highest -> lowest
+                teamIdAndScoreList.sort(key=lambda x: x[1], reverse=True)
+                # teams with a score greater than the league median get a win
+                # team with a score equal to the league median get a tie
+                for teamId, score in teamIdAndScoreList:
+                    if score > leagueMedianScore:
+                        teamIdAndLeagueMedianWins[teamId] += self._toNumber("1")
+                    elif score == leagueMedianScore:
+                        teamIdAndLeagueMedianWins[teamId] += self._toNumber("0.5")
+
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndLeagueMedianWins)
+
+    def _calculateLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getLeagueMedianWins(opponentScores=False)
+
+    def _calculateOpponentLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getLeagueMedianWins(opponentScores=True)
+
+    def _calculateWinPercentage(self) -> dict[str, Optional[Deci]]:
+        teamIdAndWins = self.get("wins")
+        teamIdAndLosses = self.get("losses")
+        teamIdAndTies = self.get("ties")
+        teamIdAndLeagueMedianWins = self.get("leagueMedianWins")
+
+        teamIdAndWinPercentage = dict()
+        for teamId in self.__allTeamIds:
+            numberOfWins = teamIdAndWins[teamId]
+            numberOfLosses = teamIdAndLosses[teamId]
+            numberOfTies = teamIdAndTies[teamId]
+            numberOfLeagueMedianWins = teamIdAndLeagueMedianWins[teamId]
+            if None in (
+                numberOfWins,
+                numberOfLosses,
+                numberOfTies,
+                numberOfLeagueMedianWins,
+            ):
+                teamIdAndWinPercentage[teamId] = None
+            else:
+                numberOfGamesPlayed = numberOfWins + numberOfLosses + numberOfTies
+                totalWins = numberOfWins
+                if self.year.yearSettings.leagueMedianGames:
+                    # add another game played for each regular season game if league median games is on in year settings
+                    numberOfGamesPlayed = self.get(
+                        "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames"
+                    )[teamId]
+                    totalWins += numberOfLeagueMedianWins
+                teamIdAndWinPercentage[teamId] = (
+                    self._toNumber(totalWins)
+                    + (self._toNumber("0.5") * self._toNumber(numberOfTies))
+                ) / self._toNumber(numberOfGamesPlayed)
+        return teamIdAndWinPercentage
+
+    def _calculateWal(self) -> dict[str, Optional[Deci]]:
+        teamIdAndWins = self.get("wins")
+        teamIdAndTies = self.get("ties")
+        teamIdAndLeagueMedianWins = self.get("leagueMedianWins")
+
+        teamIdAndWAL = dict()
+        for teamId in self.__allTeamIds:
+            wins = teamIdAndWins[teamId]
+            ties = teamIdAndTies[teamId]
+            leagueMedianWins = teamIdAndLeagueMedianWins[teamId]
+            if None in (wins, ties):
+                teamIdAndWAL[teamId] = None
+            else:
+                teamIdAndWAL[teamId] = self._toNumber(wins) + (
+                    self._toNumber("0.5") * self._toNumber(ties)
+                )
+
+            if (
+                self.year.yearSettings.leagueMedianGames is True
+                and leagueMedianWins is not None
+            ):
+                if teamIdAndWAL[teamId] is None:
+                    teamIdAndWAL[teamId] = self._toNumber(leagueMedianWins)
+                else:
+                    teamIdAndWAL[teamId] += self._toNumber(leagueMedianWins)
+        return teamIdAndWAL
+
+    def _calculateWalPerGame(self) -> dict[str, Optional[Deci]]:
+        teamIdAndWAL = self.get("wal")
+        teamIdAndNumberOfGamesPlayed = self.get(
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGameLeagueMedianGamesAsTwoGames"
+        )
+        teamIdAndWALPerGame = dict()
+        for teamId in self.__allTeamIds:
+            # to avoid division by zero, we'll just set the WAL per game to 0 if the team has no games played
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                teamIdAndWALPerGame[teamId] = self._toNumber("0")
+            else:
+                teamIdAndWALPerGame[teamId] = (
+                    teamIdAndWAL[teamId] / teamIdAndNumberOfGamesPlayed[teamId]
+                )
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndWALPerGame)
+
+    ########
+    # AWAL #
+    ########
+
+    def __getAWAL(self, opponentScores: bool) -> dict[str, Optional[Deci]]:
+        teamIdAndAWAL = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndAWAL[teamId] = self._toNumber(0)
+
+        teamIdAndWeeklyAWAL = AWALYearCalculator.getWeeklyAWAL(
+            self.get("yearIndex"),
+            self.filters,
+            opponentScores=opponentScores,
+            numericMode=self.numericMode,
+        )
+        for teamId, weeklyAWAL in teamIdAndWeeklyAWAL.items():
+            teamIdAndAWAL[teamId] += weeklyAWAL
+
+        # add league median wins if applicable
+        if self.year.yearSettings.leagueMedianGames:
+            teamIdAndLeagueMedianWins = self.get(
+                "opponentLeagueMedianWins" if opponentScores else "leagueMedianWins"
+            )
+            for teamId in self.__allTeamIds:
+                teamIdAndAWAL[teamId] = GeneralUtil.safeSum(
+                    teamIdAndAWAL[teamId], teamIdAndLeagueMedianWins[teamId]
+                )
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndAWAL)
+
+    def _calculateAwal(self) -> dict[str, Optional[Deci]]:
+        return self.__getAWAL(opponentScores=False)
+
+    def _calculateAwalPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("awal"), "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"
+        )
+
+    def _calculateOpponentAWAL(self) -> dict[str, Optional[Deci]]:
+        return self.__getAWAL(opponentScores=True)
+
+    def _calculateOpponentAWALPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentAWAL"), "numberOfGamesPlayedLeagueMedianGamesAsTwoGames"
+        )
+
+    ##############
+    # Smart Wins #
+    ##############
+
+    def __getSmartWins(self, opponentScores: bool) -> dict[str, Optional[Deci]]:
+        self.__checkMultiWeekMatchupsAreIncluded()
+        # get all scores we want to include in our smart wins calculation
+        teamIdsAndScores = list()
+        for matchup in self.get("simplifiedMatchups"):
+            if opponentScores:
+                teamIdsAndScores.append((matchup.teamAId, matchup.teamBScore))
+                teamIdsAndScores.append((matchup.teamBId, matchup.teamAScore))
+            else:
+                teamIdsAndScores.append((matchup.teamAId, matchup.teamAScore))
+                teamIdsAndScores.append((matchup.teamBId, matchup.teamBScore))
+
+        teamIdAndSmartWins = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndSmartWins[teamId] = self._toNumber(0)
+
+        scoreIndex = self.get("scoreIndex")
+        scoresBeatAndTied = scoreIndex.getNumberOfScoresBeatAndTied(
+            [score for _, score in teamIdsAndScores]
+        )
+        for (teamId, _), (scoresBeat, scoresTied) in zip(
+            teamIdsAndScores, scoresBeatAndTied
+        ):
+            smartWins = (scoresBeat + (scoresTied / self._toNumber("2"))) / (
+                scoreIndex.numberOfScores - self._toNumber("1")
+            )
+            teamIdAndSmartWins[teamId] += smartWins
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndSmartWins)
+
+    def _calculateSmartWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getSmartWins(opponentScores=False)
+
+    def _calculateSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("smartWins"), "numberOfGamesPlayedMultiWeekMatchupsAsOneGame"
+        )
+
+    def _calculateOpponentSmartWins(self) -> dict[str, Optional[Deci]]:
+        return self.__getSmartWins(opponentScores=True)
+
+    def _calculateOpponentSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentSmartWins"),
+            "numberOfGamesPlayedMultiWeekMatchupsAsOneGame",
+        )
+
+    #################
+    # Points Scored #
+    #################
+
+    def _calculatePointsScored(self) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(dict(self.__pointsScored))
+
+    def _calculatePointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(self.get("pointsScored"), "numberOfGamesPlayed")
+
+    def _calculateOpponentPointsScored(self) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(dict(self.__opponentPointsScored))
+
+    def _calculateOpponentPointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return self.__getPerGame(
+            self.get("opponentPointsScored"), "numberOfGamesPlayed"
+        )
+
+    #################
+    # Scoring Share #
+    #################
+
+    def __getScoringShare(
+        self, teamIdAndPointsScored: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        allScores = GeneralUtil.filter(value=None, list_=teamIdAndPointsScored.values())
+        totalPointsScoredInYear = sum(allScores)
+        teamIdAndScoringShare = dict()
+        for teamId in self.__allTeamIds:
+            if len(allScores) == 0 or teamIdAndPointsScored[teamId] is None:
+                teamIdAndScoringShare[teamId] = None
+            # avoid division by 0
+            elif totalPointsScoredInYear == 0:
+                teamIdAndScoringShare[teamId] = self._toNumber("0")
+            else:
+                teamIdAndScoringShare[teamId] = (
+                    teamIdAndPointsScored[teamId] / totalPointsScoredInYear
+                ) * self._toNumber(100)
+        return teamIdAndScoringShare
+
+    def _calculateScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShare(self.get("pointsScored"))
+
+    def _calculateOpponentScoringShare(self) -> dict[str, Optional[Deci]]:
+        return self.__getScoringShare(self.get("opponentPointsScored"))
+
+    def _calculateMaxScoringShare(self) -> dict[str, Optional[Deci]]:
+        teamIdAndMaxScoringShare = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndMaxScoringShare[teamId] = self._toNumber(0)
+
+        for _, weekMatchups in self.__weeksAndMatchups:
+            totalPointsScoredInWeek = sum(
+                self.__getWeekScores(weekMatchups, opponentScores=False).values()
+            )
+            # avoid division by 0
+            if totalPointsScoredInWeek == 0:
+                continue
+            for matchup in weekMatchups:
+                teamAScoringShare = (
+                    self._toNumber(matchup.teamAScore)
+                    / self._toNumber(totalPointsScoredInWeek)
+                ) * self._toNumber("100")
+                teamBScoringShare = (
+                    self._toNumber(matchup.teamBScore)
+                    / self._toNumber(totalPointsScoredInWeek)
+                ) * self._toNumber("100")
+                teamIdAndMaxScoringShare[matchup.teamAId] = max(
+                    teamAScoringShare, teamIdAndMaxScoringShare[matchup.teamAId]
+                )
+                teamIdAndMaxScoringShare[matchup.teamBId] = max(
+                    teamBScoringShare, teamIdAndMaxScoringShare[matchup.teamBId]
+                )
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndMaxScoringShare)
+
+    def _calculateMinScoringShare(self) -> dict[str, Optional[Deci]]:
+        teamIdAndMinScoringShare = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndMinScoringShare[teamId] = None
+
+        for _, weekMatchups in self.__weeksAndMatchups:
+            totalPointsScoredInWeek = sum(
+                self.__getWeekScores(weekMatchups, opponentScores=False).values()
+            )
+            for matchup in weekMatchups:
+                # avoid division by 0
+                if totalPointsScoredInWeek == 0:
+                    for teamId in self.__allTeamIds:
+                        teamIdAndMinScoringShare[teamId] = self._toNumber("0")
+                    continue
+                teamAScoringShare = (
+                    self._toNumber(matchup.teamAScore)
+                    / self._toNumber(totalPointsScoredInWeek)
+                ) * self._toNumber("100")
+                teamBScoringShare = (
+                    self._toNumber(matchup.teamBScore)
+                    / self._toNumber(totalPointsScoredInWeek)
+                ) * self._toNumber("100")
+                if teamIdAndMinScoringShare[matchup.teamAId] is None:
+                    teamIdAndMinScoringShare[matchup.teamAId] = teamAScoringShare
+                else:
+                    teamIdAndMinScoringShare[matchup.teamAId] = min(
+                        teamAScoringShare, teamIdAndMinScoringShare[matchup.teamAId]
+                    )
+                if teamIdAndMinScoringShare[matchup.teamBId] is None:
+                    teamIdAndMinScoringShare[matchup.teamBId] = teamBScoringShare
+                else:
+                    teamIdAndMinScoringShare[matchup.teamBId] = min(
+                        teamBScoringShare, teamIdAndMinScoringShare[matchup.teamBId]
+                    )
+        return self.__setToNoneIfNoGamesPlayed(teamIdAndMinScoringShare)
+
+    ################
+    # Single Score #
+    ################
+
+    def _calculateMaxScore(self) -> dict[str, Optional[float | int]]:
+        teamIdAndMaxScore = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndMaxScore[teamId] = None
+        for matchup in self.filteredMatchups:
+            aPreviousMaxScore = teamIdAndMaxScore[matchup.teamAId]
+            if aPreviousMaxScore is None or matchup.teamAScore > aPreviousMaxScore:
+                teamIdAndMaxScore[matchup.teamAId] = matchup.teamAScore
+
+            bPreviousMaxScore = teamIdAndMaxScore[matchup.teamBId]
+            if bPreviousMaxScore is None or matchup.teamBScore > bPreviousMaxScore:
+                teamIdAndMaxScore[matchup.teamBId] = matchup.teamBScore
+        return teamIdAndMaxScore
+
+    def _calculateMinScore(self) -> dict[str, Optional[float | int]]:
+        teamIdAndMinScore = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndMinScore[teamId] = None
+        for matchup in self.filteredMatchups:
+            aPreviousMinScore = teamIdAndMinScore[matchup.teamAId]
+            if aPreviousMinScore is None or matchup.teamAScore < aPreviousMinScore:
+                teamIdAndMinScore[matchup.teamAId] = matchup.teamAScore
+
+            bPreviousMinScore = teamIdAndMinScore[matchup.teamBId]
+            if bPreviousMinScore is None or matchup.teamBScore < bPreviousMinScore:
+                teamIdAndMinScore[matchup.teamBId] = matchup.teamBScore
+        return teamIdAndMinScore
+
+    ##############################
+    # Scoring Standard Deviation #
+    ##############################
+
+    def _calculateScoringStandardDeviation(self) -> dict[str, Optional[Deci]]:
+        self.__checkMultiWeekMatchupsAreIncluded()
+        teamIdAndScores = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndScores[teamId] = list()
+        for matchup in self.get("simplifiedMatchups"):
+            teamIdAndScores[matchup.teamAId].append(self._toNumber(matchup.teamAScore))
+            teamIdAndScores[matchup.teamBId].append(self._toNumber(matchup.teamBScore))
+
+        teamIdAndScoringStandardDeviation = dict()
+        for teamId in self.__allTeamIds:
+            if len(teamIdAndScores[teamId]) > 0:
+                teamIdAndScoringStandardDeviation[teamId] = self._toNumber(
+                    numpy.std(teamIdAndScores[teamId])
+                )
+            else:
+                teamIdAndScoringStandardDeviation[teamId] = None
+        return teamIdAndScoringStandardDeviation
+
+    ##############
+    # Plus Minus #
+    ##############
+
+    def _calculatePlusMinus(self) -> dict[str, Optional[Deci]]:
+        teamIdAndPointsScored = self.get("pointsScored")
+        teamIdAndOpponentPointsScored = self.get("opponentPointsScored")
+        teamIdAndPlusMinus = dict()
+        for teamId in self.__allTeamIds:
+            pointsScored = teamIdAndPointsScored[teamId]
+            opponentPointsScored = teamIdAndOpponentPointsScored[teamId]
+            if None in (pointsScored, opponentPointsScored):
+                teamIdAndPlusMinus[teamId] = None
+            else:
+                teamIdAndPlusMinus[teamId] = pointsScored - opponentPointsScored
+        return teamIdAndPlusMinus
+
+    #######
+    # SSL #
+    #######
+
+    def __getSSLStat(self, perGameStatName: str) -> dict[str, Optional[Deci]]:
+        teamIdAndPerGame = self.get(perGameStatName)
+        teamIdAndScoringShare = self.get("scoringShare")
+        teamIdAndMaxScore = self.get("maxScore")
+        teamIdAndMinScore = self.get("minScore")
+        teamIdAndSSLStat = dict()
+        for teamId in self.__allTeamIds:
+            teamIdAndSSLStat[teamId] = SSLYearCalculator.getSSLValue(
+                teamIdAndPerGame[teamId],
+                teamIdAndScoringShare[teamId],
+                teamIdAndMaxScore[teamId],
+                teamIdAndMinScore[teamId],
+                numericMode=self.numericMode,
+            )
+        return teamIdAndSSLStat
+
+    def _calculateTeamScore(self) -> dict[str, Optional[Deci]]:
+        return self.__getSSLStat("awalPerGame")
+
+    def _calculateTeamSuccess(self) -> dict[str, Optional[Deci]]:
+        return self.__getSSLStat("walPerGame")
+
+    def _calculateTeamLuck(self) -> dict[str, Optional[Deci]]:
+        teamIdAndTeamScore = self.get("teamScore")
+        teamIdAndTeamSuccess = self.get("teamSuccess")
+        teamIdAndTeamLuck = dict()
+        for teamId in self.__allTeamIds:
+            teamScore = teamIdAndTeamScore[teamId]
+            teamSuccess = teamIdAndTeamSuccess[teamId]
+            if None in (teamScore, teamSuccess):
+                teamIdAndTeamLuck[teamId] = None
+            else:
+                teamIdAndTeamLuck[teamId] = teamSuccess - teamScore
+        return teamIdAndTeamLuck
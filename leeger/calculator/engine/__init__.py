@@ -0,0 +1,3 @@
+from .AllTimeStatSheetEngine import AllTimeStatSheetEngine
+from .StatSheetEngine import StatSheetEngine
+from .YearStatSheetEngine import YearStatSheetEngine
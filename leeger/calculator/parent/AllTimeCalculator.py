@@ -5,6 +5,7 @@ from leeger.model.filter.AllTimeFilters import AllTimeFilters
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.util.Deci import Deci
+from leeger.util.index import LeagueIndex
 from leeger.util.navigator import MatchupNavigator
 from leeger.util.navigator.LeagueNavigator import LeagueNavigator
 
@@ -14,6 +15,28 @@ class AllTimeCalculator:
     Should be inherited by all All-Time calculators
     """
 
+    @classmethod
+    def _getLeagueIndex(cls, league: League, **kwargs) -> Optional[LeagueIndex]:
+        """
+        Returns the LeagueIndex given in the kwargs as "leagueIndex" if it was built from the given League.
+        Returns None otherwise.
+        """
+        leagueIndex = kwargs.get("leagueIndex")
+        if isinstance(leagueIndex, LeagueIndex) and leagueIndex.isIndexFor(league):
+            return leagueIndex
+        return None
+
+    @classmethod
+    def _getYearIndexKwargs(
+        cls, yearNumber: int, leagueIndex: Optional[LeagueIndex]
+    ) -> dict:
+        """
+        Returns the kwargs needed to pass the YearIndex for the given year number into a YearCalculator method.
+        """
+        if leagueIndex is None:
+            return dict()
+        return {"yearIndex": leagueIndex.getYearIndex(yearNumber)}
+
     @classmethod
     def _addAndCombineResults(
         cls, league: League, function: callable, **kwargs
@@ -34,6 +57,7 @@ class AllTimeCalculator:
         """
 
         allResultDicts = cls.__getAllResultDicts(league, function, **kwargs)
+        leagueIndex = cls._getLeagueIndex(league, **kwargs)
 
         # this will keep track of whether an Owner has had a non-None result
         ownerIdAndWhetherOwnerHasHadAValidResult: dict[str, bool] = dict()
@@ -52,9 +76,13 @@ class AllTimeCalculator:
                 # check if this is a valid result
                 if resultDict[teamId] is None:
                     continue
-                team = LeagueNavigator.getTeamById(league, teamId)
-                result[team.ownerId] += resultDict[teamId]
-                ownerIdAndWhetherOwnerHasHadAValidResult[team.ownerId] = True
+                ownerId = (
+                    leagueIndex.getOwnerIdForTeamId(teamId)
+                    if leagueIndex is not None
+                    else LeagueNavigator.getTeamById(league, teamId).ownerId
+                )
+                result[ownerId] += resultDict[teamId]
+                ownerIdAndWhetherOwnerHasHadAValidResult[ownerId] = True
 
         # set None for each Owner that did not have a single valid result
         for ownerId in ownerIdAndWhetherOwnerHasHadAValidResult:
@@ -72,6 +100,7 @@ class AllTimeCalculator:
         """
 
         allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        leagueIndex = cls._getLeagueIndex(league, **kwargs)
 
         # parse filters
         yearWeekNumberStartWeekNumberEnd: list[tuple] = list()
@@ -122,6 +151,7 @@ class AllTimeCalculator:
                     weekNumberStart=currentWeekNumberStart,
                     weekNumberEnd=currentWeekNumberEnd,
                     validate=kwargs.get("validate", True),
+                    **cls._getYearIndexKwargs(currentYear.yearNumber, leagueIndex),
                 )
             )
         return allResultDicts
@@ -135,6 +165,7 @@ class AllTimeCalculator:
         """
 
         allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        leagueIndex = cls._getLeagueIndex(league, **kwargs)
 
         # parse filters
         yearWeekNumberStartWeekNumberEnd: list[tuple] = list()
@@ -184,6 +215,7 @@ class AllTimeCalculator:
                 weekNumberStart=currentWeekNumberStart,
                 weekNumberEnd=currentWeekNumberEnd,
                 validate=kwargs.get("validate", True),
+                **cls._getYearIndexKwargs(currentYear.yearNumber, leagueIndex),
             )
         return allResultDicts
 
@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, Optional
 
 from leeger.model.filter.YearFilters import YearFilters
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Year import Year
+from leeger.util.index import MatchupSelectionCache, YearIndex
 from leeger.util.navigator.YearNavigator import YearNavigator
 
 
@@ -11,21 +12,41 @@ class YearCalculator:
     Should be inherited by all Year calculators
     """
 
+    @classmethod
+    def _getYearIndex(cls, year: Year, **kwargs) -> Optional[YearIndex]:
+        """
+        Returns the YearIndex given in the kwargs as "yearIndex" if it was built from the given Year.
+        Returns None otherwise.
+        """
+        yearIndex = kwargs.get("yearIndex")
+        if isinstance(yearIndex, YearIndex) and yearIndex.isIndexFor(year):
+            return yearIndex
+        return None
+
     @classmethod
     def _getAllFilteredMatchups(
         cls, year: Year, yearFilters: YearFilters, **kwargs
-    ) -> list[Matchup]:
+    ) -> tuple[Matchup, ...]:
         """
         Returns all Matchups in the given Year that are remaining after the given filters are applied.
+        The returned Matchups are shared with every other call for the same Year and filters and should not be changed.
         """
-        allFilteredMatchups: list[Matchup] = list()
-        for i in range(yearFilters.weekNumberStart - 1, yearFilters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in yearFilters.includeMatchupTypes:
-                    allFilteredMatchups.append(matchup)
+        yearIndex = cls._getYearIndex(year, **kwargs)
+        if yearIndex is not None:
+            return tuple(yearIndex.getFilteredMatchups(yearFilters))
+
+        def selectAllFilteredMatchups() -> tuple[Matchup, ...]:
+            allFilteredMatchups: list[Matchup] = list()
+            for i in range(yearFilters.weekNumberStart - 1, yearFilters.weekNumberEnd):
+                week = year.weeks[i]
+                for matchup in week.matchups:
+                    if matchup.matchupType in yearFilters.includeMatchupTypes:
+                        allFilteredMatchups.append(matchup)
+            return tuple(allFilteredMatchups)
 
-        return allFilteredMatchups
+        return MatchupSelectionCache.get(
+            "filteredMatchups", year, yearFilters, selectAllFilteredMatchups
+        )
 
     @classmethod
     def _setToNoneIfNoGamesPlayed(
@@ -44,7 +65,7 @@ class YearCalculator:
             else YearFilters.getForYear(year, **kwargs)
         )
         teamIdAndNumberOfGamesPlayed = YearNavigator.getNumberOfGamesPlayed(
-            year, yearFilters
+            year, yearFilters, yearIndex=cls._getYearIndex(year, **kwargs)
         )
 
         for teamId in responseDict:
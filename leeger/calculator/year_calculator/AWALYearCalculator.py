@@ -1,16 +1,19 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
     GameOutcomeYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
+from leeger.enum.NumericMode import NumericMode
 from leeger.model.filter import YearFilters
-from leeger.model.filter.WeekFilters import WeekFilters
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
 from leeger.util.GeneralUtil import GeneralUtil
-from leeger.util.navigator.WeekNavigator import WeekNavigator
+from leeger.util.index import YearIndex
 from leeger.util.navigator.YearNavigator import YearNavigator
 
 
@@ -20,6 +23,7 @@ class AWALYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getAWAL(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -52,39 +56,13 @@ class AWALYearCalculator(YearCalculator):
         for teamId in allTeamIds:
             teamIdAndAWAL[teamId] = Deci(0)
 
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            opponentsInWeek = (
-                WeekNavigator.getNumberOfValidTeamsInWeek(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-                - 1
-            )
-            teamsOutscored = dict()
-            teamsTied = dict()
-            for teamId in allTeamIds:
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-            allTeamIdsAndScoresForWeek = WeekNavigator.getTeamIdsAndScores(
-                week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-            )
-            allScores = allTeamIdsAndScoresForWeek.values()
-
-            for teamId in allTeamIdsAndScoresForWeek.keys():
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-                score = allTeamIdsAndScoresForWeek[teamId]
-                for s in allScores:
-                    if score > s:
-                        teamsOutscored[teamId] += 1
-                    if score == s:
-                        teamsTied[teamId] += 1
-                # remove 1 from the teamsTied tracker since we will always find a tie for this team's score in the list of all scores in the week
-                teamsTied[teamId] -= 1
-                # calculate the AWAL for each team for this week
-                teamIdAndAWAL[teamId] += (
-                    Deci(teamsOutscored[teamId]) * (Deci(1) / Deci(opponentsInWeek))
-                ) + (Deci(teamsTied[teamId]) * (Deci(0.5) / Deci(opponentsInWeek)))
+        # a YearIndex with no Matchups is falsy, so it is checked against None
+        yearIndex = cls._getYearIndex(year, **kwargs)
+        teamIdAndWeeklyAWAL = cls.getWeeklyAWAL(
+            yearIndex if yearIndex is not None else YearIndex(year), filters
+        )
+        for teamId, weeklyAWAL in teamIdAndWeeklyAWAL.items():
+            teamIdAndAWAL[teamId] += weeklyAWAL
 
         # add league median wins if applicable
         if year.yearSettings.leagueMedianGames:
@@ -101,6 +79,81 @@ class AWALYearCalculator(YearCalculator):
         return teamIdAndAWAL
 
     @classmethod
+    def getWeeklyAWAL(
+        cls,
+        yearIndex: YearIndex,
+        yearFilters: YearFilters,
+        *,
+        opponentScores=False,
+        numericMode: NumericMode = NumericMode.EXACT,
+    ) -> dict[str, Deci]:
+        """
+        Returns the AWAL each team in the given YearIndex earned from its weekly scores, without league median wins.
+        If opponentScores is True, returns the AWAL each team's opponents earned instead.
+        Teams that did not play in the filtered weeks are not included.
+        If numericMode is NumericMode.FLOAT, every week is added at once with floats and the AWAL values are floats.
+
+        Example response:
+            {
+            "someTeamId": Deci("8.7"),
+            "someOtherTeamId": Deci("11.2"),
+            "yetAnotherTeamId": Deci("7.1"),
+            ...
+            }
+        """
+        if numericMode == NumericMode.FLOAT:
+            return cls.__getWeeklyAWALAsFloats(
+                yearIndex, yearFilters, opponentScores=opponentScores
+            )
+        # most teams share a handful of (teams outscored, teams tied, teams in week) values,
+        # so each week's AWAL is only calculated once per distinct value
+        awalForScoreRank: dict[tuple[int, int, int], Deci] = dict()
+
+        teamIdAndWeeklyAWAL = dict()
+        for teamIndex, teamsOutscored, teamsTied, teamsInWeek in zip(
+            *[
+                array.tolist()
+                for array in yearIndex.getWeeklyScoreRanks(
+                    yearFilters, opponentScores=opponentScores
+                )
+            ]
+        ):
+            scoreRank = (teamsOutscored, teamsTied, teamsInWeek)
+            if scoreRank not in awalForScoreRank:
+                opponentsInWeek = teamsInWeek - 1
+                awalForScoreRank[scoreRank] = (
+                    Deci(teamsOutscored) * (Deci(1) / Deci(opponentsInWeek))
+                ) + (Deci(teamsTied) * (Deci(0.5) / Deci(opponentsInWeek)))
+            teamId = yearIndex.teamIds[teamIndex]
+            # weeks are added in order so the result matches adding them one week at a time
+            teamIdAndWeeklyAWAL[teamId] = (
+                teamIdAndWeeklyAWAL.get(teamId, Deci(0)) + awalForScoreRank[scoreRank]
+            )
+        return teamIdAndWeeklyAWAL
+
+    @staticmethod
+    def __getWeeklyAWALAsFloats(
+        yearIndex: YearIndex, yearFilters: YearFilters, *, opponentScores: bool
+    ) -> dict[str, numpy.float64]:
+        teamIndices, teamsOutscored, teamsTied, teamsInWeek = (
+            yearIndex.getWeeklyScoreRanks(yearFilters, opponentScores=opponentScores)
+        )
+        opponentsInWeek = teamsInWeek - 1
+        weeklyAWAL = teamsOutscored * (1 / opponentsInWeek) + teamsTied * (
+            0.5 / opponentsInWeek
+        )
+        numberOfTeams = len(yearIndex.teamIds)
+        awalByTeamIndex = numpy.bincount(
+            teamIndices, weights=weeklyAWAL, minlength=numberOfTeams
+        )
+        weeksByTeamIndex = numpy.bincount(teamIndices, minlength=numberOfTeams)
+        return {
+            yearIndex.teamIds[teamIndex]: awalByTeamIndex[teamIndex]
+            for teamIndex in numpy.flatnonzero(weeksByTeamIndex).tolist()
+        }
+
+    @classmethod
+    @memoizeInStatContext
     @validateYear
     def getAWALPerGame(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -121,6 +174,7 @@ class AWALYearCalculator(YearCalculator):
             year,
             YearFilters.getForYear(year, **kwargs),
             countLeagueMedianGamesAsTwoGames=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndAWALPerGame = dict()
@@ -136,6 +190,7 @@ class AWALYearCalculator(YearCalculator):
         return teamIdAndAWALPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentAWAL(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -157,41 +212,14 @@ class AWALYearCalculator(YearCalculator):
         for teamId in allTeamIds:
             teamIdAndOpponentAWAL[teamId] = Deci(0)
 
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            opponentsInWeek = (
-                WeekNavigator.getNumberOfValidTeamsInWeek(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-                - 1
-            )
-            teamsOutscored = dict()
-            teamsTied = dict()
-            for teamId in allTeamIds:
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-            allTeamIdsAndOpponentScoresForWeek = (
-                WeekNavigator.getTeamIdsAndOpponentScores(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-            )
-            allScores = allTeamIdsAndOpponentScoresForWeek.values()
-
-            for teamId in allTeamIdsAndOpponentScoresForWeek.keys():
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-                score = allTeamIdsAndOpponentScoresForWeek[teamId]
-                for s in allScores:
-                    if score > s:
-                        teamsOutscored[teamId] += 1
-                    if score == s:
-                        teamsTied[teamId] += 1
-                # remove 1 from the teamsTied tracker since we will always find a tie for this team's score in the list of all scores in the week
-                teamsTied[teamId] -= 1
-                # calculate the AWAL for each team's opponent for this week
-                teamIdAndOpponentAWAL[teamId] += (
-                    Deci(teamsOutscored[teamId]) * (Deci(1) / Deci(opponentsInWeek))
-                ) + (Deci(teamsTied[teamId]) * (Deci(0.5) / Deci(opponentsInWeek)))
+        yearIndex = cls._getYearIndex(year, **kwargs)
+        teamIdAndWeeklyOpponentAWAL = cls.getWeeklyAWAL(
+            yearIndex if yearIndex is not None else YearIndex(year),
+            filters,
+            opponentScores=True,
+        )
+        for teamId, weeklyOpponentAWAL in teamIdAndWeeklyOpponentAWAL.items():
+            teamIdAndOpponentAWAL[teamId] += weeklyOpponentAWAL
 
         # add league median wins if applicable
         if year.yearSettings.leagueMedianGames:
@@ -208,6 +236,7 @@ class AWALYearCalculator(YearCalculator):
         return teamIdAndOpponentAWAL
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentAWALPerGame(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -228,6 +257,7 @@ class AWALYearCalculator(YearCalculator):
             year,
             YearFilters.getForYear(year, **kwargs),
             countLeagueMedianGamesAsTwoGames=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndOpponentAWALPerGame = dict()
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league import Matchup
@@ -16,6 +17,7 @@ class GameOutcomeYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getWins(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -68,6 +70,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndWins
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getLosses(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -125,6 +128,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndLosses
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getTies(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -175,6 +179,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndTies
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getWinPercentage(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -226,6 +231,7 @@ class GameOutcomeYearCalculator(YearCalculator):
                         filters,
                         countMultiWeekMatchupsAsOneGame=True,
                         countLeagueMedianGamesAsTwoGames=True,
+                        yearIndex=cls._getYearIndex(year, **kwargs),
                     )[teamId]
                     totalWins += numberOfLeagueMedianWins
                 teamIdAndWinPercentage[teamId] = (
@@ -235,6 +241,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndWinPercentage
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getWAL(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -281,6 +288,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndWAL
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getWALPerGame(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -301,6 +309,7 @@ class GameOutcomeYearCalculator(YearCalculator):
             YearFilters.getForYear(year, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
             countLeagueMedianGamesAsTwoGames=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndWALPerGame = dict()
@@ -318,6 +327,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndWALPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getLeagueMedianWins(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -374,6 +384,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         return teamIdAndLeagueMedianWins
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentLeagueMedianWins(
         cls, year: Year, **kwargs
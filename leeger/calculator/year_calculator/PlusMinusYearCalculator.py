@@ -4,6 +4,7 @@ from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
     PointsScoredYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
@@ -16,6 +17,7 @@ class PlusMinusYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getPlusMinus(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
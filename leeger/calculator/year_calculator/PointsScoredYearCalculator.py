@@ -1,6 +1,7 @@
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
@@ -14,6 +15,7 @@ class PointsScoredYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getPointsScored(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -45,6 +47,7 @@ class PointsScoredYearCalculator(YearCalculator):
         return teamIdAndPointsScored
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getPointsScoredPerGame(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -62,7 +65,9 @@ class PointsScoredYearCalculator(YearCalculator):
 
         teamIdAndPointsScored = cls.getPointsScored(year, **kwargs)
         teamIdAndNumberOfGamesPlayed = YearNavigator.getNumberOfGamesPlayed(
-            year, YearFilters.getForYear(year, **kwargs)
+            year,
+            YearFilters.getForYear(year, **kwargs),
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndPointsScoredPerGame = dict()
@@ -79,6 +84,7 @@ class PointsScoredYearCalculator(YearCalculator):
         return teamIdAndPointsScoredPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentPointsScored(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -116,6 +122,7 @@ class PointsScoredYearCalculator(YearCalculator):
         return teamIdAndOpponentPointsScored
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentPointsScoredPerGame(
         cls, year: Year, **kwargs
@@ -135,7 +142,9 @@ class PointsScoredYearCalculator(YearCalculator):
 
         teamIdAndOpponentPointsScored = cls.getOpponentPointsScored(year, **kwargs)
         teamIdAndNumberOfGamesPlayed = YearNavigator.getNumberOfGamesPlayed(
-            year, YearFilters.getForYear(year, **kwargs)
+            year,
+            YearFilters.getForYear(year, **kwargs),
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndOpponentPointsScoredPerGame = dict()
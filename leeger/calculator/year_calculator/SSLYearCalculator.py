@@ -11,10 +11,13 @@ from leeger.calculator.year_calculator.ScoringShareYearCalculator import (
 from leeger.calculator.year_calculator.SingleScoreYearCalculator import (
     SingleScoreYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
+from leeger.enum.NumericMode import NumericMode
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.Numeric import Numeric
 
 
 class SSLYearCalculator(YearCalculator):
@@ -40,6 +43,35 @@ class SSLYearCalculator(YearCalculator):
     __MAX_AND_MIN_SCORE_MULTIPLIER: float = 0.05
 
     @classmethod
+    def getSSLValue(
+        cls,
+        perGame: Optional[Deci],
+        scoringShare: Optional[Deci],
+        maxScore: Optional[float | int],
+        minScore: Optional[float | int],
+        *,
+        numericMode: NumericMode = NumericMode.EXACT,
+    ) -> Optional[Deci]:
+        """
+        Returns the Team Score (when given AWAL Per Game) or Team Success (when given WAL Per Game) for a single team.
+        Returns None if any of the given stats is None.
+        If numericMode is NumericMode.FLOAT, the given stats should be floats and a float is returned.
+        """
+        # check if all stats could be found
+        if None in (perGame, scoringShare, maxScore, minScore):
+            return None
+        toNumber = Numeric.getNumberType(numericMode)
+        return (
+            (perGame * toNumber(cls.__AWAL_AND_WAL_PER_GAME_MULTIPLIER))
+            + (scoringShare * toNumber(cls.__SCORING_SHARE_MULTIPLIER))
+            + (
+                (toNumber(maxScore) + toNumber(minScore))
+                * toNumber(cls.__MAX_AND_MIN_SCORE_MULTIPLIER)
+            )
+        )
+
+    @classmethod
+    @memoizeInStatContext
     @validateYear
     def getTeamScore(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -60,30 +92,25 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
+        teamIdAndAWALPerGame = AWALYearCalculator.getAWALPerGame(year, **kwargs)
+        teamIdAndScoringShare = ScoringShareYearCalculator.getScoringShare(
+            year, **kwargs
+        )
+        teamIdAndMaxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)
+        teamIdAndMinScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)
+
         teamIdAndTeamScore = dict()
         for teamId in YearNavigator.getAllTeamIds(year):
-            awalPerGame = AWALYearCalculator.getAWALPerGame(year, **kwargs)[teamId]
-            scoringShare = ScoringShareYearCalculator.getScoringShare(year, **kwargs)[
-                teamId
-            ]
-            maxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)[teamId]
-            minScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)[teamId]
-
-            # check if all stats could be found
-            if None in (awalPerGame, scoringShare, maxScore, minScore):
-                teamIdAndTeamScore[teamId] = None
-            else:
-                teamIdAndTeamScore[teamId] = (
-                    (awalPerGame * Deci(cls.__AWAL_AND_WAL_PER_GAME_MULTIPLIER))
-                    + (scoringShare * Deci(cls.__SCORING_SHARE_MULTIPLIER))
-                    + (
-                        (Deci(maxScore) + Deci(minScore))
-                        * Deci(cls.__MAX_AND_MIN_SCORE_MULTIPLIER)
-                    )
-                )
+            teamIdAndTeamScore[teamId] = cls.getSSLValue(
+                teamIdAndAWALPerGame[teamId],
+                teamIdAndScoringShare[teamId],
+                teamIdAndMaxScore[teamId],
+                teamIdAndMinScore[teamId],
+            )
         return teamIdAndTeamScore
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getTeamSuccess(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -104,31 +131,26 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
+        teamIdAndWALPerGame = GameOutcomeYearCalculator.getWALPerGame(year, **kwargs)
+        teamIdAndScoringShare = ScoringShareYearCalculator.getScoringShare(
+            year, **kwargs
+        )
+        teamIdAndMaxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)
+        teamIdAndMinScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)
+
         teamIdAndTeamSuccess = dict()
         for teamId in YearNavigator.getAllTeamIds(year):
-            walPerGame = GameOutcomeYearCalculator.getWALPerGame(year, **kwargs)[teamId]
-            scoringShare = ScoringShareYearCalculator.getScoringShare(year, **kwargs)[
-                teamId
-            ]
-            maxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)[teamId]
-            minScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)[teamId]
-
-            # check if all stats could be found
-            if None in (walPerGame, scoringShare, maxScore, minScore):
-                teamIdAndTeamSuccess[teamId] = None
-            else:
-                teamIdAndTeamSuccess[teamId] = (
-                    (walPerGame * Deci(cls.__AWAL_AND_WAL_PER_GAME_MULTIPLIER))
-                    + (scoringShare * Deci(cls.__SCORING_SHARE_MULTIPLIER))
-                    + (
-                        (Deci(maxScore) + Deci(minScore))
-                        * Deci(cls.__MAX_AND_MIN_SCORE_MULTIPLIER)
-                    )
-                )
+            teamIdAndTeamSuccess[teamId] = cls.getSSLValue(
+                teamIdAndWALPerGame[teamId],
+                teamIdAndScoringShare[teamId],
+                teamIdAndMaxScore[teamId],
+                teamIdAndMinScore[teamId],
+            )
 
         return teamIdAndTeamSuccess
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getTeamLuck(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -149,10 +171,13 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
+        teamIdAndTeamScore = cls.getTeamScore(year, **kwargs)
+        teamIdAndTeamSuccess = cls.getTeamSuccess(year, **kwargs)
+
         teamIdAndTeamLuck = dict()
         for teamId in YearNavigator.getAllTeamIds(year):
-            teamScore = cls.getTeamScore(year, **kwargs)[teamId]
-            teamSuccess = cls.getTeamSuccess(year, **kwargs)[teamId]
+            teamScore = teamIdAndTeamScore[teamId]
+            teamSuccess = teamIdAndTeamSuccess[teamId]
 
             if None in (teamScore, teamSuccess):
                 teamIdAndTeamLuck[teamId] = None
@@ -4,6 +4,7 @@ from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
     PointsScoredYearCalculator,
 )
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import WeekFilters, YearFilters
 from leeger.model.league.Year import Year
@@ -19,6 +20,7 @@ class ScoringShareYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getScoringShare(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -62,6 +64,7 @@ class ScoringShareYearCalculator(YearCalculator):
         return teamIdAndScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentScoringShare(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -107,6 +110,7 @@ class ScoringShareYearCalculator(YearCalculator):
         return teamIdAndOpponentScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getMaxScoringShare(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -158,6 +162,7 @@ class ScoringShareYearCalculator(YearCalculator):
         return teamIdAndMaxScoringShare
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getMinScoringShare(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -3,6 +3,7 @@ from typing import Optional
 import numpy
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
@@ -16,6 +17,7 @@ class ScoringStandardDeviationYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getScoringStandardDeviation(
         cls, year: Year, **kwargs
@@ -49,7 +51,9 @@ class ScoringStandardDeviationYearCalculator(YearCalculator):
         for teamId in allTeamIds:
             teamIdAndScores[teamId] = list()
 
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+        allMatchups = YearNavigator.getMatchupSelection(
+            year, filters, simplifyMultiWeekMatchups=True
+        )
         for matchup in allMatchups:
             teamIdAndScores[matchup.teamAId].append(Deci(matchup.teamAScore))
             teamIdAndScores[matchup.teamBId].append(Deci(matchup.teamBScore))
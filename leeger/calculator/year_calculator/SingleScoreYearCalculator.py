@@ -1,6 +1,7 @@
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
@@ -13,6 +14,7 @@ class SingleScoreYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getMaxScore(cls, year: Year, **kwargs) -> dict[str, Optional[float | int]]:
         """
@@ -48,6 +50,7 @@ class SingleScoreYearCalculator(YearCalculator):
         return teamIdAndMaxScore
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getMinScore(cls, year: Year, **kwargs) -> dict[str, Optional[float | int]]:
         """
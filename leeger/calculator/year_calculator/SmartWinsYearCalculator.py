@@ -1,10 +1,12 @@
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
+from leeger.util.index import ScoreIndex
 from leeger.util.navigator.YearNavigator import YearNavigator
 
 
@@ -14,6 +16,7 @@ class SmartWinsYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getSmartWins(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -37,32 +40,14 @@ class SmartWinsYearCalculator(YearCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = YearFilters.getForYear(year, **kwargs)
 
         # get all scores we want to include in our smart wins calculation
         teamIdsAndScores = list()
 
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+        allMatchups = YearNavigator.getMatchupSelection(
+            year, filters, simplifyMultiWeekMatchups=True
+        )
 
         for matchup in allMatchups:
             teamIdsAndScores.append((matchup.teamAId, matchup.teamAScore))
@@ -74,10 +59,16 @@ class SmartWinsYearCalculator(YearCalculator):
             teamIdAndSmartWins[teamId] = Deci(0)
 
         allScores = YearNavigator.getAllScoresInYear(
-            year, simplifyMultiWeekMatchups=True
+            year,
+            simplifyMultiWeekMatchups=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
+        )
+        scoresBeatAndTied = ScoreIndex(allScores).getNumberOfScoresBeatAndTied(
+            [score for _, score in teamIdsAndScores]
         )
-        for teamId, score in teamIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
+        for (teamId, _), (scoresBeat, scoresTied) in zip(
+            teamIdsAndScores, scoresBeatAndTied
+        ):
             smartWins = (scoresBeat + (scoresTied / Deci("2"))) / (
                 len(allScores) - Deci("1")
             )
@@ -87,6 +78,7 @@ class SmartWinsYearCalculator(YearCalculator):
         return teamIdAndSmartWins
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getSmartWinsPerGame(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -107,6 +99,7 @@ class SmartWinsYearCalculator(YearCalculator):
             year,
             YearFilters.getForYear(year, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndSmartWinsPerGame = dict()
@@ -122,6 +115,7 @@ class SmartWinsYearCalculator(YearCalculator):
         return teamIdAndSmartWinsPerGame
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentSmartWins(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
         """
@@ -137,32 +131,14 @@ class SmartWinsYearCalculator(YearCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = YearFilters.getForYear(year, **kwargs)
 
         # get all scores we want to include in our smart wins calculation
         teamIdsAndScores = list()
 
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+        allMatchups = YearNavigator.getMatchupSelection(
+            year, filters, simplifyMultiWeekMatchups=True
+        )
 
         for matchup in allMatchups:
             teamIdsAndScores.append((matchup.teamAId, matchup.teamBScore))
@@ -174,10 +150,16 @@ class SmartWinsYearCalculator(YearCalculator):
             teamIdAndOpponentSmartWins[teamId] = Deci(0)
 
         allScores = YearNavigator.getAllScoresInYear(
-            year, simplifyMultiWeekMatchups=True
+            year,
+            simplifyMultiWeekMatchups=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
+        )
+        scoresBeatAndTied = ScoreIndex(allScores).getNumberOfScoresBeatAndTied(
+            [score for _, score in teamIdsAndScores]
         )
-        for teamId, score in teamIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
+        for (teamId, _), (scoresBeat, scoresTied) in zip(
+            teamIdsAndScores, scoresBeatAndTied
+        ):
             smartWins = (scoresBeat + (scoresTied / Deci("2"))) / (
                 len(allScores) - Deci("1")
             )
@@ -189,6 +171,7 @@ class SmartWinsYearCalculator(YearCalculator):
         return teamIdAndOpponentSmartWins
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getOpponentSmartWinsPerGame(
         cls, year: Year, **kwargs
@@ -213,6 +196,7 @@ class SmartWinsYearCalculator(YearCalculator):
             year,
             YearFilters.getForYear(year, **kwargs),
             countMultiWeekMatchupsAsOneGame=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
 
         teamIdAndOpponentSmartWinsPerGame = dict()
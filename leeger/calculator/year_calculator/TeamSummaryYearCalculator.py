@@ -1,6 +1,7 @@
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.memoizers import memoizeInStatContext
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
@@ -13,13 +14,16 @@ class TeamSummaryYearCalculator(YearCalculator):
     """
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getGamesPlayed(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
         """
         Returns the number of games played for each team in the given year.
         """
         filters = YearFilters.getForYear(year, **kwargs)
-        simplifiedMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+        simplifiedMatchups = YearNavigator.getMatchupSelection(
+            year, filters, simplifyMultiWeekMatchups=True
+        )
 
         teamIdAndGamesPlayed = dict()
 
@@ -33,6 +37,7 @@ class TeamSummaryYearCalculator(YearCalculator):
         return teamIdAndGamesPlayed
 
     @classmethod
+    @memoizeInStatContext
     @validateYear
     def getTotalGames(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
         """
@@ -44,5 +49,8 @@ class TeamSummaryYearCalculator(YearCalculator):
         filters = YearFilters.getForYear(year, **kwargs)
 
         return YearNavigator.getNumberOfGamesPlayed(
-            year, filters, countLeagueMedianGamesAsTwoGames=True
+            year,
+            filters,
+            countLeagueMedianGamesAsTwoGames=True,
+            yearIndex=cls._getYearIndex(year, **kwargs),
         )
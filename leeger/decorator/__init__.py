@@ -1 +1,2 @@
+from .memoizers import memoizeInStatContext
 from .validators import validateLeague, validateMatchup, validateWeek, validateYear
@@ -0,0 +1,40 @@
+from functools import wraps
+from typing import Callable
+
+from leeger.calculator.StatContext import StatContext
+from leeger.model.league.League import League
+from leeger.model.league.Year import Year
+
+
+def memoizeInStatContext(function: Callable) -> Callable:
+    """
+    It is expected that any function decorated with this will follow these rules:
+        - Have a Year or League object as a parameter
+        - Only have kwargs after the Year or League parameter
+    This decorator will take the first Year or League parameter found and keep the result of the function for it in a StatContext.
+    The StatContext used is the one given in the kwarg "statContext", then the one of the "with StatContext():" block being run.
+    If there is neither, the function is just called.
+
+    The purpose of this decorator is to not calculate the same stat more than once while calculating other stats.
+    """
+
+    @wraps(function)
+    def wrapFunction(*args, **kwargs):
+        statContext = kwargs.get("statContext")
+        if not isinstance(statContext, StatContext):
+            statContext = StatContext.getCurrent()
+        if statContext is None:
+            return function(*args, **kwargs)
+        yearOrLeague = None
+        for arg in args:
+            if isinstance(arg, (Year, League)):
+                yearOrLeague = arg
+                break
+        if yearOrLeague is None:
+            return function(*args, **kwargs)
+        with statContext:
+            return statContext.getResult(
+                function, yearOrLeague, kwargs, lambda: function(*args, **kwargs)
+            )
+
+    return wrapFunction
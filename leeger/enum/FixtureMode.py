@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from enum import Enum, unique
+
+
+@unique
+class FixtureMode(Enum):
+    """
+    Used to hold the different ways League Loaders can use ResponseFixtures.
+
+    RECORD makes every request to the platform and saves what it returns.
+    REPLAY makes no requests and returns what was saved instead.
+    """
+
+    RECORD = "RECORD"
+    REPLAY = "REPLAY"
+
+    @classmethod
+    def fromStr(cls, s: str) -> FixtureMode:
+        s_upper = s.upper()
+        if s_upper == "RECORD":
+            return FixtureMode.RECORD
+        elif s_upper == "REPLAY":
+            return FixtureMode.REPLAY
+        raise ValueError(f"'{s}' is not a valid FixtureMode.")
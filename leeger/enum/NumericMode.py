@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from enum import Enum, unique
+
+
+@unique
+class NumericMode(Enum):
+    """
+    Used to hold the different kinds of numbers stats can be calculated with.
+
+    EXACT calculates with Deci, which is exact to 28 digits.
+    FLOAT calculates with 64-bit floats, which is faster but only close to EXACT (see Numeric.FLOAT_TOLERANCE).
+    """
+
+    EXACT = "EXACT"
+    FLOAT = "FLOAT"
+
+    @classmethod
+    def fromStr(cls, s: str) -> NumericMode:
+        s_upper = s.upper()
+        if s_upper == "EXACT":
+            return NumericMode.EXACT
+        elif s_upper == "FLOAT":
+            return NumericMode.FLOAT
+        raise ValueError(f"'{s}' is not a valid NumericMode.")
@@ -1 +1,3 @@
+from .FixtureMode import FixtureMode
 from .MatchupType import MatchupType
+from .NumericMode import NumericMode
@@ -1,11 +1,15 @@
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 import espn_api.football as espn
 from espn_api.football import League as ESPNLeague
 from espn_api.football import Team as ESPNTeam
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+from leeger.league_loader.fixture.ResponseFixtures import ResponseFixtures
 from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -20,8 +24,13 @@ class ESPNLeagueLoader(LeagueLoader):
     """
     Responsible for loading a League from ESPN Fantasy Football.
     https://www.espn.com/fantasy/football/
+
+    Every season is fetched with at most maxWorkers seasons being fetched at once
+    (and at most maxRequestsPerSecond seasons started each second) before the League is built.
     """
 
+    _HOST = "lm-api-reads.fantasy.espn.com"
+    _PLATFORM = "espn"
     __ESPN_WIN_OUTCOME: str = "W"
     __ESPN_LOSS_OUTCOME: str = "L"
     __ESPN_BYE_OUTCOME: str = "U"
@@ -43,6 +52,12 @@ class ESPNLeagueLoader(LeagueLoader):
         swid: str = None,
         ownerNamesAndAliases: Optional[dict[str, list[str]]] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        responseCache: Optional[ResponseCache] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
+        responseFixtures: Optional[ResponseFixtures] = None,
     ):
         # validation
         try:
@@ -54,6 +69,12 @@ class ESPNLeagueLoader(LeagueLoader):
             years,
             ownerNamesAndAliases=ownerNamesAndAliases,
             leagueName=leagueName,
+            maxWorkers=maxWorkers,
+            maxRequestsPerSecond=maxRequestsPerSecond,
+            responseCache=responseCache,
+            onRequest=onRequest,
+            recordResponseSizes=recordResponseSizes,
+            responseFixtures=responseFixtures,
         )
 
         self.__espnS2 = espnS2
@@ -64,19 +85,32 @@ class ESPNLeagueLoader(LeagueLoader):
         )  # holds the division info for ONLY the current year
 
     def __getAllLeagues(self) -> list[ESPNLeague]:
-        espnLeagueYears = list()
-        for year in self._years:
-            espnLeagueYears.append(
-                espn.League(
-                    league_id=int(self._leagueId),
-                    year=year,
-                    espn_s2=self.__espnS2,
-                    swid=self.__swid,
+        espnLeagueYears = self._fetchAll(
+            [
+                self._cachedFetch(
+                    functools.partial(self.__getESPNLeague, year),
+                    endpoint="league",
+                    season=year,
                 )
-            )
+                for year in self._years
+            ]
+        )
         self._validateRetrievedLeagues(espnLeagueYears)
         return espnLeagueYears
 
+    def __getESPNLeague(self, year: int) -> ESPNLeague:
+        espnLeague = espn.League(
+            league_id=int(self._leagueId),
+            year=year,
+            espn_s2=self.__espnS2,
+            swid=self.__swid,
+        )
+        if self._responseCache is not None or self._responseFixtures is not None:
+            # everything needed is fetched when an ESPN League is made,
+            # so remove the login cookies to keep them out of responses written to disk
+            espnLeague.espn_request.cookies = None
+        return espnLeague
+
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
         espnLeagueYears = self.__getAllLeagues()
@@ -86,12 +120,16 @@ class ESPNLeagueLoader(LeagueLoader):
                 yearToOwnerNamesMap[espnLeagueYear.year].append(espnTeam.owner)
         return yearToOwnerNamesMap
 
+    @LeagueLoader._sharesHostRateLimiter
     def loadLeague(self, validate: bool = True) -> League:
-        espnLeagueYears = self.__getAllLeagues()
+        self._startLoad()
+        with self._timePhase("fetchLeagues"):
+            espnLeagueYears = self.__getAllLeagues()
         league = self.__buildLeague(espnLeagueYears)
         if validate:
             # validate new league
-            leagueValidation.runAllChecks(league)
+            with self._timePhase("validateLeague"):
+                leagueValidation.runAllChecks(league)
         self._warnForUnusedOwnerNames(league)
         return league
 
@@ -100,7 +138,8 @@ class ESPNLeagueLoader(LeagueLoader):
         for espnLeague in espnLeagues:
             # save league name for each year
             self._leagueNameByYear[espnLeague.year] = espnLeague.settings.name
-            self.__loadOwners(espnLeague.teams)
+            with self._timePhase("buildOwners"):
+                self.__loadOwners(espnLeague.teams)
             years.append(self.__buildYear(espnLeague))
         return League(
             name=self._getLeagueName(),
@@ -132,8 +171,10 @@ class ESPNLeagueLoader(LeagueLoader):
             self.__espnDivisionIdToDivisionMap[espnDivisionId] = Division(
                 name=espnDivisionName
             )
-        teams = self.__buildTeams(espnLeague.teams)
-        weeks = self.__buildWeeks(espnLeague)
+        with self._timePhase("buildTeams"):
+            teams = self.__buildTeams(espnLeague.teams)
+        with self._timePhase("buildWeeks"):
+            weeks = self.__buildWeeks(espnLeague)
         # TODO: see if there are cases where ESPN leagues do NOT have divisions
         year = Year(
             yearNumber=espnLeague.year,
@@ -147,12 +188,17 @@ class ESPNLeagueLoader(LeagueLoader):
 
     def __buildWeeks(self, espnLeague: ESPNLeague) -> list[Week]:
         weeks = list()
+        espnTeamIdToESPNTeamMap = {
+            espnTeam.team_id: espnTeam for espnTeam in espnLeague.teams
+        }
         # current week seems to be the last week in the league
         for i in range(espnLeague.current_week):
+            if not self._isWeekToLoad(espnLeague.year, i + 1):
+                continue
             # get each teams matchup for that week
             matchups = list()
             # to avoid adding matchups twice, we keep track of the ESPN team IDs that have already had a matchup added
-            espnTeamIDsWithMatchups = list()
+            espnTeamIDsWithMatchups = set()
             for espnTeam in espnLeague.teams:
                 # skip if we already have this team in a matchup
                 # OR
@@ -169,9 +215,7 @@ class ESPNLeagueLoader(LeagueLoader):
                 # team B is their opponent
                 espnTeamB = espnTeam.schedule[i]
                 teamB = self.__espnTeamIdToTeamMap[espnTeam.schedule[i].team_id]
-                teamBScore = self.__getESPNTeamByESPNId(
-                    espnTeam.schedule[i].team_id, espnLeague.teams
-                ).scores[i]
+                teamBScore = espnTeamIdToESPNTeamMap[espnTeamB.team_id].scores[i]
                 # figure out tiebreakers if there needs to be one
                 teamAHasTiebreaker = (
                     teamAScore == teamBScore
@@ -182,7 +226,7 @@ class ESPNLeagueLoader(LeagueLoader):
                     and espnTeamB.outcomes[i] == self.__ESPN_WIN_OUTCOME
                 )
                 matchupType = self.__getMatchupType(
-                    espnLeague, i + 1, espnTeamA.team_id
+                    espnLeague, i + 1, espnTeamIdToESPNTeamMap[espnTeamA.team_id]
                 )
                 matchups.append(
                     Matchup(
@@ -195,20 +239,19 @@ class ESPNLeagueLoader(LeagueLoader):
                         matchupType=matchupType,
                     )
                 )
-                espnTeamIDsWithMatchups.append(espnTeam.team_id)
-                espnTeamIDsWithMatchups.append(espnTeam.schedule[i].team_id)
+                espnTeamIDsWithMatchups.add(espnTeam.team_id)
+                espnTeamIDsWithMatchups.add(espnTeamB.team_id)
             if len(matchups) > 0:
                 weeks.append(Week(weekNumber=i + 1, matchups=matchups))
         return weeks
 
     def __getMatchupType(
-        self, espnLeague: ESPNLeague, weekNumber: int, espnTeamId: int
+        self, espnLeague: ESPNLeague, weekNumber: int, espnTeam: ESPNTeam
     ) -> MatchupType:
         isPlayoffWeek = weekNumber > espnLeague.settings.reg_season_count
         if isPlayoffWeek:
             # figure out if this team made the playoffs
             playoffTeamCount = espnLeague.settings.playoff_team_count
-            espnTeam = self.__getESPNTeamByESPNId(espnTeamId, espnLeague.teams)
             if playoffTeamCount >= espnTeam.standing:
                 # this team made the playoffs
                 # figure out if this is the last week of playoffs (the championship week)
@@ -238,12 +281,6 @@ class ESPNLeagueLoader(LeagueLoader):
         else:
             return MatchupType.REGULAR_SEASON
 
-    @staticmethod
-    def __getESPNTeamByESPNId(espnTeamId: int, espnTeams: list[ESPNTeam]) -> ESPNTeam:
-        for espnTeam in espnTeams:
-            if espnTeam.team_id == espnTeamId:
-                return espnTeam
-
     def __buildTeams(self, espnTeams: list[ESPNTeam]) -> list[Team]:
         teams = list()
         for espnTeam in espnTeams:
@@ -1,4 +1,5 @@
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 from fleaflicker.api.LeagueInfoAPIClient import LeagueInfoAPIClient
 from fleaflicker.api.ScoringAPIClient import ScoringAPIClient
@@ -6,7 +7,10 @@ from fleaflicker.enum.Sport import Sport
 from sleeper.enum import Sport
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+from leeger.league_loader.fixture.ResponseFixtures import ResponseFixtures
 from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -21,8 +25,14 @@ class FleaflickerLeagueLoader(LeagueLoader):
     """
     Responsible for loading a League from Fleaflicker.
     https://www.fleaflicker.com/
+
+    The scoreboards for every scoring period in a season are fetched with at most maxWorkers requests at once,
+    and at most maxRequestsPerSecond requests each second across every FleaflickerLeagueLoader loading at the same time.
     """
 
+    _HOST = "www.fleaflicker.com"
+    _PLATFORM = "fleaflicker"
+
     def __init__(
         self,
         leagueId: str,
@@ -30,6 +40,12 @@ class FleaflickerLeagueLoader(LeagueLoader):
         *,
         ownerNamesAndAliases: Optional[dict[str, list[str]]] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        responseCache: Optional[ResponseCache] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
+        responseFixtures: Optional[ResponseFixtures] = None,
     ):
         # validation
         try:
@@ -41,6 +57,12 @@ class FleaflickerLeagueLoader(LeagueLoader):
             years,
             ownerNamesAndAliases=ownerNamesAndAliases,
             leagueName=leagueName,
+            maxWorkers=maxWorkers,
+            maxRequestsPerSecond=maxRequestsPerSecond,
+            responseCache=responseCache,
+            onRequest=onRequest,
+            recordResponseSizes=recordResponseSizes,
+            responseFixtures=responseFixtures,
         )
 
         self.__fleaflickerTeamIdToOwnerMap: dict[int, Owner] = dict()
@@ -51,13 +73,21 @@ class FleaflickerLeagueLoader(LeagueLoader):
 
     def __getAllLeagues(self) -> list[dict]:
         # return a list of all leagues
-        fleaflickerLeagues = list()
-        for year in self._years:
-            fleaflickerLeagues.append(
-                LeagueInfoAPIClient.get_league_standings(
-                    sport=Sport.NFL, league_id=int(self._leagueId), season=year
+        fleaflickerLeagues = self._fetchAll(
+            [
+                self._cachedFetch(
+                    functools.partial(
+                        LeagueInfoAPIClient.get_league_standings,
+                        sport=Sport.NFL,
+                        league_id=int(self._leagueId),
+                        season=year,
+                    ),
+                    endpoint="standings",
+                    season=year,
                 )
-            )
+                for year in self._years
+            ]
+        )
         self._validateRetrievedLeagues(fleaflickerLeagues)
         return fleaflickerLeagues
 
@@ -72,18 +102,23 @@ class FleaflickerLeagueLoader(LeagueLoader):
                     yearToOwnerNamesMap[self._years[0]].append(ownerName)
         return yearToOwnerNamesMap
 
+    @LeagueLoader._sharesHostRateLimiter
     def loadLeague(self, validate: bool = True) -> League:
-        fleaflickerLeagues = self.__getAllLeagues()
+        self._startLoad()
+        with self._timePhase("fetchLeagues"):
+            fleaflickerLeagues = self.__getAllLeagues()
         league = self.__buildLeague(fleaflickerLeagues)
         if validate:
             # validate new league
-            leagueValidation.runAllChecks(league)
+            with self._timePhase("validateLeague"):
+                leagueValidation.runAllChecks(league)
         self._warnForUnusedOwnerNames(league)
         return league
 
     def __buildLeague(self, fleaflickerLeagues: list[dict]) -> League:
         years = list()
-        self.__loadOwners(fleaflickerLeagues)
+        with self._timePhase("buildOwners"):
+            self.__loadOwners(fleaflickerLeagues)
         owners = list(self.__fleaflickerTeamIdToOwnerMap.values())
         for fleaflickerLeague in fleaflickerLeagues:
             # save league name for each year
@@ -101,8 +136,14 @@ class FleaflickerLeagueLoader(LeagueLoader):
             self.__fleaflickerDivisionIdToDivisionMap[fleaflickerDivision["id"]] = (
                 Division(name=fleaflickerDivision["name"])
             )
-        teams = self.__buildTeams(fleaflickerLeague)
-        weeks = self.__buildWeeks(fleaflickerLeague)
+        with self._timePhase("buildTeams"):
+            teams = self.__buildTeams(fleaflickerLeague)
+        with self._timePhase("fetchScoreboards"):
+            scoringPeriodsAndScoreboards = self.__getScoringPeriodsAndScoreboards(
+                fleaflickerLeague
+            )
+        with self._timePhase("buildWeeks"):
+            weeks = self.__buildWeeks(scoringPeriodsAndScoreboards)
         year = Year(
             yearNumber=int(fleaflickerLeague["season"]),
             teams=teams,
@@ -113,26 +154,55 @@ class FleaflickerLeagueLoader(LeagueLoader):
         self.__fleaflickerDivisionIdToDivisionMap = dict()
         return year
 
-    def __buildWeeks(self, fleaflickerLeague: dict) -> list[Week]:
-        weeks = list()
+    def __getScoringPeriodsAndScoreboards(
+        self, fleaflickerLeague: dict
+    ) -> list[tuple[int, dict]]:
         # get all weeks
-        fleaflicker_league_scoreboard = ScoringAPIClient.get_league_scoreboard(
-            sport=Sport.NFL,
-            league_id=fleaflickerLeague["league"]["id"],
-            season=fleaflickerLeague["season"],
-        )
+        fleaflicker_league_scoreboard = self._cachedFetch(
+            functools.partial(
+                ScoringAPIClient.get_league_scoreboard,
+                sport=Sport.NFL,
+                league_id=fleaflickerLeague["league"]["id"],
+                season=fleaflickerLeague["season"],
+            ),
+            endpoint="scoreboard",
+            season=int(fleaflickerLeague["season"]),
+        )()
         number_of_scoring_periods = (
             len(fleaflicker_league_scoreboard["eligibleSchedulePeriods"]) + 1
         )
-        for scoring_period in range(1, number_of_scoring_periods):
+        # scoring periods already in a League being refreshed are not fetched
+        scoring_periods = [
+            scoring_period
+            for scoring_period in range(1, number_of_scoring_periods)
+            if self._isWeekToLoad(int(fleaflickerLeague["season"]), scoring_period)
+        ]
+        # get all games for every week, returned in the same order as scoring_periods
+        scoreboards = self._fetchAll(
+            [
+                self._cachedFetch(
+                    functools.partial(
+                        ScoringAPIClient.get_league_scoreboard,
+                        sport=Sport.NFL,
+                        league_id=fleaflickerLeague["league"]["id"],
+                        season=fleaflickerLeague["season"],
+                        scoring_period=scoring_period,
+                    ),
+                    endpoint=f"scoreboard?scoringPeriod={scoring_period}",
+                    season=int(fleaflickerLeague["season"]),
+                    week=scoring_period,
+                )
+                for scoring_period in scoring_periods
+            ]
+        )
+        return list(zip(scoring_periods, scoreboards))
+
+    def __buildWeeks(
+        self, scoringPeriodsAndScoreboards: list[tuple[int, dict]]
+    ) -> list[Week]:
+        weeks = list()
+        for scoring_period, current_scoreboard in scoringPeriodsAndScoreboards:
             matchups = list()
-            # get all games for this week
-            current_scoreboard = ScoringAPIClient.get_league_scoreboard(
-                sport=Sport.NFL,
-                league_id=fleaflickerLeague["league"]["id"],
-                season=fleaflickerLeague["season"],
-                scoring_period=scoring_period,
-            )
             for game in current_scoreboard.get("games", list()):
                 # team A
                 teamAFleaflicker: dict = game["away"]
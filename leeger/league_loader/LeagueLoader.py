@@ -1,20 +1,48 @@
+import asyncio
+import contextlib
+import datetime
+import functools
+import json
+import threading
+import time
 from abc import abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+from leeger.league_loader.fixture.ResponseFixtures import ResponseFixtures
+from leeger.league_loader.report.LoadReport import LoadReport
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league.League import League
 from leeger.model.league.Owner import Owner
+from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.util.CustomLogger import CustomLogger
+from leeger.util.RateLimiter import RateLimiter
+from leeger.validate import ownerValidation, yearValidation
+
+T = TypeVar("T")
 
 
 class LeagueLoader:
     """
     League Loader classes should inherit this.
     The point of a league loader is to load a League object from different Fantasy Football sources.
+
+    Every response a League Loader gets and how long each phase of its last load took (i.e. "fetchLeagues", "buildWeeks", "validateLeague")
+    are returned by getLoadReport(), and each response is given to onRequest as it is got.
+    The size of each response is only recorded if recordResponseSizes is True.
     """
 
+    # the host requests are made to, so every League Loader for the same platform shares a rate limit
+    _HOST: Optional[str] = None
+    # the name of the platform, which responses from it are cached under
+    _PLATFORM: Optional[str] = None
+    # seasons are assumed to be completed once this month of the next year starts
+    __SEASON_COMPLETED_MONTH = 3
+
     def __init__(
         self,
         leagueId: str,
@@ -22,6 +50,12 @@ class LeagueLoader:
         *,
         ownerNamesAndAliases: Optional[dict] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        responseCache: Optional[ResponseCache] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
+        responseFixtures: Optional[ResponseFixtures] = None,
     ):
         self._LOGGER = CustomLogger().getLogger()
         # validation
@@ -31,6 +65,9 @@ class LeagueLoader:
         if not all(isinstance(year, int) for year in years):
             raise ValueError(f"All given years must be ints.")
 
+        if not isinstance(maxWorkers, int) or maxWorkers < 1:
+            raise ValueError("'maxWorkers' must be an int that is at least 1.")
+
         self._leagueId = leagueId
         self._years = sorted(years)
         self._owners: Optional[list[Owner]] = None
@@ -47,6 +84,36 @@ class LeagueLoader:
         self._leagueNameByYear: dict[int, str] = (
             dict()
         )  # will hold league name by year like {2020: "foo", 2021: "baz", ...}
+        # the most requests that can be made to the platform at once
+        self._maxWorkers = maxWorkers
+        if maxRequestsPerSecond is not None:
+            RateLimiter.validateMaxRequestsPerSecond(maxRequestsPerSecond)
+        self._maxRequestsPerSecond = maxRequestsPerSecond
+        # League Loaders with a host share a RateLimiter with every other League Loader loading from the host at the same time,
+        # so it is only set while loading (see _sharesHostRateLimiter())
+        self._rateLimiter: Optional[RateLimiter] = (
+            RateLimiter(maxRequestsPerSecond)
+            if maxRequestsPerSecond is not None and self._HOST is None
+            else None
+        )
+        self._responseCache = responseCache
+        # records requests to the platform or replays them without the platform
+        self._responseFixtures = responseFixtures
+        # will hold how many requests have been made to each endpoint like {"scoreboard": 17, ...}
+        self._requestCounts: dict[str, int] = dict()
+        # will hold every response got during the last load
+        self._requestRecords: list[RequestRecord] = list()
+        self.__requestsLock = threading.Lock()
+        # called with the RequestRecord of every response as it is got (possibly from a worker thread)
+        self._onRequest = onRequest
+        # sizing a response means writing it as JSON, so it is only done when asked for
+        self._recordResponseSizes = recordResponseSizes
+        # will hold how long each phase of the last load took like {"fetchLeagues": 1.2, ...}
+        self._phaseTimings: dict[str, float] = dict()
+        # while refreshing a League, will hold the last week already in the League by year like {2022: 5}
+        # weeks before these are not fetched or built, and these are fetched again in case they were not finished when they were loaded
+        self._refreshFromWeekNumberByYear: dict[int, int] = dict()
+        self.__isRefreshing = False
 
     def _getLeagueName(self) -> str:
         leagueName = self._leagueName
@@ -60,6 +127,386 @@ class LeagueLoader:
             leagueName = self._leagueNameByYear[mostRecentYear]
         return leagueName
 
+    def getRequestCounts(self) -> dict[str, int]:
+        """
+        Returns how many requests *this* League Loader has made to each endpoint of the platform.
+        Responses found in the responseCache are not counted.
+        """
+        with self.__requestsLock:
+            return dict(self._requestCounts)
+
+    def getPhaseTimings(self) -> dict[str, float]:
+        """
+        Returns how many seconds each phase of the last load took, in the order the phases were run.
+        """
+        return dict(self._phaseTimings)
+
+    def getLoadReport(self) -> LoadReport:
+        """
+        Returns every response got and how long each phase took during the last load.
+        """
+        with self.__requestsLock:
+            requestRecords = list(self._requestRecords)
+        return LoadReport(
+            platform=self._PLATFORM,
+            leagueId=self._leagueId,
+            requests=requestRecords,
+            phaseTimings=self.getPhaseTimings(),
+        )
+
+    def _startLoad(self) -> None:
+        """
+        Clears what was saved about the last load.
+        League Loaders should call this at the start of loadLeague().
+        """
+        self._phaseTimings = dict()
+        with self.__requestsLock:
+            self._requestRecords = list()
+
+    @staticmethod
+    def _sharesHostRateLimiter(
+        loadLeague: Callable[..., League],
+    ) -> Callable[..., League]:
+        """
+        League Loaders should decorate loadLeague() with this.
+        While the League is loading, requests wait on the RateLimiter for the League Loader's host (see RateLimiter.forHost()),
+        so League Loaders loading from the same host at the same time share the lowest maxRequestsPerSecond given.
+        Once the League is loaded, its maxRequestsPerSecond no longer limits other League Loaders.
+        """
+
+        @functools.wraps(loadLeague)
+        def wrapLoadLeague(self: LeagueLoader, *args, **kwargs) -> League:
+            # a League Loader without a host has its own RateLimiter
+            if (
+                self._maxRequestsPerSecond is None
+                or self._HOST is None
+                or self._rateLimiter is not None
+            ):
+                return loadLeague(self, *args, **kwargs)
+            with RateLimiter.forHost(
+                self._HOST, self._maxRequestsPerSecond
+            ) as rateLimiter:
+                self._rateLimiter = rateLimiter
+                try:
+                    return loadLeague(self, *args, **kwargs)
+                finally:
+                    self._rateLimiter = None
+
+        return wrapLoadLeague
+
+    @contextlib.contextmanager
+    def _timePhase(self, phaseName: str) -> Iterator[None]:
+        """
+        Adds how long the code inside *this* context takes to the given phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._phaseTimings[phaseName] = (
+                self._phaseTimings.get(phaseName, 0.0) + seconds
+            )
+            self._LOGGER.debug(f"Phase '{phaseName}' took {seconds:.3f}s.")
+
+    def _isCompletedSeason(self, season: Optional[int]) -> bool:
+        """
+        Returns whether the given season is completed, so its responses will never change.
+        League Loaders that get this from the platform should override this.
+        """
+        if season is None:
+            return False
+        return datetime.date.today() >= datetime.date(
+            season + 1, self.__SEASON_COMPLETED_MONTH, 1
+        )
+
+    def _cachedFetch(
+        self,
+        fetch: Callable[[], T],
+        *,
+        endpoint: str,
+        season: Optional[int],
+        week: Optional[int] = None,
+        leagueId: Optional[str] = None,
+        isCompletedSeason: Optional[Callable[[Any], bool]] = None,
+    ) -> Callable[[], T]:
+        """
+        Returns a fetch that returns the response kept in the responseCache for the given endpoint, season and league ID (this League Loader's by default).
+        If no response is kept, the given fetch is called as a request to the platform and what it returns is kept.
+        isCompletedSeason is given the response to decide if it is for a completed season, otherwise _isCompletedSeason() is used.
+        If there is no responseCache, every call is a request.
+        If responseFixtures were given, requests are recorded or replayed by them.
+
+        Requests wait until another request can be made if maxRequestsPerSecond was given, and are counted in getRequestCounts().
+        Every response is recorded in getLoadReport() with the given endpoint, season and week.
+        """
+        key = ResponseCache.getKey(
+            platform=self._PLATFORM or type(self).__name__,
+            leagueId=leagueId if leagueId is not None else self._leagueId,
+            season=season,
+            endpoint=endpoint,
+        )
+        if self._responseFixtures is not None:
+            fetch = self._responseFixtures.getFetch(fetch, key)
+        fetch = self.__getRequestFetch(
+            fetch, endpoint=endpoint, season=season, week=week
+        )
+        if self._responseCache is None:
+            return fetch
+
+        def cachedFetch() -> T:
+            start = time.perf_counter()
+            found, response = self._responseCache.get(key)
+            if found:
+                self.__recordRequest(
+                    RequestRecord(
+                        endpoint=endpoint,
+                        season=season,
+                        week=week,
+                        seconds=time.perf_counter() - start,
+                        bytes=self.__getResponseSize(response),
+                        cacheHit=True,
+                    )
+                )
+                return response
+            response = fetch()
+            self._responseCache.set(
+                key,
+                response,
+                isCompletedSeason=(
+                    isCompletedSeason(response)
+                    if isCompletedSeason is not None
+                    else self._isCompletedSeason(season)
+                ),
+            )
+            return response
+
+        return cachedFetch
+
+    def _fetchAll(self, fetches: list[Callable[[], T]]) -> list[T]:
+        """
+        Calls every given fetch, with at most maxWorkers running at once.
+        Returns what each fetch returned, in the order the fetches were given.
+        If maxWorkers is 1, the fetches are called one after another in the order given.
+        """
+        if self._maxWorkers == 1 or len(fetches) <= 1:
+            return [fetch() for fetch in fetches]
+        with ThreadPoolExecutor(
+            max_workers=min(self._maxWorkers, len(fetches))
+        ) as executor:
+            return list(executor.map(lambda fetch: fetch(), fetches))
+
+    def __getRequestFetch(
+        self,
+        fetch: Callable[[], T],
+        *,
+        endpoint: str,
+        season: Optional[int],
+        week: Optional[int],
+    ) -> Callable[[], T]:
+        # requests to the same endpoint with different parameters (i.e. "scoreboard?scoringPeriod=1") are counted together
+        endpointName = endpoint.split("?")[0].split(";")[0]
+
+        def requestFetch() -> T:
+            if self._rateLimiter is not None:
+                self._rateLimiter.wait()
+            with self.__requestsLock:
+                self._requestCounts[endpointName] = (
+                    self._requestCounts.get(endpointName, 0) + 1
+                )
+            start = time.perf_counter()
+            response = fetch()
+            self.__recordRequest(
+                RequestRecord(
+                    endpoint=endpoint,
+                    season=season,
+                    week=week,
+                    seconds=time.perf_counter() - start,
+                    bytes=self.__getResponseSize(response),
+                    cacheHit=False,
+                )
+            )
+            return response
+
+        return requestFetch
+
+    def __recordRequest(self, requestRecord: RequestRecord) -> None:
+        with self.__requestsLock:
+            self._requestRecords.append(requestRecord)
+        if self._onRequest is not None:
+            self._onRequest(requestRecord)
+
+    def __getResponseSize(self, response: Any) -> Optional[int]:
+        # platform clients give back parsed JSON or their own objects, so only JSON responses have a size
+        if not self._recordResponseSizes or not isinstance(response, (dict, list)):
+            return None
+        try:
+            return len(json.dumps(response).encode())
+        except (TypeError, ValueError):
+            return None
+
+    def _isWeekToLoad(self, yearNumber: int, weekNumber: int) -> bool:
+        """
+        Returns whether the given week should be fetched and built.
+        This is False for weeks that are already in a League that is being refreshed, except for the last one.
+        """
+        return weekNumber >= self._refreshFromWeekNumberByYear.get(yearNumber, 0)
+
+    def refreshLeague(self, league: League, validate: bool = True) -> League:
+        """
+        Adds everything that has happened since the given League was loaded to it, in place.
+        The given League should have been loaded by a League Loader for the same league.
+
+        Only the most recent Year in the given League and any newer years given to *this* League Loader are loaded,
+        and only the last Week in each of those Years and the weeks after it are fetched.
+        The last Week may not have been finished when it was loaded, so its Matchups are replaced with the ones fetched.
+        New Weeks are added to the end of their Year and new Years are added to the end of the League.
+        Every ID already in the League stays the same, and a replaced Matchup keeps the ID of the Matchup it replaces if it is between the same Teams.
+        Only Years that changed and new Owners are validated.
+
+        Returns the given League.
+        """
+        yearNumberToYearMap = {year.yearNumber: year for year in league.years}
+        lastYearNumber = max(yearNumberToYearMap.keys(), default=None)
+        yearNumbersToLoad = [
+            yearNumber
+            for yearNumber in self._years
+            if lastYearNumber is None or yearNumber >= lastYearNumber
+        ]
+        if len(yearNumbersToLoad) == 0:
+            return league
+
+        allYearNumbers = self._years
+        self._years = yearNumbersToLoad
+        self._refreshFromWeekNumberByYear = {
+            yearNumber: self.__getLastWeekNumber(yearNumberToYearMap[yearNumber])
+            for yearNumber in yearNumbersToLoad
+            if yearNumber in yearNumberToYearMap
+        }
+        self.__isRefreshing = True
+        try:
+            loadedLeague = self.loadLeague(validate=False)
+        finally:
+            self._years = allYearNumbers
+            self._refreshFromWeekNumberByYear = dict()
+            self.__isRefreshing = False
+
+        # match loaded Owners to the Owners in the League by name
+        ownerNameToOwnerMap = {owner.name: owner for owner in league.owners}
+        loadedOwnerIdToOwnerIdMap: dict[str, str] = dict()
+        loadedOwnerIdToNewOwnerMap: dict[str, Owner] = dict()
+        for loadedOwner in loadedLeague.owners:
+            owner = ownerNameToOwnerMap.get(loadedOwner.name)
+            if owner is None:
+                loadedOwnerIdToNewOwnerMap[loadedOwner.id] = loadedOwner
+                owner = loadedOwner
+            loadedOwnerIdToOwnerIdMap[loadedOwner.id] = owner.id
+
+        # find everything to add before changing the League, so a League that can't be refreshed is left as it was
+        yearsAndNewWeeks: list[tuple[Year, list[Week]]] = list()
+        lastWeeksAndLoadedWeeks: list[tuple[Week, Week]] = list()
+        newYears: list[Year] = list()
+        newOwners: list[Owner] = list()
+        for loadedYear in loadedLeague.years:
+            year = yearNumberToYearMap.get(loadedYear.yearNumber)
+            if year is None:
+                for team in loadedYear.teams:
+                    if team.ownerId in loadedOwnerIdToNewOwnerMap:
+                        newOwners.append(loadedOwnerIdToNewOwnerMap.pop(team.ownerId))
+                    team.ownerId = loadedOwnerIdToOwnerIdMap[team.ownerId]
+                newYears.append(loadedYear)
+                continue
+            lastWeekNumber = self.__getLastWeekNumber(year)
+            loadedWeeks = [
+                week for week in loadedYear.weeks if week.weekNumber >= lastWeekNumber
+            ]
+            if len(loadedWeeks) == 0:
+                continue
+            self.__useTeamIds(
+                loadedWeeks,
+                self.__getLoadedTeamIdToTeamIdMap(
+                    year, loadedYear, loadedOwnerIdToOwnerIdMap
+                ),
+            )
+            newWeeks = list()
+            for loadedWeek in loadedWeeks:
+                if loadedWeek.weekNumber == lastWeekNumber:
+                    lastWeek = next(
+                        week for week in year.weeks if week.weekNumber == lastWeekNumber
+                    )
+                    lastWeeksAndLoadedWeeks.append((lastWeek, loadedWeek))
+                else:
+                    newWeeks.append(loadedWeek)
+            yearsAndNewWeeks.append((year, newWeeks))
+
+        league.owners.extend(newOwners)
+        for lastWeek, loadedWeek in lastWeeksAndLoadedWeeks:
+            self.__replaceMatchups(lastWeek, loadedWeek)
+        for year, newWeeks in yearsAndNewWeeks:
+            year.weeks.extend(newWeeks)
+        league.years.extend(newYears)
+        self._LOGGER.debug(
+            f"Refreshed League with {len(lastWeeksAndLoadedWeeks)} replaced week/s, {sum(len(newWeeks) for _, newWeeks in yearsAndNewWeeks)} new week/s and {len(newYears)} new year/s."
+        )
+
+        if validate:
+            for owner in newOwners:
+                ownerValidation.runAllChecks(owner)
+            for year in [year for year, _ in yearsAndNewWeeks] + newYears:
+                yearValidation.runAllChecks(year)
+        return league
+
+    @staticmethod
+    def __replaceMatchups(week: Week, loadedWeek: Week) -> None:
+        # a Matchup between the same Teams is the same Matchup, so it keeps its ID
+        teamIdsToMatchupIdMap = {
+            (matchup.teamAId, matchup.teamBId): matchup.id for matchup in week.matchups
+        }
+        for loadedMatchup in loadedWeek.matchups:
+            matchupId = teamIdsToMatchupIdMap.pop(
+                (loadedMatchup.teamAId, loadedMatchup.teamBId), None
+            )
+            if matchupId is not None:
+                loadedMatchup.id = matchupId
+        week.matchups = loadedWeek.matchups
+
+    @staticmethod
+    def __getLastWeekNumber(year: Year) -> int:
+        return max((week.weekNumber for week in year.weeks), default=0)
+
+    @staticmethod
+    def __getLoadedTeamIdToTeamIdMap(
+        year: Year, loadedYear: Year, loadedOwnerIdToOwnerIdMap: dict[str, str]
+    ) -> dict[str, str]:
+        # Teams are matched by Owner, since Team names can change during a season
+        ownerIdToTeamMap = {team.ownerId: team for team in year.teams}
+        loadedTeamIdToTeamIdMap = dict()
+        for loadedTeam in loadedYear.teams:
+            team = ownerIdToTeamMap.get(
+                loadedOwnerIdToOwnerIdMap.get(loadedTeam.ownerId)
+            )
+            if team is None:
+                raise LeagueLoaderException(
+                    f"Team '{loadedTeam.name}' does not match any Team in year {year.yearNumber} of the given League. Load the League again instead."
+                )
+            loadedTeamIdToTeamIdMap[loadedTeam.id] = team.id
+        return loadedTeamIdToTeamIdMap
+
+    @staticmethod
+    def __useTeamIds(
+        weeks: list[Week], loadedTeamIdToTeamIdMap: dict[str, str]
+    ) -> None:
+        for week in weeks:
+            for matchup in week.matchups:
+                matchup.teamAId = loadedTeamIdToTeamIdMap[matchup.teamAId]
+                matchup.teamBId = loadedTeamIdToTeamIdMap[matchup.teamBId]
+                if matchup.multiWeekMatchupId is not None:
+                    # some League Loaders build multi-week matchup IDs from Team IDs
+                    for loadedTeamId, teamId in loadedTeamIdToTeamIdMap.items():
+                        matchup.multiWeekMatchupId = matchup.multiWeekMatchupId.replace(
+                            loadedTeamId, teamId
+                        )
+
     def _getValidYears(self, years: list[Year]) -> list[Year]:
         validYears = list()
         # make sure years are ordered oldest -> newest
@@ -105,7 +552,8 @@ class LeagueLoader:
         """
         Logs a warning for all owner names that are not in the loaded league IF ownerNamesAndAliases is given.
         """
-        if self._ownerNamesAndAliases:
+        # a refreshed League only loads its most recent years, so owner names from older years are not used
+        if self._ownerNamesAndAliases and not self.__isRefreshing:
             allLoadedOwnerNames = [owner.name for owner in league.owners]
             unusedOwnerNames = list()
             for ownerName in self._ownerNamesAndAliases.keys():
@@ -119,5 +567,12 @@ class LeagueLoader:
     @abstractmethod
     def loadLeague(self, validate: bool = True, *args, **kwargs) -> League: ...
 
+    async def loadLeagueAsync(self, validate: bool = True, *args, **kwargs) -> League:
+        """
+        Loads the League without blocking the event loop.
+        The platform clients used by League Loaders make blocking requests, so loadLeague() is run in a worker thread.
+        """
+        return await asyncio.to_thread(self.loadLeague, validate, *args, **kwargs)
+
     @abstractmethod
     def getOwnerNames(self, *args, **kwargs) -> dict[int, list[str]]: ...
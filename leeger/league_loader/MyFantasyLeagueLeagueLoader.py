@@ -1,10 +1,15 @@
-from typing import Optional
+import functools
+import threading
+from typing import Callable, Optional
 
 from pymfl.api import CommonLeagueInfoAPIClient
 from pymfl.api.config import APIConfig
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+from leeger.league_loader.fixture.ResponseFixtures import ResponseFixtures
 from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -19,8 +24,14 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
     """
     Responsible for loading a League from MyFantasyLeague.
     http://home.myfantasyleague.com/
+
+    Every year is logged in to and fetched, then every year's schedule and playoff bracket are fetched,
+    with at most maxWorkers requests at once.
     """
 
+    _HOST = "api.myfantasyleague.com"
+    _PLATFORM = "myfantasyleague"
+
     def __init__(
         self,
         leagueId: str,
@@ -31,12 +42,24 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
         mflUserAgentName: str,
         ownerNamesAndAliases: Optional[dict[str, list[str]]] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        responseCache: Optional[ResponseCache] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
+        responseFixtures: Optional[ResponseFixtures] = None,
     ):
         super().__init__(
             leagueId,
             years,
             ownerNamesAndAliases=ownerNamesAndAliases,
             leagueName=leagueName,
+            maxWorkers=maxWorkers,
+            maxRequestsPerSecond=maxRequestsPerSecond,
+            responseCache=responseCache,
+            onRequest=onRequest,
+            recordResponseSizes=recordResponseSizes,
+            responseFixtures=responseFixtures,
         )
 
         self.__mflUsername = mflUsername
@@ -44,6 +67,11 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
         self.__mflUserAgentName = mflUserAgentName
 
         self.__mflLeagueIdToYearMap: dict[str, int] = dict()
+        self.__loggedInYears: set[int] = set()
+        self.__loginLock = threading.Lock()
+        self.__yearToLoginLockMap: dict[int, threading.Lock] = dict()
+        self.__yearToMFLScheduleMap: dict[int, dict] = dict()
+        self.__yearToMFLPlayoffBracketMap: dict[int, dict] = dict()
         self.__mflFranchiseIdToOwnerMap: dict[str, Owner] = dict()
         self.__mflFranchiseIdToTeamMap: dict[int, Team] = dict()
         self.__mflDivisionIdToDivisionMap: dict[str, Division] = (
@@ -51,25 +79,93 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
         )  # holds the division info for ONLY the current year
 
     def __getAllLeagues(self) -> list[dict]:
-        mflLeagues: list[dict] = list()
-
-        for year in self._years:
-            APIConfig.add_config_for_year_and_league_id(
-                year=year,
-                league_id=self._leagueId,
-                username=self.__mflUsername,
-                password=self.__mflPassword,
-                user_agent_name=self.__mflUserAgentName,
-            )
-
-            mflLeague = CommonLeagueInfoAPIClient.get_league(
-                year=year, league_id=self._leagueId
-            )["league"]
+        # MFL logins are made for a single year, so each year is logged in to before anything for it is fetched
+        mflLeagues: list[dict] = self._fetchAll(
+            [
+                self._cachedFetch(
+                    functools.partial(
+                        self.__fetchWithLogin,
+                        year,
+                        CommonLeagueInfoAPIClient.get_league,
+                        year=year,
+                        league_id=self._leagueId,
+                    ),
+                    endpoint="league",
+                    season=year,
+                )
+                for year in self._years
+            ]
+        )
+        mflLeagues = [mflLeague["league"] for mflLeague in mflLeagues]
+        for year, mflLeague in zip(self._years, mflLeagues):
             self.__mflLeagueIdToYearMap[mflLeague["id"]] = year
-            mflLeagues.append(mflLeague)
         self._validateRetrievedLeagues(mflLeagues)
         return mflLeagues
 
+    def __fetchWithLogin(self, loginYear: int, function: Callable, **kwargs) -> dict:
+        """
+        Logs in to the given loginYear if it has not been logged in to yet, then calls the given function with the given kwargs.
+        Years are only logged in to when something for them is requested, so nothing is logged in to if every response is cached.
+        """
+        with self.__loginLock:
+            yearLoginLock = self.__yearToLoginLockMap.setdefault(
+                loginYear, threading.Lock()
+            )
+        # years are logged in to at the same time, but each year is only logged in to once
+        with yearLoginLock:
+            if loginYear not in self.__loggedInYears:
+                APIConfig.add_config_for_year_and_league_id(
+                    year=loginYear,
+                    league_id=self._leagueId,
+                    username=self.__mflUsername,
+                    password=self.__mflPassword,
+                    user_agent_name=self.__mflUserAgentName,
+                )
+                self.__loggedInYears.add(loginYear)
+        return function(**kwargs)
+
+    def __fetchSchedulesAndPlayoffBrackets(self, mflLeagues: list[dict]) -> None:
+        yearsAndLeagueIds = [
+            (self.__mflLeagueIdToYearMap[mflLeague["id"]], mflLeague["id"])
+            for mflLeague in mflLeagues
+        ]
+        responses = self._fetchAll(
+            [
+                self._cachedFetch(
+                    functools.partial(
+                        self.__fetchWithLogin,
+                        yearNumber,
+                        CommonLeagueInfoAPIClient.get_schedule,
+                        year=yearNumber,
+                        league_id=leagueId,
+                    ),
+                    endpoint="schedule",
+                    season=yearNumber,
+                )
+                for yearNumber, leagueId in yearsAndLeagueIds
+            ]
+            + [
+                self._cachedFetch(
+                    functools.partial(
+                        self.__fetchWithLogin,
+                        yearNumber,
+                        CommonLeagueInfoAPIClient.get_playoff_bracket,
+                        year=yearNumber,
+                        league_id=leagueId,
+                        bracket_id="1",
+                    ),
+                    endpoint="playoffBracket?bracketId=1",
+                    season=yearNumber,
+                )
+                for yearNumber, leagueId in yearsAndLeagueIds
+            ]
+        )
+        for i, (yearNumber, _) in enumerate(yearsAndLeagueIds):
+            self.__yearToMFLScheduleMap[yearNumber] = responses[i]["schedule"]
+            self.__yearToMFLPlayoffBracketMap[yearNumber] = responses[
+                len(yearsAndLeagueIds) + i
+            ]["playoffBracket"]
+
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
         mflLeagues = self.__getAllLeagues()
@@ -81,18 +177,25 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
                 yearToOwnerNamesMap[yearNumber].append(ownerName)
         return yearToOwnerNamesMap
 
+    @LeagueLoader._sharesHostRateLimiter
     def loadLeague(self, validate: bool = True) -> League:
-        mflLeagues = self.__getAllLeagues()
+        self._startLoad()
+        with self._timePhase("fetchLeagues"):
+            mflLeagues = self.__getAllLeagues()
+        with self._timePhase("fetchSchedulesAndPlayoffBrackets"):
+            self.__fetchSchedulesAndPlayoffBrackets(mflLeagues)
         league = self.__buildLeague(mflLeagues)
         if validate:
             # validate new league
-            leagueValidation.runAllChecks(league)
+            with self._timePhase("validateLeague"):
+                leagueValidation.runAllChecks(league)
         self._warnForUnusedOwnerNames(league)
         return league
 
     def __buildLeague(self, mflLeagues: list[dict]) -> League:
         years = list()
-        self.__loadOwners(mflLeagues)
+        with self._timePhase("buildOwners"):
+            self.__loadOwners(mflLeagues)
         owners = list(self.__mflFranchiseIdToOwnerMap.values())
         for mflLeague in mflLeagues:
             # save league name for each year
@@ -111,8 +214,10 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
                 name=division["name"]
             )
         yearNumber = self.__mflLeagueIdToYearMap[mflLeague["id"]]
-        teams = self.__buildTeams(mflLeague)
-        weeks = self.__buildWeeks(mflLeague)
+        with self._timePhase("buildTeams"):
+            teams = self.__buildTeams(mflLeague)
+        with self._timePhase("buildWeeks"):
+            weeks = self.__buildWeeks(mflLeague)
         # TODO: see if there are cases where MFL leagues do NOT have divisions
         year = Year(
             yearNumber=yearNumber,
@@ -127,13 +232,9 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
     def __buildWeeks(self, mflLeague: dict) -> list[Week]:
         yearNumber = self.__mflLeagueIdToYearMap[mflLeague["id"]]
         weeks = list()
-        schedule: dict = CommonLeagueInfoAPIClient.get_schedule(
-            year=yearNumber, league_id=mflLeague["id"]
-        )["schedule"]
+        schedule: dict = self.__yearToMFLScheduleMap[yearNumber]
         # get playoff brackets
-        playoffBracket: dict = CommonLeagueInfoAPIClient.get_playoff_bracket(
-            year=yearNumber, league_id=mflLeague["id"], bracket_id="1"
-        )["playoffBracket"]
+        playoffBracket: dict = self.__yearToMFLPlayoffBracketMap[yearNumber]
 
         # we will assume that the "true" playoff bracket (i.e. the bracket where the winner of it is the league champion)
         # will always be the playoff bracket with id "1".
@@ -164,6 +265,8 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
             local_matchups = week.get("matchup", {})
             if not local_matchups:
                 break
+            if not self._isWeekToLoad(yearNumber, weekNumber):
+                continue
             # Make sure that localMatchups is a list (some weeks just have a json element)
             if not (isinstance(local_matchups, list)):
                 local_matchups = [local_matchups]
@@ -1,5 +1,6 @@
+import functools
 import itertools
-from typing import Optional
+from typing import Callable, Optional
 
 from sleeper.api import LeagueAPIClient
 from sleeper.enum import PlayoffRoundType as SleeperPlayoffRoundType
@@ -8,13 +9,17 @@ from sleeper.enum import Sport as SleeperSport
 from sleeper.model import League as SleeperLeague
 from sleeper.model import Matchup as SleeperMatchup
 from sleeper.model import PlayoffMatchup as SleeperPlayoffMatchup
+from sleeper.model import Roster as SleeperRoster
 from sleeper.model import SportState as SleeperSportState
 from sleeper.model import User as SleeperUser
 
 from leeger.enum.MatchupType import MatchupType
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+from leeger.league_loader.fixture.ResponseFixtures import ResponseFixtures
 from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league import YearSettings
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
@@ -30,8 +35,13 @@ class SleeperLeagueLoader(LeagueLoader):
     """
     Responsible for loading a League from Sleeper Fantasy Football.
     https://sleeper.com/
+
+    Once every Sleeper league in the given years is found, the users, rosters, playoff brackets and weekly matchups of every year are fetched
+    with at most maxWorkers requests at once (and at most maxRequestsPerSecond requests each second) before the League is built.
     """
 
+    _HOST = "api.sleeper.app"
+    _PLATFORM = "sleeper"
     __INVALID_SLEEPER_LEAGUE_IDS = [None, "0"]
 
     def __init__(
@@ -41,12 +51,24 @@ class SleeperLeagueLoader(LeagueLoader):
         *,
         ownerNamesAndAliases: Optional[dict[str, list[str]]] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        responseCache: Optional[ResponseCache] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
+        responseFixtures: Optional[ResponseFixtures] = None,
     ):
         super().__init__(
             mostRecentLeagueId,
             years,
             ownerNamesAndAliases=ownerNamesAndAliases,
             leagueName=leagueName,
+            maxWorkers=maxWorkers,
+            maxRequestsPerSecond=maxRequestsPerSecond,
+            responseCache=responseCache,
+            onRequest=onRequest,
+            recordResponseSizes=recordResponseSizes,
+            responseFixtures=responseFixtures,
         )
 
         self.__sleeperUserIdToOwnerMap: dict[str, Owner] = dict()
@@ -54,31 +76,184 @@ class SleeperLeagueLoader(LeagueLoader):
         self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE = (
             dict()
         )  # functions as a cache for Sleeper Users
+        self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE: dict[str, list[SleeperRoster]] = (
+            dict()
+        )  # functions as a cache for Sleeper Rosters
+        self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE: dict[
+            str, list[SleeperPlayoffMatchup]
+        ] = dict()  # functions as a cache for Sleeper winners brackets
+        self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE: dict[
+            tuple[str, int], list[SleeperMatchup]
+        ] = dict()  # functions as a cache for Sleeper Matchups
         self.__SLEEPER_SPORT_STATE_CACHE: SleeperSportState = (
             None  # functions as a cache for Sleeper SportState
         )
+        self.__sleeperLeagueIdToSeasonMap: dict[str, int] = dict()
+        self.__completedSeasons: set[int] = set()
         self.__sleeperDivisionIdToDivisionMap: dict[int, Division] = (
             dict()
         )  # holds the division info for ONLY the current year
 
     def __resetCaches(self) -> None:
         self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE = dict()
+        self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE = dict()
+        self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE = dict()
+        self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE = dict()
         self.__SLEEPER_SPORT_STATE_CACHE = None
 
+    def __prefetchSleeperUsers(self, sleeperLeagues: list[SleeperLeague]) -> None:
+        leagueIds = [
+            sleeperLeague.league_id
+            for sleeperLeague in sleeperLeagues
+            if sleeperLeague.league_id not in self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE
+        ]
+        allSleeperUsers = self._fetchAll(
+            [
+                self.__getSleeperFetch(
+                    LeagueAPIClient.get_users_in_league, leagueId, "users"
+                )
+                for leagueId in leagueIds
+            ]
+        )
+        self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE.update(zip(leagueIds, allSleeperUsers))
+
+    def __prefetch(self, sleeperLeagues: list[SleeperLeague]) -> None:
+        """
+        Fetches everything needed to build the League from the given Sleeper leagues, with at most maxWorkers requests at once.
+        Matchups are fetched last, since the playoff weeks to fetch them for depend on the winners brackets.
+        Requests to each endpoint are made in the same order the League is built in.
+        """
+        self.__getSleeperSportState()
+        self.__prefetchSleeperUsers(sleeperLeagues)
+        leagueIds = [sleeperLeague.league_id for sleeperLeague in sleeperLeagues]
+        responses = self._fetchAll(
+            [
+                self.__getSleeperFetch(LeagueAPIClient.get_rosters, leagueId, "rosters")
+                for leagueId in leagueIds
+            ]
+            + [
+                self.__getSleeperFetch(
+                    LeagueAPIClient.get_winners_bracket, leagueId, "winnersBracket"
+                )
+                for leagueId in leagueIds
+            ]
+        )
+        self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE.update(
+            zip(leagueIds, responses[: len(leagueIds)])
+        )
+        self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE.update(
+            zip(leagueIds, responses[len(leagueIds) :])
+        )
+
+        leagueIdsAndWeekNumbers = list()
+        for sleeperLeague in sleeperLeagues:
+            for weekNumber in self.__getCompletedRegularSeasonWeekNumbers(
+                sleeperLeague
+            ):
+                leagueIdsAndWeekNumbers.append((sleeperLeague.league_id, weekNumber))
+            for weekNumber, _ in self.__getPlayoffWeekRoundList(
+                sleeperLeague,
+                self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE[
+                    sleeperLeague.league_id
+                ],
+            ):
+                leagueIdsAndWeekNumbers.append((sleeperLeague.league_id, weekNumber))
+        allSleeperMatchups = self._fetchAll(
+            [
+                self.__getSleeperFetch(
+                    LeagueAPIClient.get_matchups_for_week,
+                    leagueId,
+                    f"matchups?week={weekNumber}",
+                    weekNumber=weekNumber,
+                )
+                for leagueId, weekNumber in leagueIdsAndWeekNumbers
+            ]
+        )
+        self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE.update(
+            zip(leagueIdsAndWeekNumbers, allSleeperMatchups)
+        )
+
+    def _isCompletedSeason(self, season: Optional[int]) -> bool:
+        return season in self.__completedSeasons
+
+    def __getSleeperFetch(
+        self,
+        function: Callable,
+        leagueId: str,
+        endpoint: str,
+        *,
+        weekNumber: Optional[int] = None,
+    ) -> Callable:
+        kwargs = {"league_id": leagueId}
+        if weekNumber is not None:
+            kwargs["week"] = weekNumber
+        return self._cachedFetch(
+            functools.partial(function, **kwargs),
+            endpoint=endpoint,
+            season=self.__sleeperLeagueIdToSeasonMap.get(leagueId),
+            week=weekNumber,
+            leagueId=leagueId,
+        )
+
     def __getSleeperUsers(self, leagueId: str) -> list[SleeperUser]:
         if leagueId not in self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE:
             # don't have these users loaded yet
-            sleeperUsers = LeagueAPIClient.get_users_in_league(league_id=leagueId)
+            sleeperUsers = self.__getSleeperFetch(
+                LeagueAPIClient.get_users_in_league, leagueId, "users"
+            )()
             self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE[leagueId] = sleeperUsers
             return sleeperUsers
         # do have these users loaded
         return self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE[leagueId]
 
+    def __getSleeperRosters(self, leagueId: str) -> list[SleeperRoster]:
+        if leagueId not in self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE:
+            self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE[leagueId] = (
+                self.__getSleeperFetch(
+                    LeagueAPIClient.get_rosters, leagueId, "rosters"
+                )()
+            )
+        return self.__SLEEPER_ROSTERS_BY_LEAGUE_ID_CACHE[leagueId]
+
+    def __getSleeperWinnersBracket(self, leagueId: str) -> list[SleeperPlayoffMatchup]:
+        if leagueId not in self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE:
+            self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE[leagueId] = (
+                self.__getSleeperFetch(
+                    LeagueAPIClient.get_winners_bracket, leagueId, "winnersBracket"
+                )()
+            )
+        return self.__SLEEPER_WINNERS_BRACKET_BY_LEAGUE_ID_CACHE[leagueId]
+
+    def __getSleeperMatchups(
+        self, leagueId: str, weekNumber: int
+    ) -> list[SleeperMatchup]:
+        if (
+            leagueId,
+            weekNumber,
+        ) not in self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE:
+            self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE[
+                (leagueId, weekNumber)
+            ] = self.__getSleeperFetch(
+                LeagueAPIClient.get_matchups_for_week,
+                leagueId,
+                f"matchups?week={weekNumber}",
+                weekNumber=weekNumber,
+            )()
+        return self.__SLEEPER_MATCHUPS_BY_LEAGUE_ID_AND_WEEK_CACHE[
+            (leagueId, weekNumber)
+        ]
+
     def __getSleeperSportState(self):
         if self.__SLEEPER_SPORT_STATE_CACHE is None:
-            self.__SLEEPER_SPORT_STATE_CACHE = LeagueAPIClient.get_sport_state(
-                sport=SleeperSport.NFL
-            )
+            # the sport state changes every week, so it is never kept as a completed season
+            self.__SLEEPER_SPORT_STATE_CACHE = self._cachedFetch(
+                functools.partial(
+                    LeagueAPIClient.get_sport_state, sport=SleeperSport.NFL
+                ),
+                endpoint="state/nfl",
+                season=None,
+                isCompletedSeason=lambda _: False,
+            )()
         return self.__SLEEPER_SPORT_STATE_CACHE
 
     def __getAllLeagues(self) -> list[SleeperLeague]:
@@ -88,9 +263,21 @@ class SleeperLeagueLoader(LeagueLoader):
         while (
             len(years) > 0 and currentLeagueId not in self.__INVALID_SLEEPER_LEAGUE_IDS
         ):
-            currentLeague: SleeperLeague = LeagueAPIClient.get_league(
-                league_id=currentLeagueId
+            currentLeague: SleeperLeague = self._cachedFetch(
+                functools.partial(
+                    LeagueAPIClient.get_league, league_id=currentLeagueId
+                ),
+                endpoint="league",
+                season=None,
+                leagueId=currentLeagueId,
+                isCompletedSeason=lambda sleeperLeague: sleeperLeague.status
+                == SleeperSeasonStatus.COMPLETE,
+            )()
+            self.__sleeperLeagueIdToSeasonMap[currentLeague.league_id] = int(
+                currentLeague.season
             )
+            if currentLeague.status == SleeperSeasonStatus.COMPLETE:
+                self.__completedSeasons.add(int(currentLeague.season))
             if int(currentLeague.season) in years:
                 # we only want to add valid seasons
                 # NOTE: Not sure if we should include SleeperSeasonStatus.POSTPONED here or not
@@ -114,6 +301,7 @@ class SleeperLeagueLoader(LeagueLoader):
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
         sleeperLeagues = self.__getAllLeagues()
+        self.__prefetchSleeperUsers(sleeperLeagues)
         for sleeperLeague in sleeperLeagues:
             yearToOwnerNamesMap[int(sleeperLeague.season)] = list()
             sleeperUsers = self.__getSleeperUsers(sleeperLeague.league_id)
@@ -122,19 +310,26 @@ class SleeperLeagueLoader(LeagueLoader):
                 yearToOwnerNamesMap[int(sleeperLeague.season)].append(ownerName)
         return yearToOwnerNamesMap
 
+    @LeagueLoader._sharesHostRateLimiter
     def loadLeague(self, validate: bool = True) -> League:
-        sleeperLeagues = self.__getAllLeagues()
+        self._startLoad()
+        with self._timePhase("fetchLeagues"):
+            sleeperLeagues = self.__getAllLeagues()
+        with self._timePhase("fetchUsersRostersAndMatchups"):
+            self.__prefetch(sleeperLeagues)
         league = self.__buildLeague(sleeperLeagues)
         if validate:
             # validate new league
-            leagueValidation.runAllChecks(league)
+            with self._timePhase("validateLeague"):
+                leagueValidation.runAllChecks(league)
         self.__resetCaches()
         self._warnForUnusedOwnerNames(league)
         return league
 
     def __buildLeague(self, sleeperLeagues: list[SleeperLeague]) -> League:
         years = list()
-        self.__loadOwners(sleeperLeagues)
+        with self._timePhase("buildOwners"):
+            self.__loadOwners(sleeperLeagues)
         owners = list(self.__sleeperUserIdToOwnerMap.values())
         for sleeperLeague in sleeperLeagues:
             # save league name for each year
@@ -151,8 +346,10 @@ class SleeperLeagueLoader(LeagueLoader):
                 self.__sleeperDivisionIdToDivisionMap[divisionNumber] = Division(
                     name=getattr(sleeperLeague.metadata, f"division_{divisionNumber}")
                 )
-        teams = self.__buildTeams(sleeperLeague)
-        weeks = self.__buildWeeks(sleeperLeague)
+        with self._timePhase("buildTeams"):
+            teams = self.__buildTeams(sleeperLeague)
+        with self._timePhase("buildWeeks"):
+            weeks = self.__buildWeeks(sleeperLeague)
         # add YearSettings
         yearSettings = YearSettings()
         if sleeperLeague.settings.league_average_match == 1:
@@ -174,66 +371,55 @@ class SleeperLeagueLoader(LeagueLoader):
     def __buildWeeks(self, sleeperLeague: SleeperLeague) -> list[Week]:
         weeks = list()
         # get regular season weeks
-        # once we have found an incomplete week, all weeks after will also be incomplete
-        foundIncompleteWeek = False
-        for weekNumber in range(1, sleeperLeague.settings.playoff_week_start):
-            if not foundIncompleteWeek and self.__isCompletedWeek(
-                weekNumber, sleeperLeague
-            ):
-                # get each teams matchup for that week
-                matchups = list()
-                sleeperMatchupsForThisWeek = LeagueAPIClient.get_matchups_for_week(
-                    league_id=sleeperLeague.league_id, week=weekNumber
-                )
-                sleeperMatchupIdToSleeperMatchupMap: dict[int, list[SleeperMatchup]] = (
-                    dict()
-                )
-                for sleeperMatchup in sleeperMatchupsForThisWeek:
-                    if (
+        for weekNumber in self.__getCompletedRegularSeasonWeekNumbers(sleeperLeague):
+            # get each teams matchup for that week
+            matchups = list()
+            sleeperMatchupsForThisWeek = self.__getSleeperMatchups(
+                sleeperLeague.league_id, weekNumber
+            )
+            sleeperMatchupIdToSleeperMatchupMap: dict[int, list[SleeperMatchup]] = (
+                dict()
+            )
+            for sleeperMatchup in sleeperMatchupsForThisWeek:
+                if (
+                    sleeperMatchup.matchup_id
+                    in sleeperMatchupIdToSleeperMatchupMap.keys()
+                ):
+                    sleeperMatchupIdToSleeperMatchupMap[
                         sleeperMatchup.matchup_id
-                        in sleeperMatchupIdToSleeperMatchupMap.keys()
-                    ):
-                        sleeperMatchupIdToSleeperMatchupMap[
-                            sleeperMatchup.matchup_id
-                        ].append(sleeperMatchup)
-                    else:
-                        sleeperMatchupIdToSleeperMatchupMap[
-                            sleeperMatchup.matchup_id
-                        ] = [sleeperMatchup]
-
-                for sleeperMatchupPair in sleeperMatchupIdToSleeperMatchupMap.values():
-                    # team A
-                    teamASleeperMatchup = sleeperMatchupPair[0]
-                    teamA = self.__sleeperRosterIdToTeamMap[
-                        teamASleeperMatchup.roster_id
+                    ].append(sleeperMatchup)
+                else:
+                    sleeperMatchupIdToSleeperMatchupMap[sleeperMatchup.matchup_id] = [
+                        sleeperMatchup
                     ]
 
-                    # team B
-                    teamBSleeperMatchup = sleeperMatchupPair[1]
-                    teamB = self.__sleeperRosterIdToTeamMap[
-                        teamBSleeperMatchup.roster_id
-                    ]
+            for sleeperMatchupPair in sleeperMatchupIdToSleeperMatchupMap.values():
+                # team A
+                teamASleeperMatchup = sleeperMatchupPair[0]
+                teamA = self.__sleeperRosterIdToTeamMap[teamASleeperMatchup.roster_id]
 
-                    # sleeper does not have tiebreakers for regular season games
-                    # Source: https://support.sleeper.app/en/articles/4238872-can-i-set-tiebreakers#:~:text=We%20do%20not%20offer%20any,and%20adjust%20the%20point%20total.
-                    matchups.append(
-                        Matchup(
-                            teamAId=teamA.id,
-                            teamBId=teamB.id,
-                            teamAScore=teamASleeperMatchup.points,
-                            teamBScore=teamBSleeperMatchup.points,
-                            teamAHasTiebreaker=False,
-                            teamBHasTiebreaker=False,
-                            matchupType=MatchupType.REGULAR_SEASON,
-                        )
+                # team B
+                teamBSleeperMatchup = sleeperMatchupPair[1]
+                teamB = self.__sleeperRosterIdToTeamMap[teamBSleeperMatchup.roster_id]
+
+                # sleeper does not have tiebreakers for regular season games
+                # Source: https://support.sleeper.app/en/articles/4238872-can-i-set-tiebreakers#:~:text=We%20do%20not%20offer%20any,and%20adjust%20the%20point%20total.
+                matchups.append(
+                    Matchup(
+                        teamAId=teamA.id,
+                        teamBId=teamB.id,
+                        teamAScore=teamASleeperMatchup.points,
+                        teamBScore=teamBSleeperMatchup.points,
+                        teamAHasTiebreaker=False,
+                        teamBHasTiebreaker=False,
+                        matchupType=MatchupType.REGULAR_SEASON,
                     )
-                weeks.append(Week(weekNumber=weekNumber, matchups=matchups))
-            else:
-                foundIncompleteWeek = True
+                )
+            weeks.append(Week(weekNumber=weekNumber, matchups=matchups))
         # get playoff weeks
         # NOTE: bye weeks will not be returned here. That's ok because we don't want those anyways
-        allSleeperPlayoffMatchups = LeagueAPIClient.get_winners_bracket(
-            league_id=sleeperLeague.league_id
+        allSleeperPlayoffMatchups = self.__getSleeperWinnersBracket(
+            sleeperLeague.league_id
         )
         if len(allSleeperPlayoffMatchups) > 0:
             # sort sleeperPlayoffMatchups by round into a dict
@@ -252,26 +438,14 @@ class SleeperLeagueLoader(LeagueLoader):
                     playoffRoundAndSleeperPlayoffMatchups[
                         sleeperPlayoffMatchup.round
                     ] = [sleeperPlayoffMatchup]
-            numberOfPlayoffRounds = max(
-                [playoffMatchup.round for playoffMatchup in allSleeperPlayoffMatchups]
-            )  # don't know a better way to determine this
-            numberOfPlayoffWeeks = self.__calculate_number_of_playoff_weeks(
+            playoffWeekRoundList = self.__getPlayoffWeekRoundList(
                 sleeperLeague, allSleeperPlayoffMatchups
             )
-            playoffWeeks = list(
-                range(
-                    sleeperLeague.settings.playoff_week_start,
-                    sleeperLeague.settings.playoff_week_start + numberOfPlayoffWeeks,
-                )
-            )
-            playoffWeekRoundList = self.__create_playoff_week_round_list(
-                sleeperLeague, playoffWeeks, numberOfPlayoffRounds
-            )
             for weekNumber, roundNumber in playoffWeekRoundList:
                 # get each teams matchup for that week
                 matchups = list()
-                sleeperMatchupsForThisWeek = LeagueAPIClient.get_matchups_for_week(
-                    league_id=sleeperLeague.league_id, week=weekNumber
+                sleeperMatchupsForThisWeek = self.__getSleeperMatchups(
+                    sleeperLeague.league_id, weekNumber
                 )
                 # remove matchups that don't have a matchup id
                 sleeperMatchupsForThisWeek = [
@@ -352,6 +526,45 @@ class SleeperLeagueLoader(LeagueLoader):
                     weeks.append(Week(weekNumber=weekNumber, matchups=matchups))
         return weeks
 
+    def __getCompletedRegularSeasonWeekNumbers(
+        self, sleeperLeague: SleeperLeague
+    ) -> list[int]:
+        weekNumbers = list()
+        for weekNumber in range(1, sleeperLeague.settings.playoff_week_start):
+            # once we have found an incomplete week, all weeks after will also be incomplete
+            if not self.__isCompletedWeek(weekNumber, sleeperLeague):
+                break
+            if self._isWeekToLoad(int(sleeperLeague.season), weekNumber):
+                weekNumbers.append(weekNumber)
+        return weekNumbers
+
+    def __getPlayoffWeekRoundList(
+        self,
+        sleeperLeague: SleeperLeague,
+        allSleeperPlayoffMatchups: list[SleeperPlayoffMatchup],
+    ) -> list[tuple[int, int]]:
+        if len(allSleeperPlayoffMatchups) == 0:
+            return list()
+        numberOfPlayoffRounds = max(
+            [playoffMatchup.round for playoffMatchup in allSleeperPlayoffMatchups]
+        )  # don't know a better way to determine this
+        numberOfPlayoffWeeks = self.__calculate_number_of_playoff_weeks(
+            sleeperLeague, allSleeperPlayoffMatchups
+        )
+        playoffWeeks = list(
+            range(
+                sleeperLeague.settings.playoff_week_start,
+                sleeperLeague.settings.playoff_week_start + numberOfPlayoffWeeks,
+            )
+        )
+        return [
+            (weekNumber, roundNumber)
+            for weekNumber, roundNumber in self.__create_playoff_week_round_list(
+                sleeperLeague, playoffWeeks, numberOfPlayoffRounds
+            )
+            if self._isWeekToLoad(int(sleeperLeague.season), weekNumber)
+        ]
+
     def __yearHasDivisions(self, sleeperLeague: SleeperLeague) -> bool:
         return sleeperLeague.settings.divisions not in [None, 0]
 
@@ -367,7 +580,7 @@ class SleeperLeagueLoader(LeagueLoader):
     def __buildTeams(self, sleeperLeague: SleeperLeague) -> list[Team]:
         teams = list()
         sleeperUsers = self.__getSleeperUsers(sleeperLeague.league_id)
-        sleeperRosters = LeagueAPIClient.get_rosters(league_id=sleeperLeague.league_id)
+        sleeperRosters = self.__getSleeperRosters(sleeperLeague.league_id)
         for sleeperUser in sleeperUsers:
             # connect a sleeperUser to a sleeperRoster
             rosterId = None
@@ -1,6 +1,6 @@
 import multiprocessing
 import subprocess
-from typing import Optional
+from typing import Callable, Optional
 
 from yahoofantasy import Context as YahooContext
 from yahoofantasy import League as YahooLeague
@@ -12,6 +12,7 @@ from leeger.enum.MatchupType import MatchupType
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
 from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.report.RequestRecord import RequestRecord
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Owner import Owner
@@ -25,8 +26,13 @@ class YahooLeagueLoader(LeagueLoader):
     """
     Responsible for loading a League from Yahoo Fantasy Football.
     https://football.fantasysports.yahoo.com/
+
+    The scoreboards for every week in a season are fetched once, with at most maxWorkers requests at once
+    (and at most maxRequestsPerSecond requests each second), before the weeks are built.
     """
 
+    _HOST = "fantasysports.yahooapis.com"
+    _PLATFORM = "yahoo"
     __NFL = "nfl"
 
     def __init__(
@@ -39,6 +45,10 @@ class YahooLeagueLoader(LeagueLoader):
         loginTimeoutSeconds: Optional[int] = 20,
         ownerNamesAndAliases: Optional[dict[str, list[str]]] = None,
         leagueName: Optional[str] = None,
+        maxWorkers: int = 1,
+        maxRequestsPerSecond: Optional[float] = None,
+        onRequest: Optional[Callable[[RequestRecord], None]] = None,
+        recordResponseSizes: bool = False,
     ):
         # validation
         try:
@@ -52,6 +62,10 @@ class YahooLeagueLoader(LeagueLoader):
             years,
             ownerNamesAndAliases=ownerNamesAndAliases,
             leagueName=leagueName,
+            maxWorkers=maxWorkers,
+            maxRequestsPerSecond=maxRequestsPerSecond,
+            onRequest=onRequest,
+            recordResponseSizes=recordResponseSizes,
         )
         self.__clientId = clientId
         self.__clientSecret = clientSecret
@@ -128,12 +142,16 @@ class YahooLeagueLoader(LeagueLoader):
                 yearToOwnerNamesMap[yahooLeague.season].append(ownerName)
         return yearToOwnerNamesMap
 
+    @LeagueLoader._sharesHostRateLimiter
     def loadLeague(self, validate: bool = True) -> League:
-        yahooLeagues = self.__getAllLeagues()
+        self._startLoad()
+        with self._timePhase("fetchLeagues"):
+            yahooLeagues = self.__getAllLeagues()
         league = self.__buildLeague(yahooLeagues)
         if validate:
             # validate new league
-            leagueValidation.runAllChecks(league)
+            with self._timePhase("validateLeague"):
+                leagueValidation.runAllChecks(league)
         self._warnForUnusedOwnerNames(league)
         return league
 
@@ -142,26 +160,62 @@ class YahooLeagueLoader(LeagueLoader):
         for yahooLeague in yahooLeagues:
             # save league name for each year
             self._leagueNameByYear[yahooLeague.season] = yahooLeague.name
-            self.__loadOwners(yahooLeague.teams())
-            years.append(self.__buildYear(yahooLeague))
+            with self._timePhase("fetchTeams"):
+                yahooTeams = yahooLeague.teams()
+            with self._timePhase("buildOwners"):
+                self.__loadOwners(yahooTeams)
+            years.append(self.__buildYear(yahooLeague, yahooTeams))
         return League(
             name=self._getLeagueName(),
             owners=list(self.__yahooManagerIdToOwnerMap.values()),
             years=self._getValidYears(years),
         )
 
-    def __buildYear(self, yahooLeague: YahooLeague) -> Year:
+    def __buildYear(
+        self, yahooLeague: YahooLeague, yahooTeams: list[YahooTeam]
+    ) -> Year:
         self.__yearToTeamIdHasLostInPlayoffs[yahooLeague.season] = dict()
-        teams = self.__buildTeams(yahooLeague.teams())
-        weeks = self.__buildWeeks(yahooLeague)
+        with self._timePhase("buildTeams"):
+            teams = self.__buildTeams(yahooTeams)
+        with self._timePhase("fetchScoreboards"):
+            yahooWeeks = self.__getYahooWeeks(yahooLeague)
+        with self._timePhase("buildWeeks"):
+            weeks = self.__buildWeeks(yahooWeeks)
         return Year(yearNumber=yahooLeague.season, teams=teams, weeks=weeks)
 
-    def __buildWeeks(self, yahooLeague: YahooLeague) -> list[Week]:
+    def __getYahooWeeks(self, yahooLeague: YahooLeague) -> list[YahooWeek]:
+        """
+        Fetches the scoreboard for every week to load in the given Yahoo league, with at most maxWorkers requests at once.
+        YahooLeague.weeks() is not used, since it fetches every week in the season each time it is called.
+        """
+        # current week seems to be the last week in the league
+        weekNumbers = [
+            weekNumber
+            for weekNumber in range(
+                1, min(yahooLeague.current_week, yahooLeague.end_week) + 1
+            )
+            if self._isWeekToLoad(yahooLeague.season, weekNumber)
+        ]
+        yahooWeeks = [
+            YahooWeek(yahooLeague.ctx, yahooLeague, weekNumber)
+            for weekNumber in weekNumbers
+        ]
+        self._fetchAll(
+            [
+                self._cachedFetch(
+                    yahooWeek.sync,
+                    endpoint=f"scoreboard;week={weekNumber}",
+                    season=yahooLeague.season,
+                    week=weekNumber,
+                )
+                for weekNumber, yahooWeek in zip(weekNumbers, yahooWeeks)
+            ]
+        )
+        return yahooWeeks
+
+    def __buildWeeks(self, yahooWeeks: list[YahooWeek]) -> list[Week]:
         weeks = list()
-        for i in range(
-            yahooLeague.current_week
-        ):  # current week seems to be the last week in the league
-            yahooWeek: YahooWeek = yahooLeague.weeks()[i]
+        for yahooWeek in yahooWeeks:
             # get each teams matchup for that week
             matchups = list()
             # only get matchups that are completed
@@ -201,49 +255,35 @@ class YahooLeagueLoader(LeagueLoader):
                     )
                 )
             if len(matchups) > 0:
-                weeks.append(Week(weekNumber=i + 1, matchups=matchups))
+                weeks.append(Week(weekNumber=yahooWeek.week_num, matchups=matchups))
         return weeks
 
     def __getMatchupType(self, yahooMatchup: YahooMatchup) -> MatchupType:
-        team1Id = yahooMatchup.teams.team[0].team_id
-        team2Id = yahooMatchup.teams.team[1].team_id
         # check if this is a playoff week
         if yahooMatchup.is_playoffs == 1:
+            teamIdHasLostInPlayoffs = self.__yearToTeamIdHasLostInPlayoffs[
+                yahooMatchup.league.season
+            ]
+            yahooTeamResults = yahooMatchup.teams.team
             # figure out if this is the last week of playoffs (the championship week)
             if yahooMatchup.week == yahooMatchup.league.end_week:
                 # this is the championship week
                 # figure out if either team has lost in the playoffs yet (or hasn't played in the playoffs yet, in case their first game is the championship)
                 if (
-                    (
-                        team1Id
-                        not in self.__yearToTeamIdHasLostInPlayoffs[
-                            yahooMatchup.league.season
-                        ]
-                        or not self.__yearToTeamIdHasLostInPlayoffs[
-                            yahooMatchup.league.season
-                        ][team1Id]
-                    )
-                    and (
-                        team2Id
-                        not in self.__yearToTeamIdHasLostInPlayoffs[
-                            yahooMatchup.league.season
-                        ]
-                        or not self.__yearToTeamIdHasLostInPlayoffs[
-                            yahooMatchup.league.season
-                        ][team2Id]
+                    not any(
+                        teamIdHasLostInPlayoffs.get(yahooTeamResult.team_id, False)
+                        for yahooTeamResult in yahooTeamResults[:2]
                     )
                     and yahooMatchup.is_consolation == 0
                 ):
                     return MatchupType.CHAMPIONSHIP
             # update tracking dict with the team that lost
-            for yahooTeamResult in yahooMatchup.teams.team:
+            for yahooTeamResult in yahooTeamResults:
                 # NOTE: this check is needed so we don't overwrite teams that have already lost with a win (e.g. W, L, W)
-                if not self.__yearToTeamIdHasLostInPlayoffs[
-                    yahooMatchup.league.season
-                ].get(yahooTeamResult.team_id, False):
-                    self.__yearToTeamIdHasLostInPlayoffs[yahooMatchup.league.season][
-                        yahooTeamResult.team_id
-                    ] = yahooTeamResult.team_key != yahooMatchup.winner_team_key
+                if not teamIdHasLostInPlayoffs.get(yahooTeamResult.team_id, False):
+                    teamIdHasLostInPlayoffs[yahooTeamResult.team_id] = (
+                        yahooTeamResult.team_key != yahooMatchup.winner_team_key
+                    )
             return MatchupType.PLAYOFF
         else:
             return MatchupType.REGULAR_SEASON
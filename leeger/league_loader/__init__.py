@@ -1,3 +1,4 @@
+from .bulk import LeagueSpec, loadLeagues
 from .ESPNLeagueLoader import ESPNLeagueLoader
 from .MyFantasyLeagueLeagueLoader import MyFantasyLeagueLeagueLoader
 from .SleeperLeagueLoader import SleeperLeagueLoader
@@ -0,0 +1,113 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from leeger.league_loader.ESPNLeagueLoader import ESPNLeagueLoader
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.MyFantasyLeagueLeagueLoader import (
+    MyFantasyLeagueLeagueLoader,
+)
+from leeger.league_loader.SleeperLeagueLoader import SleeperLeagueLoader
+from leeger.league_loader.YahooLeagueLoader import YahooLeagueLoader
+from leeger.model.league.League import League
+
+PLATFORM_TO_LEAGUE_LOADER_MAP: dict[str, type[LeagueLoader]] = {
+    leagueLoaderClass._PLATFORM: leagueLoaderClass
+    for leagueLoaderClass in (
+        ESPNLeagueLoader,
+        FleaflickerLeagueLoader,
+        MyFantasyLeagueLeagueLoader,
+        SleeperLeagueLoader,
+        YahooLeagueLoader,
+    )
+}
+
+
+@dataclass(kw_only=True, frozen=True)
+class LeagueSpec:
+    """
+    Used to describe a League to load with loadLeagues().
+    """
+
+    platform: str  # one of PLATFORM_TO_LEAGUE_LOADER_MAP (i.e. "sleeper")
+    leagueId: str
+    years: list[int]
+    # any other keyword arguments to give the League Loader (i.e. {"espnS2": "...", "swid": "..."})
+    leagueLoaderKwargs: dict = field(default_factory=dict)
+
+    def getLeagueLoader(self, **kwargs) -> LeagueLoader:
+        """
+        Returns a League Loader for *this* League.
+        The given kwargs are used for any keyword arguments not in leagueLoaderKwargs.
+        """
+        if self.platform not in PLATFORM_TO_LEAGUE_LOADER_MAP:
+            raise ValueError(
+                f"Platform '{self.platform}' is not supported. Supported platforms: {sorted(PLATFORM_TO_LEAGUE_LOADER_MAP)}"
+            )
+        return PLATFORM_TO_LEAGUE_LOADER_MAP[self.platform](
+            self.leagueId, self.years, **(kwargs | self.leagueLoaderKwargs)
+        )
+
+
+async def loadLeagues(
+    leagueSpecs: list[LeagueSpec],
+    *,
+    maxConcurrentLeagues: int = 4,
+    maxRequestsPerSecondByPlatform: Optional[dict[str, float]] = None,
+    validate: bool = True,
+    returnExceptions: bool = False,
+) -> AsyncIterator[tuple[LeagueSpec, League | Exception]]:
+    """
+    Loads every given League, with at most maxConcurrentLeagues being loaded at once.
+    Yields each LeagueSpec with its League as soon as that League is loaded, so Leagues are yielded in the order they finish.
+
+    maxRequestsPerSecondByPlatform is shared by every League being loaded from the same platform (i.e. {"sleeper": 10}).
+    A LeagueSpec can give its own "maxRequestsPerSecond", but League Loaders loading from a platform at the same time share one rate,
+    so the lowest rate given by a League that is still loading is used.
+    If returnExceptions is True, a League that fails to load is yielded as the exception it raised instead of stopping every other load.
+
+    Each League is loaded in a worker thread (see LeagueLoader.loadLeagueAsync()).
+    If the caller stops iterating early (or a load fails), Leagues that haven't started loading are not loaded,
+    but a thread cannot be stopped, so Leagues that are already loading keep loading in the background until they finish,
+    and keep sharing their platform's rate limit until then.
+
+    Usage:
+        async for leagueSpec, league in loadLeagues(leagueSpecs, maxConcurrentLeagues=8):
+            ...
+    """
+    if not isinstance(maxConcurrentLeagues, int) or maxConcurrentLeagues < 1:
+        raise ValueError("'maxConcurrentLeagues' must be an int that is at least 1.")
+    maxRequestsPerSecondByPlatform = maxRequestsPerSecondByPlatform or dict()
+    # make every League Loader before loading anything, so a bad LeagueSpec fails fast
+    leagueLoaders = [
+        leagueSpec.getLeagueLoader(
+            maxRequestsPerSecond=maxRequestsPerSecondByPlatform.get(leagueSpec.platform)
+        )
+        for leagueSpec in leagueSpecs
+    ]
+    semaphore = asyncio.Semaphore(maxConcurrentLeagues)
+
+    async def load(
+        leagueSpec: LeagueSpec, leagueLoader: LeagueLoader
+    ) -> tuple[LeagueSpec, League | Exception]:
+        async with semaphore:
+            try:
+                return leagueSpec, await leagueLoader.loadLeagueAsync(validate)
+            except Exception as e:
+                if not returnExceptions:
+                    raise
+                return leagueSpec, e
+
+    tasks = [
+        asyncio.create_task(load(leagueSpec, leagueLoader))
+        for leagueSpec, leagueLoader in zip(leagueSpecs, leagueLoaders)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        # stop Leagues that haven't started loading if the caller stops early or a load fails
+        # Leagues already loading in a worker thread still finish in the background
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,62 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Optional
+
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+
+
+class DirectoryResponseCache(ResponseCache):
+    """
+    Keeps League Loader responses as files in the given directory, one file for each response.
+    """
+
+    def __init__(
+        self, directory: str, *, inProgressSeasonTTLSeconds: Optional[float] = None
+    ):
+        super().__init__(inProgressSeasonTTLSeconds=inProgressSeasonTTLSeconds)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __getFilePath(self, key: str) -> str:
+        fileName = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key.split("/")[0], f"{fileName}.pickle")
+
+    def _read(self, key: str) -> Optional[tuple[float, bool, bytes]]:
+        try:
+            with open(self.__getFilePath(key), "rb") as file:
+                storedKey, createdAt, isCompletedSeason, data = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._LOGGER.warning(f"Could not read cached response '{key}': {e}")
+            return None
+        # keys with the same hash are not the same key
+        if storedKey != key:
+            return None
+        return createdAt, isCompletedSeason, data
+
+    def _write(
+        self, key: str, createdAt: float, isCompletedSeason: bool, data: bytes
+    ) -> None:
+        filePath = self.__getFilePath(key)
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+        # write to a temporary file first, so a response being read is never partly written
+        fileDescriptor, temporaryFilePath = tempfile.mkstemp(
+            dir=os.path.dirname(filePath)
+        )
+        try:
+            with os.fdopen(fileDescriptor, "wb") as file:
+                pickle.dump((key, createdAt, isCompletedSeason, data), file)
+            os.replace(temporaryFilePath, filePath)
+        except BaseException:
+            os.remove(temporaryFilePath)
+            raise
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
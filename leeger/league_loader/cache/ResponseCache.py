@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from abc import abstractmethod
+from typing import Any, Optional
+
+from leeger.util.ConfigReader import ConfigReader
+from leeger.util.CustomLogger import CustomLogger
+
+
+class ResponseCache:
+    """
+    Response Cache classes should inherit this.
+    Keeps the responses League Loaders get from platforms, so loading a League again does not request them again.
+
+    Responses are kept by platform, league ID, season and endpoint.
+    Responses for completed seasons are kept forever, since they never change.
+    Responses for seasons that are not completed are kept for inProgressSeasonTTLSeconds.
+    Responses are pickled, so any response that can't be pickled is not kept.
+    """
+
+    DEFAULT_IN_PROGRESS_SEASON_TTL_SECONDS = ConfigReader.get(
+        "CACHE", "IN_PROGRESS_SEASON_RESPONSE_TTL_SECONDS", asType=float
+    )
+
+    def __init__(self, *, inProgressSeasonTTLSeconds: Optional[float] = None):
+        self._LOGGER = CustomLogger().getLogger()
+        self.inProgressSeasonTTLSeconds = (
+            inProgressSeasonTTLSeconds
+            if inProgressSeasonTTLSeconds is not None
+            else self.DEFAULT_IN_PROGRESS_SEASON_TTL_SECONDS
+        )
+        self.__statsLock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__writes = 0
+
+    @staticmethod
+    def getKey(
+        *, platform: str, leagueId: str, season: Optional[int], endpoint: str
+    ) -> str:
+        """
+        Returns the key a response is kept by.
+        """
+        return f"{platform}/{leagueId}/{season}/{endpoint}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Returns whether a response that has not expired is kept for the given key, and the response if it is.
+        """
+        found = self._read(key)
+        if found is not None:
+            createdAt, isCompletedSeason, data = found
+            if (
+                isCompletedSeason
+                or time.time() - createdAt < self.inProgressSeasonTTLSeconds
+            ):
+                try:
+                    response = pickle.loads(data)
+                except Exception as e:
+                    self._LOGGER.warning(f"Could not read cached response '{key}': {e}")
+                else:
+                    self.__count(hits=1)
+                    return True, response
+        self.__count(misses=1)
+        return False, None
+
+    def set(self, key: str, response: Any, *, isCompletedSeason: bool) -> None:
+        """
+        Keeps the given response for the given key.
+        """
+        try:
+            data = pickle.dumps(response)
+        except Exception as e:
+            self._LOGGER.warning(f"Could not cache response '{key}': {e}")
+            return
+        self._write(key, time.time(), isCompletedSeason, data)
+        self.__count(writes=1)
+
+    def getStats(self) -> dict[str, int]:
+        """
+        Returns how *this* cache has been used.
+
+        Example response:
+            {
+            "hits": 120,
+            "misses": 12,
+            "writes": 12
+            }
+        """
+        with self.__statsLock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "writes": self.__writes,
+            }
+
+    def __count(self, *, hits: int = 0, misses: int = 0, writes: int = 0) -> None:
+        with self.__statsLock:
+            self.__hits += hits
+            self.__misses += misses
+            self.__writes += writes
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[tuple[float, bool, bytes]]:
+        """
+        Returns (when the response was kept, whether it is for a completed season, the pickled response) for the given key.
+        Returns None if no response is kept for the given key.
+        """
+
+    @abstractmethod
+    def _write(
+        self, key: str, createdAt: float, isCompletedSeason: bool, data: bytes
+    ) -> None:
+        """
+        Keeps the given pickled response for the given key, replacing any response already kept for it.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes every kept response.
+        """
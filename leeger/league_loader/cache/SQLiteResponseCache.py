@@ -0,0 +1,51 @@
+import sqlite3
+import threading
+from typing import Optional
+
+from leeger.league_loader.cache.ResponseCache import ResponseCache
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Keeps League Loader responses in a table in the SQLite database at the given file path.
+    """
+
+    def __init__(
+        self, filePath: str, *, inProgressSeasonTTLSeconds: Optional[float] = None
+    ):
+        super().__init__(inProgressSeasonTTLSeconds=inProgressSeasonTTLSeconds)
+        self.filePath = filePath
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(filePath, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS response "
+                "(key TEXT PRIMARY KEY, createdAt REAL, isCompletedSeason INTEGER, data BLOB)"
+            )
+
+    def _read(self, key: str) -> Optional[tuple[float, bool, bytes]]:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT createdAt, isCompletedSeason, data FROM response WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], bool(row[1]), row[2]
+
+    def _write(
+        self, key: str, createdAt: float, isCompletedSeason: bool, data: bytes
+    ) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?)",
+                (key, createdAt, int(isCompletedSeason), data),
+            )
+
+    def clear(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM response")
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
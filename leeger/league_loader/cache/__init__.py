@@ -0,0 +1,3 @@
+from .DirectoryResponseCache import DirectoryResponseCache
+from .ResponseCache import ResponseCache
+from .SQLiteResponseCache import SQLiteResponseCache
@@ -0,0 +1,101 @@
+import os
+import pickle
+import tempfile
+import time
+import urllib.parse
+from typing import Any, Callable, Optional, TypeVar
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.exception.LeagueLoaderException import LeagueLoaderException
+
+T = TypeVar("T")
+
+
+class ResponseFixtures:
+    """
+    Saves the responses League Loaders get from platforms as files in the given directory, so a League can be loaded again without the platform.
+
+    In FixtureMode.RECORD, every request is made to the platform and its response is saved, replacing any response already saved for it.
+    In FixtureMode.REPLAY, no requests are made to the platform and the saved responses are returned instead.
+    Each replayed response waits latencySeconds first, or as long as the request took when it was recorded if latencySeconds is None,
+    so loads can be timed with different maxWorkers and maxRequestsPerSecond offline.
+
+    Responses are saved by platform, league ID, season and endpoint (like ResponseCache), one file for each response:
+        {directory}/{platform}/{leagueId}/{season}/{endpoint}.pickle
+    Responses are pickled, so only responses that can be pickled can be recorded.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        mode: FixtureMode,
+        *,
+        latencySeconds: Optional[float] = 0.0,
+    ):
+        if not isinstance(mode, FixtureMode):
+            raise ValueError("'mode' must be a FixtureMode.")
+        if latencySeconds is not None and (
+            not isinstance(latencySeconds, (int, float)) or latencySeconds < 0
+        ):
+            raise ValueError(
+                "'latencySeconds' must be None or a number that is at least 0."
+            )
+        self.directory = directory
+        self.mode = mode
+        self.latencySeconds = latencySeconds
+        if mode == FixtureMode.RECORD:
+            os.makedirs(directory, exist_ok=True)
+
+    def getFilePath(self, key: str) -> str:
+        """
+        Returns the path of the file the response for the given ResponseCache key is saved in.
+        """
+        # keys look like "{platform}/{leagueId}/{season}/{endpoint}" and endpoints can have any characters
+        *directories, endpoint = key.split("/", 3)
+        return os.path.join(
+            self.directory,
+            *[urllib.parse.quote(name, safe="") for name in directories],
+            f"{urllib.parse.quote(endpoint, safe='')}.pickle",
+        )
+
+    def getFetch(self, fetch: Callable[[], T], key: str) -> Callable[[], T]:
+        """
+        Returns a fetch that records or replays the response of the given fetch for the given ResponseCache key.
+        """
+        if self.mode == FixtureMode.RECORD:
+            return lambda: self.__record(fetch, key)
+        return lambda: self.__replay(key)
+
+    def __record(self, fetch: Callable[[], T], key: str) -> T:
+        start = time.perf_counter()
+        response = fetch()
+        seconds = time.perf_counter() - start
+        try:
+            data = pickle.dumps((key, seconds, response))
+        except Exception as e:
+            raise LeagueLoaderException(f"Could not record response '{key}': {e}")
+        filePath = self.getFilePath(key)
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+        # write to a temporary file first, so a response being replayed is never partly written
+        fileDescriptor, temporaryFilePath = tempfile.mkstemp(
+            dir=os.path.dirname(filePath)
+        )
+        try:
+            with os.fdopen(fileDescriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporaryFilePath, filePath)
+        except BaseException:
+            os.remove(temporaryFilePath)
+            raise
+        return response
+
+    def __replay(self, key: str) -> Any:
+        try:
+            with open(self.getFilePath(key), "rb") as file:
+                _, seconds, response = pickle.load(file)
+        except FileNotFoundError:
+            raise LeagueLoaderException(
+                f"No response recorded for '{key}' in '{self.directory}'."
+            )
+        time.sleep(self.latencySeconds if self.latencySeconds is not None else seconds)
+        return response
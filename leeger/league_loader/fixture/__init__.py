@@ -0,0 +1 @@
+from .ResponseFixtures import ResponseFixtures
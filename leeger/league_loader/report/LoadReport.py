@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from leeger.league_loader.report.RequestRecord import RequestRecord
+
+
+@dataclass(kw_only=True, frozen=True)
+class LoadReport:
+    """
+    Used to describe where the last load of a League Loader spent its time.
+    """
+
+    platform: Optional[str]
+    leagueId: str
+    requests: list[RequestRecord]  # in the order the responses were got
+    phaseTimings: dict[
+        str, float
+    ]  # seconds each phase took, in the order the phases were run
+
+    @property
+    def requestCount(self) -> int:
+        """
+        Returns how many requests were made to the platform.
+        """
+        return sum(1 for request in self.requests if not request.cacheHit)
+
+    @property
+    def cacheHitCount(self) -> int:
+        return sum(1 for request in self.requests if request.cacheHit)
+
+    @property
+    def requestSeconds(self) -> float:
+        """
+        Returns the total seconds spent on requests to the platform.
+        Requests made at once are all counted, so this can be more than the time the load took.
+        """
+        return sum(request.seconds for request in self.requests if not request.cacheHit)
+
+    def getEndpointSummaries(self) -> dict[str, dict[str, int | float]]:
+        """
+        Returns the number of requests, cache hits, total seconds and total bytes for each endpoint, like:
+        {"scoreboard": {"requests": 16, "cacheHits": 1, "seconds": 3.2, "bytes": 123456}, ...}
+        """
+        endpointSummaries: dict[str, dict[str, int | float]] = dict()
+        for request in self.requests:
+            endpointSummary = endpointSummaries.setdefault(
+                request.endpointName,
+                {"requests": 0, "cacheHits": 0, "seconds": 0.0, "bytes": 0},
+            )
+            endpointSummary["cacheHits" if request.cacheHit else "requests"] += 1
+            endpointSummary["seconds"] += request.seconds
+            endpointSummary["bytes"] += request.bytes or 0
+        return endpointSummaries
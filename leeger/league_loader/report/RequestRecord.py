@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True)
+class RequestRecord:
+    """
+    Used to describe one response a League Loader got, either from the platform or from its responseCache.
+    """
+
+    endpoint: str  # i.e. "scoreboard?scoringPeriod=1"
+    season: Optional[int]
+    week: Optional[int]
+    seconds: float  # how long the response took to get, not counting any wait for maxRequestsPerSecond
+    bytes: Optional[
+        int
+    ]  # the size of the response as JSON, if it is JSON and the League Loader was made with recordResponseSizes=True
+    cacheHit: bool  # whether the response came from the responseCache
+
+    @property
+    def endpointName(self) -> str:
+        """
+        Returns the endpoint without its parameters (i.e. "scoreboard" for "scoreboard?scoringPeriod=1").
+        """
+        return self.endpoint.split("?")[0].split(";")[0]
@@ -0,0 +1,2 @@
+from .LoadReport import LoadReport
+from .RequestRecord import RequestRecord
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+from typing import Any, Iterable, Optional
+
+
+class Fingerprinted:
+    """
+    Model classes should inherit this in order to have a .fingerprint property.
+
+    A fingerprint is a digest of every field in a model, where each child model is represented by its own fingerprint.
+    Fingerprints are cached, so getting the fingerprint of a model that has not changed is O(1).
+
+    Setting a field or changing a list field marks the model as changed.
+    A changed model also marks every model that holds it as changed, so the fingerprint of a League notices a change to any of its Matchups.
+    List fields are kept as a FingerprintedList.
+    A FingerprintedList that is given is kept as is, so it can still be filled after it is given to a model.
+    Any other list is copied into a new FingerprintedList, so changes to the given list are not seen by the model.
+    """
+
+    # bytes that are a whole fingerprint
+    FINGERPRINT_SIZE = 16
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self.__dataclass_fields__:
+            object.__setattr__(self, name, value)
+            return
+        if isinstance(value, FingerprintedList):
+            value._addOwner(self)
+        elif isinstance(value, list):
+            value = FingerprintedList(value, owner=self)
+        else:
+            self.__adopt(value)
+        object.__setattr__(self, name, value)
+        self._markChanged()
+
+    def __getstate__(self) -> dict:
+        # fingerprints and the models holding *this* model belong to this instance only
+        state = self.__dict__.copy()
+        state.pop("_fingerprint", None)
+        state.pop("_parents", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        Returns the fingerprint of *this* model.
+        Models with the same fields and children have the same fingerprint.
+        """
+        fingerprint = self.__dict__.get("_fingerprint")
+        if fingerprint is None:
+            fingerprint = self.__getFingerprint()
+            object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
+    def _markChanged(self) -> None:
+        """
+        Clears the cached fingerprint of *this* model and of every model that holds it.
+        """
+        modelsToMark = [self]
+        while modelsToMark:
+            model = modelsToMark.pop()
+            # a model without a fingerprint has already marked the models that hold it
+            if model.__dict__.get("_fingerprint") is None:
+                continue
+            object.__setattr__(model, "_fingerprint", None)
+            for parentReference in model.__dict__.get("_parents", dict()).values():
+                parent = parentReference()
+                if parent is not None:
+                    modelsToMark.append(parent)
+
+    def _adopt(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.__adopt(value)
+
+    def __adopt(self, value: Any) -> None:
+        # remember that *this* model holds the given model, so changes to the given model can mark *this* model as changed
+        if isinstance(value, Fingerprinted):
+            if "_parents" not in value.__dict__:
+                object.__setattr__(value, "_parents", dict())
+            value._parents[id(self)] = weakref.ref(self)
+
+    def __getFingerprint(self) -> bytes:
+        digest = hashlib.blake2b(
+            type(self).__name__.encode(), digest_size=self.FINGERPRINT_SIZE
+        )
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if isinstance(value, list):
+                digest.update(f";{name}=[{len(value)}]".encode())
+                for item in value:
+                    self.__updateDigest(digest, item)
+            else:
+                digest.update(f";{name}=".encode())
+                self.__updateDigest(digest, value)
+        return digest.digest()
+
+    @staticmethod
+    def __updateDigest(digest, value: Any) -> None:
+        if isinstance(value, Fingerprinted):
+            # a child model is always FINGERPRINT_SIZE bytes in its parent's digest
+            digest.update(value.fingerprint)
+        else:
+            digest.update(f"{type(value).__name__}:{value!r},".encode())
+
+
+class FingerprintedList(list):
+    """
+    A list field of a Fingerprinted model.
+    Changing the list marks every model that holds it as changed.
+    Copies and pickles of this list are plain lists, which become a FingerprintedList again when set on a model.
+    """
+
+    def __init__(
+        self, values: Iterable[Any] = (), owner: Optional[Fingerprinted] = None
+    ):
+        super().__init__(values)
+        # model object ID -> weak reference to the model
+        self.__owners: dict[int, weakref.ref] = dict()
+        if owner is not None:
+            self._addOwner(owner)
+
+    def __reduce_ex__(self, protocol: int):
+        return list, (list(self),)
+
+    def _addOwner(self, owner: Fingerprinted) -> None:
+        self.__owners[id(owner)] = weakref.ref(owner)
+        owner._adopt(self)
+
+    def __changed(self, newValues: Optional[Iterable[Any]] = None) -> None:
+        for ownerReference in list(self.__owners.values()):
+            owner = ownerReference()
+            if owner is not None:
+                if newValues is not None:
+                    owner._adopt(newValues)
+                owner._markChanged()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+        super().__setitem__(index, value)
+        self.__changed(value if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.__changed()
+
+    def __iadd__(self, values: Iterable[Any]) -> FingerprintedList:
+        values = list(values)
+        super().__iadd__(values)
+        self.__changed(values)
+        return self
+
+    def __imul__(self, times: int) -> FingerprintedList:
+        super().__imul__(times)
+        self.__changed()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self.__changed((value,))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        values = list(values)
+        super().extend(values)
+        self.__changed(values)
+
+    def insert(self, index: int, value: Any) -> None:
+        super().insert(index, value)
+        self.__changed((value,))
+
+    def pop(self, index: int = -1) -> Any:
+        value = super().pop(index)
+        self.__changed()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self.__changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self.__changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.__changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__changed()
@@ -1,19 +1,33 @@
+import threading
 from abc import ABC
 from dataclasses import dataclass, field
+from typing import Optional
 
 from leeger.util.IdGenerator import IdGenerator
 
 
-@dataclass
+# every model defines its own __eq__, so a generated one would never be used
+@dataclass(eq=False)
 class UniqueId(ABC):
     """
-    Model classes should inherit this in order to have a unique ID on init.
+    Model classes should inherit this in order to have a unique ID.
+
+    The ID is only generated the first time it is needed.
+    This way, models that are given an ID right after init (i.e. in fromJson()) and models that are only used for a moment
+    (i.e. in MatchupNavigator.simplifyMultiWeekMatchups()) never generate one.
     """
 
-    __id: str = field(default_factory=IdGenerator.generateId, init=False)
+    __id: Optional[str] = field(default=None, init=False)
+    # makes sure threads that read a new model's ID at the same time get the same ID
+    __ID_LOCK = threading.Lock()
 
     @property
-    def id(self):
+    def id(self) -> str:
+        if self.__id is None:
+            with UniqueId.__ID_LOCK:
+                if self.__id is None:
+                    # generating an ID does not change the model, so it does not mark the model as changed
+                    object.__setattr__(self, "_UniqueId__id", IdGenerator.generateId())
         return self.__id
 
     @id.setter
@@ -23,3 +37,14 @@ class UniqueId(ABC):
     @id.deleter
     def id(self):
         raise Exception("ID cannot be deleted.")
+
+    @property
+    def fingerprint(self) -> bytes:
+        # the ID is part of the fingerprint, so it is generated first
+        self.id
+        return super().fingerprint
+
+    def __getstate__(self) -> dict:
+        # copies have the same ID as the model they are copied from, so it is generated first
+        self.id
+        return super().__getstate__()
@@ -1 +1,2 @@
+from .Fingerprinted import Fingerprinted, FingerprintedList
 from .UniqueId import UniqueId
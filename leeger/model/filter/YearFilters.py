@@ -119,3 +119,16 @@ class YearFilters:
             "onlyChampionship": self.onlyChampionship,
             "onlyRegularSeason": self.onlyRegularSeason,
         }
+
+    def asKey(self) -> tuple:
+        """
+        Returns a hashable key that is the same for any YearFilters with the same filters.
+        """
+        return (
+            self.weekNumberStart,
+            self.weekNumberEnd,
+            self.includeMultiWeekMatchups,
+            self.onlyPostSeason,
+            self.onlyChampionship,
+            self.onlyRegularSeason,
+        )
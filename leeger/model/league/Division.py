@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
@@ -11,7 +12,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Division(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Division(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     name: str
 
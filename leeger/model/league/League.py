@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.model.league.Owner import Owner
 from leeger.model.league.Year import Year
@@ -15,14 +16,16 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class League(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     name: str
     owners: list[Owner]
     years: list[Year]
 
     def __hash__(self):
-        return hash(str(self.toJson()))
+        return hash(self.fingerprint)
 
     def equals(
         self,
@@ -187,3 +190,21 @@ class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         league = League(name=d["name"], owners=owners, years=years)
         league.id = d["id"]
         return league
+
+    def toBytes(self) -> bytes:
+        """
+        Returns *this* League in the binary League format, which is much smaller and faster to load than JSON.
+        Use leeger.util.binary.LeagueBytesReader to load only some Years from it.
+        """
+        from leeger.util.binary import leagueToBytes
+
+        return leagueToBytes(self)
+
+    @staticmethod
+    def fromBytes(data: bytes) -> League:
+        """
+        Takes bytes in the binary League format (from League.toBytes()) and turns them into a League.
+        """
+        from leeger.util.binary import leagueFromBytes
+
+        return leagueFromBytes(data)
@@ -7,6 +7,7 @@ from leeger.enum.MatchupType import MatchupType
 from leeger.exception import DoesNotExistException
 from leeger.exception.InvalidMatchupFormatException import InvalidMatchupFormatException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.model.league_helper.Performance import Performance
 from leeger.util.CustomLogger import CustomLogger
@@ -16,7 +17,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Matchup(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Matchup(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     teamAId: str
     teamBId: str
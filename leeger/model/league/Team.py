@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
@@ -12,7 +13,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Team(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Team(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     ownerId: str
     name: str
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from leeger.enum.MatchupType import MatchupType
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.model.league.Matchup import Matchup
 from leeger.util.CustomLogger import CustomLogger
@@ -14,7 +15,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Week(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     weekNumber: int
     matchups: list[Matchup]
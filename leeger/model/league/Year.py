@@ -5,6 +5,7 @@ from typing import Optional
 
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.model.abstract.UniqueId import UniqueId
 from leeger.model.league.Division import Division
 from leeger.model.league.Team import Team
@@ -17,7 +18,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Year(
+    UniqueId, Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable
+):
     __LOGGER = CustomLogger.getLogger()
     yearNumber: int
     teams: list[Team]
@@ -32,7 +35,7 @@ class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
             self.yearSettings = YearSettings()
 
     def __hash__(self):
-        return hash(str(self.toJson()))
+        return hash(self.fingerprint)
 
     def equals(
         self,
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from leeger.model.abstract.EqualityCheck import EqualityCheck
+from leeger.model.abstract.Fingerprinted import Fingerprinted
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
 from leeger.util.JSONDeserializable import JSONDeserializable
@@ -11,7 +12,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class YearSettings(EqualityCheck, JSONSerializable, JSONDeserializable):
+class YearSettings(Fingerprinted, EqualityCheck, JSONSerializable, JSONDeserializable):
     __LOGGER = CustomLogger.getLogger()
     leagueMedianGames: Optional[bool] = False
 
@@ -0,0 +1,548 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Iterable, Optional
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import DoesNotExistException
+from leeger.exception.InvalidFilterException import InvalidFilterException
+from leeger.model.filter import AllTimeFilters
+from leeger.model.league.League import League
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.index import YearIndex
+
+
+class MatchupArchive:
+    """
+    A directory of NumPy column files with a row for every Matchup in one or more Leagues,
+    plus an ID dictionary ("ids.json") with the IDs and names the columns point to.
+
+    The columns are opened with numpy.memmap, so only the parts of a column that are used are read from disk,
+    and stats can be answered for millions of Matchups without loading Leagues.
+    Each League's rows are next to each other, so answering stats for one League only reads that League's rows.
+
+    Stats are answered for each Owner and take the same filter kwargs as All-Time calculators (i.e. "onlyRegularSeason", "yearNumberStart").
+    Scores are kept as float64, so points can differ from the calculators in the last few digits (see Numeric.FLOAT_TOLERANCE).
+    League median games are not counted.
+
+    Usage:
+        MatchupArchive.write("archive", leagues)
+        matchupArchive = MatchupArchive("archive")
+        wins = matchupArchive.getWins(leagueId, onlyRegularSeason=True)
+    """
+
+    VERSION: int = 1
+    ID_DICTIONARY_FILE_NAME: str = "ids.json"
+    NO_MULTI_WEEK_MATCHUP: int = YearIndex.NO_MULTI_WEEK_MATCHUP
+    # one row per Matchup
+    MATCHUP_COLUMNS: dict[str, type] = {
+        "yearNumbers": numpy.int32,
+        "weekNumbers": numpy.int32,
+        # the position of the matchup type in YearIndex.MATCHUP_TYPES
+        "matchupTypes": numpy.int8,
+        # the position of the Team in the ID dictionary's "teamIds"
+        "teamAIndices": numpy.int32,
+        "teamBIndices": numpy.int32,
+        "teamAScores": numpy.float64,
+        "teamBScores": numpy.float64,
+        "teamAHasTiebreaker": numpy.bool_,
+        "teamBHasTiebreaker": numpy.bool_,
+        # the position of the multi-week matchup ID in the ID dictionary's "multiWeekMatchupIds"
+        "multiWeekMatchupIndices": numpy.int32,
+    }
+    # one row per Team
+    TEAM_COLUMNS: dict[str, type] = {
+        # the position of the Owner in the ID dictionary's "ownerIds"
+        "teamOwnerIndices": numpy.int32,
+    }
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(self.__getIdDictionaryFilePath(directory)) as file:
+            idDictionary = json.load(file)
+        if idDictionary.get("version") != self.VERSION:
+            raise ValueError(
+                f"Matchup archive version {idDictionary.get('version')} is not supported."
+            )
+        self.ownerIds: list[str] = idDictionary["ownerIds"]
+        self.ownerNames: list[str] = idDictionary["ownerNames"]
+        self.teamIds: list[str] = idDictionary["teamIds"]
+        self.multiWeekMatchupIds: list[str] = idDictionary["multiWeekMatchupIds"]
+        self.__leagueIdToLeague: dict[str, dict] = {
+            league["id"]: league for league in idDictionary["leagues"]
+        }
+        self.__columns: dict[str, numpy.memmap] = {
+            name: numpy.load(self.__getColumnFilePath(directory, name), mmap_mode="r")
+            for name in self.MATCHUP_COLUMNS | self.TEAM_COLUMNS
+        }
+
+    @classmethod
+    def write(cls, directory: str, leagues: Iterable[League]) -> MatchupArchive:
+        """
+        Writes the given Leagues to the given directory and returns the opened archive.
+        Leagues can be a generator, so only one League has to be held at once.
+        Leagues with the same ID as an earlier League are not written.
+        """
+        os.makedirs(directory, exist_ok=True)
+        idDictionary = {
+            "version": cls.VERSION,
+            "leagues": list(),
+            "ownerIds": list(),
+            "ownerNames": list(),
+            "teamIds": list(),
+            "multiWeekMatchupIds": list(),
+        }
+        columnToArrays: dict[str, list[numpy.ndarray]] = {
+            name: list() for name in cls.MATCHUP_COLUMNS | cls.TEAM_COLUMNS
+        }
+        writtenLeagueIds = set()
+        numberOfRows = 0
+        for league in leagues:
+            if league.id in writtenLeagueIds:
+                continue
+            writtenLeagueIds.add(league.id)
+            leagueColumns = cls.__getLeagueColumns(league, idDictionary, numberOfRows)
+            for name, array in leagueColumns.items():
+                columnToArrays[name].append(array)
+            numberOfRows += len(leagueColumns["yearNumbers"])
+
+        for name, dtype in (cls.MATCHUP_COLUMNS | cls.TEAM_COLUMNS).items():
+            arrays = columnToArrays[name]
+            numpy.save(
+                cls.__getColumnFilePath(directory, name),
+                numpy.concatenate(arrays).astype(dtype, copy=False)
+                if len(arrays) > 0
+                else numpy.array([], dtype=dtype),
+            )
+        # the ID dictionary is written last, so an archive is only opened once every column is written
+        with open(cls.__getIdDictionaryFilePath(directory), "w") as file:
+            json.dump(idDictionary, file)
+        return cls(directory)
+
+    @classmethod
+    def __getLeagueColumns(
+        cls, league: League, idDictionary: dict, rowStart: int
+    ) -> dict[str, numpy.ndarray]:
+        """
+        Adds the IDs in the given League to the given ID dictionary and returns the columns for the given League.
+        """
+        ownerIdToIndex = dict()
+        for owner in league.owners:
+            ownerIdToIndex[owner.id] = len(idDictionary["ownerIds"])
+            idDictionary["ownerIds"].append(owner.id)
+            idDictionary["ownerNames"].append(owner.name)
+        teamIdToIndex = dict()
+        teamOwnerIndices = list()
+        multiWeekMatchupIdToIndex = dict()
+        matchupTypeToCode = {
+            matchupType: code
+            for code, matchupType in enumerate(YearIndex.MATCHUP_TYPES)
+        }
+        rows = {name: list() for name in cls.MATCHUP_COLUMNS}
+        years = list()
+
+        for year in league.years:
+            for team in year.teams:
+                if team.ownerId not in ownerIdToIndex:
+                    raise DoesNotExistException(
+                        f"Owner with ID {team.ownerId} does not exist in League with ID {league.id}."
+                    )
+                # first Team found with an ID wins, the same way LeagueNavigator.getTeamById() finds Teams
+                if team.id not in teamIdToIndex:
+                    teamIdToIndex[team.id] = len(idDictionary["teamIds"])
+                    idDictionary["teamIds"].append(team.id)
+                    teamOwnerIndices.append(ownerIdToIndex[team.ownerId])
+            if len(year.weeks) > 0:
+                years.append(
+                    [
+                        year.yearNumber,
+                        year.weeks[0].weekNumber,
+                        year.weeks[-1].weekNumber,
+                    ]
+                )
+            for week in year.weeks:
+                for matchup in week.matchups:
+                    for teamId in (matchup.teamAId, matchup.teamBId):
+                        if teamId not in teamIdToIndex:
+                            raise DoesNotExistException(
+                                f"Team with ID {teamId} does not exist in League with ID {league.id}."
+                            )
+                    rows["yearNumbers"].append(year.yearNumber)
+                    rows["weekNumbers"].append(week.weekNumber)
+                    rows["matchupTypes"].append(matchupTypeToCode[matchup.matchupType])
+                    rows["teamAIndices"].append(teamIdToIndex[matchup.teamAId])
+                    rows["teamBIndices"].append(teamIdToIndex[matchup.teamBId])
+                    rows["teamAScores"].append(matchup.teamAScore)
+                    rows["teamBScores"].append(matchup.teamBScore)
+                    rows["teamAHasTiebreaker"].append(bool(matchup.teamAHasTiebreaker))
+                    rows["teamBHasTiebreaker"].append(bool(matchup.teamBHasTiebreaker))
+                    mwmid = matchup.multiWeekMatchupId
+                    if mwmid is None:
+                        rows["multiWeekMatchupIndices"].append(
+                            cls.NO_MULTI_WEEK_MATCHUP
+                        )
+                    else:
+                        if mwmid not in multiWeekMatchupIdToIndex:
+                            multiWeekMatchupIdToIndex[mwmid] = len(
+                                idDictionary["multiWeekMatchupIds"]
+                            )
+                            idDictionary["multiWeekMatchupIds"].append(mwmid)
+                        rows["multiWeekMatchupIndices"].append(
+                            multiWeekMatchupIdToIndex[mwmid]
+                        )
+
+        idDictionary["leagues"].append(
+            {
+                "id": league.id,
+                "name": league.name,
+                "ownerStart": len(idDictionary["ownerIds"]) - len(league.owners),
+                "ownerEnd": len(idDictionary["ownerIds"]),
+                "rowStart": rowStart,
+                "rowEnd": rowStart + len(rows["yearNumbers"]),
+                # [year number, first week number, last week number] for each Year with Weeks
+                "years": years,
+            }
+        )
+        return {
+            name: numpy.array(values, dtype=cls.MATCHUP_COLUMNS[name])
+            for name, values in rows.items()
+        } | {
+            "teamOwnerIndices": numpy.array(
+                teamOwnerIndices, dtype=cls.TEAM_COLUMNS["teamOwnerIndices"]
+            )
+        }
+
+    @staticmethod
+    def __getIdDictionaryFilePath(directory: str) -> str:
+        return os.path.join(directory, MatchupArchive.ID_DICTIONARY_FILE_NAME)
+
+    @staticmethod
+    def __getColumnFilePath(directory: str, name: str) -> str:
+        return os.path.join(directory, f"{name}.npy")
+
+    def __len__(self) -> int:
+        return len(self.__columns["yearNumbers"])
+
+    def getColumn(self, name: str) -> numpy.memmap:
+        """
+        Returns the read-only column with the given name (one of MATCHUP_COLUMNS or TEAM_COLUMNS) for every League.
+        """
+        if name not in self.__columns:
+            raise DoesNotExistException(f"Column '{name}' does not exist.")
+        return self.__columns[name]
+
+    def getLeagueIds(self) -> list[str]:
+        """
+        Returns the ID of every League in *this* archive, in the order they were written.
+        """
+        return list(self.__leagueIdToLeague)
+
+    def getLeagueName(self, leagueId: str) -> str:
+        return self.__getLeague(leagueId)["name"]
+
+    def getOwnerIds(self, leagueId: str) -> list[str]:
+        league = self.__getLeague(leagueId)
+        return self.ownerIds[league["ownerStart"] : league["ownerEnd"]]
+
+    def getRows(self, leagueId: str) -> slice:
+        """
+        Returns the rows of the Matchup columns that belong to the League with the given ID.
+        """
+        league = self.__getLeague(leagueId)
+        return slice(league["rowStart"], league["rowEnd"])
+
+    def getAllTimeFilters(self, leagueId: str, **kwargs) -> AllTimeFilters:
+        """
+        Returns the AllTimeFilters for the League with the given ID and the given filter kwargs.
+        Filters that are not given default to the whole League, like AllTimeFilters.getForLeague().
+        """
+        kwargs = dict(kwargs)
+        years = self.__getLeague(leagueId)["years"]
+        if len(years) == 0:
+            raise DoesNotExistException(
+                f"League with ID '{leagueId}' does not have any weeks in the archive."
+            )
+        yearNumberToWeekNumberBounds = {
+            yearNumber: (firstWeekNumber, lastWeekNumber)
+            for yearNumber, firstWeekNumber, lastWeekNumber in years
+        }
+        onlyChampionship = kwargs.pop("onlyChampionship", False)
+        onlyPostSeason = kwargs.pop("onlyPostSeason", False)
+        onlyRegularSeason = kwargs.pop("onlyRegularSeason", False)
+        yearNumberStart = kwargs.pop("yearNumberStart", years[0][0])
+        yearNumberEnd = kwargs.pop("yearNumberEnd", years[-1][0])
+        for yearNumber in (yearNumberStart, yearNumberEnd):
+            if yearNumber not in yearNumberToWeekNumberBounds:
+                raise DoesNotExistException(
+                    f"League with ID '{leagueId}' does not have weeks in year {yearNumber}."
+                )
+        weekNumberStart = kwargs.pop(
+            "weekNumberStart", yearNumberToWeekNumberBounds[yearNumberStart][0]
+        )
+        weekNumberEnd = kwargs.pop(
+            "weekNumberEnd", yearNumberToWeekNumberBounds[yearNumberEnd][1]
+        )
+        # kwargs that are used by calculators but not by stats
+        kwargs.pop("validate", None)
+        GeneralUtil.warnForUnusedKwargs(kwargs)
+
+        if [onlyChampionship, onlyPostSeason, onlyRegularSeason].count(True) > 1:
+            raise InvalidFilterException(
+                "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True"
+            )
+        if yearNumberStart > yearNumberEnd:
+            raise InvalidFilterException(
+                "'yearNumberStart' cannot be greater than 'yearNumberEnd'."
+            )
+        if weekNumberStart > weekNumberEnd and yearNumberStart == yearNumberEnd:
+            raise InvalidFilterException(
+                "'weekNumberStart' cannot be greater than 'weekNumberEnd' within the same year."
+            )
+        return AllTimeFilters(
+            yearNumberStart=yearNumberStart,
+            weekNumberStart=weekNumberStart,
+            yearNumberEnd=yearNumberEnd,
+            weekNumberEnd=weekNumberEnd,
+            onlyChampionship=onlyChampionship,
+            onlyPostSeason=onlyPostSeason,
+            onlyRegularSeason=onlyRegularSeason,
+        )
+
+    def getFilterMask(self, leagueId: str, **kwargs) -> numpy.ndarray:
+        """
+        Returns a boolean array that is True for each of the League's rows (see getRows()) that is in the given filters.
+        """
+        allTimeFilters = self.getAllTimeFilters(leagueId, **kwargs)
+        rows = self.getRows(leagueId)
+        yearNumbers = self.__columns["yearNumbers"][rows]
+        weekNumbers = self.__columns["weekNumbers"][rows]
+        return (
+            numpy.isin(
+                self.__columns["matchupTypes"][rows],
+                YearIndex.getMatchupTypeCodes(allTimeFilters.includeMatchupTypes),
+            )
+            & (
+                (yearNumbers > allTimeFilters.yearNumberStart)
+                | (
+                    (yearNumbers == allTimeFilters.yearNumberStart)
+                    & (weekNumbers >= allTimeFilters.weekNumberStart)
+                )
+            )
+            & (
+                (yearNumbers < allTimeFilters.yearNumberEnd)
+                | (
+                    (yearNumbers == allTimeFilters.yearNumberEnd)
+                    & (weekNumbers <= allTimeFilters.weekNumberEnd)
+                )
+            )
+        )
+
+    def getPointsScored(self, leagueId: str, **kwargs) -> dict[str, Optional[float]]:
+        """
+        Returns the number of Points Scored for each Owner in the League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": 1009.7,
+            "someOtherOwnerId": 1412.2,
+            ...
+            }
+        """
+        teamAOwners, teamBOwners, teamAScores, teamBScores = self.__getMatchups(
+            leagueId, **kwargs
+        )
+        return self.__getStatByOwnerId(
+            leagueId, teamAOwners, teamBOwners, teamAScores, teamBScores
+        )
+
+    def getOpponentPointsScored(
+        self, leagueId: str, **kwargs
+    ) -> dict[str, Optional[float]]:
+        """
+        Returns the number of Points Scored by each Owner's opponents in the League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        teamAOwners, teamBOwners, teamAScores, teamBScores = self.__getMatchups(
+            leagueId, **kwargs
+        )
+        return self.__getStatByOwnerId(
+            leagueId, teamAOwners, teamBOwners, teamBScores, teamAScores
+        )
+
+    def getGamesPlayed(
+        self, leagueId: str, *, countMultiWeekMatchupsAsOneGame: bool = True, **kwargs
+    ) -> dict[str, int]:
+        """
+        Returns the number of games played by each Owner in the League with the given ID.
+        Multi-week matchups count as one game, like TeamSummaryAllTimeCalculator.getGamesPlayed(), unless countMultiWeekMatchupsAsOneGame is False.
+        """
+        if countMultiWeekMatchupsAsOneGame:
+            teamAOwners, teamBOwners = self.__getGames(leagueId, **kwargs)[:2]
+        else:
+            teamAOwners, teamBOwners = self.__getMatchups(leagueId, **kwargs)[:2]
+        ones = numpy.ones(len(teamAOwners))
+        gamesPlayed = self.__getStatByOwnerId(
+            leagueId, teamAOwners, teamBOwners, ones, ones
+        )
+        return {ownerId: int(games or 0) for ownerId, games in gamesPlayed.items()}
+
+    def getWins(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of wins for each Owner in the League with the given ID.
+        Multi-week matchups count as one game and ties are won by the team with the tiebreaker.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getOutcomeByOwnerId(leagueId, 1, **kwargs)
+
+    def getLosses(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of losses for each Owner in the League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getOutcomeByOwnerId(leagueId, -1, **kwargs)
+
+    def getTies(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of ties for each Owner in the League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getOutcomeByOwnerId(leagueId, 0, **kwargs)
+
+    ####################
+    # Helper functions #
+    ####################
+
+    def __getLeague(self, leagueId: str) -> dict:
+        if leagueId not in self.__leagueIdToLeague:
+            raise DoesNotExistException(
+                f"League with ID '{leagueId}' does not exist in the archive."
+            )
+        return self.__leagueIdToLeague[leagueId]
+
+    def __getMatchups(self, leagueId: str, **kwargs) -> tuple[numpy.ndarray, ...]:
+        """
+        Returns the Owner index of each team and each team's score for every Matchup in the given filters.
+        Owner indices are the position of the Owner in the League's Owners.
+        """
+        rowIndices = (
+            numpy.flatnonzero(self.getFilterMask(leagueId, **kwargs))
+            + self.getRows(leagueId).start
+        )
+        teamOwnerIndices = self.__columns["teamOwnerIndices"]
+        ownerStart = self.__getLeague(leagueId)["ownerStart"]
+        return (
+            teamOwnerIndices[self.__columns["teamAIndices"][rowIndices]] - ownerStart,
+            teamOwnerIndices[self.__columns["teamBIndices"][rowIndices]] - ownerStart,
+            self.__columns["teamAScores"][rowIndices],
+            self.__columns["teamBScores"][rowIndices],
+        )
+
+    def __getGames(self, leagueId: str, **kwargs) -> tuple[numpy.ndarray, ...]:
+        """
+        Returns the same as __getMatchups(), with each multi-week matchup in the given filters added together into one game.
+        Also returns whether each team has the tiebreaker.
+        Each multi-week matchup uses the teams and tiebreakers of its first Matchup, like MatchupNavigator.simplifyMultiWeekMatchups().
+        """
+        rowIndices = (
+            numpy.flatnonzero(self.getFilterMask(leagueId, **kwargs))
+            + self.getRows(leagueId).start
+        )
+        multiWeekMatchupIndices = self.__columns["multiWeekMatchupIndices"][rowIndices]
+        isMultiWeekRow = multiWeekMatchupIndices != self.NO_MULTI_WEEK_MATCHUP
+        _, firstPositions, gameOfRow = numpy.unique(
+            multiWeekMatchupIndices[isMultiWeekRow],
+            return_index=True,
+            return_inverse=True,
+        )
+        singleWeekRowIndices = rowIndices[~isMultiWeekRow]
+        firstMultiWeekRowIndices = rowIndices[isMultiWeekRow][firstPositions]
+        gameRowIndices = numpy.concatenate(
+            (singleWeekRowIndices, firstMultiWeekRowIndices)
+        )
+
+        scores = list()
+        for name in ("teamAScores", "teamBScores"):
+            column = self.__columns[name]
+            scores.append(
+                numpy.concatenate(
+                    (
+                        column[singleWeekRowIndices],
+                        numpy.bincount(
+                            gameOfRow,
+                            weights=column[rowIndices[isMultiWeekRow]],
+                            minlength=len(firstPositions),
+                        ),
+                    )
+                )
+            )
+        teamOwnerIndices = self.__columns["teamOwnerIndices"]
+        ownerStart = self.__getLeague(leagueId)["ownerStart"]
+        return (
+            teamOwnerIndices[self.__columns["teamAIndices"][gameRowIndices]]
+            - ownerStart,
+            teamOwnerIndices[self.__columns["teamBIndices"][gameRowIndices]]
+            - ownerStart,
+            scores[0],
+            scores[1],
+            self.__columns["teamAHasTiebreaker"][gameRowIndices],
+            self.__columns["teamBHasTiebreaker"][gameRowIndices],
+        )
+
+    def __getOutcomeByOwnerId(
+        self, leagueId: str, outcome: int, **kwargs
+    ) -> dict[str, Optional[int]]:
+        """
+        Returns the number of games with the given outcome (1 for a win, 0 for a tie and -1 for a loss) for each Owner.
+        """
+        (
+            teamAOwners,
+            teamBOwners,
+            teamAScores,
+            teamBScores,
+            teamAHasTiebreaker,
+            teamBHasTiebreaker,
+        ) = self.__getGames(leagueId, **kwargs)
+        isTied = teamAScores == teamBScores
+        teamAWon = (teamAScores > teamBScores) | (isTied & teamAHasTiebreaker)
+        teamBWon = (teamBScores > teamAScores) | (isTied & teamBHasTiebreaker)
+        teamAOutcomes = numpy.where(teamAWon, 1, numpy.where(teamBWon, -1, 0))
+        teamBOutcomes = numpy.where(teamBWon, 1, numpy.where(teamAWon, -1, 0))
+        result = self.__getStatByOwnerId(
+            leagueId,
+            teamAOwners,
+            teamBOwners,
+            teamAOutcomes == outcome,
+            teamBOutcomes == outcome,
+        )
+        return {
+            ownerId: None if value is None else int(value)
+            for ownerId, value in result.items()
+        }
+
+    def __getStatByOwnerId(
+        self,
+        leagueId: str,
+        teamAOwners: numpy.ndarray,
+        teamBOwners: numpy.ndarray,
+        teamAValues: numpy.ndarray,
+        teamBValues: numpy.ndarray,
+    ) -> dict[str, Optional[float]]:
+        """
+        Adds the given values for each Owner.
+        Returns None for an Owner that is not in any of the given rows.
+        """
+        ownerIds = self.getOwnerIds(leagueId)
+        totals = numpy.bincount(
+            teamAOwners, weights=teamAValues, minlength=len(ownerIds)
+        ) + numpy.bincount(teamBOwners, weights=teamBValues, minlength=len(ownerIds))
+        numberOfRows = numpy.bincount(
+            teamAOwners, minlength=len(ownerIds)
+        ) + numpy.bincount(teamBOwners, minlength=len(ownerIds))
+        return {
+            ownerId: float(totals[i]) if numberOfRows[i] > 0 else None
+            for i, ownerId in enumerate(ownerIds)
+        }
@@ -0,0 +1,515 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import DoesNotExistException
+from leeger.exception.InvalidFilterException import InvalidFilterException
+from leeger.model.filter import AllTimeFilters
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+from leeger.util.GeneralUtil import GeneralUtil
+
+
+class SQLiteLeagueStore:
+    """
+    Keeps Leagues in tables in the SQLite database at the given file path (or ":memory:").
+    Each model is a row in its own table, so simple stats can be answered with SQL without loading the League.
+
+    Leagues are kept by their ID, and adding a League with the same ID as a kept League replaces it.
+    Positions of every model are kept, so getLeague() returns the same League that was added.
+
+    Stats are answered for each Owner and take the same filter kwargs as All-Time calculators (i.e. "onlyRegularSeason", "yearNumberStart").
+    Points are added by SQLite as floats, so they can differ from the calculators in the last few digits (see Numeric.FLOAT_TOLERANCE).
+    League median games are not counted.
+    """
+
+    __SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS league (id TEXT PRIMARY KEY, name TEXT)",
+        "CREATE TABLE IF NOT EXISTS owner "
+        "(leagueId TEXT, id TEXT, position INTEGER, name TEXT, PRIMARY KEY (leagueId, id))",
+        "CREATE TABLE IF NOT EXISTS year "
+        "(leagueId TEXT, id TEXT, position INTEGER, yearNumber INTEGER, leagueMedianGames INTEGER, "
+        "PRIMARY KEY (leagueId, yearNumber))",
+        "CREATE TABLE IF NOT EXISTS division "
+        "(leagueId TEXT, yearNumber INTEGER, id TEXT, position INTEGER, name TEXT)",
+        "CREATE TABLE IF NOT EXISTS team "
+        "(leagueId TEXT, yearNumber INTEGER, id TEXT, position INTEGER, ownerId TEXT, name TEXT, divisionId TEXT, "
+        "PRIMARY KEY (leagueId, id))",
+        "CREATE TABLE IF NOT EXISTS week "
+        "(leagueId TEXT, yearNumber INTEGER, id TEXT, position INTEGER, weekNumber INTEGER)",
+        # scores have no type, so ints stay ints and floats stay floats
+        "CREATE TABLE IF NOT EXISTS matchup "
+        "(leagueId TEXT, yearNumber INTEGER, weekNumber INTEGER, id TEXT, position INTEGER, "
+        "teamAId TEXT, teamBId TEXT, teamAScore, teamBScore, matchupType TEXT, "
+        "teamAHasTiebreaker INTEGER, teamBHasTiebreaker INTEGER, multiWeekMatchupId TEXT)",
+        "CREATE INDEX IF NOT EXISTS division_year ON division (leagueId, yearNumber)",
+        "CREATE INDEX IF NOT EXISTS team_owner ON team (leagueId, ownerId)",
+        "CREATE INDEX IF NOT EXISTS week_year ON week (leagueId, yearNumber)",
+        "CREATE INDEX IF NOT EXISTS matchup_year_week ON matchup (leagueId, yearNumber, weekNumber)",
+        "CREATE INDEX IF NOT EXISTS matchup_team_a ON matchup (leagueId, teamAId)",
+        "CREATE INDEX IF NOT EXISTS matchup_team_b ON matchup (leagueId, teamBId)",
+        "CREATE INDEX IF NOT EXISTS matchup_type ON matchup (leagueId, matchupType)",
+    ]
+    __TABLES = ["league", "owner", "year", "division", "team", "week", "matchup"]
+
+    def __init__(self, filePath: str):
+        self.filePath = filePath
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(filePath, check_same_thread=False)
+        with self.__lock, self.__connection:
+            for statement in self.__SCHEMA:
+                self.__connection.execute(statement)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    def addLeague(self, league: League) -> None:
+        """
+        Keeps the given League, replacing any kept League with the same ID.
+        """
+        self.addLeagues([league])
+
+    def addLeagues(self, leagues: Iterable[League]) -> None:
+        """
+        Keeps every given League in one transaction, replacing any kept League with the same ID.
+        """
+        with self.__lock, self.__connection:
+            for league in leagues:
+                self.__deleteLeague(league.id)
+                self.__insertLeague(league)
+
+    def removeLeague(self, leagueId: str) -> None:
+        with self.__lock, self.__connection:
+            self.__deleteLeague(leagueId)
+
+    def getLeagueIds(self) -> list[str]:
+        """
+        Returns the ID of every kept League, in the order they were first added.
+        """
+        with self.__lock:
+            return [
+                row[0]
+                for row in self.__connection.execute(
+                    "SELECT id FROM league ORDER BY rowid"
+                )
+            ]
+
+    def getLeague(self, leagueId: str) -> League:
+        """
+        Returns the kept League with the given ID.
+        """
+        with self.__lock:
+            leagueRow = self.__connection.execute(
+                "SELECT name FROM league WHERE id = ?", (leagueId,)
+            ).fetchone()
+            if leagueRow is None:
+                raise DoesNotExistException(
+                    f"League with ID '{leagueId}' does not exist in the store."
+                )
+            ownerRows = self.__select("owner", "id, name", leagueId)
+            yearRows = self.__select(
+                "year", "id, yearNumber, leagueMedianGames", leagueId
+            )
+            divisionRows = self.__select("division", "yearNumber, id, name", leagueId)
+            teamRows = self.__select(
+                "team", "yearNumber, id, ownerId, name, divisionId", leagueId
+            )
+            weekRows = self.__select("week", "yearNumber, id, weekNumber", leagueId)
+            matchupRows = self.__select(
+                "matchup",
+                "yearNumber, weekNumber, id, teamAId, teamBId, teamAScore, teamBScore, matchupType, "
+                "teamAHasTiebreaker, teamBHasTiebreaker, multiWeekMatchupId",
+                leagueId,
+            )
+
+        owners = list()
+        for ownerId, name in ownerRows:
+            owner = Owner(name=name)
+            owner.id = ownerId
+            owners.append(owner)
+
+        yearNumberToDivisions: dict[int, list[Division]] = dict()
+        for yearNumber, divisionId, name in divisionRows:
+            division = Division(name=name)
+            division.id = divisionId
+            yearNumberToDivisions.setdefault(yearNumber, list()).append(division)
+
+        yearNumberToTeams: dict[int, list[Team]] = dict()
+        for yearNumber, teamId, ownerId, name, divisionId in teamRows:
+            team = Team(ownerId=ownerId, name=name, divisionId=divisionId)
+            team.id = teamId
+            yearNumberToTeams.setdefault(yearNumber, list()).append(team)
+
+        yearNumberAndWeekNumberToMatchups: dict[tuple[int, int], list[Matchup]] = dict()
+        for (
+            yearNumber,
+            weekNumber,
+            matchupId,
+            teamAId,
+            teamBId,
+            teamAScore,
+            teamBScore,
+            matchupType,
+            teamAHasTiebreaker,
+            teamBHasTiebreaker,
+            multiWeekMatchupId,
+        ) in matchupRows:
+            matchup = Matchup(
+                teamAId=teamAId,
+                teamBId=teamBId,
+                teamAScore=teamAScore,
+                teamBScore=teamBScore,
+                matchupType=MatchupType.fromStr(matchupType),
+                teamAHasTiebreaker=self.__toOptionalBool(teamAHasTiebreaker),
+                teamBHasTiebreaker=self.__toOptionalBool(teamBHasTiebreaker),
+                multiWeekMatchupId=multiWeekMatchupId,
+            )
+            matchup.id = matchupId
+            yearNumberAndWeekNumberToMatchups.setdefault(
+                (yearNumber, weekNumber), list()
+            ).append(matchup)
+
+        yearNumberToWeeks: dict[int, list[Week]] = dict()
+        for yearNumber, weekId, weekNumber in weekRows:
+            week = Week(
+                weekNumber=weekNumber,
+                matchups=yearNumberAndWeekNumberToMatchups.get(
+                    (yearNumber, weekNumber), list()
+                ),
+            )
+            week.id = weekId
+            yearNumberToWeeks.setdefault(yearNumber, list()).append(week)
+
+        years = list()
+        for yearId, yearNumber, leagueMedianGames in yearRows:
+            year = Year(
+                yearNumber=yearNumber,
+                teams=yearNumberToTeams.get(yearNumber, list()),
+                weeks=yearNumberToWeeks.get(yearNumber, list()),
+                divisions=yearNumberToDivisions.get(yearNumber, list()),
+                yearSettings=YearSettings(leagueMedianGames=bool(leagueMedianGames)),
+            )
+            year.id = yearId
+            years.append(year)
+
+        league = League(name=leagueRow[0], owners=owners, years=years)
+        league.id = leagueId
+        return league
+
+    def getAllTimeFilters(self, leagueId: str, **kwargs) -> AllTimeFilters:
+        """
+        Returns the AllTimeFilters for the kept League with the given ID and the given filter kwargs.
+        Filters that are not given default to the whole League, like AllTimeFilters.getForLeague().
+        """
+        kwargs = dict(kwargs)
+        with self.__lock:
+            yearNumberBounds = self.__connection.execute(
+                "SELECT MIN(yearNumber), MAX(yearNumber) FROM year WHERE leagueId = ?",
+                (leagueId,),
+            ).fetchone()
+        if yearNumberBounds[0] is None:
+            raise DoesNotExistException(
+                f"League with ID '{leagueId}' does not exist in the store."
+            )
+        onlyChampionship = kwargs.pop("onlyChampionship", False)
+        onlyPostSeason = kwargs.pop("onlyPostSeason", False)
+        onlyRegularSeason = kwargs.pop("onlyRegularSeason", False)
+        yearNumberStart = kwargs.pop("yearNumberStart", yearNumberBounds[0])
+        yearNumberEnd = kwargs.pop("yearNumberEnd", yearNumberBounds[1])
+        weekNumberStart = kwargs.pop(
+            "weekNumberStart", self.__getWeekNumberBounds(leagueId, yearNumberStart)[0]
+        )
+        weekNumberEnd = kwargs.pop(
+            "weekNumberEnd", self.__getWeekNumberBounds(leagueId, yearNumberEnd)[1]
+        )
+        # kwargs that are used by calculators but not by stats
+        kwargs.pop("validate", None)
+        GeneralUtil.warnForUnusedKwargs(kwargs)
+
+        if [onlyChampionship, onlyPostSeason, onlyRegularSeason].count(True) > 1:
+            raise InvalidFilterException(
+                "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True"
+            )
+        if yearNumberStart > yearNumberEnd:
+            raise InvalidFilterException(
+                "'yearNumberStart' cannot be greater than 'yearNumberEnd'."
+            )
+        if weekNumberStart > weekNumberEnd and yearNumberStart == yearNumberEnd:
+            raise InvalidFilterException(
+                "'weekNumberStart' cannot be greater than 'weekNumberEnd' within the same year."
+            )
+        return AllTimeFilters(
+            yearNumberStart=yearNumberStart,
+            weekNumberStart=weekNumberStart,
+            yearNumberEnd=yearNumberEnd,
+            weekNumberEnd=weekNumberEnd,
+            onlyChampionship=onlyChampionship,
+            onlyPostSeason=onlyPostSeason,
+            onlyRegularSeason=onlyRegularSeason,
+        )
+
+    def getPointsScored(self, leagueId: str, **kwargs) -> dict[str, Optional[float]]:
+        """
+        Returns the number of Points Scored for each Owner in the kept League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": 1009.7,
+            "someOtherOwnerId": 1412.2,
+            ...
+            }
+        """
+        return self.__getStatByOwnerId(
+            leagueId, "SUM(score)", self.__TEAM_SCORES, **kwargs
+        )
+
+    def getOpponentPointsScored(
+        self, leagueId: str, **kwargs
+    ) -> dict[str, Optional[float]]:
+        """
+        Returns the number of Points Scored by each Owner's opponents in the kept League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getStatByOwnerId(
+            leagueId, "SUM(opponentScore)", self.__TEAM_SCORES, **kwargs
+        )
+
+    def getGamesPlayed(
+        self, leagueId: str, *, countMultiWeekMatchupsAsOneGame: bool = True, **kwargs
+    ) -> dict[str, int]:
+        """
+        Returns the number of games played by each Owner in the kept League with the given ID.
+        Multi-week matchups count as one game, like TeamSummaryAllTimeCalculator.getGamesPlayed(), unless countMultiWeekMatchupsAsOneGame is False.
+        """
+        gamesPlayed = self.__getStatByOwnerId(
+            leagueId,
+            "COUNT(*)",
+            self.__TEAM_GAMES
+            if countMultiWeekMatchupsAsOneGame
+            else self.__TEAM_SCORES,
+            **kwargs,
+        )
+        return {ownerId: games or 0 for ownerId, games in gamesPlayed.items()}
+
+    def getWins(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of wins for each Owner in the kept League with the given ID.
+        Multi-week matchups count as one game and ties are won by the team with the tiebreaker.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getStatByOwnerId(
+            leagueId, "SUM(outcome = 1)", self.__TEAM_GAMES, **kwargs
+        )
+
+    def getLosses(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of losses for each Owner in the kept League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getStatByOwnerId(
+            leagueId, "SUM(outcome = -1)", self.__TEAM_GAMES, **kwargs
+        )
+
+    def getTies(self, leagueId: str, **kwargs) -> dict[str, Optional[int]]:
+        """
+        Returns the number of ties for each Owner in the kept League with the given ID.
+        Returns None for an Owner if they have no games played in the range.
+        """
+        return self.__getStatByOwnerId(
+            leagueId, "SUM(outcome = 0)", self.__TEAM_GAMES, **kwargs
+        )
+
+    # the matchups in the filters, with a row for each team in each matchup
+    __TEAM_SCORES = """
+        SELECT teamAId AS teamId, teamAScore AS score, teamBScore AS opponentScore FROM filteredMatchup
+        UNION ALL
+        SELECT teamBId, teamBScore, teamAScore FROM filteredMatchup
+    """
+    # the games in the filters (multi-week matchups added together), with a row for each team in each game
+    # outcome is 1 for a win, 0 for a tie and -1 for a loss
+    __TEAM_GAMES = """
+        SELECT teamAId AS teamId,
+            CASE WHEN teamAScore > teamBScore OR (teamAScore = teamBScore AND teamAHasTiebreaker) THEN 1
+                 WHEN teamBScore > teamAScore OR (teamAScore = teamBScore AND teamBHasTiebreaker) THEN -1
+                 ELSE 0 END AS outcome
+        FROM filteredGame
+        UNION ALL
+        SELECT teamBId,
+            CASE WHEN teamBScore > teamAScore OR (teamAScore = teamBScore AND teamBHasTiebreaker) THEN 1
+                 WHEN teamAScore > teamBScore OR (teamAScore = teamBScore AND teamAHasTiebreaker) THEN -1
+                 ELSE 0 END
+        FROM filteredGame
+    """
+
+    def __getStatByOwnerId(
+        self, leagueId: str, aggregate: str, teamRows: str, **kwargs
+    ) -> dict:
+        allTimeFilters = self.getAllTimeFilters(leagueId, **kwargs)
+        matchupTypes = [
+            matchupType.name for matchupType in allTimeFilters.includeMatchupTypes
+        ]
+        matchupTypeParameters = ", ".join(
+            f":matchupType{i}" for i in range(len(matchupTypes))
+        )
+        query = f"""
+            WITH filteredMatchup AS (
+                SELECT * FROM matchup
+                WHERE leagueId = :leagueId
+                AND matchupType IN ({matchupTypeParameters})
+                AND (yearNumber > :yearNumberStart OR (yearNumber = :yearNumberStart AND weekNumber >= :weekNumberStart))
+                AND (yearNumber < :yearNumberEnd OR (yearNumber = :yearNumberEnd AND weekNumber <= :weekNumberEnd))
+            ),
+            filteredGame AS (
+                SELECT MIN(teamAId) AS teamAId, MIN(teamBId) AS teamBId,
+                    SUM(teamAScore) AS teamAScore, SUM(teamBScore) AS teamBScore,
+                    MAX(teamAHasTiebreaker) AS teamAHasTiebreaker, MAX(teamBHasTiebreaker) AS teamBHasTiebreaker
+                FROM filteredMatchup
+                GROUP BY COALESCE(multiWeekMatchupId, id)
+            ),
+            teamRow AS ({teamRows})
+            SELECT team.ownerId, {aggregate}
+            FROM teamRow JOIN team ON team.leagueId = :leagueId AND team.id = teamRow.teamId
+            GROUP BY team.ownerId
+        """
+        parameters = {
+            "leagueId": leagueId,
+            "yearNumberStart": allTimeFilters.yearNumberStart,
+            "weekNumberStart": allTimeFilters.weekNumberStart,
+            "yearNumberEnd": allTimeFilters.yearNumberEnd,
+            "weekNumberEnd": allTimeFilters.weekNumberEnd,
+        } | {f"matchupType{i}": name for i, name in enumerate(matchupTypes)}
+        with self.__lock:
+            ownerIds = [row[0] for row in self.__select("owner", "id", leagueId)]
+            rows = self.__connection.execute(query, parameters).fetchall()
+        result = {ownerId: None for ownerId in ownerIds}
+        result.update(rows)
+        return result
+
+    def __getWeekNumberBounds(self, leagueId: str, yearNumber: int) -> tuple[int, int]:
+        with self.__lock:
+            weekNumberBounds = self.__connection.execute(
+                "SELECT MIN(weekNumber), MAX(weekNumber) FROM week WHERE leagueId = ? AND yearNumber = ?",
+                (leagueId, yearNumber),
+            ).fetchone()
+        if weekNumberBounds[0] is None:
+            raise DoesNotExistException(
+                f"League with ID '{leagueId}' does not have weeks in year {yearNumber}."
+            )
+        return weekNumberBounds
+
+    def __select(self, table: str, columns: str, leagueId: str) -> list[tuple]:
+        return self.__connection.execute(
+            f"SELECT {columns} FROM {table} WHERE leagueId = ? ORDER BY position",
+            (leagueId,),
+        ).fetchall()
+
+    def __deleteLeague(self, leagueId: str) -> None:
+        for table in self.__TABLES:
+            column = "id" if table == "league" else "leagueId"
+            self.__connection.execute(
+                f"DELETE FROM {table} WHERE {column} = ?", (leagueId,)
+            )
+
+    def __insertLeague(self, league: League) -> None:
+        self.__connection.execute(
+            "INSERT INTO league VALUES (?, ?)", (league.id, league.name)
+        )
+        self.__connection.executemany(
+            "INSERT INTO owner VALUES (?, ?, ?, ?)",
+            (
+                (league.id, owner.id, position, owner.name)
+                for position, owner in enumerate(league.owners)
+            ),
+        )
+        self.__connection.executemany(
+            "INSERT INTO year VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    league.id,
+                    year.id,
+                    position,
+                    year.yearNumber,
+                    int(bool(year.yearSettings.leagueMedianGames)),
+                )
+                for position, year in enumerate(league.years)
+            ),
+        )
+        # positions are counted across the League, so every Year's rows come back in order
+        self.__connection.executemany(
+            "INSERT INTO division VALUES (?, ?, ?, ?, ?)",
+            (
+                (league.id, year.yearNumber, division.id, position, division.name)
+                for position, (year, division) in enumerate(
+                    (year, division)
+                    for year in league.years
+                    for division in year.divisions
+                )
+            ),
+        )
+        self.__connection.executemany(
+            "INSERT INTO team VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    league.id,
+                    year.yearNumber,
+                    team.id,
+                    position,
+                    team.ownerId,
+                    team.name,
+                    team.divisionId,
+                )
+                for position, (year, team) in enumerate(
+                    (year, team) for year in league.years for team in year.teams
+                )
+            ),
+        )
+        self.__connection.executemany(
+            "INSERT INTO week VALUES (?, ?, ?, ?, ?)",
+            (
+                (league.id, year.yearNumber, week.id, position, week.weekNumber)
+                for position, (year, week) in enumerate(
+                    (year, week) for year in league.years for week in year.weeks
+                )
+            ),
+        )
+        self.__connection.executemany(
+            "INSERT INTO matchup VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    league.id,
+                    year.yearNumber,
+                    week.weekNumber,
+                    matchup.id,
+                    position,
+                    matchup.teamAId,
+                    matchup.teamBId,
+                    matchup.teamAScore,
+                    matchup.teamBScore,
+                    matchup.matchupType.name,
+                    matchup.teamAHasTiebreaker,
+                    matchup.teamBHasTiebreaker,
+                    matchup.multiWeekMatchupId,
+                )
+                for position, (year, week, matchup) in enumerate(
+                    (year, week, matchup)
+                    for year in league.years
+                    for week in year.weeks
+                    for matchup in week.matchups
+                )
+            ),
+        )
+
+    @staticmethod
+    def __toOptionalBool(value: Optional[int]) -> Optional[bool]:
+        return None if value is None else bool(value)
@@ -0,0 +1,2 @@
+from .MatchupArchive import MatchupArchive
+from .SQLiteLeagueStore import SQLiteLeagueStore
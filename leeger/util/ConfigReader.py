@@ -13,7 +13,7 @@ class ConfigReader:
         section: str,
         name: str,
         *,
-        asType: str | list = str,
+        asType: type = str,
         propFile: str = "app.properties",
     ) -> Optional[str | int | float | bool]:
         configParser = configparser.ConfigParser(
@@ -29,6 +29,12 @@ class ConfigReader:
             value = configParser.getlist(section, name)
         elif asType == str:
             value = configParser[section][name]
+        elif asType == int:
+            value = configParser.getint(section, name)
+        elif asType == float:
+            value = configParser.getfloat(section, name)
+        elif asType == bool:
+            value = configParser.getboolean(section, name)
         else:
             raise ValueError(f"Type '{asType}' not supported for conversion.")
         return value
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Any, Callable, Iterator, Optional
+
+import numpy
+
+from leeger.enum.NumericMode import NumericMode
+from leeger.util.Deci import Deci
+
+
+class Numeric:
+    """
+    Used to choose what kind of number stats are calculated with.
+
+    Only stat sheets (leagueStatSheet() and yearStatSheet()) use a NumericMode; calculators always calculate with Deci.
+    Stat sheets are calculated with Deci unless NumericMode.FLOAT is given, either:
+        - As the "numericMode" kwarg (i.e. leagueStatSheet(league, numericMode="float"))
+        - With the Numeric.mode() context manager (i.e. with Numeric.mode("float"): ...)
+    Stats calculated with floats are converted to Deci before they are returned, so the types returned are the same in every mode.
+    """
+
+    # the most a stat calculated with floats can differ from the same stat calculated with Deci,
+    # relative to the Deci stat (or to 1 if the Deci stat is between -1 and 1, since stats like Team Luck subtract nearly equal numbers)
+    FLOAT_TOLERANCE = Deci("1e-9")
+
+    __CURRENT_MODE: contextvars.ContextVar[NumericMode] = contextvars.ContextVar(
+        "numericMode", default=NumericMode.EXACT
+    )
+
+    @classmethod
+    def getNumericMode(cls, **kwargs) -> NumericMode:
+        """
+        Returns the NumericMode given in the "numericMode" kwarg.
+        If it is not given, returns the NumericMode set with Numeric.mode(), which is NumericMode.EXACT by default.
+        """
+        numericMode = kwargs.get("numericMode")
+        if numericMode is None:
+            return cls.__CURRENT_MODE.get()
+        return cls.__toNumericMode(numericMode)
+
+    @staticmethod
+    def getNumberType(numericMode: NumericMode) -> Callable[[Any], Deci | float]:
+        """
+        Returns what numbers should be created with in the given NumericMode.
+        """
+        if numericMode == NumericMode.FLOAT:
+            return numpy.float64
+        return Deci
+
+    @classmethod
+    @contextlib.contextmanager
+    def mode(cls, numericMode: NumericMode | str) -> Iterator[None]:
+        """
+        Calculates stat sheets with the given NumericMode inside *this* context, unless a "numericMode" kwarg is given.
+        """
+        token = cls.__CURRENT_MODE.set(cls.__toNumericMode(numericMode))
+        try:
+            yield
+        finally:
+            cls.__CURRENT_MODE.reset(token)
+
+    @staticmethod
+    def toDeci(value: Optional[Any]) -> Optional[Any]:
+        """
+        Returns the given value as a Deci if it was calculated with floats.
+        Any other value is returned as it was given.
+        """
+        if isinstance(value, numpy.floating):
+            return Deci(float(value))
+        return value
+
+    @classmethod
+    def isClose(cls, exact: Optional[Any], approximate: Optional[Any]) -> bool:
+        """
+        Returns whether the given stat calculated with floats is within FLOAT_TOLERANCE of the same stat calculated with Deci.
+        """
+        if exact is None or approximate is None:
+            return exact is approximate
+        exact = Deci(exact)
+        return abs(exact - Deci(approximate)) <= cls.FLOAT_TOLERANCE * max(
+            Deci(1), abs(exact)
+        )
+
+    @staticmethod
+    def __toNumericMode(numericMode: NumericMode | str) -> NumericMode:
+        if isinstance(numericMode, NumericMode):
+            return numericMode
+        if isinstance(numericMode, str):
+            return NumericMode.fromStr(numericMode)
+        raise ValueError("'numericMode' must be type 'NumericMode' or 'str'")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import Iterator
+
+
+class RateLimiter:
+    """
+    Spaces out calls to wait() so no more than maxRequestsPerSecond are let through each second, across every thread.
+    RateLimiters got with RateLimiter.forHost() are shared by everything making requests to the same host at the same time.
+    """
+
+    # host -> (RateLimiter, rates given by every forHost() block for the host that is running)
+    __HOST_RATE_LIMITERS: dict[str, tuple[RateLimiter, list[float]]] = dict()
+    __HOST_RATE_LIMITERS_LOCK = threading.Lock()
+
+    def __init__(self, maxRequestsPerSecond: float):
+        self.validateMaxRequestsPerSecond(maxRequestsPerSecond)
+        self.maxRequestsPerSecond = maxRequestsPerSecond
+        self.__secondsBetweenRequests = 1 / maxRequestsPerSecond
+        self.__nextRequestTime = 0.0
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def validateMaxRequestsPerSecond(maxRequestsPerSecond: float) -> None:
+        if (
+            not isinstance(maxRequestsPerSecond, (int, float))
+            or maxRequestsPerSecond <= 0
+        ):
+            raise ValueError("'maxRequestsPerSecond' must be a number greater than 0.")
+
+    @classmethod
+    @contextlib.contextmanager
+    def forHost(cls, host: str, maxRequestsPerSecond: float) -> Iterator[RateLimiter]:
+        """
+        Gives the RateLimiter for the given host inside *this* context.
+        Every forHost() block for the same host that is running at the same time gets the same RateLimiter,
+        which uses the lowest rate given by any of them.
+        Once a block ends, its rate is no longer used, and once every block for a host ends, the RateLimiter is dropped.
+
+        Usage:
+            with RateLimiter.forHost("api.sleeper.app", 10) as rateLimiter:
+                rateLimiter.wait()
+                ...
+        """
+        cls.validateMaxRequestsPerSecond(maxRequestsPerSecond)
+        with cls.__HOST_RATE_LIMITERS_LOCK:
+            if host not in cls.__HOST_RATE_LIMITERS:
+                cls.__HOST_RATE_LIMITERS[host] = (
+                    RateLimiter(maxRequestsPerSecond),
+                    list(),
+                )
+            rateLimiter, rates = cls.__HOST_RATE_LIMITERS[host]
+            rates.append(maxRequestsPerSecond)
+            rateLimiter.__setMaxRequestsPerSecond(min(rates))
+        try:
+            yield rateLimiter
+        finally:
+            with cls.__HOST_RATE_LIMITERS_LOCK:
+                rates.remove(maxRequestsPerSecond)
+                if len(rates) == 0:
+                    del cls.__HOST_RATE_LIMITERS[host]
+                else:
+                    rateLimiter.__setMaxRequestsPerSecond(min(rates))
+
+    def __setMaxRequestsPerSecond(self, maxRequestsPerSecond: float) -> None:
+        with self.__lock:
+            self.maxRequestsPerSecond = maxRequestsPerSecond
+            self.__secondsBetweenRequests = 1 / maxRequestsPerSecond
+
+    def wait(self) -> None:
+        """
+        Blocks until another request can be made.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            requestTime = max(now, self.__nextRequestTime)
+            self.__nextRequestTime = requestTime + self.__secondsBetweenRequests
+        if requestTime > now:
+            time.sleep(requestTime - now)
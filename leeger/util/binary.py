@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import struct
+from typing import Optional
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+
+# The binary League format (all numbers are little-endian):
+#
+#     header          magic, version, league ID, league name, owner count, year count
+#     string table    string count, the UTF-8 length of each string, then every string
+#     owners          (ID, name) for each Owner
+#     year table      (year number, offset, size) for each Year, so any Year can be read without reading the others
+#     years           for each Year:
+#                         ID, year number, league median games, division count, team count, week count
+#                         (ID, name) for each Division
+#                         (ID, owner ID, name, division ID) for each Team
+#                         for each Week: ID, week number, matchup count, then a packed record for each Matchup
+#
+# Every string (IDs and names) is stored once in the string table and referred to by its index in it.
+
+_MAGIC = b"LGRB"
+_VERSION = 1
+# the string index used for None
+_NONE = 0xFFFFFFFF
+# the largest int a score can be and still be stored exactly as a double
+_MAX_EXACT_INT = 2**53
+
+_HEADER = struct.Struct("<4sHIIII")
+_COUNT = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_YEAR_TABLE_ENTRY = struct.Struct("<iQQ")
+_YEAR = struct.Struct("<Ii?III")
+_TEAM = struct.Struct("<IIII")
+_WEEK = struct.Struct("<IiI")
+_MATCHUP = struct.Struct("<IIIddBBI")
+
+_MATCHUP_TYPES = list(MatchupType)
+_MATCHUP_TYPE_TO_INDEX = {
+    matchupType: index for index, matchupType in enumerate(_MATCHUP_TYPES)
+}
+# matchup flags
+_TEAM_A_SCORE_IS_INT = 1
+_TEAM_B_SCORE_IS_INT = 2
+_TEAM_A_TIEBREAKER_SHIFT = 2
+_TEAM_B_TIEBREAKER_SHIFT = 4
+_TIEBREAKER_TO_BITS = {None: 0, False: 1, True: 2}
+_BITS_TO_TIEBREAKER = {
+    bits: tiebreaker for tiebreaker, bits in _TIEBREAKER_TO_BITS.items()
+}
+
+
+def leagueToBytes(league: League) -> bytes:
+    """
+    Returns the given League in the binary League format.
+    Scores that are ints must be no bigger than 2^53, so they can be stored exactly.
+    """
+    strings: list[str] = list()
+    stringToIndex: dict[str, int] = dict()
+
+    def getStringIndex(s: Optional[str]) -> int:
+        if s is None:
+            return _NONE
+        index = stringToIndex.get(s)
+        if index is None:
+            index = len(strings)
+            stringToIndex[s] = index
+            strings.append(s)
+        return index
+
+    leagueIdIndex = getStringIndex(league.id)
+    leagueNameIndex = getStringIndex(league.name)
+    ownersBytes = b"".join(
+        _PAIR.pack(getStringIndex(owner.id), getStringIndex(owner.name))
+        for owner in league.owners
+    )
+    allYearBytes = [_yearToBytes(year, getStringIndex) for year in league.years]
+
+    encodedStrings = [s.encode("utf-8") for s in strings]
+    stringTableBytes = (
+        _COUNT.pack(len(encodedStrings))
+        + struct.pack(f"<{len(encodedStrings)}I", *map(len, encodedStrings))
+        + b"".join(encodedStrings)
+    )
+    headerBytes = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        leagueIdIndex,
+        leagueNameIndex,
+        len(league.owners),
+        len(league.years),
+    )
+    # years start after everything else
+    yearOffset = (
+        len(headerBytes)
+        + len(stringTableBytes)
+        + len(ownersBytes)
+        + _YEAR_TABLE_ENTRY.size * len(league.years)
+    )
+    yearTableEntries = list()
+    for year, yearBytes in zip(league.years, allYearBytes):
+        yearTableEntries.append(
+            _YEAR_TABLE_ENTRY.pack(year.yearNumber, yearOffset, len(yearBytes))
+        )
+        yearOffset += len(yearBytes)
+    return b"".join(
+        [headerBytes, stringTableBytes, ownersBytes, *yearTableEntries, *allYearBytes]
+    )
+
+
+def leagueFromBytes(data: bytes) -> League:
+    """
+    Returns the League in the given bytes, which must be in the binary League format.
+    """
+    return LeagueBytesReader(data).getLeague()
+
+
+def _yearToBytes(year: Year, getStringIndex) -> bytes:
+    parts = [
+        _YEAR.pack(
+            getStringIndex(year.id),
+            year.yearNumber,
+            bool(year.yearSettings.leagueMedianGames),
+            len(year.divisions),
+            len(year.teams),
+            len(year.weeks),
+        )
+    ]
+    for division in year.divisions:
+        parts.append(
+            _PAIR.pack(getStringIndex(division.id), getStringIndex(division.name))
+        )
+    for team in year.teams:
+        parts.append(
+            _TEAM.pack(
+                getStringIndex(team.id),
+                getStringIndex(team.ownerId),
+                getStringIndex(team.name),
+                getStringIndex(team.divisionId),
+            )
+        )
+    for week in year.weeks:
+        parts.append(
+            _WEEK.pack(getStringIndex(week.id), week.weekNumber, len(week.matchups))
+        )
+        for matchup in week.matchups:
+            flags = (
+                _TIEBREAKER_TO_BITS[matchup.teamAHasTiebreaker]
+                << _TEAM_A_TIEBREAKER_SHIFT
+                | _TIEBREAKER_TO_BITS[matchup.teamBHasTiebreaker]
+                << _TEAM_B_TIEBREAKER_SHIFT
+            )
+            if _isExactInt(matchup.teamAScore):
+                flags |= _TEAM_A_SCORE_IS_INT
+            if _isExactInt(matchup.teamBScore):
+                flags |= _TEAM_B_SCORE_IS_INT
+            parts.append(
+                _MATCHUP.pack(
+                    getStringIndex(matchup.id),
+                    getStringIndex(matchup.teamAId),
+                    getStringIndex(matchup.teamBId),
+                    matchup.teamAScore,
+                    matchup.teamBScore,
+                    _MATCHUP_TYPE_TO_INDEX[matchup.matchupType],
+                    flags,
+                    getStringIndex(matchup.multiWeekMatchupId),
+                )
+            )
+    return b"".join(parts)
+
+
+def _isExactInt(score: float | int) -> bool:
+    if not isinstance(score, int):
+        return False
+    if abs(score) > _MAX_EXACT_INT:
+        raise ValueError(f"Score {score} is too big to be stored exactly.")
+    return True
+
+
+class LeagueBytesReader:
+    """
+    Reads a League in the binary League format.
+    Only the header, owners and year table are read when a LeagueBytesReader is made.
+    Each Year is only decoded when it is asked for, and strings are only decoded when a decoded Year uses them.
+
+    Data can be any bytes-like object (i.e. bytes or an mmap of a file), and must stay open while *this* reader is used.
+
+    Usage:
+        reader = LeagueBytesReader(data)
+        year = reader.getYear(2022)
+        league = reader.getLeague(yearNumbers=[2021, 2022])
+    """
+
+    def __init__(self, data: bytes):
+        self.__data = memoryview(data)
+        if len(self.__data) < _HEADER.size:
+            raise ValueError("Data is not in the binary League format.")
+        (
+            magic,
+            version,
+            leagueIdIndex,
+            leagueNameIndex,
+            ownerCount,
+            yearCount,
+        ) = _HEADER.unpack_from(self.__data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Data is not in the binary League format.")
+        if version != _VERSION:
+            raise ValueError(
+                f"Binary League format version {version} is not supported."
+            )
+        offset = _HEADER.size
+        # string table
+        (stringCount,) = _COUNT.unpack_from(self.__data, offset)
+        offset += _COUNT.size
+        stringLengths = struct.unpack_from(f"<{stringCount}I", self.__data, offset)
+        offset += 4 * stringCount
+        self.__stringOffsets: list[int] = list()
+        for stringLength in stringLengths:
+            self.__stringOffsets.append(offset)
+            offset += stringLength
+        self.__stringOffsets.append(offset)
+        self.__strings: list[Optional[str]] = [None] * stringCount
+        # owners
+        self.__ownerIdAndNameIndexes = list(
+            _PAIR.iter_unpack(self.__data[offset : offset + _PAIR.size * ownerCount])
+        )
+        offset += _PAIR.size * ownerCount
+        # year table
+        self.__yearNumberToOffsetAndSize: dict[int, tuple[int, int]] = dict()
+        for yearNumber, yearOffset, yearSize in _YEAR_TABLE_ENTRY.iter_unpack(
+            self.__data[offset : offset + _YEAR_TABLE_ENTRY.size * yearCount]
+        ):
+            self.__yearNumberToOffsetAndSize[yearNumber] = (yearOffset, yearSize)
+        self.leagueId = self.__getString(leagueIdIndex)
+        self.leagueName = self.__getString(leagueNameIndex)
+
+    @property
+    def yearNumbers(self) -> list[int]:
+        """
+        Returns the year number of every Year, in the order they are in the League.
+        """
+        return list(self.__yearNumberToOffsetAndSize.keys())
+
+    def getOwners(self) -> list[Owner]:
+        owners = list()
+        for idIndex, nameIndex in self.__ownerIdAndNameIndexes:
+            owner = Owner(name=self.__getString(nameIndex))
+            owner.id = self.__getString(idIndex)
+            owners.append(owner)
+        return owners
+
+    def getLeague(self, yearNumbers: Optional[list[int]] = None) -> League:
+        """
+        Returns the League, with only the Years with the given year numbers if any are given.
+        Years are always in the order they are in the League.
+        """
+        if yearNumbers is None:
+            yearNumbers = self.yearNumbers
+        else:
+            yearNumbersToGet = set(yearNumbers)
+            yearNumbers = [
+                yearNumber
+                for yearNumber in self.yearNumbers
+                if yearNumber in yearNumbersToGet
+            ]
+        league = League(
+            name=self.leagueName,
+            owners=self.getOwners(),
+            years=[self.getYear(yearNumber) for yearNumber in yearNumbers],
+        )
+        league.id = self.leagueId
+        return league
+
+    def getYear(self, yearNumber: int) -> Year:
+        """
+        Decodes and returns the Year with the given year number.
+        """
+        if yearNumber not in self.__yearNumberToOffsetAndSize:
+            raise ValueError(f"There is no year with year number {yearNumber}.")
+        getString = self.__getString
+        offset, _ = self.__yearNumberToOffsetAndSize[yearNumber]
+        (
+            yearIdIndex,
+            yearNumber,
+            leagueMedianGames,
+            divisionCount,
+            teamCount,
+            weekCount,
+        ) = _YEAR.unpack_from(self.__data, offset)
+        offset += _YEAR.size
+
+        divisions = list()
+        for idIndex, nameIndex in _PAIR.iter_unpack(
+            self.__data[offset : offset + _PAIR.size * divisionCount]
+        ):
+            division = Division(name=getString(nameIndex))
+            division.id = getString(idIndex)
+            divisions.append(division)
+        offset += _PAIR.size * divisionCount
+
+        teams = list()
+        for idIndex, ownerIdIndex, nameIndex, divisionIdIndex in _TEAM.iter_unpack(
+            self.__data[offset : offset + _TEAM.size * teamCount]
+        ):
+            team = Team(
+                ownerId=getString(ownerIdIndex),
+                name=getString(nameIndex),
+                divisionId=getString(divisionIdIndex),
+            )
+            team.id = getString(idIndex)
+            teams.append(team)
+        offset += _TEAM.size * teamCount
+
+        weeks = list()
+        for _ in range(weekCount):
+            weekIdIndex, weekNumber, matchupCount = _WEEK.unpack_from(
+                self.__data, offset
+            )
+            offset += _WEEK.size
+            matchups = list()
+            for (
+                idIndex,
+                teamAIdIndex,
+                teamBIdIndex,
+                teamAScore,
+                teamBScore,
+                matchupTypeIndex,
+                flags,
+                multiWeekMatchupIdIndex,
+            ) in _MATCHUP.iter_unpack(
+                self.__data[offset : offset + _MATCHUP.size * matchupCount]
+            ):
+                matchup = Matchup(
+                    teamAId=getString(teamAIdIndex),
+                    teamBId=getString(teamBIdIndex),
+                    teamAScore=(
+                        int(teamAScore) if flags & _TEAM_A_SCORE_IS_INT else teamAScore
+                    ),
+                    teamBScore=(
+                        int(teamBScore) if flags & _TEAM_B_SCORE_IS_INT else teamBScore
+                    ),
+                    matchupType=_MATCHUP_TYPES[matchupTypeIndex],
+                    teamAHasTiebreaker=_BITS_TO_TIEBREAKER[
+                        flags >> _TEAM_A_TIEBREAKER_SHIFT & 3
+                    ],
+                    teamBHasTiebreaker=_BITS_TO_TIEBREAKER[
+                        flags >> _TEAM_B_TIEBREAKER_SHIFT & 3
+                    ],
+                    multiWeekMatchupId=getString(multiWeekMatchupIdIndex),
+                )
+                matchup.id = getString(idIndex)
+                matchups.append(matchup)
+            offset += _MATCHUP.size * matchupCount
+            week = Week(weekNumber=weekNumber, matchups=matchups)
+            week.id = getString(weekIdIndex)
+            weeks.append(week)
+
+        year = Year(
+            yearNumber=yearNumber,
+            teams=teams,
+            weeks=weeks,
+            divisions=divisions,
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+        year.id = getString(yearIdIndex)
+        return year
+
+    def __getString(self, index: int) -> Optional[str]:
+        if index == _NONE:
+            return None
+        s = self.__strings[index]
+        if s is None:
+            s = str(
+                self.__data[
+                    self.__stringOffsets[index] : self.__stringOffsets[index + 1]
+                ],
+                "utf-8",
+            )
+            self.__strings[index] = s
+        return s
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.league.League import League
+from leeger.util.index.YearIndex import YearIndex
+
+
+class LeagueIndex:
+    """
+    A columnar snapshot of every Matchup in a League.
+
+    Holds a YearIndex for each Year in the League as well as League-wide columns that are the concatenation of each YearIndex.
+    In the League-wide columns, teams are represented by the index of their Owner in ownerIds.
+
+    NOTE: This is a snapshot. If the League is modified after the index is built, a new index must be built.
+    """
+
+    NO_OWNER: int = -1
+
+    def __init__(self, league: League):
+        self.leagueId: str = league.id
+        self.ownerIds: list[str] = [owner.id for owner in league.owners]
+        self.ownerIdToIndex: dict[str, int] = {
+            ownerId: i for i, ownerId in enumerate(self.ownerIds)
+        }
+        self.teamIdToOwnerId: dict[str, str] = dict()
+        self.yearIndices: list[YearIndex] = list()
+        self.__yearNumberToYearIndex: dict[int, YearIndex] = dict()
+
+        for year in league.years:
+            for team in year.teams:
+                # first Team found with an ID wins, the same way LeagueNavigator.getTeamById() finds Teams
+                self.teamIdToOwnerId.setdefault(team.id, team.ownerId)
+            yearIndex = YearIndex(year)
+            self.yearIndices.append(yearIndex)
+            self.__yearNumberToYearIndex.setdefault(year.yearNumber, yearIndex)
+
+        yearNumbers = list()
+        teamAOwnerIndices = list()
+        teamBOwnerIndices = list()
+        multiWeekMatchupIndices = list()
+        multiWeekMatchupOffset = 0
+        for yearIndex in self.yearIndices:
+            yearNumbers.append(numpy.full(len(yearIndex), yearIndex.yearNumber))
+            teamIndexToOwnerIndex = numpy.array(
+                [
+                    self.ownerIdToIndex.get(
+                        self.teamIdToOwnerId.get(teamId), self.NO_OWNER
+                    )
+                    for teamId in yearIndex.teamIds
+                ],
+                dtype=numpy.int32,
+            )
+            teamAOwnerIndices.append(teamIndexToOwnerIndex[yearIndex.teamAIndices])
+            teamBOwnerIndices.append(teamIndexToOwnerIndex[yearIndex.teamBIndices])
+            # multi-week matchup indices are made unique across the League
+            multiWeekMatchupIndices.append(
+                numpy.where(
+                    yearIndex.multiWeekMatchupIndices
+                    == YearIndex.NO_MULTI_WEEK_MATCHUP,
+                    YearIndex.NO_MULTI_WEEK_MATCHUP,
+                    yearIndex.multiWeekMatchupIndices + multiWeekMatchupOffset,
+                )
+            )
+            multiWeekMatchupOffset += len(yearIndex.multiWeekMatchupIds)
+
+        self.yearNumbers = self.__concatenate(yearNumbers, numpy.int32)
+        self.weekNumbers = self.__concatenate(
+            [yearIndex.weekNumbers for yearIndex in self.yearIndices], numpy.int32
+        )
+        self.matchupTypes = self.__concatenate(
+            [yearIndex.matchupTypes for yearIndex in self.yearIndices], numpy.int8
+        )
+        self.teamAOwnerIndices = self.__concatenate(teamAOwnerIndices, numpy.int32)
+        self.teamBOwnerIndices = self.__concatenate(teamBOwnerIndices, numpy.int32)
+        self.teamAScores = self.__concatenate(
+            [yearIndex.teamAScores for yearIndex in self.yearIndices], numpy.float64
+        )
+        self.teamBScores = self.__concatenate(
+            [yearIndex.teamBScores for yearIndex in self.yearIndices], numpy.float64
+        )
+        self.teamAHasTiebreaker = self.__concatenate(
+            [yearIndex.teamAHasTiebreaker for yearIndex in self.yearIndices], bool
+        )
+        self.teamBHasTiebreaker = self.__concatenate(
+            [yearIndex.teamBHasTiebreaker for yearIndex in self.yearIndices], bool
+        )
+        self.multiWeekMatchupIndices = self.__concatenate(
+            multiWeekMatchupIndices, numpy.int32
+        )
+
+    @staticmethod
+    def __concatenate(arrays: list[numpy.ndarray], dtype) -> numpy.ndarray:
+        if len(arrays) == 0:
+            return numpy.array([], dtype=dtype)
+        return numpy.concatenate(arrays).astype(dtype, copy=False)
+
+    def __deepcopy__(self, memo: dict) -> LeagueIndex:
+        # the index is a read-only snapshot, so it is safe to share
+        return self
+
+    def __len__(self) -> int:
+        return sum([len(yearIndex) for yearIndex in self.yearIndices])
+
+    def isIndexFor(self, league: League) -> bool:
+        """
+        Returns whether *this* index was built from the given League.
+        """
+        return self.leagueId == league.id and len(self.yearIndices) == len(league.years)
+
+    def getYearIndex(self, yearNumber: int) -> YearIndex:
+        if yearNumber not in self.__yearNumberToYearIndex:
+            raise DoesNotExistException(
+                f"Year {yearNumber} does not exist in the given League."
+            )
+        return self.__yearNumberToYearIndex[yearNumber]
+
+    def getOwnerIdForTeamId(self, teamId: str) -> str:
+        if teamId not in self.teamIdToOwnerId:
+            raise DoesNotExistException(
+                f"Team with ID {teamId} does not exist in the given League."
+            )
+        return self.teamIdToOwnerId[teamId]
+
+    def getAllScores(self, simplifyMultiWeekMatchups=False) -> list[float | int]:
+        """
+        Returns a list of all scores for the indexed League.
+        This gives the same response as LeagueNavigator.getAllScoresInLeague().
+        """
+        allScores = list()
+        for yearIndex in self.yearIndices:
+            allScores += yearIndex.getAllScores(
+                simplifyMultiWeekMatchups=simplifyMultiWeekMatchups
+            )
+        return allScores
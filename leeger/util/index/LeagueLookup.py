@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Year import Year
+
+
+class LeagueLookup:
+    """
+    Finds Teams, Owners and Years in a League by ID or year number without walking the League.
+
+    A lookup is built the first time it is needed and kept on the League it was built from.
+    It only remembers where each object was found, and an object is only returned if it is still in that spot.
+    If the League has changed so an object is not where the lookup expects, the lookup is rebuilt once before giving up.
+    """
+
+    # the attribute the lookup is kept in on the League
+    ATTRIBUTE_NAME = "_leagueLookup"
+
+    def __init__(self, league: League):
+        # team ID -> (position of the Year in League.years, position of the Team in Year.teams)
+        self.__teamIdToPositions: dict[str, tuple[int, int]] = dict()
+        self.__ownerIdToPosition: dict[str, int] = dict()
+        self.__yearNumberToPosition: dict[int, int] = dict()
+
+        for yearPosition, year in enumerate(league.years):
+            # keep the first position found so lookups give the same object as walking the League
+            self.__yearNumberToPosition.setdefault(year.yearNumber, yearPosition)
+            for teamPosition, team in enumerate(year.teams):
+                self.__teamIdToPositions.setdefault(
+                    team.id, (yearPosition, teamPosition)
+                )
+        for ownerPosition, owner in enumerate(league.owners):
+            self.__ownerIdToPosition.setdefault(owner.id, ownerPosition)
+
+    def __deepcopy__(self, memo: dict) -> LeagueLookup:
+        # positions are the same in a copy of the League, so it is safe to share
+        return self
+
+    @classmethod
+    def getTeamAndYear(cls, league: League, teamId: str) -> Optional[tuple[Team, Year]]:
+        """
+        Returns the Team with the given ID and the Year it is in.
+        Returns None if there is no Team with the given ID in the given League.
+        """
+        return cls.__find(
+            league, lambda lookup: lookup.__getTeamAndYear(league, teamId)
+        )
+
+    @classmethod
+    def getOwner(cls, league: League, ownerId: str) -> Optional[Owner]:
+        """
+        Returns the Owner with the given ID.
+        Returns None if there is no Owner with the given ID in the given League.
+        """
+        return cls.__find(league, lambda lookup: lookup.__getOwner(league, ownerId))
+
+    @classmethod
+    def getYear(cls, league: League, yearNumber: int) -> Optional[Year]:
+        """
+        Returns the Year with the given year number.
+        Returns None if there is no Year with the given year number in the given League.
+        """
+        return cls.__find(league, lambda lookup: lookup.__getYear(league, yearNumber))
+
+    @classmethod
+    def __find(cls, league: League, find):
+        lookup = getattr(league, cls.ATTRIBUTE_NAME, None)
+        if lookup is not None:
+            found = find(lookup)
+            if found is not None:
+                return found
+        # this League has not been looked up yet or has changed since it was
+        lookup = LeagueLookup(league)
+        setattr(league, cls.ATTRIBUTE_NAME, lookup)
+        return find(lookup)
+
+    def __getTeamAndYear(
+        self, league: League, teamId: str
+    ) -> Optional[tuple[Team, Year]]:
+        positions = self.__teamIdToPositions.get(teamId)
+        if positions is None:
+            return None
+        yearPosition, teamPosition = positions
+        if yearPosition < len(league.years):
+            year = league.years[yearPosition]
+            if teamPosition < len(year.teams) and year.teams[teamPosition].id == teamId:
+                return year.teams[teamPosition], year
+        return None
+
+    def __getOwner(self, league: League, ownerId: str) -> Optional[Owner]:
+        position = self.__ownerIdToPosition.get(ownerId)
+        if (
+            position is not None
+            and position < len(league.owners)
+            and league.owners[position].id == ownerId
+        ):
+            return league.owners[position]
+        return None
+
+    def __getYear(self, league: League, yearNumber: int) -> Optional[Year]:
+        position = self.__yearNumberToPosition.get(yearNumber)
+        if (
+            position is not None
+            and position < len(league.years)
+            and league.years[position].yearNumber == yearNumber
+        ):
+            return league.years[position]
+        return None
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable
+
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.league.Year import Year
+from leeger.util.ConfigReader import ConfigReader
+
+
+class MatchupSelectionCache:
+    """
+    Keeps the Matchups selected from a Year with some filters, so selecting them again does not walk the Year.
+
+    Selections are kept by the Year's fingerprint and YearFilters.asKey(), so a Year that changes is selected from again.
+    The fingerprint of a Year that has not changed is cached, so finding a kept selection does not walk the Year.
+    Selections are kept as tuples, so everything that asks for the same selection can share it.
+    Once there are more selections than the max size, the least recently used one is dropped.
+    Every selection for a Year is dropped as soon as the Year is garbage collected, so kept selections never keep Matchups in memory.
+    """
+
+    __MAX_SIZE = ConfigReader.get("CACHE", "MATCHUP_SELECTION_CACHE_SIZE", asType=int)
+    # (selection name, Year object ID, Year fingerprint, filter key) -> (weak reference to the Year, selection)
+    __SELECTIONS: OrderedDict[tuple, tuple[weakref.ref, Any]] = OrderedDict()
+    # Year object ID -> (weak reference to the Year, keys of the Year's selections)
+    __YEAR_KEYS: dict[int, tuple[weakref.ref, set[tuple]]] = dict()
+    # weak references to Years that were garbage collected while the lock was held
+    __DROPPED_YEAR_REFERENCES: list[tuple[int, weakref.ref]] = list()
+    __LOCK = threading.Lock()
+    __hits = 0
+    __misses = 0
+
+    @classmethod
+    def get(
+        cls,
+        selectionName: str,
+        year: Year,
+        yearFilters: YearFilters,
+        select: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the selection with the given name for the given Year and filters.
+        If it is not kept, select() is called and what it returns is kept.
+        select() should return something that will not be changed, like a tuple.
+        """
+        key = (selectionName, id(year), year.fingerprint, yearFilters.asKey())
+        with cls.__LOCK:
+            cls.__dropCollectedYears()
+            found = cls.__SELECTIONS.get(key)
+            # a Year with the same object ID may have replaced a Year that is gone
+            if found is not None and found[0]() is year:
+                cls.__SELECTIONS.move_to_end(key)
+                cls.__hits += 1
+                return found[1]
+            cls.__misses += 1
+        selection = select()
+        with cls.__LOCK:
+            cls.__dropCollectedYears()
+            yearReference, yearKeys = cls.__getYearKeys(year)
+            cls.__SELECTIONS[key] = (yearReference, selection)
+            cls.__SELECTIONS.move_to_end(key)
+            yearKeys.add(key)
+            cls.__dropLeastRecentlyUsed()
+        return selection
+
+    @classmethod
+    def __getYearKeys(cls, year: Year) -> tuple[weakref.ref, set[tuple]]:
+        """
+        Returns the weak reference to the given Year and the keys of its selections.
+        The weak reference drops every selection for the Year when the Year is garbage collected.
+        """
+        yearId = id(year)
+        found = cls.__YEAR_KEYS.get(yearId)
+        if found is not None and found[0]() is year:
+            return found
+        if found is not None:
+            # a Year with the same object ID is gone, but its selections were not dropped yet
+            cls.__dropYear(yearId, found[0])
+        yearReference = weakref.ref(
+            year, lambda reference: cls.__onYearCollected(yearId, reference)
+        )
+        cls.__YEAR_KEYS[yearId] = (yearReference, set())
+        return cls.__YEAR_KEYS[yearId]
+
+    @classmethod
+    def __onYearCollected(cls, yearId: int, yearReference: weakref.ref) -> None:
+        # this can be called by the garbage collector while the lock is held, so it never waits for the lock
+        if cls.__LOCK.acquire(blocking=False):
+            try:
+                cls.__dropYear(yearId, yearReference)
+            finally:
+                cls.__LOCK.release()
+        else:
+            cls.__DROPPED_YEAR_REFERENCES.append((yearId, yearReference))
+
+    @classmethod
+    def __dropCollectedYears(cls) -> None:
+        while cls.__DROPPED_YEAR_REFERENCES:
+            cls.__dropYear(*cls.__DROPPED_YEAR_REFERENCES.pop())
+
+    @classmethod
+    def __dropYear(cls, yearId: int, yearReference: weakref.ref) -> None:
+        found = cls.__YEAR_KEYS.get(yearId)
+        # the object ID may already belong to a new Year
+        if found is None or found[0] is not yearReference:
+            return
+        del cls.__YEAR_KEYS[yearId]
+        for key in found[1]:
+            cls.__SELECTIONS.pop(key, None)
+
+    @classmethod
+    def __dropLeastRecentlyUsed(cls) -> None:
+        while len(cls.__SELECTIONS) > cls.__MAX_SIZE:
+            key, (yearReference, _) = cls.__SELECTIONS.popitem(last=False)
+            found = cls.__YEAR_KEYS.get(key[1])
+            if found is not None and found[0] is yearReference:
+                found[1].discard(key)
+                if len(found[1]) == 0:
+                    del cls.__YEAR_KEYS[key[1]]
+
+    @classmethod
+    def getStats(cls) -> dict[str, int]:
+        """
+        Returns how the cache has been used since it was last cleared.
+
+        Example response:
+            {
+            "hits": 120,
+            "misses": 12,
+            "size": 12,
+            "maxSize": 512
+            }
+        """
+        with cls.__LOCK:
+            cls.__dropCollectedYears()
+            return {
+                "hits": cls.__hits,
+                "misses": cls.__misses,
+                "size": len(cls.__SELECTIONS),
+                "maxSize": cls.__MAX_SIZE,
+            }
+
+    @classmethod
+    def setMaxSize(cls, maxSize: int) -> None:
+        """
+        Sets how many selections are kept, dropping the least recently used ones if there are too many.
+        """
+        if not isinstance(maxSize, int) or maxSize < 1:
+            raise ValueError("'maxSize' must be an int that is at least 1.")
+        with cls.__LOCK:
+            cls.__MAX_SIZE = maxSize
+            cls.__dropLeastRecentlyUsed()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops every selection and resets the hit and miss counts.
+        """
+        with cls.__LOCK:
+            cls.__SELECTIONS.clear()
+            cls.__YEAR_KEYS.clear()
+            cls.__DROPPED_YEAR_REFERENCES.clear()
+            cls.__hits = 0
+            cls.__misses = 0
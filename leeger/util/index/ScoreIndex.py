@@ -0,0 +1,38 @@
+import numpy
+
+
+class ScoreIndex:
+    """
+    A sorted snapshot of a collection of scores.
+
+    Finding how many scores in the collection a given score beats and ties is a binary search instead of a scan of every score,
+    so ranking every score in the collection against itself is O(n log n) instead of O(n²).
+    """
+
+    def __init__(self, scores: list[float | int]):
+        self.numberOfScores: int = len(scores)
+        self.__sortedScores = numpy.sort(numpy.array(scores, dtype=numpy.float64))
+
+    def getNumberOfScoresBeatAndTied(
+        self, scores: list[float | int]
+    ) -> list[tuple[int, int]]:
+        """
+        Returns how many scores in this index each of the given scores beats and ties, in the same order as the given scores.
+        Each given score is assumed to be in this index, so 1 is removed from its number of scores tied.
+
+        Example response:
+            [
+                (3, 0),
+                (0, 1),
+                ...
+            ]
+        """
+        scores = numpy.array(scores, dtype=numpy.float64)
+        # number of scores strictly less than each score
+        scoresBeat = numpy.searchsorted(self.__sortedScores, scores, side="left")
+        scoresLessThanOrEqual = numpy.searchsorted(
+            self.__sortedScores, scores, side="right"
+        )
+        # remove 1 from the scores tied since we will always find a tie for a score that is in this index
+        scoresTied = scoresLessThanOrEqual - scoresBeat - 1
+        return list(zip(scoresBeat.tolist(), scoresTied.tolist()))
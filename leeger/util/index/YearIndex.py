@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Year import Year
+
+
+class YearIndex:
+    """
+    A columnar snapshot of every Matchup in a Year.
+
+    Each Matchup becomes one row across a set of NumPy arrays, in the same order the Matchups are found when walking Year.weeks.
+    This lets navigators and calculators filter and aggregate a Year without re-walking the model.
+
+    NOTE: This is a snapshot. If the Year is modified after the index is built, a new index must be built.
+    """
+
+    # matchup types are stored as their position in this tuple
+    MATCHUP_TYPES: tuple[MatchupType, ...] = tuple(MatchupType)
+    NO_MULTI_WEEK_MATCHUP: int = -1
+
+    def __init__(self, year: Year):
+        self.yearId: str = year.id
+        self.yearNumber: int = year.yearNumber
+        self.leagueMedianGames: bool = bool(year.yearSettings.leagueMedianGames)
+        self.numberOfWeeks: int = len(year.weeks)
+        self.firstWeekNumber: Optional[int] = (
+            year.weeks[0].weekNumber if year.weeks else None
+        )
+        self.lastWeekNumber: Optional[int] = (
+            year.weeks[-1].weekNumber if year.weeks else None
+        )
+
+        self.teamIds: list[str] = list()
+        self.teamIdToIndex: dict[str, int] = dict()
+        for team in year.teams:
+            self.__addTeamId(team.id)
+
+        # row-aligned with the arrays below
+        self.matchups: list[Matchup] = list()
+        self.multiWeekMatchupIds: list[str] = list()
+        multiWeekMatchupIdToIndex: dict[str, int] = dict()
+
+        weekIndices = list()
+        weekNumbers = list()
+        matchupTypes = list()
+        teamAIndices = list()
+        teamBIndices = list()
+        teamAScores = list()
+        teamBScores = list()
+        teamAHasTiebreaker = list()
+        teamBHasTiebreaker = list()
+        multiWeekMatchupIndices = list()
+        weekIsRegularSeason = list()
+
+        matchupTypeToCode = {
+            matchupType: code for code, matchupType in enumerate(self.MATCHUP_TYPES)
+        }
+
+        for weekIndex, week in enumerate(year.weeks):
+            weekIsRegularSeason.append(week.isRegularSeasonWeek)
+            for matchup in week.matchups:
+                self.matchups.append(matchup)
+                weekIndices.append(weekIndex)
+                weekNumbers.append(week.weekNumber)
+                matchupTypes.append(matchupTypeToCode[matchup.matchupType])
+                teamAIndices.append(self.__addTeamId(matchup.teamAId))
+                teamBIndices.append(self.__addTeamId(matchup.teamBId))
+                teamAScores.append(matchup.teamAScore)
+                teamBScores.append(matchup.teamBScore)
+                teamAHasTiebreaker.append(bool(matchup.teamAHasTiebreaker))
+                teamBHasTiebreaker.append(bool(matchup.teamBHasTiebreaker))
+                mwmid = matchup.multiWeekMatchupId
+                if mwmid is None:
+                    multiWeekMatchupIndices.append(self.NO_MULTI_WEEK_MATCHUP)
+                else:
+                    if mwmid not in multiWeekMatchupIdToIndex:
+                        multiWeekMatchupIdToIndex[mwmid] = len(self.multiWeekMatchupIds)
+                        self.multiWeekMatchupIds.append(mwmid)
+                    multiWeekMatchupIndices.append(multiWeekMatchupIdToIndex[mwmid])
+
+        self.weekIndices = numpy.array(weekIndices, dtype=numpy.int32)
+        self.weekNumbers = numpy.array(weekNumbers, dtype=numpy.int32)
+        self.matchupTypes = numpy.array(matchupTypes, dtype=numpy.int8)
+        self.teamAIndices = numpy.array(teamAIndices, dtype=numpy.int32)
+        self.teamBIndices = numpy.array(teamBIndices, dtype=numpy.int32)
+        self.teamAScores = numpy.array(teamAScores, dtype=numpy.float64)
+        self.teamBScores = numpy.array(teamBScores, dtype=numpy.float64)
+        self.teamAHasTiebreaker = numpy.array(teamAHasTiebreaker, dtype=bool)
+        self.teamBHasTiebreaker = numpy.array(teamBHasTiebreaker, dtype=bool)
+        self.multiWeekMatchupIndices = numpy.array(
+            multiWeekMatchupIndices, dtype=numpy.int32
+        )
+        self.weekIsRegularSeason = numpy.array(weekIsRegularSeason, dtype=bool)
+
+    def __addTeamId(self, teamId: str) -> int:
+        if teamId not in self.teamIdToIndex:
+            self.teamIdToIndex[teamId] = len(self.teamIds)
+            self.teamIds.append(teamId)
+        return self.teamIdToIndex[teamId]
+
+    def __deepcopy__(self, memo: dict) -> YearIndex:
+        # the index is a read-only snapshot, so it is safe to share
+        return self
+
+    def __len__(self) -> int:
+        return len(self.matchups)
+
+    @classmethod
+    def getMatchupTypeCodes(cls, matchupTypes: list[MatchupType]) -> list[int]:
+        return [cls.MATCHUP_TYPES.index(matchupType) for matchupType in matchupTypes]
+
+    def getDefaultYearFilters(self) -> YearFilters:
+        """
+        Returns the same filters that YearFilters.getForYear() gives when no kwargs are passed.
+        """
+        return YearFilters(
+            weekNumberStart=self.firstWeekNumber, weekNumberEnd=self.lastWeekNumber
+        )
+
+    def isIndexFor(self, year: Year) -> bool:
+        """
+        Returns whether *this* index was built from the given Year.
+        """
+        return self.yearId == year.id and self.yearNumber == year.yearNumber
+
+    def getFilterMask(
+        self, yearFilters: YearFilters, *, applyMultiWeekMatchupFilter: bool = False
+    ) -> numpy.ndarray:
+        """
+        Returns a boolean array that is True for each row that is remaining after the given filters are applied.
+        Week ranges are applied by the position of the Week in the Year, the same way navigators apply them.
+        If applyMultiWeekMatchupFilter is True, multi-week matchups are removed when the filters do not include them.
+        """
+        mask = (
+            (self.weekIndices >= yearFilters.weekNumberStart - 1)
+            & (self.weekIndices < yearFilters.weekNumberEnd)
+            & numpy.isin(
+                self.matchupTypes,
+                self.getMatchupTypeCodes(yearFilters.includeMatchupTypes),
+            )
+        )
+        if applyMultiWeekMatchupFilter and not yearFilters.includeMultiWeekMatchups:
+            mask &= self.multiWeekMatchupIndices == self.NO_MULTI_WEEK_MATCHUP
+        return mask
+
+    def getFilteredMatchups(
+        self, yearFilters: YearFilters, *, applyMultiWeekMatchupFilter: bool = False
+    ) -> list[Matchup]:
+        """
+        Returns all Matchups that are remaining after the given filters are applied, in Year order.
+        """
+        rows = numpy.flatnonzero(
+            self.getFilterMask(
+                yearFilters, applyMultiWeekMatchupFilter=applyMultiWeekMatchupFilter
+            )
+        )
+        return [self.matchups[row] for row in rows]
+
+    def getFirstMultiWeekMatchupRowMask(self, mask: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns a boolean array that is True for each row in the given mask that is either:
+            - Not a multi-week matchup
+            - The first row found for its multi-week matchup
+        """
+        firstRowMask = mask.copy()
+        multiWeekRows = numpy.flatnonzero(
+            mask & (self.multiWeekMatchupIndices != self.NO_MULTI_WEEK_MATCHUP)
+        )
+        if len(multiWeekRows) > 0:
+            _, firstPositions = numpy.unique(
+                self.multiWeekMatchupIndices[multiWeekRows], return_index=True
+            )
+            firstRowMask[multiWeekRows] = False
+            firstRowMask[multiWeekRows[firstPositions]] = True
+        return firstRowMask
+
+    def getNumberOfGamesPlayed(
+        self,
+        yearFilters: YearFilters,
+        countMultiWeekMatchupsAsOneGame=False,
+        countLeagueMedianGamesAsTwoGames=False,
+    ) -> dict[str, int]:
+        """
+        Returns the number of games played for each team in the indexed Year.
+        This gives the same response as YearNavigator.getNumberOfGamesPlayed().
+        """
+        mask = self.getFilterMask(yearFilters)
+        if countMultiWeekMatchupsAsOneGame:
+            mask = self.getFirstMultiWeekMatchupRowMask(mask)
+
+        gamesPerRow = numpy.ones(len(self), dtype=numpy.int64)
+        if self.leagueMedianGames and countLeagueMedianGamesAsTwoGames:
+            regularSeasonCode = self.MATCHUP_TYPES.index(MatchupType.REGULAR_SEASON)
+            gamesPerRow[self.matchupTypes == regularSeasonCode] = 2
+        gamesPerRow[~mask] = 0
+
+        numberOfGamesPlayed = numpy.bincount(
+            self.teamAIndices, weights=gamesPerRow, minlength=len(self.teamIds)
+        ) + numpy.bincount(
+            self.teamBIndices, weights=gamesPerRow, minlength=len(self.teamIds)
+        )
+        return {
+            teamId: int(numberOfGamesPlayed[self.teamIdToIndex[teamId]])
+            for teamId in self.teamIds
+        }
+
+    def getAllScores(
+        self,
+        yearFilters: Optional[YearFilters] = None,
+        simplifyMultiWeekMatchups=False,
+    ) -> list[float | int]:
+        """
+        Returns a list of all scores for the indexed Year.
+        All Team A scores are listed first, followed by all Team B scores.
+        This gives the same response as YearNavigator.getAllScoresInYear() when no filters are given.
+        """
+        if self.numberOfWeeks == 0:
+            return list()
+        yearFilters = (
+            yearFilters if yearFilters is not None else self.getDefaultYearFilters()
+        )
+        mask = self.getFilterMask(yearFilters, applyMultiWeekMatchupFilter=True)
+        if not simplifyMultiWeekMatchups:
+            rows = numpy.flatnonzero(mask)
+            return [self.matchups[row].teamAScore for row in rows] + [
+                self.matchups[row].teamBScore for row in rows
+            ]
+
+        # non multi-week matchups first, then one combined score per multi-week matchup
+        singleWeekRows = numpy.flatnonzero(
+            mask & (self.multiWeekMatchupIndices == self.NO_MULTI_WEEK_MATCHUP)
+        )
+        teamAScores = [self.matchups[row].teamAScore for row in singleWeekRows]
+        teamBScores = [self.matchups[row].teamBScore for row in singleWeekRows]
+        for matchupList in self.getMultiWeekMatchups(yearFilters).values():
+            teamAScores.append(sum([matchup.teamAScore for matchup in matchupList]))
+            teamBScores.append(sum([matchup.teamBScore for matchup in matchupList]))
+        return teamAScores + teamBScores
+
+    def getWeeklyScoreRanks(
+        self, yearFilters: YearFilters, *, opponentScores: bool = False
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Ranks each team's score against every other score in the same week, for every week at once.
+        Multi-week matchups are ranked week by week.
+        If opponentScores is True, each team's opponent's score is ranked instead.
+
+        Returns 4 arrays with one entry per team per week, ordered by week:
+            - The index of the team in teamIds
+            - The number of scores in the week that the score beat
+            - The number of other scores in the week that the score tied
+            - The number of teams that played in the week
+        """
+        rows = numpy.flatnonzero(self.getFilterMask(yearFilters))
+        teamIndices = numpy.concatenate(
+            (self.teamAIndices[rows], self.teamBIndices[rows])
+        )
+        scores = (
+            numpy.concatenate((self.teamBScores[rows], self.teamAScores[rows]))
+            if opponentScores
+            else numpy.concatenate((self.teamAScores[rows], self.teamBScores[rows]))
+        )
+        weekIndices = numpy.concatenate(
+            (self.weekIndices[rows], self.weekIndices[rows])
+        )
+
+        # sort by week, then by score within each week
+        order = numpy.lexsort((scores, weekIndices))
+        sortedScores = scores[order]
+        sortedWeekIndices = weekIndices[order]
+        positions = numpy.arange(len(order))
+
+        isNewWeek = numpy.ones(len(order), dtype=bool)
+        isNewWeek[1:] = sortedWeekIndices[1:] != sortedWeekIndices[:-1]
+        isNewScore = isNewWeek.copy()
+        isNewScore[1:] |= sortedScores[1:] != sortedScores[:-1]
+
+        # the first position of each week and of each run of tied scores
+        weekStarts = numpy.maximum.accumulate(numpy.where(isNewWeek, positions, 0))
+        scoreStarts = numpy.maximum.accumulate(numpy.where(isNewScore, positions, 0))
+        weekIds = numpy.cumsum(isNewWeek) - 1
+        scoreIds = numpy.cumsum(isNewScore) - 1
+
+        # sorting by week first keeps every team's entries in week order
+        return (
+            teamIndices[order],
+            scoreStarts - weekStarts,
+            numpy.bincount(scoreIds)[scoreIds] - 1,
+            numpy.bincount(weekIds)[weekIds],
+        )
+
+    def getMultiWeekMatchups(
+        self, yearFilters: YearFilters
+    ) -> dict[str, list[Matchup]]:
+        """
+        Returns a dictionary that has the multi-week matchup ID as the key and a list of matchups as the value.
+        Multi-week matchups are ordered by the first time they are found in the Year.
+        """
+        multiWeekRows = numpy.flatnonzero(
+            self.getFilterMask(yearFilters)
+            & (self.multiWeekMatchupIndices != self.NO_MULTI_WEEK_MATCHUP)
+        )
+        multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
+        for row in multiWeekRows:
+            mwmid = self.multiWeekMatchupIds[self.multiWeekMatchupIndices[row]]
+            multiWeekMatchupIdToMatchupListMap.setdefault(mwmid, list()).append(
+                self.matchups[row]
+            )
+        return multiWeekMatchupIdToMatchupListMap
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from leeger.model.league.Division import Division
+from leeger.model.league.Team import Team
+from leeger.model.league.Year import Year
+
+
+class YearLookup:
+    """
+    Finds Teams and Divisions in a Year by ID without walking the Year.
+
+    Works the same way as LeagueLookup:
+    it is kept on the Year it was built from, only trusts an object that is still where it was found, and is rebuilt once on a miss.
+    """
+
+    # the attribute the lookup is kept in on the Year
+    ATTRIBUTE_NAME = "_yearLookup"
+
+    def __init__(self, year: Year):
+        self.__teamIdToPosition: dict[str, int] = dict()
+        self.__divisionIdToPosition: dict[str, int] = dict()
+
+        for teamPosition, team in enumerate(year.teams):
+            self.__teamIdToPosition.setdefault(team.id, teamPosition)
+        for divisionPosition, division in enumerate(year.divisions or list()):
+            self.__divisionIdToPosition.setdefault(division.id, divisionPosition)
+
+    def __deepcopy__(self, memo: dict) -> YearLookup:
+        # positions are the same in a copy of the Year, so it is safe to share
+        return self
+
+    @classmethod
+    def getTeam(cls, year: Year, teamId: str) -> Optional[Team]:
+        """
+        Returns the Team with the given ID.
+        Returns None if there is no Team with the given ID in the given Year.
+        """
+        return cls.__find(
+            year,
+            lambda lookup: cls.__getAtPosition(
+                year.teams, lookup.__teamIdToPosition.get(teamId), teamId
+            ),
+        )
+
+    @classmethod
+    def getDivision(cls, year: Year, divisionId: str) -> Optional[Division]:
+        """
+        Returns the Division with the given ID.
+        Returns None if there is no Division with the given ID in the given Year.
+        """
+        return cls.__find(
+            year,
+            lambda lookup: cls.__getAtPosition(
+                year.divisions or list(),
+                lookup.__divisionIdToPosition.get(divisionId),
+                divisionId,
+            ),
+        )
+
+    @classmethod
+    def __find(cls, year: Year, find):
+        lookup = getattr(year, cls.ATTRIBUTE_NAME, None)
+        if lookup is not None:
+            found = find(lookup)
+            if found is not None:
+                return found
+        # this Year has not been looked up yet or has changed since it was
+        lookup = YearLookup(year)
+        setattr(year, cls.ATTRIBUTE_NAME, lookup)
+        return find(lookup)
+
+    @staticmethod
+    def __getAtPosition(
+        objects: list[Team | Division], position: Optional[int], id_: str
+    ) -> Optional[Team | Division]:
+        if position is not None and position < len(objects):
+            if objects[position].id == id_:
+                return objects[position]
+        return None
@@ -0,0 +1,6 @@
+from .LeagueIndex import LeagueIndex
+from .LeagueLookup import LeagueLookup
+from .MatchupSelectionCache import MatchupSelectionCache
+from .ScoreIndex import ScoreIndex
+from .YearIndex import YearIndex
+from .YearLookup import YearLookup
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import codecs
+import json
+from dataclasses import dataclass
+from typing import IO, Any, Iterable, Iterator
+
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Year import Year
+
+# how many characters are read from a file at once
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def writeLeagueJson(league: League, file: IO[str]) -> None:
+    """
+    Writes the given League to the given text file as JSON, one Year at a time.
+    Writes the same JSON as json.dump(league.toJson(), file), without holding the JSON of the whole League.
+    """
+    file.write(f"{{{json.dumps('id')}: {json.dumps(league.id)}")
+    file.write(f", {json.dumps('name')}: {json.dumps(league.name)}")
+    file.write(
+        f", {json.dumps('owners')}: {json.dumps([owner.toJson() for owner in league.owners])}"
+    )
+    file.write(f", {json.dumps('years')}: [")
+    for i, year in enumerate(league.years):
+        if i > 0:
+            file.write(", ")
+        file.write(json.dumps(year.toJson()))
+    file.write("]}")
+
+
+def writeLeaguesJson(leagues: Iterable[League], file: IO[str]) -> None:
+    """
+    Writes the given Leagues to the given text file as a JSON list, one Year at a time.
+    Leagues can be a generator, so only one League has to be held at once.
+    """
+    file.write("[")
+    for i, league in enumerate(leagues):
+        if i > 0:
+            file.write(", ")
+        writeLeagueJson(league, file)
+    file.write("]")
+
+
+@dataclass(kw_only=True)
+class StreamedLeague:
+    """
+    Used to hold a League being read from a JSON file by readLeagueJson() or readLeaguesJson().
+    Years are read from the file as they are iterated.
+    """
+
+    id: str
+    name: str
+    owners: list[Owner]
+    years: Iterator[Year]
+
+    def toLeague(self) -> League:
+        """
+        Reads every Year that has not been read yet and returns the whole League.
+        """
+        league = League(name=self.name, owners=self.owners, years=list(self.years))
+        league.id = self.id
+        return league
+
+
+def readLeagueJson(file: IO, *, chunkSize: int = DEFAULT_CHUNK_SIZE) -> StreamedLeague:
+    """
+    Reads the League in the given JSON file (like one written by writeLeagueJson() or json.dump(league.toJson(), file)).
+    The id, name and owners are read right away and each Year is only read when StreamedLeague.years gets to it,
+    so only one Year is held at once.
+    The file can be opened in text or binary mode (binary files must be UTF-8).
+
+    Usage:
+        with open("league.json") as file:
+            for year in readLeagueJson(file).years:
+                ...
+    """
+    return _JSONStreamReader(file, chunkSize).readLeague()
+
+
+def readLeaguesJson(
+    file: IO, *, chunkSize: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[StreamedLeague]:
+    """
+    Reads each League in the given JSON list of Leagues (like one written by writeLeaguesJson()).
+    Any Years of a StreamedLeague that were not read are skipped when the next StreamedLeague is read.
+
+    Usage:
+        with open("leagues.json") as file:
+            for streamedLeague in readLeaguesJson(file):
+                for year in streamedLeague.years:
+                    ...
+    """
+    reader = _JSONStreamReader(file, chunkSize)
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        streamedLeague = reader.readLeague()
+        yield streamedLeague
+        # skip any Years that were not read
+        for _ in streamedLeague.years:
+            pass
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+        reader.expect(",")
+
+
+class _JSONStreamReader:
+    """
+    Reads JSON values one at a time from a file, holding only what has been read and not used yet.
+    """
+
+    __DECODER = json.JSONDecoder()
+    __WHITESPACE = " \t\n\r"
+
+    def __init__(self, file: IO, chunkSize: int):
+        if not isinstance(chunkSize, int) or chunkSize < 1:
+            raise ValueError("'chunkSize' must be an int that is at least 1.")
+        self.__file = file
+        self.__chunkSize = chunkSize
+        self.__buffer = ""
+        self.__position = 0
+        self.__isAtEndOfFile = False
+        self.__bytesDecoder = None
+
+    def __read(self, size: int) -> bool:
+        """
+        Adds at least size more characters to the buffer, unless the file ends first.
+        Returns whether anything was added.
+        """
+        if self.__isAtEndOfFile:
+            return False
+        # forget what has been used
+        self.__buffer = self.__buffer[self.__position :]
+        self.__position = 0
+        while True:
+            chunk = self.__file.read(size)
+            self.__isAtEndOfFile = len(chunk) == 0
+            if isinstance(chunk, bytes):
+                if self.__bytesDecoder is None:
+                    self.__bytesDecoder = codecs.getincrementaldecoder("utf-8")()
+                # a chunk can end partway through a character, which is decoded with the next chunk
+                chunk = self.__bytesDecoder.decode(chunk, final=self.__isAtEndOfFile)
+            if len(chunk) > 0:
+                self.__buffer += chunk
+                return True
+            if self.__isAtEndOfFile:
+                return False
+
+    def peek(self) -> str:
+        """
+        Returns the next character that is not whitespace without using it.
+        """
+        while True:
+            while (
+                self.__position < len(self.__buffer)
+                and self.__buffer[self.__position] in self.__WHITESPACE
+            ):
+                self.__position += 1
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__read(self.__chunkSize):
+                raise ValueError("Unexpected end of JSON.")
+
+    def expect(self, character: str) -> None:
+        found = self.peek()
+        if found != character:
+            raise ValueError(f"Expected '{character}' but found '{found}'.")
+        self.__position += 1
+
+    def readValue(self) -> Any:
+        """
+        Reads and returns the next JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.__DECODER.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError:
+                # the value may not be fully read yet, so read as much again as is held
+                if not self.__read(max(self.__chunkSize, len(self.__buffer))):
+                    raise
+                continue
+            # a number at the end of what has been read may have more digits after it
+            if end == len(self.__buffer) and self.__read(self.__chunkSize):
+                continue
+            self.__position = end
+            return value
+
+    def readLeague(self) -> StreamedLeague:
+        """
+        Reads a League object up to its years, which are read as StreamedLeague.years is iterated.
+        """
+        self.expect("{")
+        fields: dict[str, Any] = dict()
+        heldYears: list[Year] = list()
+        isFirstField = True
+        while self.peek() != "}":
+            if not isFirstField:
+                self.expect(",")
+            isFirstField = False
+            key = self.readValue()
+            self.expect(":")
+            if key != "years":
+                fields[key] = self.readValue()
+                continue
+            if {"id", "name", "owners"} <= fields.keys():
+                # everything else has been read, so the years can be read as they are used
+                return StreamedLeague(
+                    id=fields["id"],
+                    name=fields["name"],
+                    owners=[
+                        Owner.fromJson(ownerDict) for ownerDict in fields["owners"]
+                    ],
+                    years=self.__readYears(),
+                )
+            # the years come before the rest of the League, so they have to be held
+            heldYears = list(self.__readYearList())
+        self.expect("}")
+        return StreamedLeague(
+            id=fields["id"],
+            name=fields["name"],
+            owners=[Owner.fromJson(ownerDict) for ownerDict in fields["owners"]],
+            years=iter(heldYears),
+        )
+
+    def __readYearList(self) -> Iterator[Year]:
+        self.expect("[")
+        isFirstYear = True
+        while self.peek() != "]":
+            if not isFirstYear:
+                self.expect(",")
+            isFirstYear = False
+            yield Year.fromJson(self.readValue())
+        self.expect("]")
+
+    def __readYears(self) -> Iterator[Year]:
+        """
+        Reads the years of a League object and then the rest of the League object.
+        """
+        yield from self.__readYearList()
+        # the rest of the League object
+        while self.peek() != "}":
+            self.expect(",")
+            self.readValue()
+            self.expect(":")
+            self.readValue()
+        self.expect("}")
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.model.filter.AllTimeFilters import AllTimeFilters
 from leeger.model.filter.YearFilters import YearFilters
@@ -5,8 +9,12 @@ from leeger.model.league import Owner
 from leeger.model.league.League import League
 from leeger.model.league.Team import Team
 from leeger.model.league.Year import Year
+from leeger.util.index.LeagueLookup import LeagueLookup
 from leeger.util.navigator.YearNavigator import YearNavigator
 
+if TYPE_CHECKING:
+    from leeger.util.index import LeagueIndex
+
 
 class LeagueNavigator:
     """
@@ -15,28 +23,40 @@ class LeagueNavigator:
 
     @staticmethod
     def getYearByYearNumber(league: League, yearNumber: int) -> Year:
-        for year in league.years:
-            if year.yearNumber == yearNumber:
-                return year
+        year = LeagueLookup.getYear(league, yearNumber)
+        if year is not None:
+            return year
         raise DoesNotExistException(
             f"Year {yearNumber} does not exist in the given League."
         )
 
     @staticmethod
     def getTeamById(league: League, teamId: str) -> Team:
-        for year in league.years:
-            for team in year.teams:
-                if team.id == teamId:
-                    return team
+        teamAndYear = LeagueLookup.getTeamAndYear(league, teamId)
+        if teamAndYear is not None:
+            return teamAndYear[0]
+        raise DoesNotExistException(
+            f"Team with ID {teamId} does not exist in the given League."
+        )
+
+    @staticmethod
+    def getYearByTeamId(league: League, teamId: str) -> Year:
+        teamAndYear = LeagueLookup.getTeamAndYear(league, teamId)
+        if teamAndYear is not None:
+            return teamAndYear[1]
         raise DoesNotExistException(
             f"Team with ID {teamId} does not exist in the given League."
         )
 
+    @classmethod
+    def getOwnerIdByTeamId(cls, league: League, teamId: str) -> str:
+        return cls.getTeamById(league, teamId).ownerId
+
     @staticmethod
     def getOwnerById(league: League, ownerId: str) -> Owner:
-        for owner in league.owners:
-            if owner.id == ownerId:
-                return owner
+        owner = LeagueLookup.getOwner(league, ownerId)
+        if owner is not None:
+            return owner
         raise DoesNotExistException(
             f"Owner with ID {ownerId} does not exist in the given League."
         )
@@ -45,28 +65,24 @@ class LeagueNavigator:
     def getAllOwnerIds(league: League) -> list[str]:
         return [owner.id for owner in league.owners]
 
-    @classmethod
-    def getNumberOfGamesPlayed(
-        cls,
-        league: League,
-        allTimeFilters: AllTimeFilters,
-        countMultiWeekMatchupsAsOneGame=False,
-        countLeagueMedianGamesAsTwoGames=False,
-    ) -> dict[str, int]:
+    @staticmethod
+    def getYearsAndWeekNumberRanges(
+        league: League, allTimeFilters: AllTimeFilters
+    ) -> list[tuple[Year, int, int]]:
         """
-        Returns the number of games played for each owner in the given League all time.
+        Returns each Year in the given filters with the week number start and week number end to use for that Year.
+        Years are in order from least -> most recent.
 
         Example response:
-            {
-            "someTeamId": 14,
-            "someOtherTeamId": 16,
-            "yetAnotherTeamId": 21,
+            [
+            (Year(...), 3, 14),
+            (Year(...), 1, 14),
+            (Year(...), 1, 9),
             ...
-            }
+            ]
         """
-
         # parse filters
-        yearWeekNumberStartWeekNumberEnd: list[tuple] = list()
+        yearWeekNumberStartWeekNumberEnd: list[tuple[Year, int, int]] = list()
         if allTimeFilters.yearNumberStart == allTimeFilters.yearNumberEnd:
             yearWeekNumberStartWeekNumberEnd.append(
                 (
@@ -98,6 +114,36 @@ class LeagueNavigator:
                 ):
                     # this year is in our year range, include every week in this year
                     yearWeekNumberStartWeekNumberEnd.append((year, 1, len(year.weeks)))
+        return yearWeekNumberStartWeekNumberEnd
+
+    @classmethod
+    def getNumberOfGamesPlayed(
+        cls,
+        league: League,
+        allTimeFilters: AllTimeFilters,
+        countMultiWeekMatchupsAsOneGame=False,
+        countLeagueMedianGamesAsTwoGames=False,
+        leagueIndex: Optional[LeagueIndex] = None,
+    ) -> dict[str, int]:
+        """
+        Returns the number of games played for each owner in the given League all time.
+        If a LeagueIndex built from the given League is passed, it will be used instead of walking the League.
+
+        Example response:
+            {
+            "someTeamId": 14,
+            "someOtherTeamId": 16,
+            "yetAnotherTeamId": 21,
+            ...
+            }
+        """
+
+        yearWeekNumberStartWeekNumberEnd = cls.getYearsAndWeekNumberRanges(
+            league, allTimeFilters
+        )
+
+        if leagueIndex is not None and not leagueIndex.isIndexFor(league):
+            leagueIndex = None
 
         allResultDicts: list[dict] = list()
 
@@ -119,6 +165,11 @@ class LeagueNavigator:
                     yearFilters,
                     countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
                     countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+                    yearIndex=(
+                        leagueIndex.getYearIndex(currentYear.yearNumber)
+                        if leagueIndex is not None
+                        else None
+                    ),
                 )
             )
 
@@ -130,20 +181,30 @@ class LeagueNavigator:
 
         for resultDict in allResultDicts:
             for teamId in resultDict.keys():
-                ownerIdAndNumberOfGamesPlayed[
-                    LeagueNavigator.getTeamById(league, teamId).ownerId
-                ] += resultDict[teamId]
+                ownerId = (
+                    leagueIndex.getOwnerIdForTeamId(teamId)
+                    if leagueIndex is not None
+                    else LeagueNavigator.getTeamById(league, teamId).ownerId
+                )
+                ownerIdAndNumberOfGamesPlayed[ownerId] += resultDict[teamId]
 
         return ownerIdAndNumberOfGamesPlayed
 
     @staticmethod
     def getAllScoresInLeague(
-        league: League, simplifyMultiWeekMatchups=False
+        league: League,
+        simplifyMultiWeekMatchups=False,
+        leagueIndex: Optional[LeagueIndex] = None,
     ) -> list[float | int]:
         """
         Returns a list of all scores for the given League.
         Will count all scores EXCEPT for IGNORE Matchups.
+        If a LeagueIndex built from the given League is passed, it will be used instead of walking the League.
         """
+        if leagueIndex is not None and leagueIndex.isIndexFor(league):
+            return leagueIndex.getAllScores(
+                simplifyMultiWeekMatchups=simplifyMultiWeekMatchups
+            )
         allScores = list()
         for year in league.years:
             allScores += YearNavigator.getAllScoresInYear(
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import copy
+from typing import TYPE_CHECKING, Optional
 
 from leeger.enum import MatchupType
 from leeger.exception import DoesNotExistException
@@ -6,6 +9,11 @@ from leeger.model.filter.YearFilters import YearFilters
 from leeger.model.league import Matchup, Team
 from leeger.model.league.Division import Division
 from leeger.model.league.Year import Year
+from leeger.util.index.MatchupSelectionCache import MatchupSelectionCache
+from leeger.util.index.YearLookup import YearLookup
+
+if TYPE_CHECKING:
+    from leeger.util.index import YearIndex
 
 
 class YearNavigator:
@@ -19,18 +27,18 @@ class YearNavigator:
 
     @staticmethod
     def getTeamById(year: Year, teamId: str) -> Team:
-        for team in year.teams:
-            if team.id == teamId:
-                return team
+        team = YearLookup.getTeam(year, teamId)
+        if team is not None:
+            return team
         raise DoesNotExistException(
             f"Team with ID '{teamId}' does not exist in the given Year."
         )
 
     @staticmethod
     def getDivisionById(year: Year, divisionId: str) -> Division:
-        for division in year.divisions:
-            if division.id == divisionId:
-                return division
+        division = YearLookup.getDivision(year, divisionId)
+        if division is not None:
+            return division
         raise DoesNotExistException(
             f"Division with ID '{divisionId}' does not exist in the given Year."
         )
@@ -42,9 +50,11 @@ class YearNavigator:
         yearFilters: YearFilters,
         countMultiWeekMatchupsAsOneGame=False,
         countLeagueMedianGamesAsTwoGames=False,
+        yearIndex: Optional[YearIndex] = None,
     ) -> dict[str, int]:
         """
         Returns the number of games played for each team in the given Year.
+        If a YearIndex built from the given Year is passed, it will be used instead of walking the Year.
 
         Example response:
             {
@@ -54,6 +64,16 @@ class YearNavigator:
             ...
             }
         """
+        if yearIndex is not None and yearIndex.isIndexFor(year):
+            teamIdAndNumberOfGamesPlayed = yearIndex.getNumberOfGamesPlayed(
+                yearFilters,
+                countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+            )
+            return {
+                teamId: teamIdAndNumberOfGamesPlayed[teamId]
+                for teamId in YearNavigator.getAllTeamIds(year)
+            }
 
         teamIdAndNumberOfGamesPlayed = dict()
         allTeamIds = YearNavigator.getAllTeamIds(year)
@@ -88,12 +108,19 @@ class YearNavigator:
 
     @staticmethod
     def getAllScoresInYear(
-        year: Year, simplifyMultiWeekMatchups=False
+        year: Year,
+        simplifyMultiWeekMatchups=False,
+        yearIndex: Optional[YearIndex] = None,
     ) -> list[float | int]:
         """
         Returns a list of all scores for the given Year.
         Will count all scores EXCEPT for IGNORE Matchups.
+        If a YearIndex built from the given Year is passed, it will be used instead of walking the Year.
         """
+        if yearIndex is not None and yearIndex.isIndexFor(year):
+            return yearIndex.getAllScores(
+                simplifyMultiWeekMatchups=simplifyMultiWeekMatchups
+            )
         # add simplified multi-week matchup scores if requested
         if simplifyMultiWeekMatchups:
             allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year)
@@ -117,6 +144,21 @@ class YearNavigator:
             raise ValueError(
                 "Multi-Week matchups must be included in this calculation."
             )
+        multiWeekMatchupIdToMatchups = MatchupSelectionCache.get(
+            "multiWeekMatchups",
+            year,
+            filters,
+            lambda: YearNavigator.__selectAllMultiWeekMatchups(year, filters),
+        )
+        return {
+            mwmid: list(matchups)
+            for mwmid, matchups in multiWeekMatchupIdToMatchups.items()
+        }
+
+    @staticmethod
+    def __selectAllMultiWeekMatchups(
+        year: Year, filters: YearFilters
+    ) -> dict[str, tuple[Matchup, ...]]:
         multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
 
         for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
@@ -129,11 +171,64 @@ class YearNavigator:
                             multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
                         else:
                             multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
-        return multiWeekMatchupIdToMatchupListMap
+        return {
+            mwmid: tuple(matchups)
+            for mwmid, matchups in multiWeekMatchupIdToMatchupListMap.items()
+        }
 
     @staticmethod
     def getAllMatchupsInYear(year: Year, filters: YearFilters = None) -> list[Matchup]:
         filters = filters if filters is not None else YearFilters.getForYear(year)
+        return list(YearNavigator.getMatchupSelection(year, filters))
+
+    @staticmethod
+    def getMatchupSelection(
+        year: Year, filters: YearFilters, *, simplifyMultiWeekMatchups=False
+    ) -> tuple[Matchup, ...]:
+        """
+        Returns the same Matchups as getAllMatchupsInYear() or getAllSimplifiedMatchupsInYear() as a tuple.
+        The tuple is kept in MatchupSelectionCache and shared with every other call for the same Year and filters, so it and its Matchups should not be changed.
+        """
+        from leeger.util.navigator import MatchupNavigator
+
+        if not simplifyMultiWeekMatchups:
+            return MatchupSelectionCache.get(
+                "matchups",
+                year,
+                filters,
+                lambda: tuple(YearNavigator.__selectAllMatchups(year, filters)),
+            )
+
+        if not filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
+
+        def selectAllSimplifiedMatchups() -> tuple[Matchup, ...]:
+            # get all non multi-week matchups
+            modifiedFilters = copy.deepcopy(filters)
+            modifiedFilters.includeMultiWeekMatchups = False
+            allMatchups: list[Matchup] = YearNavigator.__selectAllMatchups(
+                year, modifiedFilters
+            )
+            # get all multi-week matchups
+            allMultiWeekMatchups: dict[str, list[Matchup]] = (
+                YearNavigator.getAllMultiWeekMatchups(year, filters)
+            )
+
+            # simplify multi-week matchups
+            for _, matchupList in allMultiWeekMatchups.items():
+                allMatchups.append(
+                    MatchupNavigator.simplifyMultiWeekMatchups(matchupList)
+                )
+            return tuple(allMatchups)
+
+        return MatchupSelectionCache.get(
+            "simplifiedMatchups", year, filters, selectAllSimplifiedMatchups
+        )
+
+    @staticmethod
+    def __selectAllMatchups(year: Year, filters: YearFilters) -> list[Matchup]:
         allMatchups = list()
         for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
             week = year.weeks[i]
@@ -152,26 +247,9 @@ class YearNavigator:
         """
         Returns a list of matchups for the given year with multi-week matchups simplified.
         """
-        from leeger.util.navigator import MatchupNavigator
-
         filters = filters if filters is not None else YearFilters.getForYear(year)
-        if not filters.includeMultiWeekMatchups:
-            raise ValueError(
-                "Multi-Week matchups must be included in this calculation."
+        return list(
+            YearNavigator.getMatchupSelection(
+                year, filters, simplifyMultiWeekMatchups=True
             )
-
-        # get all non multi-week matchups
-        modifiedFilters = copy.deepcopy(filters)
-        modifiedFilters.includeMultiWeekMatchups = False
-        allMatchups: list[Matchup] = YearNavigator.getAllMatchupsInYear(
-            year, modifiedFilters
-        )
-        # get all multi-week matchups
-        allMultiWeekMatchups: dict[str, list[Matchup]] = (
-            YearNavigator.getAllMultiWeekMatchups(year, filters)
         )
-
-        # simplify multi-week matchups
-        for _, matchupList in allMultiWeekMatchups.items():
-            allMatchups.append(MatchupNavigator.simplifyMultiWeekMatchups(matchupList))
-        return allMatchups
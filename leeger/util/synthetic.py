@@ -0,0 +1,200 @@
+import math
+import random
+from typing import Optional
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import (
+    Division,
+    League,
+    Matchup,
+    Owner,
+    Team,
+    Week,
+    Year,
+    YearSettings,
+)
+
+
+def generateLeague(
+    *,
+    numberOfYears: int = 3,
+    numberOfTeams: int = 10,
+    numberOfRegularSeasonWeeks: int = 13,
+    numberOfPlayoffTeams: int = 4,
+    numberOfDivisions: int = 0,
+    numberOfLeagueMedianYears: int = 0,
+    multiWeekPlayoffs: bool = False,
+    firstYearNumber: int = 2000,
+    seed: Optional[int] = None,
+) -> League:
+    """
+    Returns a valid League with made-up scores, to test or benchmark with.
+    The same seed always makes a League with the same names and scores.
+
+    Each Year has the same Owners and:
+        - numberOfRegularSeasonWeeks weeks where every team plays a random opponent
+        - Playoffs for the numberOfPlayoffTeams teams with the most regular season wins, with the last round as the championship
+          (each playoff round is a multi-week matchup over 2 weeks if multiWeekPlayoffs is True)
+        - numberOfDivisions Divisions that teams are split between
+        - League median games if it is one of the last numberOfLeagueMedianYears Years
+    """
+    if numberOfYears < 1:
+        raise ValueError("'numberOfYears' must be at least 1.")
+    if numberOfTeams < 2 or numberOfTeams % 2 != 0:
+        raise ValueError("'numberOfTeams' must be an even number that is at least 2.")
+    if numberOfRegularSeasonWeeks < 1:
+        raise ValueError("'numberOfRegularSeasonWeeks' must be at least 1.")
+    if numberOfPlayoffTeams != 0 and (
+        numberOfPlayoffTeams < 2
+        or numberOfPlayoffTeams > numberOfTeams
+        or numberOfPlayoffTeams & (numberOfPlayoffTeams - 1) != 0
+    ):
+        raise ValueError(
+            "'numberOfPlayoffTeams' must be 0 or a power of 2 that is at least 2 and at most 'numberOfTeams'."
+        )
+    if not 0 <= numberOfDivisions <= numberOfTeams:
+        raise ValueError(
+            "'numberOfDivisions' must be between 0 and 'numberOfTeams' (inclusive)."
+        )
+    if not 0 <= numberOfLeagueMedianYears <= numberOfYears:
+        raise ValueError(
+            "'numberOfLeagueMedianYears' must be between 0 and 'numberOfYears' (inclusive)."
+        )
+
+    rand = random.Random(seed)
+    owners = [Owner(name=f"Owner {i + 1}") for i in range(numberOfTeams)]
+    years = list()
+    for yearPosition in range(numberOfYears):
+        yearNumber = firstYearNumber + yearPosition
+        divisions = [
+            Division(name=f"Division {i + 1}") for i in range(numberOfDivisions)
+        ]
+        teams = [
+            Team(
+                ownerId=owner.id,
+                name=f"Team {i + 1} ({yearNumber})",
+                divisionId=divisions[i % numberOfDivisions].id if divisions else None,
+            )
+            for i, owner in enumerate(owners)
+        ]
+        weeks = _getRegularSeasonWeeks(rand, teams, numberOfRegularSeasonWeeks)
+        if numberOfPlayoffTeams > 0:
+            weeks += _getPlayoffWeeks(
+                rand,
+                teams,
+                weeks,
+                numberOfPlayoffTeams=numberOfPlayoffTeams,
+                multiWeekPlayoffs=multiWeekPlayoffs,
+                yearNumber=yearNumber,
+            )
+        years.append(
+            Year(
+                yearNumber=yearNumber,
+                teams=teams,
+                weeks=weeks,
+                divisions=divisions,
+                yearSettings=YearSettings(
+                    leagueMedianGames=yearPosition
+                    >= numberOfYears - numberOfLeagueMedianYears
+                ),
+            )
+        )
+    return League(name="Synthetic League", owners=owners, years=years)
+
+
+def _getScore(rand: random.Random) -> float:
+    return round(rand.uniform(60, 160), 2)
+
+
+def _getRegularSeasonWeeks(
+    rand: random.Random, teams: list[Team], numberOfWeeks: int
+) -> list[Week]:
+    weeks = list()
+    for weekNumber in range(1, numberOfWeeks + 1):
+        shuffledTeams = rand.sample(teams, len(teams))
+        weeks.append(
+            Week(
+                weekNumber=weekNumber,
+                matchups=[
+                    Matchup(
+                        teamAId=teamA.id,
+                        teamBId=teamB.id,
+                        teamAScore=_getScore(rand),
+                        teamBScore=_getScore(rand),
+                    )
+                    for teamA, teamB in zip(shuffledTeams[::2], shuffledTeams[1::2])
+                ],
+            )
+        )
+    return weeks
+
+
+def _getPlayoffWeeks(
+    rand: random.Random,
+    teams: list[Team],
+    regularSeasonWeeks: list[Week],
+    *,
+    numberOfPlayoffTeams: int,
+    multiWeekPlayoffs: bool,
+    yearNumber: int,
+) -> list[Week]:
+    # seed teams by regular season wins, then by position so seeding is the same every time
+    teamIdToWins = {team.id: 0 for team in teams}
+    for week in regularSeasonWeeks:
+        for matchup in week.matchups:
+            if matchup.teamAScore > matchup.teamBScore:
+                teamIdToWins[matchup.teamAId] += 1
+            elif matchup.teamBScore > matchup.teamAScore:
+                teamIdToWins[matchup.teamBId] += 1
+    remainingTeamIds = sorted(
+        teamIdToWins, key=lambda teamId: teamIdToWins[teamId], reverse=True
+    )[:numberOfPlayoffTeams]
+
+    weeks = list()
+    weekNumber = len(regularSeasonWeeks) + 1
+    numberOfRounds = int(math.log2(numberOfPlayoffTeams))
+    weeksPerRound = 2 if multiWeekPlayoffs else 1
+    for roundNumber in range(1, numberOfRounds + 1):
+        matchupType = (
+            MatchupType.CHAMPIONSHIP
+            if roundNumber == numberOfRounds
+            else MatchupType.PLAYOFF
+        )
+        # best remaining seed plays worst remaining seed, and the better seed wins ties
+        pairs = [
+            (remainingTeamIds[i], remainingTeamIds[-(i + 1)])
+            for i in range(len(remainingTeamIds) // 2)
+        ]
+        pairToTotalScores = {pair: [0, 0] for pair in pairs}
+        for _ in range(weeksPerRound):
+            matchups = list()
+            for pairNumber, (teamAId, teamBId) in enumerate(pairs):
+                teamAScore = _getScore(rand)
+                teamBScore = _getScore(rand)
+                pairToTotalScores[(teamAId, teamBId)][0] += teamAScore
+                pairToTotalScores[(teamAId, teamBId)][1] += teamBScore
+                matchups.append(
+                    Matchup(
+                        teamAId=teamAId,
+                        teamBId=teamBId,
+                        teamAScore=teamAScore,
+                        teamBScore=teamBScore,
+                        matchupType=matchupType,
+                        teamAHasTiebreaker=True,
+                        multiWeekMatchupId=(
+                            f"{yearNumber}-{roundNumber}-{pairNumber + 1}"
+                            if multiWeekPlayoffs
+                            else None
+                        ),
+                    )
+                )
+            weeks.append(Week(weekNumber=weekNumber, matchups=matchups))
+            weekNumber += 1
+        remainingTeamIds = [
+            teamAId if teamAScore >= teamBScore else teamBId
+            for (teamAId, teamBId), (
+                teamAScore,
+                teamBScore,
+            ) in pairToTotalScores.items()
+        ]
+    return weeks
@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+
+from leeger.calculator.all_time_calculator.SSLAllTimeCalculator import (
+    SSLAllTimeCalculator,
+)
+from leeger.calculator.StatContext import StatContext
+from leeger.calculator.year_calculator.SingleScoreYearCalculator import (
+    SingleScoreYearCalculator,
+)
+from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+from leeger.util.synthetic import generateLeague
+
+
+class TestStatContext(unittest.TestCase):
+    def setUp(self):
+        self.league = generateLeague(numberOfYears=2, numberOfTeams=4, seed=0)
+        self.year = self.league.years[0]
+
+    def test_statContext_nestedCallsAreOnlyCalculatedOnce(self):
+        expected = SSLYearCalculator.getTeamLuck(self.year)
+        statContext = StatContext()
+
+        response = SSLYearCalculator.getTeamLuck(self.year, statContext=statContext)
+
+        self.assertEqual(expected, response)
+        # Team Score and Team Success both use Scoring Share, Max Score and Min Score
+        self.assertEqual(3, statContext.hits)
+
+    def test_statContext_withBlock(self):
+        with StatContext() as statContext:
+            response1 = SSLYearCalculator.getTeamScore(self.year)
+            response2 = SSLYearCalculator.getTeamScore(self.year)
+        self.assertIsNone(StatContext.getCurrent())
+
+        self.assertEqual(response1, response2)
+        self.assertEqual(1, statContext.hits)
+
+    def test_statContext_differentKwargsAreCalculatedAgain(self):
+        statContext = StatContext()
+
+        response1 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext
+        )
+        response2 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext, weekNumberEnd=1
+        )
+
+        self.assertEqual(0, statContext.hits)
+        self.assertEqual(2, statContext.misses)
+        self.assertNotEqual(response1, response2)
+
+    def test_statContext_changedYearIsCalculatedAgain(self):
+        statContext = StatContext()
+        response1 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext
+        )
+
+        self.year.weeks[0].matchups[0].teamAScore = 1000
+        response2 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext
+        )
+
+        self.assertEqual(0, statContext.hits)
+        self.assertEqual(1000, response2[self.year.weeks[0].matchups[0].teamAId])
+        self.assertNotEqual(response1, response2)
+
+    def test_statContext_changingResultDoesNotChangeKeptResult(self):
+        statContext = StatContext()
+        response1 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext
+        )
+        expected = dict(response1)
+        response1.clear()
+
+        response2 = SingleScoreYearCalculator.getMaxScore(
+            self.year, statContext=statContext
+        )
+
+        self.assertEqual(1, statContext.hits)
+        self.assertEqual(expected, response2)
+
+    def test_statContext_allTimeCalculator(self):
+        expected = SSLAllTimeCalculator.getAdjustedTeamLuck(self.league)
+        statContext = StatContext()
+
+        response = SSLAllTimeCalculator.getAdjustedTeamLuck(
+            self.league, statContext=statContext
+        )
+
+        self.assertEqual(expected, response)
+        self.assertGreater(statContext.hits, 0)
+
+    def test_statContext_noStatContext_nothingIsKept(self):
+        with mock.patch.object(StatContext, "getResult") as getResult:
+            response = SSLYearCalculator.getTeamLuck(self.year)
+
+        getResult.assert_not_called()
+        self.assertEqual(
+            SSLYearCalculator.getTeamLuck(self.year, statContext=StatContext()),
+            response,
+        )
@@ -0,0 +1,250 @@
+import unittest
+from decimal import Decimal
+
+from leeger.calculator.all_time_calculator import (
+    AWALAllTimeCalculator,
+    GameOutcomeAllTimeCalculator,
+    PlusMinusAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+    ScoringShareAllTimeCalculator,
+    ScoringStandardDeviationAllTimeCalculator,
+    SingleScoreAllTimeCalculator,
+    SmartWinsAllTimeCalculator,
+    SSLAllTimeCalculator,
+    TeamSummaryAllTimeCalculator,
+)
+from leeger.calculator.engine.AllTimeStatSheetEngine import AllTimeStatSheetEngine
+from leeger.enum.MatchupType import MatchupType
+from leeger.enum.NumericMode import NumericMode
+from leeger.model.league import YearSettings
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.Numeric import Numeric
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestAllTimeStatSheetEngine(unittest.TestCase):
+    STAT_NAME_TO_CALCULATOR_METHOD = {
+        "gamesPlayed": TeamSummaryAllTimeCalculator.getGamesPlayed,
+        "totalGames": TeamSummaryAllTimeCalculator.getTotalGames,
+        "wins": GameOutcomeAllTimeCalculator.getWins,
+        "losses": GameOutcomeAllTimeCalculator.getLosses,
+        "ties": GameOutcomeAllTimeCalculator.getTies,
+        "winPercentage": GameOutcomeAllTimeCalculator.getWinPercentage,
+        "wal": GameOutcomeAllTimeCalculator.getWAL,
+        "walPerGame": GameOutcomeAllTimeCalculator.getWALPerGame,
+        "leagueMedianWins": GameOutcomeAllTimeCalculator.getLeagueMedianWins,
+        "opponentLeagueMedianWins": GameOutcomeAllTimeCalculator.getOpponentLeagueMedianWins,
+        "awal": AWALAllTimeCalculator.getAWAL,
+        "awalPerGame": AWALAllTimeCalculator.getAWALPerGame,
+        "opponentAWAL": AWALAllTimeCalculator.getOpponentAWAL,
+        "opponentAWALPerGame": AWALAllTimeCalculator.getOpponentAWALPerGame,
+        "smartWins": SmartWinsAllTimeCalculator.getSmartWins,
+        "smartWinsPerGame": SmartWinsAllTimeCalculator.getSmartWinsPerGame,
+        "opponentSmartWins": SmartWinsAllTimeCalculator.getOpponentSmartWins,
+        "opponentSmartWinsPerGame": SmartWinsAllTimeCalculator.getOpponentSmartWinsPerGame,
+        "pointsScored": PointsScoredAllTimeCalculator.getPointsScored,
+        "pointsScoredPerGame": PointsScoredAllTimeCalculator.getPointsScoredPerGame,
+        "opponentPointsScored": PointsScoredAllTimeCalculator.getOpponentPointsScored,
+        "opponentPointsScoredPerGame": PointsScoredAllTimeCalculator.getOpponentPointsScoredPerGame,
+        "scoringShare": ScoringShareAllTimeCalculator.getScoringShare,
+        "opponentScoringShare": ScoringShareAllTimeCalculator.getOpponentScoringShare,
+        "maxScoringShare": ScoringShareAllTimeCalculator.getMaxScoringShare,
+        "minScoringShare": ScoringShareAllTimeCalculator.getMinScoringShare,
+        "maxScore": SingleScoreAllTimeCalculator.getMaxScore,
+        "minScore": SingleScoreAllTimeCalculator.getMinScore,
+        "scoringStandardDeviation": ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation,
+        "plusMinus": PlusMinusAllTimeCalculator.getPlusMinus,
+        "adjustedTeamScore": SSLAllTimeCalculator.getAdjustedTeamScore,
+        "adjustedTeamSuccess": SSLAllTimeCalculator.getAdjustedTeamSuccess,
+        "adjustedTeamLuck": SSLAllTimeCalculator.getAdjustedTeamLuck,
+    }
+
+    @staticmethod
+    def __getYear(yearNumber: int, teams: list[Team], leagueMedianGames: bool) -> Year:
+        return Year(
+            yearNumber=yearNumber,
+            teams=teams,
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[1].id,
+                            teamAScore=1.5,
+                            teamBScore=2,
+                        ),
+                        Matchup(
+                            teamAId=teams[2].id,
+                            teamBId=teams[3].id,
+                            teamAScore=3,
+                            teamBScore=3,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=2,
+                            teamBScore=2,
+                            teamBHasTiebreaker=True,
+                        ),
+                        Matchup(
+                            teamAId=teams[1].id,
+                            teamBId=teams[3].id,
+                            teamAScore=yearNumber % 7,
+                            teamBScore=2.25,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=4,
+                            teamBScore=5.25,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId=str(yearNumber),
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=4,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=6,
+                            teamBScore=2,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId=str(yearNumber),
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=5,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=7,
+                            teamBScore=7.5,
+                            matchupType=MatchupType.CHAMPIONSHIP,
+                        )
+                    ],
+                ),
+            ],
+        )
+
+    def __getLeague(self) -> League:
+        owners, teams1 = getNDefaultOwnersAndTeams(4)
+        teams2 = [Team(ownerId=owner.id, name=f"{owner.name} 2") for owner in owners]
+        return League(
+            name="TEST",
+            owners=owners,
+            years=[
+                self.__getYear(2000, teams1, leagueMedianGames=False),
+                self.__getYear(2001, teams2, leagueMedianGames=True),
+            ],
+        )
+
+    def __assertSameAsCalculators(self, league: League, **kwargs):
+        engine = AllTimeStatSheetEngine(league, **kwargs)
+        response = engine.calculate(list(self.STAT_NAME_TO_CALCULATOR_METHOD.keys()))
+        for statName, calculatorMethod in self.STAT_NAME_TO_CALCULATOR_METHOD.items():
+            expected = calculatorMethod(league, **kwargs)
+            self.assertEqual(expected, response[statName], statName)
+            self.assertEqual(
+                [type(value) for value in expected.values()],
+                [type(value) for value in response[statName].values()],
+                statName,
+            )
+
+    def __assertCloseToCalculators(self, league: League, **kwargs):
+        engine = AllTimeStatSheetEngine(league, numericMode=NumericMode.FLOAT, **kwargs)
+        response = engine.calculate(list(self.STAT_NAME_TO_CALCULATOR_METHOD.keys()))
+        for statName, calculatorMethod in self.STAT_NAME_TO_CALCULATOR_METHOD.items():
+            expected = calculatorMethod(league, **kwargs)
+            self.assertEqual(expected.keys(), response[statName].keys(), statName)
+            for key, value in expected.items():
+                self.assertTrue(
+                    Numeric.isClose(value, response[statName][key]), statName
+                )
+                # floats are only used inside the engine
+                if isinstance(value, Decimal):
+                    self.assertIsInstance(response[statName][key], Deci, statName)
+                else:
+                    self.assertEqual(
+                        type(value), type(response[statName][key]), statName
+                    )
+
+    def test_calculate_sameAsCalculators(self):
+        league = self.__getLeague()
+
+        self.__assertSameAsCalculators(league)
+        self.__assertSameAsCalculators(league, onlyRegularSeason=True)
+        self.__assertSameAsCalculators(league, onlyPostSeason=True)
+        self.__assertSameAsCalculators(league, onlyChampionship=True)
+        self.__assertSameAsCalculators(
+            league,
+            yearNumberStart=2000,
+            weekNumberStart=3,
+            yearNumberEnd=2001,
+            weekNumberEnd=2,
+        )
+
+    def test_calculate_floatNumericMode_closeToCalculators(self):
+        league = self.__getLeague()
+
+        self.__assertCloseToCalculators(league)
+        self.__assertCloseToCalculators(league, onlyRegularSeason=True)
+        with Numeric.mode("float"):
+            self.assertEqual(
+                NumericMode.FLOAT, AllTimeStatSheetEngine(league).numericMode
+            )
+        self.assertEqual(NumericMode.EXACT, AllTimeStatSheetEngine(league).numericMode)
+
+    def test_getStatNames_leagueMedianStatsOnlyWhenAnyYearHasLeagueMedianGames(self):
+        league = self.__getLeague()
+
+        self.assertEqual(
+            list(AllTimeStatSheetEngine.STAT_SHEET_STATS)
+            + list(AllTimeStatSheetEngine.LEAGUE_MEDIAN_STATS),
+            AllTimeStatSheetEngine(league).getStatNames(),
+        )
+
+        league.years[1].yearSettings.leagueMedianGames = False
+        self.assertEqual(
+            list(AllTimeStatSheetEngine.STAT_SHEET_STATS),
+            AllTimeStatSheetEngine(league).getStatNames(),
+        )
+
+    def test_calculate_ownerWithNoTeamInAYear(self):
+        league = self.__getLeague()
+        newOwner = Owner(name="newOwner")
+        league.owners.append(newOwner)
+        league.years[1].teams[3].ownerId = newOwner.id
+
+        engine = AllTimeStatSheetEngine(league)
+        response = engine.calculate(["gamesPlayed", "wins", "pointsScored"])
+
+        self.assertEqual(
+            TeamSummaryAllTimeCalculator.getGamesPlayed(league), response["gamesPlayed"]
+        )
+        self.assertEqual(GameOutcomeAllTimeCalculator.getWins(league), response["wins"])
+        self.assertEqual(
+            PointsScoredAllTimeCalculator.getPointsScored(league),
+            response["pointsScored"],
+        )
@@ -0,0 +1,77 @@
+import unittest
+
+from leeger.calculator.engine.StatSheetEngine import StatSheetEngine
+
+
+class TestStatSheetEngine(unittest.TestCase):
+    class _TestEngine(StatSheetEngine):
+        DEPENDENCIES = {
+            "a": (),
+            "b": ("a",),
+            "c": ("a", "b"),
+            "d": ("c",),
+        }
+
+        def __init__(self):
+            super().__init__()
+            self.calls = list()
+
+        def _calculateA(self):
+            self.calls.append("a")
+            return 1
+
+        def _calculateB(self):
+            self.calls.append("b")
+            return self.get("a") + 1
+
+        def _calculateC(self):
+            self.calls.append("c")
+            return self.get("a") + self.get("b")
+
+        def _calculateD(self):
+            self.calls.append("d")
+            return self.get("c") * 10
+
+    class _CircularEngine(StatSheetEngine):
+        DEPENDENCIES = {"a": ("b",), "b": ("a",)}
+
+    def test_plan_happyPath(self):
+        engine = self._TestEngine()
+
+        self.assertEqual(["a", "b", "c", "d"], engine.plan(["d"]))
+        self.assertEqual(["a", "b"], engine.plan(["b", "a"]))
+
+    def test_plan_unknownStat_raisesException(self):
+        engine = self._TestEngine()
+
+        with self.assertRaises(ValueError) as context:
+            engine.plan(["e"])
+        self.assertEqual(
+            "'e' is not a stat that can be calculated.", str(context.exception)
+        )
+
+    def test_plan_circularDependency_raisesException(self):
+        engine = self._CircularEngine()
+
+        with self.assertRaises(ValueError) as context:
+            engine.plan(["a"])
+        self.assertEqual(
+            "Circular dependency found for stat 'a'.", str(context.exception)
+        )
+
+    def test_calculate_eachStatIsCalculatedOnce(self):
+        engine = self._TestEngine()
+
+        response = engine.calculate(["d", "c", "b"])
+
+        self.assertEqual({"d": 30, "c": 3, "b": 2}, response)
+        self.assertEqual(["a", "b", "c", "d"], engine.calls)
+
+    def test_get_unknownStat_raisesException(self):
+        engine = self._TestEngine()
+
+        with self.assertRaises(ValueError) as context:
+            engine.get("e")
+        self.assertEqual(
+            "'e' is not a stat that can be calculated.", str(context.exception)
+        )
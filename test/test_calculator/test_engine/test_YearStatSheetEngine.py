@@ -0,0 +1,254 @@
+import unittest
+from decimal import Decimal
+
+from leeger.calculator.engine.YearStatSheetEngine import YearStatSheetEngine
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    GameOutcomeYearCalculator,
+    PlusMinusYearCalculator,
+    PointsScoredYearCalculator,
+    ScoringShareYearCalculator,
+    ScoringStandardDeviationYearCalculator,
+    SingleScoreYearCalculator,
+    SmartWinsYearCalculator,
+    SSLYearCalculator,
+    TeamSummaryYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.enum.NumericMode import NumericMode
+from leeger.exception import InvalidYearFormatException
+from leeger.model.league import YearSettings
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.Numeric import Numeric
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearStatSheetEngine(unittest.TestCase):
+    STAT_NAME_TO_CALCULATOR_METHOD = {
+        "gamesPlayed": TeamSummaryYearCalculator.getGamesPlayed,
+        "totalGames": TeamSummaryYearCalculator.getTotalGames,
+        "wins": GameOutcomeYearCalculator.getWins,
+        "losses": GameOutcomeYearCalculator.getLosses,
+        "ties": GameOutcomeYearCalculator.getTies,
+        "winPercentage": GameOutcomeYearCalculator.getWinPercentage,
+        "wal": GameOutcomeYearCalculator.getWAL,
+        "walPerGame": GameOutcomeYearCalculator.getWALPerGame,
+        "leagueMedianWins": GameOutcomeYearCalculator.getLeagueMedianWins,
+        "opponentLeagueMedianWins": GameOutcomeYearCalculator.getOpponentLeagueMedianWins,
+        "awal": AWALYearCalculator.getAWAL,
+        "awalPerGame": AWALYearCalculator.getAWALPerGame,
+        "opponentAWAL": AWALYearCalculator.getOpponentAWAL,
+        "opponentAWALPerGame": AWALYearCalculator.getOpponentAWALPerGame,
+        "smartWins": SmartWinsYearCalculator.getSmartWins,
+        "smartWinsPerGame": SmartWinsYearCalculator.getSmartWinsPerGame,
+        "opponentSmartWins": SmartWinsYearCalculator.getOpponentSmartWins,
+        "opponentSmartWinsPerGame": SmartWinsYearCalculator.getOpponentSmartWinsPerGame,
+        "pointsScored": PointsScoredYearCalculator.getPointsScored,
+        "pointsScoredPerGame": PointsScoredYearCalculator.getPointsScoredPerGame,
+        "opponentPointsScored": PointsScoredYearCalculator.getOpponentPointsScored,
+        "opponentPointsScoredPerGame": PointsScoredYearCalculator.getOpponentPointsScoredPerGame,
+        "scoringShare": ScoringShareYearCalculator.getScoringShare,
+        "opponentScoringShare": ScoringShareYearCalculator.getOpponentScoringShare,
+        "maxScoringShare": ScoringShareYearCalculator.getMaxScoringShare,
+        "minScoringShare": ScoringShareYearCalculator.getMinScoringShare,
+        "maxScore": SingleScoreYearCalculator.getMaxScore,
+        "minScore": SingleScoreYearCalculator.getMinScore,
+        "scoringStandardDeviation": ScoringStandardDeviationYearCalculator.getScoringStandardDeviation,
+        "plusMinus": PlusMinusYearCalculator.getPlusMinus,
+        "teamScore": SSLYearCalculator.getTeamScore,
+        "teamSuccess": SSLYearCalculator.getTeamSuccess,
+        "teamLuck": SSLYearCalculator.getTeamLuck,
+    }
+
+    @staticmethod
+    def __getYear(teams: list[Team], leagueMedianGames: bool) -> Year:
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[1].id,
+                            teamAScore=1.5,
+                            teamBScore=2,
+                        ),
+                        Matchup(
+                            teamAId=teams[2].id,
+                            teamBId=teams[3].id,
+                            teamAScore=3,
+                            teamBScore=3,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=2,
+                            teamBScore=2,
+                            teamBHasTiebreaker=True,
+                        ),
+                        Matchup(
+                            teamAId=teams[1].id,
+                            teamBId=teams[3].id,
+                            teamAScore=0,
+                            teamBScore=2.25,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=4,
+                            teamBScore=5.25,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=4,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=6,
+                            teamBScore=2,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=5,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[2].id,
+                            teamAScore=7,
+                            teamBScore=7.5,
+                            matchupType=MatchupType.CHAMPIONSHIP,
+                        )
+                    ],
+                ),
+            ],
+        )
+
+    def __assertSameAsCalculators(self, year: Year, **kwargs):
+        engine = YearStatSheetEngine(year, **kwargs)
+        response = engine.calculate(list(self.STAT_NAME_TO_CALCULATOR_METHOD.keys()))
+        for statName, calculatorMethod in self.STAT_NAME_TO_CALCULATOR_METHOD.items():
+            expected = calculatorMethod(year, **kwargs)
+            self.assertEqual(expected, response[statName], statName)
+            # same types so the stat sheet looks the same
+            self.assertEqual(
+                [type(value) for value in expected.values()],
+                [type(value) for value in response[statName].values()],
+                statName,
+            )
+
+    def __assertCloseToCalculators(self, year: Year, **kwargs):
+        engine = YearStatSheetEngine(year, numericMode=NumericMode.FLOAT, **kwargs)
+        response = engine.calculate(list(self.STAT_NAME_TO_CALCULATOR_METHOD.keys()))
+        for statName, calculatorMethod in self.STAT_NAME_TO_CALCULATOR_METHOD.items():
+            expected = calculatorMethod(year, **kwargs)
+            self.assertEqual(expected.keys(), response[statName].keys(), statName)
+            for key, value in expected.items():
+                self.assertTrue(
+                    Numeric.isClose(value, response[statName][key]), statName
+                )
+                # floats are only used inside the engine
+                if isinstance(value, Decimal):
+                    self.assertIsInstance(response[statName][key], Deci, statName)
+                else:
+                    self.assertEqual(
+                        type(value), type(response[statName][key]), statName
+                    )
+
+    def test_calculate_sameAsCalculators(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = self.__getYear(teams, leagueMedianGames=False)
+
+        self.__assertSameAsCalculators(year)
+        self.__assertSameAsCalculators(year, onlyRegularSeason=True)
+        self.__assertSameAsCalculators(year, onlyPostSeason=True)
+        self.__assertSameAsCalculators(year, onlyChampionship=True)
+        self.__assertSameAsCalculators(year, weekNumberStart=2, weekNumberEnd=3)
+
+    def test_calculate_leagueMedianGames_sameAsCalculators(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = self.__getYear(teams, leagueMedianGames=True)
+
+        self.__assertSameAsCalculators(year)
+        self.__assertSameAsCalculators(year, onlyRegularSeason=True)
+        self.__assertSameAsCalculators(year, onlyPostSeason=True)
+        self.__assertSameAsCalculators(year, weekNumberStart=2, weekNumberEnd=4)
+
+    def test_calculate_floatNumericMode_closeToCalculators(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = self.__getYear(teams, leagueMedianGames=True)
+
+        self.__assertCloseToCalculators(year)
+        self.__assertCloseToCalculators(year, weekNumberStart=2, weekNumberEnd=4)
+        with Numeric.mode("float"):
+            self.assertEqual(NumericMode.FLOAT, YearStatSheetEngine(year).numericMode)
+        self.assertEqual(NumericMode.EXACT, YearStatSheetEngine(year).numericMode)
+
+    def test_getStatNames_leagueMedianStatsOnlyWhenLeagueMedianGamesAreOn(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        statNames = YearStatSheetEngine(
+            self.__getYear(teams, leagueMedianGames=False)
+        ).getStatNames()
+        self.assertEqual(list(YearStatSheetEngine.STAT_SHEET_STATS), statNames)
+
+        statNames = YearStatSheetEngine(
+            self.__getYear(teams, leagueMedianGames=True)
+        ).getStatNames()
+        self.assertEqual(
+            list(YearStatSheetEngine.STAT_SHEET_STATS)
+            + list(YearStatSheetEngine.LEAGUE_MEDIAN_STATS),
+            statNames,
+        )
+
+    def test_calculate_multiWeekMatchupsNotIncluded_raisesException(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        engine = YearStatSheetEngine(
+            self.__getYear(teams, leagueMedianGames=False),
+            includeMultiWeekMatchups=False,
+        )
+
+        with self.assertRaises(ValueError) as context:
+            engine.calculate(["gamesPlayed"])
+        self.assertEqual(
+            "Multi-Week matchups must be included in this calculation.",
+            str(context.exception),
+        )
+
+    def test_init_invalidYear_raisesException(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = self.__getYear(teams, leagueMedianGames=False)
+        year.weeks[0].weekNumber = 2
+
+        with self.assertRaises(InvalidYearFormatException):
+            YearStatSheetEngine(year)
+
+    def test_init_numericModeKwarg_noUnusedKwargWarning(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = self.__getYear(teams, leagueMedianGames=False)
+
+        with self.assertNoLogs():
+            YearStatSheetEngine(year, numericMode="float")
@@ -1,12 +1,17 @@
 import unittest
+from unittest.mock import patch
 
 from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
 from leeger.enum.MatchupType import MatchupType
+from leeger.enum.NumericMode import NumericMode
+from leeger.model.filter import YearFilters
 from leeger.model.league import YearSettings
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
+from leeger.util.index import YearIndex
+from leeger.util.Numeric import Numeric
 from test.helper.prototypes import getNDefaultOwnersAndTeams
 
 
@@ -845,6 +850,143 @@ class TestAWALYearCalculator(unittest.TestCase):
         self.assertEqual(Deci("0.9333333333333333333333333334"), response[teams[14].id])
         self.assertEqual(Deci("1"), response[teams[15].id])
 
+    def test_getAWAL_yearIndexGiven(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=3, teamBScore=3
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1, matchup2])
+
+        year = Year(
+            yearNumber=2000,
+            teams=[teams[0], teams[1], teams[2], teams[3]],
+            weeks=[week1],
+        )
+
+        response = AWALYearCalculator.getAWAL(year, yearIndex=YearIndex(year))
+
+        self.assertEqual(AWALYearCalculator.getAWAL(year), response)
+
+    def test_getAWAL_emptyYearIndexGiven_yearIndexIsNotRebuilt(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        # a Year without Matchups is not valid, but its YearIndex is empty and so is falsy
+        week1 = Week(weekNumber=1, matchups=[])
+        year = Year(yearNumber=2000, teams=[teams[0], teams[1]], weeks=[week1])
+        yearIndex = YearIndex(year)
+        self.assertEqual(0, len(yearIndex))
+
+        with patch(
+            "leeger.calculator.year_calculator.AWALYearCalculator.YearIndex"
+        ) as mockYearIndex:
+            mockYearIndex.side_effect = AssertionError("YearIndex was rebuilt")
+            response = AWALYearCalculator.getAWAL(
+                year, yearIndex=yearIndex, validate=False
+            )
+            opponentResponse = AWALYearCalculator.getOpponentAWAL(
+                year, yearIndex=yearIndex, validate=False
+            )
+
+        mockYearIndex.assert_not_called()
+        self.assertEqual({teams[0].id: None, teams[1].id: None}, response)
+        self.assertEqual({teams[0].id: None, teams[1].id: None}, opponentResponse)
+
+    def test_getWeeklyAWAL_happyPath(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=3, teamBScore=3
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1, matchup2])
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=5, teamBScore=4
+        )
+        week2 = Week(weekNumber=2, matchups=[matchup1])
+
+        year = Year(
+            yearNumber=2000,
+            teams=[teams[0], teams[1], teams[2], teams[3]],
+            weeks=[week1, week2],
+        )
+        yearIndex = YearIndex(year)
+
+        response = AWALYearCalculator.getWeeklyAWAL(
+            yearIndex, YearFilters.getForYear(year)
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci("1"), response[teams[0].id])
+        self.assertEqual(Deci("0.3333333333333333333333333333"), response[teams[1].id])
+        self.assertEqual(Deci("0.8333333333333333333333333333"), response[teams[2].id])
+        self.assertEqual(Deci("0.8333333333333333333333333333"), response[teams[3].id])
+
+        response = AWALYearCalculator.getWeeklyAWAL(
+            yearIndex, YearFilters.getForYear(year, weekNumberStart=2)
+        )
+
+        # teams that did not play in the filtered weeks are not included
+        self.assertEqual({teams[0].id: Deci("1"), teams[1].id: Deci("0")}, response)
+
+        response = AWALYearCalculator.getWeeklyAWAL(
+            yearIndex, YearFilters.getForYear(year), opponentScores=True
+        )
+
+        self.assertEqual(Deci("0.3333333333333333333333333333"), response[teams[0].id])
+        self.assertEqual(Deci("1"), response[teams[1].id])
+        self.assertEqual(Deci("0.8333333333333333333333333333"), response[teams[2].id])
+        self.assertEqual(Deci("0.8333333333333333333333333333"), response[teams[3].id])
+
+    def test_getWeeklyAWAL_floatNumericMode(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=3, teamBScore=3
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1, matchup2])
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=5, teamBScore=4
+        )
+        week2 = Week(weekNumber=2, matchups=[matchup1])
+
+        year = Year(
+            yearNumber=2000,
+            teams=[teams[0], teams[1], teams[2], teams[3]],
+            weeks=[week1, week2],
+        )
+        yearIndex = YearIndex(year)
+
+        for opponentScores in (False, True):
+            for yearFilters in (
+                YearFilters.getForYear(year),
+                YearFilters.getForYear(year, weekNumberStart=2),
+            ):
+                expected = AWALYearCalculator.getWeeklyAWAL(
+                    yearIndex, yearFilters, opponentScores=opponentScores
+                )
+                response = AWALYearCalculator.getWeeklyAWAL(
+                    yearIndex,
+                    yearFilters,
+                    opponentScores=opponentScores,
+                    numericMode=NumericMode.FLOAT,
+                )
+
+                self.assertEqual(expected.keys(), response.keys())
+                for teamId, awal in response.items():
+                    self.assertIsInstance(awal, float)
+                    self.assertTrue(Numeric.isClose(expected[teamId], awal))
+
     def test_getAWALPerGame_happyPath(self):
         owners, teams = getNDefaultOwnersAndTeams(6)
 
@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 
 from leeger.calculator.year_calculator.SmartWinsYearCalculator import (
     SmartWinsYearCalculator,
@@ -2279,3 +2280,24 @@ class TestSmartWinsYearCalculator(unittest.TestCase):
         self.assertEqual(Deci("0.3333333333333333333333333333"), response[teams[3].id])
         self.assertEqual(Deci("0.9333333333333333333333333335"), response[teams[4].id])
         self.assertEqual(Deci("0.6333333333333333333333333335"), response[teams[5].id])
+
+    def test_getSmartWins_numericModeKwarg_warnsUnused(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+
+        with self.assertLogs() as captured:
+            response = SmartWinsYearCalculator.getSmartWins(year, numericMode="float")
+
+        # only stat sheets use the numeric mode
+        self.assertIn(
+            "Keyword argument 'numericMode' unused.",
+            [record.getMessage() for record in captured.records],
+        )
+        self.assertIsInstance(response[teams[0].id], Decimal)
@@ -1381,3 +1381,68 @@ class TestESPNLeagueLoader(unittest.TestCase):
         league = loader.loadLeague()
 
         self.assertEqual("custom name", league.name)
+
+    @patch("espn_api.football.League")
+    def test_load_league_withMaxWorkers(self, mockLeague):
+        def getMockEspnLeague(*, league_id, year, espn_s2, swid):
+            mockEspnLeague = Mock()
+            mockEspnLeague.year = year
+            mockEspnLeague.current_week = 1
+            mockEspnLeague.settings.name = f"Test League {year}"
+            mockEspnLeague.settings.reg_season_count = 1
+            mockEspnLeague.settings.playoff_team_count = 2
+            mockEspnLeague.settings.division_map = {0: f"d1_{year}"}
+            mockTeam1 = Mock(
+                team_id=1,
+                owners=self.__getMockOwnersList("Owner", "1"),
+                team_name="Team 1",
+                outcomes=["W"],
+                scores=[year - 1900],
+                standing=1,
+                division_id=0,
+            )
+            mockTeam2 = Mock(
+                team_id=2,
+                owners=self.__getMockOwnersList("Owner", "2"),
+                team_name="Team 2",
+                outcomes=["L"],
+                scores=[90],
+                standing=2,
+                division_id=0,
+            )
+            mockTeam1.schedule = [mockTeam2]
+            mockTeam2.schedule = [mockTeam1]
+            mockEspnLeague.teams = [mockTeam1, mockTeam2]
+            return mockEspnLeague
+
+        mockLeague.side_effect = getMockEspnLeague
+
+        years = list(range(2015, 2024))
+        league = ESPNLeagueLoader("123", years, maxWorkers=4).loadLeague()
+
+        self.assertEqual(len(years), mockLeague.call_count)
+        # seasons are built in order, whatever order they were fetched in
+        self.assertEqual(years, [year.yearNumber for year in league.years])
+        self.assertEqual(
+            [year - 1900 for year in years],
+            [year.weeks[0].matchups[0].teamAScore for year in league.years],
+        )
+        self.assertEqual("Test League 2023", league.name)
+
+    @patch("espn_api.football.League")
+    def test_getESPNLeague_cookiesOnlyRemovedWhenResponsesAreKept(self, mockLeague):
+        cookies = {"espn_s2": "s2", "SWID": "swid"}
+        mockLeague.side_effect = lambda **kwargs: Mock(
+            espn_request=Mock(cookies=cookies)
+        )
+
+        espnLeague = ESPNLeagueLoader(
+            "123", [2022], espnS2="s2", swid="swid"
+        )._ESPNLeagueLoader__getESPNLeague(2022)
+        self.assertEqual(cookies, espnLeague.espn_request.cookies)
+
+        # kept responses are written to disk, so they should not have the login cookies
+        espnLeague = ESPNLeagueLoader(
+            "123", [2022], espnS2="s2", swid="swid", responseCache=Mock()
+        )._ESPNLeagueLoader__getESPNLeague(2022)
+        self.assertIsNone(espnLeague.espn_request.cookies)
@@ -1,7 +1,9 @@
+import tempfile
 import unittest
 from unittest import mock
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.league_loader.cache import DirectoryResponseCache
 from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
@@ -1463,3 +1465,210 @@ class TestFleaflickerLeagueLoader(unittest.TestCase):
         league = leagueLoader.loadLeague()
 
         self.assertEqual("custom name", league.name)
+
+    @mock.patch(
+        "fleaflicker.api.LeagueInfoAPIClient.LeagueInfoAPIClient.get_league_standings"
+    )
+    @mock.patch(
+        "fleaflicker.api.ScoringAPIClient.ScoringAPIClient.get_league_scoreboard"
+    )
+    def test_loadLeague_withMaxWorkers(
+        self, mockGetLeagueScoreboard, mockGetLeaguestandings
+    ):
+        mockTeams = [
+            {"owners": [{"displayName": f"Owner {i}"}], "id": i, "name": f"Team {i}"}
+            for i in range(1, 5)
+        ]
+        mockLeagueStandings2022 = {
+            "divisions": [{"id": 1, "name": "d1_2022", "teams": mockTeams}],
+            "league": {"name": "Test League 2022", "id": 123},
+            "season": 2022,
+        }
+        # scoring period -> (away team score, home team score) for each game
+        scoringPeriodToScores = {
+            1: [(100, 90), (80, 70)],
+            2: [(60, 65), (75, 85)],
+            3: [(110, 105), (95, 96)],
+            4: [(50, 40), (30, 20)],
+        }
+        scoringPeriodToScoreboard = {
+            scoringPeriod: {
+                "games": [
+                    {
+                        "away": mockTeams[gameNumber * 2],
+                        "home": mockTeams[gameNumber * 2 + 1],
+                        "awayScore": {"score": {"value": awayScore}},
+                        "homeScore": {"score": {"value": homeScore}},
+                        "isFinalScore": True,
+                    }
+                    for gameNumber, (awayScore, homeScore) in enumerate(scores)
+                ]
+            }
+            for scoringPeriod, scores in scoringPeriodToScores.items()
+        }
+
+        def getLeagueScoreboard(*, sport, league_id, season, scoring_period=None):
+            if scoring_period is None:
+                return {
+                    "eligibleSchedulePeriods": list(scoringPeriodToScoreboard.values())
+                }
+            return scoringPeriodToScoreboard[scoring_period]
+
+        mockGetLeaguestandings.return_value = mockLeagueStandings2022
+        # requests may be made in any order when many are made at once
+        mockGetLeagueScoreboard.side_effect = getLeagueScoreboard
+
+        leagueLoader = FleaflickerLeagueLoader(
+            "123", [2022], maxWorkers=4, maxRequestsPerSecond=1000
+        )
+        league = leagueLoader.loadLeague()
+
+        self.assertEqual(5, mockGetLeagueScoreboard.call_count)
+        year = league.years[0]
+        teamIdToTeamName = {team.id: team.name for team in year.teams}
+        self.assertEqual([1, 2, 3, 4], [week.weekNumber for week in year.weeks])
+        for week in year.weeks:
+            self.assertEqual(
+                scoringPeriodToScores[week.weekNumber],
+                [(matchup.teamAScore, matchup.teamBScore) for matchup in week.matchups],
+            )
+            self.assertEqual(
+                ["Team 1", "Team 2", "Team 3", "Team 4"],
+                [
+                    teamIdToTeamName[teamId]
+                    for matchup in week.matchups
+                    for teamId in (matchup.teamAId, matchup.teamBId)
+                ],
+            )
+
+    @mock.patch(
+        "fleaflicker.api.LeagueInfoAPIClient.LeagueInfoAPIClient.get_league_standings"
+    )
+    @mock.patch(
+        "fleaflicker.api.ScoringAPIClient.ScoringAPIClient.get_league_scoreboard"
+    )
+    def test_loadLeague_withResponseCache(
+        self, mockGetLeagueScoreboard, mockGetLeaguestandings
+    ):
+        mockTeams = [
+            {"owners": [{"displayName": f"Owner {i}"}], "id": i, "name": f"Team {i}"}
+            for i in range(1, 3)
+        ]
+        mockGetLeaguestandings.side_effect = lambda *, sport, league_id, season: {
+            "divisions": [{"id": 1, "name": "d1", "teams": mockTeams}],
+            "league": {"name": f"Test League {season}", "id": 123},
+            "season": season,
+        }
+        mockGame = {
+            "away": mockTeams[0],
+            "home": mockTeams[1],
+            "awayScore": {"score": {"value": 100}},
+            "homeScore": {"score": {"value": 90}},
+            "isFinalScore": True,
+        }
+        mockGetLeagueScoreboard.side_effect = (
+            lambda *, sport, league_id, season, scoring_period=None: (
+                {"eligibleSchedulePeriods": [{}]}
+                if scoring_period is None
+                else {"games": [mockGame]}
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            responseCache = DirectoryResponseCache(directory)
+            # 2022 is completed, so it is kept forever
+            league1 = FleaflickerLeagueLoader(
+                "123", [2022], responseCache=responseCache
+            ).loadLeague()
+            leagueLoader2 = FleaflickerLeagueLoader(
+                "123", [2022], responseCache=responseCache
+            )
+            league2 = leagueLoader2.loadLeague()
+
+        self.assertEqual(1, mockGetLeaguestandings.call_count)
+        self.assertEqual(2, mockGetLeagueScoreboard.call_count)
+        self.assertEqual(
+            {"hits": 3, "misses": 3, "writes": 3}, responseCache.getStats()
+        )
+        self.assertTrue(league1.equals(league2, ignoreBaseIds=True, ignoreIds=True))
+        # the second load got every response from the responseCache
+        loadReport = leagueLoader2.getLoadReport()
+        self.assertEqual(0, loadReport.requestCount)
+        self.assertEqual(3, loadReport.cacheHitCount)
+        self.assertEqual(
+            [None, None, 1],
+            [requestRecord.week for requestRecord in loadReport.requests],
+        )
+        self.assertEqual(
+            [
+                "fetchLeagues",
+                "buildOwners",
+                "buildTeams",
+                "fetchScoreboards",
+                "buildWeeks",
+                "validateLeague",
+            ],
+            list(loadReport.phaseTimings.keys()),
+        )
+
+    @mock.patch(
+        "fleaflicker.api.LeagueInfoAPIClient.LeagueInfoAPIClient.get_league_standings"
+    )
+    @mock.patch(
+        "fleaflicker.api.ScoringAPIClient.ScoringAPIClient.get_league_scoreboard"
+    )
+    def test_refreshLeague(self, mockGetLeagueScoreboard, mockGetLeaguestandings):
+        mockTeams = [
+            {"owners": [{"displayName": f"Owner {i}"}], "id": i, "name": f"Team {i}"}
+            for i in range(1, 3)
+        ]
+        mockGetLeaguestandings.side_effect = lambda *, sport, league_id, season: {
+            "divisions": [{"id": 1, "name": "d1", "teams": mockTeams}],
+            "league": {"name": "Test League", "id": 123},
+            "season": season,
+        }
+        finalScoringPeriods = [1]
+        mockGetLeagueScoreboard.side_effect = (
+            lambda *, sport, league_id, season, scoring_period=None: (
+                {"eligibleSchedulePeriods": [{}, {}]}
+                if scoring_period is None
+                else {
+                    "games": [
+                        {
+                            "away": mockTeams[0],
+                            "home": mockTeams[1],
+                            "awayScore": {"score": {"value": 100 + scoring_period}},
+                            "homeScore": {"score": {"value": 90}},
+                            "isFinalScore": scoring_period in finalScoringPeriods,
+                        }
+                    ]
+                }
+            )
+        )
+
+        league = FleaflickerLeagueLoader("123", [2022]).loadLeague()
+        teamIds = [team.id for team in league.years[0].teams]
+        self.assertEqual(1, len(league.years[0].weeks))
+
+        finalScoringPeriods.append(2)
+        mockGetLeagueScoreboard.reset_mock()
+        FleaflickerLeagueLoader("123", [2022]).refreshLeague(league)
+
+        # scoring period 1 is the last one in the League, so it is fetched again in case it changed
+        self.assertEqual(
+            [None, 1, 2],
+            [
+                call.kwargs.get("scoring_period")
+                for call in mockGetLeagueScoreboard.call_args_list
+            ],
+        )
+        self.assertEqual([1, 2], [week.weekNumber for week in league.years[0].weeks])
+        self.assertEqual(teamIds, [team.id for team in league.years[0].teams])
+        self.assertEqual(
+            teamIds,
+            [
+                league.years[0].weeks[1].matchups[0].teamAId,
+                league.years[0].weeks[1].matchups[0].teamBId,
+            ],
+        )
+        self.assertEqual(102, league.years[0].weeks[1].matchups[0].teamAScore)
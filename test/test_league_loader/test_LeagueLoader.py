@@ -1,12 +1,17 @@
 import unittest
+from unittest import mock
+from unittest.mock import Mock
 
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
 from leeger.league_loader.LeagueLoader import LeagueLoader
 from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
+from leeger.validate import leagueValidation
 
 
 class TestLeagueLoader(unittest.TestCase):
@@ -37,6 +42,57 @@ class TestLeagueLoader(unittest.TestCase):
         # test for no error
         LeagueLoader("0", [1])
 
+    def test_maxWorkersInvalid(self):
+        with self.assertRaises(ValueError) as context:
+            LeagueLoader("0", [1], maxWorkers=0)
+        self.assertEqual(
+            "'maxWorkers' must be an int that is at least 1.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            LeagueLoader("0", [1], maxWorkers=1.5)
+        self.assertEqual(
+            "'maxWorkers' must be an int that is at least 1.", str(context.exception)
+        )
+
+    def test__fetchAll(self):
+        fetches = [lambda i=i: i * 2 for i in range(20)]
+
+        # one at a time
+        leagueLoader = LeagueLoader("0", [1])
+        self.assertEqual([i * 2 for i in range(20)], leagueLoader._fetchAll(fetches))
+
+        # many at once, returned in the order given
+        leagueLoader = LeagueLoader("0", [1], maxWorkers=4)
+        self.assertEqual([i * 2 for i in range(20)], leagueLoader._fetchAll(fetches))
+        self.assertEqual(list(), leagueLoader._fetchAll(list()))
+
+    def test__fetchAll_fetchRaisesException(self):
+        def raiseException():
+            raise LeagueLoaderException("bad fetch")
+
+        leagueLoader = LeagueLoader("0", [1], maxWorkers=4)
+        with self.assertRaises(LeagueLoaderException) as context:
+            leagueLoader._fetchAll([lambda: 1, raiseException, lambda: 3])
+        self.assertEqual("bad fetch", str(context.exception))
+
+    def test_getPhaseTimings(self):
+        leagueLoader = LeagueLoader("0", [1])
+        self.assertEqual(dict(), leagueLoader.getPhaseTimings())
+
+        with leagueLoader._timePhase("a"):
+            pass
+        with self.assertRaises(LeagueLoaderException):
+            with leagueLoader._timePhase("b"):
+                raise LeagueLoaderException()
+
+        phaseTimings = leagueLoader.getPhaseTimings()
+        self.assertEqual(["a", "b"], list(phaseTimings.keys()))
+        self.assertTrue(all(seconds >= 0 for seconds in phaseTimings.values()))
+        # changing the returned timings does not change the saved timings
+        phaseTimings.clear()
+        self.assertEqual(2, len(leagueLoader.getPhaseTimings()))
+
     def test__getGeneralOwnerNameFromGivenOwnerName(self):
         leagueLoader = LeagueLoader(
             "leagueId",
@@ -200,3 +256,278 @@ class TestLeagueLoader(unittest.TestCase):
             "Some owner names were given but not assigned to the loaded League: ['o3', 'o4']",
             str(captured.records[0].getMessage()),
         )
+
+    def test_refreshLeague(self):
+        class FakeLeagueLoader(LeagueLoader):
+            """
+            Loads a League where 2 Teams play each other every week, with the given number of weeks in each year.
+            """
+
+            def __init__(self, years: list[int], yearToNumberOfWeeks: dict[int, int]):
+                super().__init__("0", years)
+                self.yearToNumberOfWeeks = yearToNumberOfWeeks
+                self.loadedYearAndWeekNumbers = list()
+
+            def loadLeague(self, validate: bool = True) -> League:
+                owners = [Owner(name="o1"), Owner(name="o2")]
+                years = list()
+                for yearNumber in self._years:
+                    teams = [
+                        Team(ownerId=owner.id, name=owner.name) for owner in owners
+                    ]
+                    weeks = list()
+                    for weekNumber in range(
+                        1, self.yearToNumberOfWeeks[yearNumber] + 1
+                    ):
+                        if not self._isWeekToLoad(yearNumber, weekNumber):
+                            continue
+                        self.loadedYearAndWeekNumbers.append((yearNumber, weekNumber))
+                        weeks.append(
+                            Week(
+                                weekNumber=weekNumber,
+                                matchups=[
+                                    Matchup(
+                                        teamAId=teams[0].id,
+                                        teamBId=teams[1].id,
+                                        teamAScore=weekNumber,
+                                        teamBScore=0,
+                                    )
+                                ],
+                            )
+                        )
+                    years.append(Year(yearNumber=yearNumber, teams=teams, weeks=weeks))
+                return League(
+                    name="league", owners=owners, years=self._getValidYears(years)
+                )
+
+        league = FakeLeagueLoader([2021, 2022], {2021: 2, 2022: 1}).loadLeague()
+        ownerIds = [owner.id for owner in league.owners]
+        year2022 = league.years[1]
+        teamIds = [team.id for team in year2022.teams]
+        week1 = year2022.weeks[0]
+
+        leagueLoader = FakeLeagueLoader([2021, 2022, 2023], {2021: 2, 2022: 3, 2023: 1})
+        refreshedLeague = leagueLoader.refreshLeague(league)
+
+        self.assertIs(league, refreshedLeague)
+        # only the most recent year and new years are loaded, and only the last week and new weeks
+        self.assertEqual(
+            [(2022, 1), (2022, 2), (2022, 3), (2023, 1)],
+            leagueLoader.loadedYearAndWeekNumbers,
+        )
+        self.assertEqual(ownerIds, [owner.id for owner in league.owners])
+        self.assertEqual([2021, 2022, 2023], [year.yearNumber for year in league.years])
+        self.assertIs(year2022, league.years[1])
+        self.assertEqual(teamIds, [team.id for team in year2022.teams])
+        self.assertEqual([1, 2, 3], [week.weekNumber for week in year2022.weeks])
+        self.assertIs(week1, year2022.weeks[0])
+        for week in year2022.weeks:
+            self.assertEqual(teamIds[0], week.matchups[0].teamAId)
+            self.assertEqual(teamIds[1], week.matchups[0].teamBId)
+        self.assertEqual(ownerIds, [team.ownerId for team in league.years[2].teams])
+        leagueValidation.runAllChecks(league)
+
+        # nothing new, so the last week is fetched again and replaced without changing the League
+        leagueLoader.loadedYearAndWeekNumbers.clear()
+        fingerprint = league.fingerprint
+        leagueLoader.refreshLeague(league)
+        self.assertEqual([(2023, 1)], leagueLoader.loadedYearAndWeekNumbers)
+        self.assertEqual(fingerprint, league.fingerprint)
+
+        # a Team that isn't in the League can't be matched, and the League is not changed
+        leagueLoader = FakeLeagueLoader([2023], {2023: 2})
+        league.years[2].teams[1].ownerId = league.owners[0].id
+        with self.assertRaises(LeagueLoaderException) as context:
+            leagueLoader.refreshLeague(league, validate=False)
+        self.assertEqual(
+            "Team 'o2' does not match any Team in year 2023 of the given League. Load the League again instead.",
+            str(context.exception),
+        )
+        self.assertEqual(1, len(league.years[2].weeks))
+
+    def test_refreshLeague_lastWeekWasPartlyPlayed(self):
+        class FakeLeagueLoader(LeagueLoader):
+            """
+            Loads one year of a League with 4 Teams, where each week has the given scores for each Matchup that has been played.
+            """
+
+            def __init__(self, weekNumberToScores: dict[int, list[tuple[int, int]]]):
+                super().__init__("0", [2022])
+                self.weekNumberToScores = weekNumberToScores
+
+            def loadLeague(self, validate: bool = True) -> League:
+                owners = [Owner(name=f"o{i}") for i in range(1, 5)]
+                teams = [Team(ownerId=owner.id, name=owner.name) for owner in owners]
+                weeks = [
+                    Week(
+                        weekNumber=weekNumber,
+                        matchups=[
+                            Matchup(
+                                teamAId=teams[i * 2].id,
+                                teamBId=teams[i * 2 + 1].id,
+                                teamAScore=teamAScore,
+                                teamBScore=teamBScore,
+                            )
+                            for i, (teamAScore, teamBScore) in enumerate(scores)
+                        ],
+                    )
+                    for weekNumber, scores in self.weekNumberToScores.items()
+                    if self._isWeekToLoad(2022, weekNumber)
+                ]
+                return League(
+                    name="league",
+                    owners=owners,
+                    years=[Year(yearNumber=2022, teams=teams, weeks=weeks)],
+                )
+
+        # week 2 was loaded while only its first Matchup had started
+        league = FakeLeagueLoader({1: [(1, 2), (3, 4)], 2: [(5, 0)]}).loadLeague()
+        year = league.years[0]
+        week2 = year.weeks[1]
+        matchupId = week2.matchups[0].id
+        fingerprint = league.fingerprint
+
+        FakeLeagueLoader(
+            {1: [(1, 2), (3, 4)], 2: [(50, 60), (7, 8)], 3: [(9, 10)]}
+        ).refreshLeague(league)
+
+        # the last week's final scores and its new Matchup are picked up
+        self.assertEqual([1, 2, 3], [week.weekNumber for week in year.weeks])
+        self.assertIs(week2, year.weeks[1])
+        self.assertEqual(
+            [(50, 60), (7, 8)],
+            [(matchup.teamAScore, matchup.teamBScore) for matchup in week2.matchups],
+        )
+        self.assertEqual(matchupId, week2.matchups[0].id)
+        teamIds = [team.id for team in year.teams]
+        self.assertEqual(
+            [(teamIds[0], teamIds[1]), (teamIds[2], teamIds[3])],
+            [(matchup.teamAId, matchup.teamBId) for matchup in week2.matchups],
+        )
+        self.assertNotEqual(fingerprint, league.fingerprint)
+        leagueValidation.runAllChecks(league)
+
+    def test_getRequestCounts(self):
+        responseCache = Mock()
+        responseCache.get.side_effect = [(False, None), (True, "kept")]
+        leagueLoader = LeagueLoader("0", [1], responseCache=responseCache)
+        self.assertEqual(dict(), leagueLoader.getRequestCounts())
+
+        leagueLoader._fetchAll(
+            [
+                leagueLoader._cachedFetch(
+                    lambda: "a", endpoint="scoreboard?week=1", season=1
+                ),
+                leagueLoader._cachedFetch(
+                    lambda: "b", endpoint="scoreboard?week=2", season=1
+                ),
+            ]
+        )
+
+        # responses found in the responseCache are not requests
+        self.assertEqual({"scoreboard": 1}, leagueLoader.getRequestCounts())
+
+    def test_getLoadReport(self):
+        responseCache = Mock()
+        responseCache.get.side_effect = [(False, None), (True, {"kept": 1})]
+        requestRecords = list()
+        leagueLoader = LeagueLoader(
+            "0",
+            [1],
+            responseCache=responseCache,
+            onRequest=requestRecords.append,
+            recordResponseSizes=True,
+        )
+
+        leagueLoader._startLoad()
+        with leagueLoader._timePhase("fetchScoreboards"):
+            leagueLoader._cachedFetch(
+                lambda: {"week": 1}, endpoint="scoreboard?week=1", season=1, week=1
+            )()
+        with leagueLoader._timePhase("fetchScoreboards"):
+            leagueLoader._cachedFetch(
+                lambda: {"week": 2}, endpoint="scoreboard?week=2", season=1, week=2
+            )()
+        loadReport = leagueLoader.getLoadReport()
+
+        self.assertEqual("0", loadReport.leagueId)
+        self.assertEqual(requestRecords, loadReport.requests)
+        self.assertEqual(
+            ["scoreboard?week=1", "scoreboard?week=2"],
+            [requestRecord.endpoint for requestRecord in loadReport.requests],
+        )
+        self.assertEqual(
+            [1, 2], [requestRecord.week for requestRecord in loadReport.requests]
+        )
+        self.assertEqual(
+            [False, True],
+            [requestRecord.cacheHit for requestRecord in loadReport.requests],
+        )
+        self.assertEqual(1, loadReport.requestCount)
+        self.assertEqual(1, loadReport.cacheHitCount)
+        # phases run more than once are added together
+        self.assertEqual(["fetchScoreboards"], list(loadReport.phaseTimings.keys()))
+        endpointSummary = loadReport.getEndpointSummaries()["scoreboard"]
+        self.assertEqual(1, endpointSummary["requests"])
+        self.assertEqual(1, endpointSummary["cacheHits"])
+        self.assertEqual(
+            len('{"week": 1}') + len('{"kept": 1}'), endpointSummary["bytes"]
+        )
+
+        # a new load starts a new report
+        leagueLoader._startLoad()
+        self.assertEqual(list(), leagueLoader.getLoadReport().requests)
+        self.assertEqual(dict(), leagueLoader.getLoadReport().phaseTimings)
+
+    def test_sharesHostRateLimiter(self):
+        class FakeLeagueLoader(LeagueLoader):
+            _HOST = "fake.example.com"
+
+            def __init__(self, maxRequestsPerSecond: float):
+                super().__init__("0", [1], maxRequestsPerSecond=maxRequestsPerSecond)
+                self.rateLimiters = list()
+
+            @LeagueLoader._sharesHostRateLimiter
+            def loadLeague(self, validate: bool = True) -> League:
+                self.rateLimiters.append(self._rateLimiter)
+                if hasattr(self, "otherLeagueLoader"):
+                    self.otherLeagueLoader.loadLeague()
+
+        slowLeagueLoader = FakeLeagueLoader(1)
+        fastLeagueLoader = FakeLeagueLoader(100)
+
+        # League Loaders loading from the same host at the same time share the lowest rate
+        slowLeagueLoader.otherLeagueLoader = fastLeagueLoader
+        slowLeagueLoader.loadLeague()
+        self.assertIs(
+            slowLeagueLoader.rateLimiters[0], fastLeagueLoader.rateLimiters[0]
+        )
+        self.assertEqual(1, fastLeagueLoader.rateLimiters[0].maxRequestsPerSecond)
+        self.assertIsNone(slowLeagueLoader._rateLimiter)
+
+        # once a League is loaded, its rate no longer limits other League Loaders
+        fastLeagueLoader.loadLeague()
+        self.assertEqual(100, fastLeagueLoader.rateLimiters[1].maxRequestsPerSecond)
+
+        with self.assertRaises(ValueError) as context:
+            FakeLeagueLoader(0)
+        self.assertEqual(
+            "'maxRequestsPerSecond' must be a number greater than 0.",
+            str(context.exception),
+        )
+
+    def test_getLoadReport_responseSizesNotRecordedByDefault(self):
+        leagueLoader = LeagueLoader("0", [1])
+
+        with mock.patch("json.dumps") as mockDumps:
+            leagueLoader._cachedFetch(
+                lambda: {"week": 1}, endpoint="scoreboard", season=1
+            )()
+
+        # responses are not written as JSON just to size them
+        mockDumps.assert_not_called()
+        self.assertIsNone(leagueLoader.getLoadReport().requests[0].bytes)
+        self.assertEqual(
+            0,
+            leagueLoader.getLoadReport().getEndpointSummaries()["scoreboard"]["bytes"],
+        )
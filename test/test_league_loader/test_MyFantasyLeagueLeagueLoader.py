@@ -2742,3 +2742,133 @@ class TestMyFantasyLeagueLeagueLoader(unittest.TestCase):
         league = leagueLoader.loadLeague()
 
         self.assertEqual("custom name", league.name)
+
+    @mock.patch("pymfl.api.config.APIConfig.add_config_for_year_and_league_id")
+    @mock.patch("pymfl.api.CommonLeagueInfoAPIClient.get_league")
+    @mock.patch("pymfl.api.CommonLeagueInfoAPIClient.get_schedule")
+    @mock.patch("pymfl.api.CommonLeagueInfoAPIClient.get_playoff_bracket")
+    def test_loadLeague_withMaxWorkers(
+        self, mockGetPlayoffBracket, mockGetSchedule, mockGetLeague, mockAddConfig
+    ):
+        years = [2020, 2021, 2022, 2023]
+
+        def getMockFranchise(year: int, franchiseId: int) -> dict:
+            return {
+                "owner_name": f"Owner {franchiseId}",
+                "name": f"Team {franchiseId} ({year})",
+                "id": franchiseId,
+                "division": "1",
+            }
+
+        def getLeague(*, year, league_id):
+            return {
+                "league": {
+                    "id": year,
+                    "name": f"Test League {year}",
+                    "lastRegularSeasonWeek": "1",
+                    "franchises": {
+                        "franchise": [
+                            getMockFranchise(year, franchiseId)
+                            for franchiseId in range(1, 5)
+                        ]
+                    },
+                    "divisions": {"division": [{"id": "1", "name": f"d1_{year}"}]},
+                }
+            }
+
+        def getMatchup(year: int, aId: int, bId: int, aScore: int) -> dict:
+            return {
+                "franchise": [
+                    self.__addScoreToMockFranchise(
+                        mockFranchise=getMockFranchise(year, aId),
+                        score=aScore,
+                        result="W",
+                    ),
+                    self.__addScoreToMockFranchise(
+                        mockFranchise=getMockFranchise(year, bId),
+                        score=aScore - 10,
+                        result="L",
+                    ),
+                ]
+            }
+
+        def getSchedule(*, year, league_id):
+            # each year has different scores, so a schedule built into the wrong year is caught
+            return {
+                "schedule": {
+                    "weeklySchedule": [
+                        {
+                            "week": "1",
+                            "matchup": [
+                                getMatchup(year, 1, 2, year),
+                                getMatchup(year, 3, 4, year + 1),
+                            ],
+                        },
+                        {"week": "2", "matchup": getMatchup(year, 1, 3, year + 2)},
+                    ]
+                }
+            }
+
+        def getPlayoffBracket(*, year, league_id, bracket_id):
+            return {
+                "playoffBracket": {
+                    "playoffRound": {
+                        "week": 2,
+                        "playoffGame": {
+                            "away": {"franchise_id": 1},
+                            "home": {"franchise_id": 3},
+                        },
+                    }
+                }
+            }
+
+        # requests may be made in any order when many are made at once
+        mockGetLeague.side_effect = getLeague
+        mockGetSchedule.side_effect = getSchedule
+        mockGetPlayoffBracket.side_effect = getPlayoffBracket
+
+        leagueLoader = MyFantasyLeagueLeagueLoader(
+            "789",
+            years,
+            mflUsername="mflu",
+            mflPassword="mflp",
+            mflUserAgentName="mfluan",
+            maxWorkers=4,
+        )
+        league = leagueLoader.loadLeague()
+
+        self.assertEqual(4, mockAddConfig.call_count)
+        self.assertEqual(4, mockGetSchedule.call_count)
+        self.assertEqual(4, mockGetPlayoffBracket.call_count)
+        self.assertEqual(years, [year.yearNumber for year in league.years])
+        for year in league.years:
+            self.assertEqual(
+                [
+                    [
+                        (year.yearNumber, year.yearNumber - 10),
+                        (year.yearNumber + 1, year.yearNumber - 9),
+                    ],
+                    [(year.yearNumber + 2, year.yearNumber - 8)],
+                ],
+                [
+                    [
+                        (matchup.teamAScore, matchup.teamBScore)
+                        for matchup in week.matchups
+                    ]
+                    for week in year.weeks
+                ],
+            )
+            self.assertEqual(
+                MatchupType.CHAMPIONSHIP, year.weeks[1].matchups[0].matchupType
+            )
+        self.assertEqual(
+            [
+                "fetchLeagues",
+                "fetchSchedulesAndPlayoffBrackets",
+                "buildOwners",
+                "buildTeams",
+                "buildWeeks",
+                "validateLeague",
+            ],
+            list(leagueLoader.getPhaseTimings().keys()),
+        )
@@ -3161,3 +3161,140 @@ class TestSleeperLeagueLoader(unittest.TestCase):
             for week in year.weeks:
                 for matchup in week.matchups:
                     self.assertIsNone(matchup.multiWeekMatchupId)
+
+    @patch("sleeper.api.LeagueAPIClient.get_league")
+    @patch("sleeper.api.LeagueAPIClient.get_users_in_league")
+    @patch("sleeper.api.LeagueAPIClient.get_rosters")
+    @patch("sleeper.api.LeagueAPIClient.get_matchups_for_week")
+    @patch("sleeper.api.LeagueAPIClient.get_sport_state")
+    @patch("sleeper.api.LeagueAPIClient.get_winners_bracket")
+    def test_load_league_happyPath_withMaxWorkers(
+        self,
+        mockGetWinnersBracket,
+        mockGetSportState,
+        mockGetMatchupsForWeek,
+        mockGetRosters,
+        mockGetUsersInLeague,
+        mockGetLeague,
+    ):
+        mockSleeperLeague2022 = Mock()
+        mockSleeperLeague2022.league_id = "2022"
+        mockSleeperLeague2022.previous_league_id = None
+        mockSleeperLeague2022.season = "2022"
+        mockSleeperLeague2022.status = SleeperSeasonStatus.COMPLETE
+        mockSleeperLeague2022.name = "Test League 2022"
+        mockSleeperLeague2022.settings.playoff_week_start = 3
+        mockSleeperLeague2022.settings.league_average_match = 0
+        mockSleeperLeague2022.settings.divisions = 0
+        mockSleeperLeague2022.settings.playoff_round_type_enum = (
+            SleeperPlayoffRoundType.ONE_WEEK_PER_ROUND
+        )
+
+        mockSleeperUsers2022 = [
+            self.__generateMockSleeperUser(displayName=f"User {i}", userId=str(i))
+            for i in range(1, 5)
+        ]
+        mockSleeperRosters2022 = [
+            self.__generateMockSleeperRoster(
+                ownerId=str(i), rosterId=202200 + i, division=None
+            )
+            for i in range(1, 5)
+        ]
+        # week number -> (roster ID, points) for each team in each matchup
+        weekNumberToScores = {
+            1: [((202201, 100), (202202, 90)), ((202203, 80), (202204, 70))],
+            2: [((202201, 60), (202203, 65)), ((202202, 75), (202204, 85))],
+            3: [((202201, 110), (202204, 105))],
+        }
+        weekNumberToSleeperMatchups = {
+            weekNumber: [
+                self.__generateMockSleeperMatchup(
+                    matchupId=matchupNumber, rosterId=rosterId, points=points
+                )
+                for matchupNumber, pair in enumerate(scores, start=1)
+                for rosterId, points in pair
+            ]
+            for weekNumber, scores in weekNumberToScores.items()
+        }
+        mockSleeperPlayoffMatchups2022 = [
+            self.__generateMockSleeperPlayoffMatchup(
+                round=1,
+                team1RosterId=202201,
+                team2RosterId=202204,
+                winningRosterId=202201,
+                p=1,
+                matchupId=1,
+            )
+        ]
+
+        mockGetLeague.return_value = mockSleeperLeague2022
+        mockGetUsersInLeague.return_value = mockSleeperUsers2022
+        mockGetRosters.return_value = mockSleeperRosters2022
+        # requests may be made in any order when many are made at once
+        mockGetMatchupsForWeek.side_effect = (
+            lambda league_id, week: weekNumberToSleeperMatchups[week]
+        )
+        mockGetSportState.return_value = self.__generateMockSleeperSportState(
+            season="2023", leg=1
+        )
+        mockGetWinnersBracket.return_value = mockSleeperPlayoffMatchups2022
+
+        league = SleeperLeagueLoader("2022", [2022], maxWorkers=4).loadLeague()
+
+        self.assertEqual(3, mockGetMatchupsForWeek.call_count)
+        self.assertEqual(1, mockGetRosters.call_count)
+        self.assertEqual(1, mockGetWinnersBracket.call_count)
+        self.assertEqual(1, len(league.years))
+        year = league.years[0]
+        teamIdToRosterId = {
+            team.id: 202200 + int(team.name.split(" ")[-1]) for team in year.teams
+        }
+        self.assertEqual([1, 2, 3], [week.weekNumber for week in year.weeks])
+        for week in year.weeks:
+            self.assertEqual(
+                weekNumberToScores[week.weekNumber],
+                [
+                    (
+                        (teamIdToRosterId[matchup.teamAId], matchup.teamAScore),
+                        (teamIdToRosterId[matchup.teamBId], matchup.teamBScore),
+                    )
+                    for matchup in week.matchups
+                ],
+            )
+        self.assertEqual(
+            [MatchupType.REGULAR_SEASON] * 4 + [MatchupType.CHAMPIONSHIP],
+            [matchup.matchupType for week in year.weeks for matchup in week.matchups],
+        )
+
+    @patch("sleeper.api.LeagueAPIClient.get_users_in_league")
+    @patch("sleeper.api.LeagueAPIClient.get_rosters")
+    @patch("sleeper.api.LeagueAPIClient.get_matchups_for_week")
+    @patch("sleeper.api.LeagueAPIClient.get_winners_bracket")
+    def test_fetchNotPrefetched_requestIsRecorded(
+        self,
+        mockGetWinnersBracket,
+        mockGetMatchupsForWeek,
+        mockGetRosters,
+        mockGetUsersInLeague,
+    ):
+        mockGetUsersInLeague.return_value = list()
+        mockGetRosters.return_value = list()
+        mockGetMatchupsForWeek.return_value = list()
+        mockGetWinnersBracket.return_value = list()
+        leagueLoader = SleeperLeagueLoader("2022", [2022])
+
+        # responses that were not prefetched are fetched the same way as prefetched ones
+        leagueLoader._SleeperLeagueLoader__getSleeperUsers("2022")
+        leagueLoader._SleeperLeagueLoader__getSleeperRosters("2022")
+        leagueLoader._SleeperLeagueLoader__getSleeperWinnersBracket("2022")
+        leagueLoader._SleeperLeagueLoader__getSleeperMatchups("2022", 1)
+        leagueLoader._SleeperLeagueLoader__getSleeperMatchups("2022", 1)
+
+        self.assertEqual(
+            ["users", "rosters", "winnersBracket", "matchups?week=1"],
+            [
+                requestRecord.endpoint
+                for requestRecord in leagueLoader.getLoadReport().requests
+            ],
+        )
+        mockGetMatchupsForWeek.assert_called_once_with(league_id="2022", week=1)
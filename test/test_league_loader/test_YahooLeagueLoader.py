@@ -14,6 +14,20 @@ from leeger.model.league.Year import Year
 
 
 class TestYahooLeagueLoader(unittest.TestCase):
+    def setUp(self):
+        # each Yahoo week is fetched on its own, so give back the mock week from the mock league's weeks
+        def mockYahooWeek(ctx, league, week_num):
+            mockWeek = league.weeks()[week_num - 1]
+            mockWeek.week_num = week_num
+            return mockWeek
+
+        patcher = mock.patch(
+            "leeger.league_loader.YahooLeagueLoader.YahooWeek",
+            side_effect=mockYahooWeek,
+        )
+        self.mockYahooWeek = patcher.start()
+        self.addCleanup(patcher.stop)
+
     # helper methods
     def __getMockTeamsMethod(self, teams: list) -> callable:
         def mockTeamsMethod():
@@ -1709,3 +1723,71 @@ class TestYahooLeagueLoader(unittest.TestCase):
         league = yahooLeagueLoader.loadLeague()
 
         self.assertEqual("custom name", league.name)
+
+    @mock.patch("multiprocessing.Process")
+    @mock.patch("yahoofantasy.Context.__init__")
+    @mock.patch("yahoofantasy.Context.get_leagues")
+    def test_loadLeague_withMaxWorkers(
+        self,
+        mockYahooContextGetLeagues,
+        mockYahooContextInit,
+        mockMultiprocessingProcess,
+    ):
+        mockLeague = Mock()
+        mockLeague.name = "Test League 2022"
+        mockLeague.league_id = "123"
+        mockLeague.season = 2022
+        mockLeague.current_week = 3
+        mockLeague.end_week = 3
+        mockYahooTeam1 = self.__getMockYahooTeam(
+            teamId=1, teamKey=1, name="Team 1", managerNickname="Owner 1", managerId=1
+        )
+        mockYahooTeam2 = self.__getMockYahooTeam(
+            teamId=2, teamKey=2, name="Team 2", managerNickname="Owner 2", managerId=2
+        )
+        mockLeague.teams = self.__getMockTeamsMethod([mockYahooTeam1, mockYahooTeam2])
+        mockWeeks = list()
+        for weekNumber in range(1, 4):
+            mockYahooMatchup = self.__getMockYahooMatchup(
+                week=weekNumber,
+                status="postevent",
+                winnerTeamKey=1,
+                isTied=0,
+                isPlayoffs=0,
+                isConsolation=0,
+                league=mockLeague,
+            )
+            mockYahooMatchup.teams.team = [
+                self.__setMockYahooTeamPoints(
+                    mockYahooTeam=mockYahooTeam1, teamPointsTotal=100 + weekNumber
+                ),
+                self.__setMockYahooTeamPoints(
+                    mockYahooTeam=mockYahooTeam2, teamPointsTotal=90
+                ),
+            ]
+            mockWeek = Mock()
+            mockWeek.matchups = [mockYahooMatchup]
+            mockWeeks.append(mockWeek)
+        mockLeague.weeks = self.__getMockWeeksMethod(mockWeeks)
+
+        mockYahooContextInit.side_effect = [None]
+        mockYahooContextGetLeagues.side_effect = [[mockLeague]]
+        mockLoginProcess = mockMultiprocessingProcess.return_value
+        mockLoginProcess.is_alive.return_value = (
+            False  # Simulate login process completion
+        )
+
+        yahooLeagueLoader = YahooLeagueLoader(
+            "123", [2022], clientId="cid", clientSecret="cs", maxWorkers=3
+        )
+        league = yahooLeagueLoader.loadLeague()
+
+        # every week is fetched once
+        for mockWeek in mockWeeks:
+            mockWeek.sync.assert_called_once_with()
+        self.assertEqual({"scoreboard": 3}, yahooLeagueLoader.getRequestCounts())
+        self.assertEqual([1, 2, 3], [week.weekNumber for week in league.years[0].weeks])
+        self.assertEqual(
+            [101, 102, 103],
+            [week.matchups[0].teamAScore for week in league.years[0].weeks],
+        )
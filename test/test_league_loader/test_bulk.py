@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from fleaflicker.api.FleaflickerAPIClient import FleaflickerAPIClient
+
+from leeger.league_loader import LeagueSpec, loadLeagues
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+from leeger.model.league.League import League
+
+
+class FakeFleaflickerServer(ThreadingHTTPServer):
+    """
+    A local stand-in for the Fleaflicker API.
+    Every league has 2 teams that play each other in 2 scoring periods each season.
+    League "404" does not exist.
+    """
+
+    def __init__(self, secondsPerRequest: float = 0.05):
+        super().__init__(("127.0.0.1", 0), FakeFleaflickerRequestHandler)
+        self.secondsPerRequest = secondsPerRequest
+        self.requestPaths = list()
+        self.requestsInProgress = 0
+        self.mostRequestsInProgress = 0
+        self.lock = threading.Lock()
+
+    @property
+    def baseUrl(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeFleaflickerRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server: FakeFleaflickerServer = self.server
+        with server.lock:
+            server.requestPaths.append(self.path)
+            server.requestsInProgress += 1
+            server.mostRequestsInProgress = max(
+                server.mostRequestsInProgress, server.requestsInProgress
+            )
+        try:
+            time.sleep(server.secondsPerRequest)
+            url = urlparse(self.path)
+            query = {name: values[0] for name, values in parse_qs(url.query).items()}
+            if query["league_id"] == "404":
+                self.send_error(404)
+                return
+            body = self.__getBody(url.path, query)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps(body).encode())
+        finally:
+            with server.lock:
+                server.requestsInProgress -= 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+    @staticmethod
+    def __getBody(path: str, query: dict[str, str]) -> dict:
+        leagueId = int(query["league_id"])
+        teams = [
+            {
+                "owners": [{"displayName": f"Owner {i}"}],
+                "id": i,
+                "name": f"Team {i}",
+            }
+            for i in range(1, 3)
+        ]
+        if path == "/FetchLeagueStandings":
+            return {
+                "divisions": [{"id": 1, "name": "Division 1", "teams": teams}],
+                "league": {"name": f"League {leagueId}", "id": leagueId},
+                "season": int(query["season"]),
+            }
+        if "scoring_period" not in query:
+            return {"eligibleSchedulePeriods": [{}, {}]}
+        return {
+            "games": [
+                {
+                    "away": teams[0],
+                    "home": teams[1],
+                    "awayScore": {"score": {"value": leagueId}},
+                    "homeScore": {"score": {"value": int(query["scoring_period"])}},
+                    "isFinalScore": True,
+                }
+            ]
+        }
+
+
+class TestBulk(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = FakeFleaflickerServer()
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        patcher = mock.patch.object(
+            FleaflickerAPIClient, "_BASE_URL", self.server.baseUrl
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_loadLeagueAsync(self):
+        league = await FleaflickerLeagueLoader("100", [2022]).loadLeagueAsync()
+
+        self.assertIsInstance(league, League)
+        self.assertEqual("League 100", league.name)
+        self.assertEqual([1, 2], [week.weekNumber for week in league.years[0].weeks])
+        self.assertEqual(4, len(self.server.requestPaths))
+
+    async def test_loadLeagues(self):
+        leagueSpecs = [
+            LeagueSpec(platform="fleaflicker", leagueId=str(leagueId), years=[2022])
+            for leagueId in range(100, 106)
+        ]
+
+        results = [
+            result
+            async for result in loadLeagues(
+                leagueSpecs,
+                maxConcurrentLeagues=2,
+                maxRequestsPerSecondByPlatform={"fleaflicker": 1000},
+            )
+        ]
+
+        self.assertEqual(
+            sorted(leagueSpec.leagueId for leagueSpec in leagueSpecs),
+            sorted(leagueSpec.leagueId for leagueSpec, _ in results),
+        )
+        for leagueSpec, league in results:
+            self.assertEqual(f"League {leagueSpec.leagueId}", league.name)
+            self.assertEqual(
+                int(leagueSpec.leagueId),
+                league.years[0].weeks[0].matchups[0].teamAScore,
+            )
+        self.assertEqual(4 * len(leagueSpecs), len(self.server.requestPaths))
+        # each League Loader makes one request at a time, so no more than 2 requests are made at once
+        self.assertEqual(2, self.server.mostRequestsInProgress)
+
+    async def test_loadLeagues_leagueFailsToLoad(self):
+        leagueSpecs = [
+            LeagueSpec(platform="fleaflicker", leagueId="404", years=[2022]),
+            LeagueSpec(platform="fleaflicker", leagueId="100", years=[2022]),
+        ]
+
+        results = dict()
+        async for leagueSpec, leagueOrException in loadLeagues(
+            leagueSpecs, returnExceptions=True
+        ):
+            results[leagueSpec.leagueId] = leagueOrException
+        self.assertIsInstance(results["404"], Exception)
+        self.assertIsInstance(results["100"], League)
+
+        with self.assertRaises(Exception):
+            async for _ in loadLeagues(leagueSpecs):
+                pass
+
+    async def test_loadLeagues_invalidArguments(self):
+        with self.assertRaises(ValueError) as context:
+            async for _ in loadLeagues(list(), maxConcurrentLeagues=0):
+                pass
+        self.assertEqual(
+            "'maxConcurrentLeagues' must be an int that is at least 1.",
+            str(context.exception),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            async for _ in loadLeagues(
+                [LeagueSpec(platform="bad", leagueId="1", years=[2022])]
+            ):
+                pass
+        self.assertEqual(
+            "Platform 'bad' is not supported. Supported platforms: ['espn', 'fleaflicker', 'myfantasyleague', 'sleeper', 'yahoo']",
+            str(context.exception),
+        )
+        # nothing is loaded
+        self.assertEqual(list(), self.server.requestPaths)
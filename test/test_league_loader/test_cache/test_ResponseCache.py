@@ -0,0 +1,99 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from leeger.league_loader.cache import (
+    DirectoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def __getResponseCaches(self, **kwargs) -> list[ResponseCache]:
+        sqliteResponseCache = SQLiteResponseCache(
+            os.path.join(self.directory.name, "cache.db"), **kwargs
+        )
+        self.addCleanup(sqliteResponseCache.close)
+        return [
+            DirectoryResponseCache(
+                os.path.join(self.directory.name, "responses"), **kwargs
+            ),
+            sqliteResponseCache,
+        ]
+
+    def test_getKey(self):
+        self.assertEqual(
+            "sleeper/123/2022/matchups?week=1",
+            ResponseCache.getKey(
+                platform="sleeper",
+                leagueId="123",
+                season=2022,
+                endpoint="matchups?week=1",
+            ),
+        )
+
+    def test_getAndSet(self):
+        for responseCache in self.__getResponseCaches():
+            with self.subTest(type(responseCache).__name__):
+                self.assertEqual((False, None), responseCache.get("a/1/2022/x"))
+
+                responseCache.set(
+                    "a/1/2022/x", {"games": [1, 2]}, isCompletedSeason=True
+                )
+                responseCache.set("a/1/2022/y", [3], isCompletedSeason=True)
+                # replaces what was kept
+                responseCache.set("a/1/2022/y", [4], isCompletedSeason=True)
+
+                self.assertEqual(
+                    (True, {"games": [1, 2]}), responseCache.get("a/1/2022/x")
+                )
+                self.assertEqual((True, [4]), responseCache.get("a/1/2022/y"))
+                self.assertEqual(
+                    {"hits": 2, "misses": 1, "writes": 3}, responseCache.getStats()
+                )
+
+                responseCache.clear()
+                self.assertEqual((False, None), responseCache.get("a/1/2022/x"))
+
+    def test_inProgressSeasonExpires(self):
+        for responseCache in self.__getResponseCaches(inProgressSeasonTTLSeconds=0.05):
+            with self.subTest(type(responseCache).__name__):
+                responseCache.set("a/1/2024/x", "inProgress", isCompletedSeason=False)
+                responseCache.set("a/1/2022/x", "completed", isCompletedSeason=True)
+                self.assertEqual((True, "inProgress"), responseCache.get("a/1/2024/x"))
+
+                time.sleep(0.1)
+
+                self.assertEqual((False, None), responseCache.get("a/1/2024/x"))
+                self.assertEqual((True, "completed"), responseCache.get("a/1/2022/x"))
+
+    def test_defaultInProgressSeasonTTLSeconds(self):
+        for responseCache in self.__getResponseCaches():
+            self.assertEqual(
+                ResponseCache.DEFAULT_IN_PROGRESS_SEASON_TTL_SECONDS,
+                responseCache.inProgressSeasonTTLSeconds,
+            )
+
+    def test_set_responseCantBePickled_isNotKept(self):
+        for responseCache in self.__getResponseCaches():
+            with self.subTest(type(responseCache).__name__):
+                responseCache.set(
+                    "a/1/2022/x", threading.Lock(), isCompletedSeason=True
+                )
+
+                self.assertEqual((False, None), responseCache.get("a/1/2022/x"))
+                self.assertEqual(0, responseCache.getStats()["writes"])
+
+    def test_keptBetweenInstances(self):
+        for responseCache in self.__getResponseCaches():
+            responseCache.set("a/1/2022/x", "kept", isCompletedSeason=True)
+        for responseCache in self.__getResponseCaches():
+            with self.subTest(type(responseCache).__name__):
+                self.assertEqual((True, "kept"), responseCache.get("a/1/2022/x"))
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.league_loader.fixture import ResponseFixtures
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+
+
+class TestResponseFixtures(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_recordAndReplay(self):
+        recordFixtures = ResponseFixtures(self.directory.name, FixtureMode.RECORD)
+        replayFixtures = ResponseFixtures(self.directory.name, FixtureMode.REPLAY)
+
+        self.assertEqual(
+            {"games": [1]},
+            recordFixtures.getFetch(lambda: {"games": [1]}, "a/1/2022/x?week=1")(),
+        )
+        self.assertEqual(
+            os.path.join(self.directory.name, "a", "1", "2022", "x%3Fweek%3D1.pickle"),
+            recordFixtures.getFilePath("a/1/2022/x?week=1"),
+        )
+        self.assertTrue(os.path.isfile(recordFixtures.getFilePath("a/1/2022/x?week=1")))
+
+        fetch = mock.Mock()
+        self.assertEqual(
+            {"games": [1]}, replayFixtures.getFetch(fetch, "a/1/2022/x?week=1")()
+        )
+        # nothing is requested while replaying
+        fetch.assert_not_called()
+
+        with self.assertRaises(LeagueLoaderException) as context:
+            replayFixtures.getFetch(fetch, "a/1/2022/y")()
+        self.assertEqual(
+            f"No response recorded for 'a/1/2022/y' in '{self.directory.name}'.",
+            str(context.exception),
+        )
+
+    def test_replayLatency(self):
+        def slowFetch() -> list:
+            time.sleep(0.05)
+            return [1]
+
+        ResponseFixtures(self.directory.name, FixtureMode.RECORD).getFetch(
+            slowFetch, "a/1/2022/x"
+        )()
+
+        for latencySeconds, minimumSeconds in ((0.1, 0.1), (None, 0.05)):
+            with self.subTest(latencySeconds=latencySeconds):
+                replayFixtures = ResponseFixtures(
+                    self.directory.name,
+                    FixtureMode.REPLAY,
+                    latencySeconds=latencySeconds,
+                )
+                start = time.perf_counter()
+                replayFixtures.getFetch(slowFetch, "a/1/2022/x")()
+                self.assertGreaterEqual(time.perf_counter() - start, minimumSeconds)
+
+    def test_invalidArguments(self):
+        with self.assertRaises(ValueError) as context:
+            ResponseFixtures(self.directory.name, "REPLAY")
+        self.assertEqual("'mode' must be a FixtureMode.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            ResponseFixtures(self.directory.name, FixtureMode.REPLAY, latencySeconds=-1)
+        self.assertEqual(
+            "'latencySeconds' must be None or a number that is at least 0.",
+            str(context.exception),
+        )
+
+    @mock.patch(
+        "fleaflicker.api.LeagueInfoAPIClient.LeagueInfoAPIClient.get_league_standings"
+    )
+    @mock.patch(
+        "fleaflicker.api.ScoringAPIClient.ScoringAPIClient.get_league_scoreboard"
+    )
+    def test_loadLeague(self, mockGetLeagueScoreboard, mockGetLeaguestandings):
+        mockTeams = [
+            {"owners": [{"displayName": f"Owner {i}"}], "id": i, "name": f"Team {i}"}
+            for i in range(1, 3)
+        ]
+        mockGetLeaguestandings.side_effect = lambda *, sport, league_id, season: {
+            "divisions": [{"id": 1, "name": "d1", "teams": mockTeams}],
+            "league": {"name": f"Test League {season}", "id": 123},
+            "season": season,
+        }
+        mockGetLeagueScoreboard.side_effect = (
+            lambda *, sport, league_id, season, scoring_period=None: (
+                {"eligibleSchedulePeriods": [{}, {}]}
+                if scoring_period is None
+                else {
+                    "games": [
+                        {
+                            "away": mockTeams[0],
+                            "home": mockTeams[1],
+                            "awayScore": {"score": {"value": 100}},
+                            "homeScore": {"score": {"value": scoring_period}},
+                            "isFinalScore": True,
+                        }
+                    ]
+                }
+            )
+        )
+
+        recordedLeague = FleaflickerLeagueLoader(
+            "123",
+            [2021, 2022],
+            responseFixtures=ResponseFixtures(self.directory.name, FixtureMode.RECORD),
+        ).loadLeague()
+        self.assertEqual(2, mockGetLeaguestandings.call_count)
+        self.assertEqual(6, mockGetLeagueScoreboard.call_count)
+
+        leagueLoader = FleaflickerLeagueLoader(
+            "123",
+            [2021, 2022],
+            maxWorkers=4,
+            responseFixtures=ResponseFixtures(
+                self.directory.name, FixtureMode.REPLAY, latencySeconds=0.01
+            ),
+        )
+        replayedLeague = leagueLoader.loadLeague()
+
+        # nothing more is requested from the platform
+        self.assertEqual(2, mockGetLeaguestandings.call_count)
+        self.assertEqual(6, mockGetLeagueScoreboard.call_count)
+        self.assertTrue(
+            recordedLeague.equals(replayedLeague, ignoreBaseIds=True, ignoreIds=True)
+        )
+        # replayed responses are still requests, so loads can be timed with different settings
+        self.assertEqual(
+            {"standings": 2, "scoreboard": 6}, leagueLoader.getRequestCounts()
+        )
+        self.assertTrue(
+            all(
+                requestRecord.seconds >= 0.01
+                for requestRecord in leagueLoader.getLoadReport().requests
+            )
+        )
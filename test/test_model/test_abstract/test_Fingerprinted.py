@@ -0,0 +1,163 @@
+import copy
+import pickle
+import unittest
+from unittest import mock
+
+from leeger.exception.InvalidMatchupFormatException import InvalidMatchupFormatException
+from leeger.model.abstract.Fingerprinted import Fingerprinted, FingerprintedList
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+from leeger.validate import leagueValidation
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestFingerprinted(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        week = Week(weekNumber=1, matchups=[matchup])
+        year = Year(yearNumber=2000, teams=teams, weeks=[week])
+        return League(name="League", owners=owners, years=[year])
+
+    def test_fingerprint_sameForUnchangedModel(self):
+        league = self.__getLeague()
+
+        self.assertIsInstance(league.fingerprint, bytes)
+        self.assertEqual(league.fingerprint, league.fingerprint)
+        self.assertEqual(hash(league), hash(league))
+
+    def test_fingerprint_unchangedModelIsNotHashedAgain(self):
+        league = self.__getLeague()
+        hash(league)
+
+        with mock.patch.object(
+            Fingerprinted,
+            "_Fingerprinted__getFingerprint",
+            autospec=True,
+            side_effect=Fingerprinted._Fingerprinted__getFingerprint,
+        ) as getFingerprint:
+            hash(league)
+            hash(league)
+            self.assertEqual(0, getFingerprint.call_count)
+
+            # only the changed Matchup and the models holding it are hashed again
+            league.years[0].weeks[0].matchups[0].teamAScore = 3
+            hash(league)
+            self.assertCountEqual(
+                ["Matchup", "Week", "Year", "League"],
+                [type(call.args[0]).__name__ for call in getFingerprint.call_args_list],
+            )
+
+    def test_fingerprint_sameForCopies(self):
+        league = self.__getLeague()
+
+        deepCopy = copy.deepcopy(league)
+        pickled = pickle.loads(pickle.dumps(league))
+
+        self.assertEqual(league.fingerprint, deepCopy.fingerprint)
+        self.assertEqual(league.fingerprint, pickled.fingerprint)
+        self.assertIsInstance(deepCopy.years, FingerprintedList)
+        self.assertIsInstance(pickled.years[0].weeks, FingerprintedList)
+        # copies still notice changes
+        deepCopy.years[0].weeks[0].matchups.pop()
+        self.assertNotEqual(league.fingerprint, deepCopy.fingerprint)
+
+    def test_fingerprint_differentForDifferentModels(self):
+        self.assertNotEqual(
+            self.__getLeague().fingerprint, self.__getLeague().fingerprint
+        )
+        self.assertNotEqual(
+            YearSettings(leagueMedianGames=True).fingerprint,
+            YearSettings(leagueMedianGames=False).fingerprint,
+        )
+
+    def test_fingerprint_changesWhenChildFieldIsSet(self):
+        league = self.__getLeague()
+        year = league.years[0]
+        leagueFingerprint = league.fingerprint
+        yearFingerprint = year.fingerprint
+
+        year.weeks[0].matchups[0].teamAScore = 3
+
+        self.assertNotEqual(leagueFingerprint, league.fingerprint)
+        self.assertNotEqual(yearFingerprint, year.fingerprint)
+
+        year.weeks[0].matchups[0].teamAScore = 1
+
+        self.assertEqual(leagueFingerprint, league.fingerprint)
+        self.assertEqual(yearFingerprint, year.fingerprint)
+
+    def test_fingerprint_changesWhenListFieldChanges(self):
+        league = self.__getLeague()
+        week = league.years[0].weeks[0]
+        fingerprint = league.fingerprint
+
+        matchup = week.matchups.pop()
+        self.assertNotEqual(fingerprint, league.fingerprint)
+
+        week.matchups.append(matchup)
+        self.assertEqual(fingerprint, league.fingerprint)
+
+        # a model added to a list is watched for changes too
+        newMatchup = copy.deepcopy(matchup)
+        week.matchups[0] = newMatchup
+        fingerprint = league.fingerprint
+        newMatchup.teamBScore = 5
+        self.assertNotEqual(fingerprint, league.fingerprint)
+
+    def test_fingerprint_changesWhenListFieldIsReplaced(self):
+        league = self.__getLeague()
+        fingerprint = league.fingerprint
+
+        league.years = league.years + [copy.deepcopy(league.years[0])]
+
+        self.assertIsInstance(league.years, FingerprintedList)
+        self.assertNotEqual(fingerprint, league.fingerprint)
+
+    def test_fingerprint_fingerprintedListGivenOnInitIsKept(self):
+        league = self.__getLeague()
+        matchup = league.years[0].weeks[0].matchups[0]
+        matchups = FingerprintedList()
+        week = Week(weekNumber=1, matchups=matchups)
+        fingerprint = week.fingerprint
+        year = league.years[0]
+        year.weeks = [week]
+        yearFingerprint = year.fingerprint
+
+        # the given FingerprintedList is the model's list, so appending to it changes the model
+        matchups.append(matchup)
+
+        self.assertIs(matchups, week.matchups)
+        self.assertEqual(1, len(week.matchups))
+        self.assertNotEqual(yearFingerprint, year.fingerprint)
+        self.assertNotEqual(fingerprint, week.fingerprint)
+
+        # a model appended to the list is watched for changes too
+        fingerprint = week.fingerprint
+        yearFingerprint = year.fingerprint
+        matchup.teamAScore = 100
+        self.assertNotEqual(fingerprint, week.fingerprint)
+        self.assertNotEqual(yearFingerprint, year.fingerprint)
+
+    def test_fingerprint_changesWhenIdChanges(self):
+        league = self.__getLeague()
+        fingerprint = league.fingerprint
+
+        league.owners[0].id = "newId"
+
+        self.assertNotEqual(fingerprint, league.fingerprint)
+
+    def test_fingerprint_validationCacheNoticesChanges(self):
+        league = self.__getLeague()
+        leagueValidation.runAllChecks(league)
+
+        league.years[0].weeks[0].matchups[0].teamAId = league.years[0].teams[1].id
+
+        with self.assertRaises(InvalidMatchupFormatException):
+            leagueValidation.runAllChecks(league)
@@ -1,6 +1,15 @@
+import copy
+import threading
+import time
 import unittest
+from unittest import mock
 
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.util.IdGenerator import IdGenerator
+from leeger.util.navigator import MatchupNavigator
+from leeger.util.synthetic import generateLeague
 
 
 class TestUniqueId(unittest.TestCase):
@@ -30,3 +39,67 @@ class TestUniqueId(unittest.TestCase):
         with self.assertRaises(Exception) as e:
             del uniqueId.id
         self.assertEqual("ID cannot be deleted.", str(e.exception))
+
+    def test_uniqueId_idOnlyGeneratedWhenNeeded(self):
+        league = generateLeague(
+            numberOfYears=1,
+            numberOfTeams=4,
+            numberOfRegularSeasonWeeks=2,
+            numberOfPlayoffTeams=2,
+            multiWeekPlayoffs=True,
+            seed=0,
+        )
+        leagueJson = league.toJson()
+        with mock.patch.object(
+            IdGenerator, "generateId", wraps=IdGenerator.generateId
+        ) as mockGenerateId:
+            # models given an ID never generate one
+            self.assertEqual(leagueJson, League.fromJson(leagueJson).toJson())
+            # models only used for a moment never generate one
+            MatchupNavigator.simplifyMultiWeekMatchups(
+                league.years[0].weeks[-1].matchups
+            )
+            self.assertEqual(0, mockGenerateId.call_count)
+
+            owner = Owner(name="owner")
+            self.assertEqual(owner.id, owner.id)
+            self.assertEqual(1, mockGenerateId.call_count)
+
+    def test_uniqueId_generatedIdIsKept(self):
+        owner = Owner(name="owner")
+        fingerprint = owner.fingerprint
+
+        self.assertEqual(fingerprint, owner.fingerprint)
+        self.assertNotEqual(fingerprint, Owner(name="owner").fingerprint)
+
+        # a copy of a model that has not generated its ID yet has the same ID
+        otherOwner = Owner(name="other")
+        otherOwnerCopy = copy.deepcopy(otherOwner)
+        self.assertEqual(otherOwner.id, otherOwnerCopy.id)
+
+    def test_uniqueId_idReadByManyThreadsAtOnce_sameId(self):
+        generateId = IdGenerator.generateId
+
+        def slowGenerateId() -> str:
+            # gives every thread time to read the ID before it is set
+            time.sleep(0.01)
+            return generateId()
+
+        owner = Owner(name="owner")
+        numberOfThreads = 8
+        barrier = threading.Barrier(numberOfThreads)
+        ids = list()
+
+        def readId():
+            barrier.wait()
+            ids.append(owner.id)
+
+        with mock.patch.object(IdGenerator, "generateId", side_effect=slowGenerateId):
+            threads = [threading.Thread(target=readId) for _ in range(numberOfThreads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(numberOfThreads, len(ids))
+        self.assertEqual({owner.id}, set(ids))
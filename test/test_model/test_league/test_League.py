@@ -590,3 +590,35 @@ class TestLeague(unittest.TestCase):
         leagueDerived = League.fromJson(leagueJson)
         self.assertEqual(league, leagueDerived)
         self.assertEqual(league.id, leagueDerived.id)
+
+    def test_league_toBytesAndFromBytes(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup_1 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=1.1,
+            teamBScore=2,
+            matchupType=MatchupType.PLAYOFF,
+            teamAHasTiebreaker=True,
+            teamBHasTiebreaker=None,
+        )
+        week_1 = Week(weekNumber=1, matchups=[matchup_1])
+        year_1 = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[week_1],
+            yearSettings=YearSettings(leagueMedianGames=True),
+        )
+        league = League(name="LEAGUE", owners=owners, years=[year_1])
+        leagueBytes = league.toBytes()
+        leagueDerived = League.fromBytes(leagueBytes)
+
+        self.assertIsInstance(leagueBytes, bytes)
+        self.assertEqual(league, leagueDerived)
+        self.assertEqual(league.id, leagueDerived.id)
+        self.assertEqual(league.toJson(), leagueDerived.toJson())
+        # ints stay ints
+        self.assertIsInstance(
+            leagueDerived.years[0].weeks[0].matchups[0].teamBScore, int
+        )
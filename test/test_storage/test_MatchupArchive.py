@@ -0,0 +1,226 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from leeger.calculator.all_time_calculator import (
+    GameOutcomeAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+    TeamSummaryAllTimeCalculator,
+)
+from leeger.exception import DoesNotExistException
+from leeger.exception.InvalidFilterException import InvalidFilterException
+from leeger.model.filter import AllTimeFilters
+from leeger.storage import MatchupArchive
+from leeger.util.navigator import LeagueNavigator
+from leeger.util.synthetic import generateLeague
+
+
+class TestMatchupArchive(unittest.TestCase):
+    def setUp(self):
+        self.league = generateLeague(
+            numberOfYears=3,
+            numberOfTeams=6,
+            numberOfRegularSeasonWeeks=4,
+            numberOfPlayoffTeams=4,
+            numberOfDivisions=2,
+            multiWeekPlayoffs=True,
+            seed=0,
+        )
+        self.otherLeague = generateLeague(
+            numberOfYears=1,
+            numberOfTeams=4,
+            numberOfRegularSeasonWeeks=3,
+            numberOfPlayoffTeams=2,
+            seed=1,
+        )
+        temporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporaryDirectory.cleanup)
+        self.directory = temporaryDirectory.name
+        self.archive = MatchupArchive.write(
+            self.directory, (league for league in [self.otherLeague, self.league])
+        )
+
+    def test_write(self):
+        numberOfMatchups = sum(
+            len(week.matchups)
+            for league in (self.otherLeague, self.league)
+            for year in league.years
+            for week in year.weeks
+        )
+
+        self.assertEqual(numberOfMatchups, len(self.archive))
+        self.assertEqual(
+            [self.otherLeague.id, self.league.id], self.archive.getLeagueIds()
+        )
+        self.assertEqual(self.league.name, self.archive.getLeagueName(self.league.id))
+        self.assertEqual(
+            [owner.id for owner in self.league.owners],
+            self.archive.getOwnerIds(self.league.id),
+        )
+        for name, dtype in (
+            MatchupArchive.MATCHUP_COLUMNS | MatchupArchive.TEAM_COLUMNS
+        ).items():
+            column = self.archive.getColumn(name)
+            self.assertIsInstance(column, numpy.memmap)
+            self.assertEqual(numpy.dtype(dtype), column.dtype)
+            self.assertTrue(os.path.exists(os.path.join(self.directory, f"{name}.npy")))
+
+        # each League's rows are in Matchup order
+        rows = self.archive.getRows(self.league.id)
+        matchups = [
+            matchup
+            for year in self.league.years
+            for week in year.weeks
+            for matchup in week.matchups
+        ]
+        self.assertEqual(
+            [matchup.teamAScore for matchup in matchups],
+            self.archive.getColumn("teamAScores")[rows].tolist(),
+        )
+        self.assertEqual(
+            [matchup.teamBId for matchup in matchups],
+            [
+                self.archive.teamIds[teamIndex]
+                for teamIndex in self.archive.getColumn("teamBIndices")[rows]
+            ],
+        )
+
+    def test_stats(self):
+        for kwargs in (
+            dict(),
+            {"onlyRegularSeason": True},
+            {"onlyPostSeason": True},
+            {"onlyChampionship": True},
+            {
+                "yearNumberStart": self.league.years[0].yearNumber,
+                "weekNumberStart": 3,
+                "yearNumberEnd": self.league.years[1].yearNumber,
+                "weekNumberEnd": 2,
+            },
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    AllTimeFilters.getForLeague(self.league, **kwargs),
+                    self.archive.getAllTimeFilters(self.league.id, **kwargs),
+                )
+                for calculatorMethod, archiveMethod in (
+                    (
+                        PointsScoredAllTimeCalculator.getPointsScored,
+                        self.archive.getPointsScored,
+                    ),
+                    (
+                        PointsScoredAllTimeCalculator.getOpponentPointsScored,
+                        self.archive.getOpponentPointsScored,
+                    ),
+                ):
+                    points = calculatorMethod(self.league, **kwargs)
+                    archivePoints = archiveMethod(self.league.id, **kwargs)
+                    self.assertEqual(points.keys(), archivePoints.keys())
+                    for ownerId, ownerPoints in points.items():
+                        if ownerPoints is None:
+                            self.assertIsNone(archivePoints[ownerId])
+                        else:
+                            self.assertAlmostEqual(
+                                float(ownerPoints), archivePoints[ownerId]
+                            )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getWins(self.league, **kwargs),
+                    self.archive.getWins(self.league.id, **kwargs),
+                )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getLosses(self.league, **kwargs),
+                    self.archive.getLosses(self.league.id, **kwargs),
+                )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getTies(self.league, **kwargs),
+                    self.archive.getTies(self.league.id, **kwargs),
+                )
+                allTimeFilters = AllTimeFilters.getForLeague(self.league, **kwargs)
+                for countMultiWeekMatchupsAsOneGame in (False, True):
+                    self.assertEqual(
+                        LeagueNavigator.getNumberOfGamesPlayed(
+                            self.league,
+                            allTimeFilters,
+                            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                        ),
+                        self.archive.getGamesPlayed(
+                            self.league.id,
+                            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                            **kwargs,
+                        ),
+                    )
+        # the other League in the archive does not change the stats
+        self.assertEqual(
+            GameOutcomeAllTimeCalculator.getWins(self.otherLeague),
+            self.archive.getWins(self.otherLeague.id),
+        )
+
+    def test_getGamesPlayed_multiWeekMatchupsAreOneGame(self):
+        # the League has two-week playoff matchups, which the calculator counts as one game
+        for kwargs in (dict(), {"onlyPostSeason": True}):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    TeamSummaryAllTimeCalculator.getGamesPlayed(self.league, **kwargs),
+                    self.archive.getGamesPlayed(self.league.id, **kwargs),
+                )
+
+    def test_stats_noGamesPlayed(self):
+        # the championship of a year is only played by 2 Owners
+        yearNumber = self.league.years[0].yearNumber
+        wins = self.archive.getWins(
+            self.league.id,
+            onlyChampionship=True,
+            yearNumberStart=yearNumber,
+            yearNumberEnd=yearNumber,
+        )
+
+        self.assertEqual(len(self.league.owners) - 2, list(wins.values()).count(None))
+
+    def test_openArchive(self):
+        archive = MatchupArchive(self.directory)
+
+        self.assertEqual(self.archive.getLeagueIds(), archive.getLeagueIds())
+        self.assertEqual(
+            self.archive.getWins(self.league.id), archive.getWins(self.league.id)
+        )
+
+        # no Leagues
+        with tempfile.TemporaryDirectory() as directory:
+            archive = MatchupArchive.write(directory, list())
+        self.assertEqual(0, len(archive))
+        self.assertEqual(list(), archive.getLeagueIds())
+
+        # unsupported version
+        idDictionaryFilePath = os.path.join(
+            self.directory, MatchupArchive.ID_DICTIONARY_FILE_NAME
+        )
+        with open(idDictionaryFilePath) as file:
+            idDictionary = json.load(file)
+        idDictionary["version"] = 0
+        with open(idDictionaryFilePath, "w") as file:
+            json.dump(idDictionary, file)
+        with self.assertRaises(ValueError) as context:
+            MatchupArchive(self.directory)
+        self.assertEqual(
+            "Matchup archive version 0 is not supported.", str(context.exception)
+        )
+
+    def test_getAllTimeFilters_invalidFilters(self):
+        with self.assertRaises(InvalidFilterException) as context:
+            self.archive.getAllTimeFilters(
+                self.league.id, onlyRegularSeason=True, onlyPostSeason=True
+            )
+        self.assertEqual(
+            "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True",
+            str(context.exception),
+        )
+
+        with self.assertRaises(DoesNotExistException) as context:
+            self.archive.getWins("bad")
+        self.assertEqual(
+            "League with ID 'bad' does not exist in the archive.",
+            str(context.exception),
+        )
@@ -0,0 +1,189 @@
+import os
+import tempfile
+import unittest
+
+from leeger.calculator.all_time_calculator import (
+    GameOutcomeAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+    TeamSummaryAllTimeCalculator,
+)
+from leeger.exception import DoesNotExistException
+from leeger.exception.InvalidFilterException import InvalidFilterException
+from leeger.model.filter import AllTimeFilters
+from leeger.storage import SQLiteLeagueStore
+from leeger.util.navigator import LeagueNavigator
+from leeger.util.synthetic import generateLeague
+
+
+class TestSQLiteLeagueStore(unittest.TestCase):
+    def setUp(self):
+        self.league = generateLeague(
+            numberOfYears=3,
+            numberOfTeams=6,
+            numberOfRegularSeasonWeeks=4,
+            numberOfPlayoffTeams=4,
+            numberOfDivisions=2,
+            multiWeekPlayoffs=True,
+            seed=0,
+        )
+        self.store = SQLiteLeagueStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.store.addLeague(self.league)
+
+    def test_getLeague(self):
+        matchup = self.league.years[0].weeks[0].matchups[0]
+        matchup.teamAScore = 100
+        self.store.addLeague(self.league)
+
+        league = self.store.getLeague(self.league.id)
+
+        self.assertTrue(self.league.equals(league))
+        self.assertEqual(self.league.toJson(), league.toJson())
+        self.assertIsInstance(league.years[0].weeks[0].matchups[0].teamAScore, int)
+
+        with self.assertRaises(DoesNotExistException) as context:
+            self.store.getLeague("bad")
+        self.assertEqual(
+            "League with ID 'bad' does not exist in the store.", str(context.exception)
+        )
+
+    def test_addLeagues(self):
+        otherLeague = generateLeague(
+            numberOfYears=1,
+            numberOfTeams=4,
+            numberOfRegularSeasonWeeks=3,
+            numberOfPlayoffTeams=2,
+            seed=1,
+        )
+        # adding a League that is kept replaces it
+        self.league.name = "new name"
+        self.store.addLeagues([self.league, otherLeague])
+
+        self.assertEqual([self.league.id, otherLeague.id], self.store.getLeagueIds())
+        self.assertEqual("new name", self.store.getLeague(self.league.id).name)
+        self.assertTrue(otherLeague.equals(self.store.getLeague(otherLeague.id)))
+
+        self.store.removeLeague(self.league.id)
+        self.assertEqual([otherLeague.id], self.store.getLeagueIds())
+
+    def test_keptInFile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "leagues.db")
+            store = SQLiteLeagueStore(filePath)
+            store.addLeague(self.league)
+            store.close()
+
+            store = SQLiteLeagueStore(filePath)
+            league = store.getLeague(self.league.id)
+            store.close()
+
+        self.assertTrue(self.league.equals(league))
+
+    def test_stats(self):
+        for kwargs in (
+            dict(),
+            {"onlyRegularSeason": True},
+            {"onlyPostSeason": True},
+            {"onlyChampionship": True},
+            {
+                "yearNumberStart": self.league.years[0].yearNumber,
+                "weekNumberStart": 3,
+                "yearNumberEnd": self.league.years[1].yearNumber,
+                "weekNumberEnd": 2,
+            },
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    AllTimeFilters.getForLeague(self.league, **kwargs),
+                    self.store.getAllTimeFilters(self.league.id, **kwargs),
+                )
+                pointsScored = PointsScoredAllTimeCalculator.getPointsScored(
+                    self.league, **kwargs
+                )
+                storePointsScored = self.store.getPointsScored(self.league.id, **kwargs)
+                self.assertEqual(pointsScored.keys(), storePointsScored.keys())
+                for ownerId, points in pointsScored.items():
+                    if points is None:
+                        self.assertIsNone(storePointsScored[ownerId])
+                    else:
+                        self.assertAlmostEqual(
+                            float(points), storePointsScored[ownerId]
+                        )
+                opponentPointsScored = (
+                    PointsScoredAllTimeCalculator.getOpponentPointsScored(
+                        self.league, **kwargs
+                    )
+                )
+                storeOpponentPointsScored = self.store.getOpponentPointsScored(
+                    self.league.id, **kwargs
+                )
+                for ownerId, points in opponentPointsScored.items():
+                    if points is None:
+                        self.assertIsNone(storeOpponentPointsScored[ownerId])
+                    else:
+                        self.assertAlmostEqual(
+                            float(points), storeOpponentPointsScored[ownerId]
+                        )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getWins(self.league, **kwargs),
+                    self.store.getWins(self.league.id, **kwargs),
+                )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getLosses(self.league, **kwargs),
+                    self.store.getLosses(self.league.id, **kwargs),
+                )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getTies(self.league, **kwargs),
+                    self.store.getTies(self.league.id, **kwargs),
+                )
+                allTimeFilters = AllTimeFilters.getForLeague(self.league, **kwargs)
+                for countMultiWeekMatchupsAsOneGame in (False, True):
+                    self.assertEqual(
+                        LeagueNavigator.getNumberOfGamesPlayed(
+                            self.league,
+                            allTimeFilters,
+                            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                        ),
+                        self.store.getGamesPlayed(
+                            self.league.id,
+                            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                            **kwargs,
+                        ),
+                    )
+
+    def test_getGamesPlayed_multiWeekMatchupsAreOneGame(self):
+        # the League has two-week playoff matchups, which the calculator counts as one game
+        for kwargs in (dict(), {"onlyPostSeason": True}):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    TeamSummaryAllTimeCalculator.getGamesPlayed(self.league, **kwargs),
+                    self.store.getGamesPlayed(self.league.id, **kwargs),
+                )
+
+    def test_stats_noGamesPlayed(self):
+        # the championship of a year is only played by 2 Owners
+        yearNumber = self.league.years[0].yearNumber
+        wins = self.store.getWins(
+            self.league.id,
+            onlyChampionship=True,
+            yearNumberStart=yearNumber,
+            yearNumberEnd=yearNumber,
+        )
+
+        self.assertEqual(len(self.league.owners) - 2, list(wins.values()).count(None))
+
+    def test_getAllTimeFilters_invalidFilters(self):
+        with self.assertRaises(InvalidFilterException) as context:
+            self.store.getAllTimeFilters(
+                self.league.id, onlyRegularSeason=True, onlyPostSeason=True
+            )
+        self.assertEqual(
+            "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True",
+            str(context.exception),
+        )
+
+        with self.assertRaises(DoesNotExistException) as context:
+            self.store.getWins("bad")
+        self.assertEqual(
+            "League with ID 'bad' does not exist in the store.", str(context.exception)
+        )
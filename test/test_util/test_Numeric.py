@@ -0,0 +1,63 @@
+import unittest
+
+import numpy
+
+from leeger.enum.NumericMode import NumericMode
+from leeger.util.Deci import Deci
+from leeger.util.Numeric import Numeric
+
+
+class TestNumeric(unittest.TestCase):
+    def test_getNumericMode_happyPath(self):
+        self.assertEqual(NumericMode.EXACT, Numeric.getNumericMode())
+        self.assertEqual(
+            NumericMode.FLOAT, Numeric.getNumericMode(numericMode=NumericMode.FLOAT)
+        )
+        self.assertEqual(NumericMode.FLOAT, Numeric.getNumericMode(numericMode="float"))
+        self.assertEqual(NumericMode.EXACT, Numeric.getNumericMode(numericMode="EXACT"))
+
+    def test_getNumericMode_invalidNumericMode_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            Numeric.getNumericMode(numericMode="bad")
+        self.assertEqual("'bad' is not a valid NumericMode.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            Numeric.getNumericMode(numericMode=1)
+        self.assertEqual(
+            "'numericMode' must be type 'NumericMode' or 'str'", str(context.exception)
+        )
+
+    def test_mode_happyPath(self):
+        with Numeric.mode("float"):
+            self.assertEqual(NumericMode.FLOAT, Numeric.getNumericMode())
+            # a kwarg is used over the mode
+            self.assertEqual(
+                NumericMode.EXACT, Numeric.getNumericMode(numericMode="exact")
+            )
+            with Numeric.mode(NumericMode.EXACT):
+                self.assertEqual(NumericMode.EXACT, Numeric.getNumericMode())
+            self.assertEqual(NumericMode.FLOAT, Numeric.getNumericMode())
+        self.assertEqual(NumericMode.EXACT, Numeric.getNumericMode())
+
+    def test_getNumberType_happyPath(self):
+        self.assertIs(Deci, Numeric.getNumberType(NumericMode.EXACT))
+        self.assertIs(numpy.float64, Numeric.getNumberType(NumericMode.FLOAT))
+
+    def test_toDeci_happyPath(self):
+        response = Numeric.toDeci(numpy.float64(0.1) + numpy.float64(0.2))
+
+        self.assertIsInstance(response, Deci)
+        self.assertEqual(Deci("0.30000000000000004"), response)
+        # values not calculated with floats are not changed
+        self.assertEqual(1.5, Numeric.toDeci(1.5))
+        self.assertIsInstance(Numeric.toDeci(1.5), float)
+        self.assertEqual(3, Numeric.toDeci(3))
+        self.assertIsNone(Numeric.toDeci(None))
+
+    def test_isClose_happyPath(self):
+        self.assertTrue(Numeric.isClose(Deci("1") / Deci("3"), 1 / 3))
+        self.assertTrue(Numeric.isClose(Deci("1E-17"), 1.4e-14))
+        self.assertTrue(Numeric.isClose(Deci("1000000"), 1000000.0001))
+        self.assertFalse(Numeric.isClose(Deci("1"), 1.01))
+        self.assertTrue(Numeric.isClose(None, None))
+        self.assertFalse(Numeric.isClose(None, 0.0))
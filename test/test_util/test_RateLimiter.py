@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+
+from leeger.util.RateLimiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_init_invalidMaxRequestsPerSecond_raisesException(self):
+        for maxRequestsPerSecond in (0, -1, "1"):
+            with self.assertRaises(ValueError) as context:
+                RateLimiter(maxRequestsPerSecond)
+            self.assertEqual(
+                "'maxRequestsPerSecond' must be a number greater than 0.",
+                str(context.exception),
+            )
+
+    def test_wait_spacesOutRequests(self):
+        rateLimiter = RateLimiter(100)
+        requestTimes = list()
+        requestTimesLock = threading.Lock()
+
+        def makeRequests():
+            for _ in range(5):
+                rateLimiter.wait()
+                with requestTimesLock:
+                    requestTimes.append(time.monotonic())
+
+        threads = [threading.Thread(target=makeRequests) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 requests at 100 per second take at least 0.19 seconds
+        self.assertEqual(20, len(requestTimes))
+        self.assertGreaterEqual(max(requestTimes) - start, 0.18)
+
+    def test_forHost(self):
+        with RateLimiter.forHost("example.com", 5) as rateLimiter:
+            with RateLimiter.forHost("example.com", 5) as sameHostRateLimiter:
+                self.assertIs(rateLimiter, sameHostRateLimiter)
+            with RateLimiter.forHost("example.org", 5) as otherHostRateLimiter:
+                self.assertIsNot(rateLimiter, otherHostRateLimiter)
+            # a higher rate for the same host shares the RateLimiter without raising its rate
+            with RateLimiter.forHost("example.com", 10) as sameHostRateLimiter:
+                self.assertIs(rateLimiter, sameHostRateLimiter)
+                self.assertEqual(5, rateLimiter.maxRequestsPerSecond)
+
+        # once every block for a host ends, the RateLimiter is dropped
+        with RateLimiter.forHost("example.com", 10) as newRateLimiter:
+            self.assertIsNot(rateLimiter, newRateLimiter)
+            self.assertEqual(10, newRateLimiter.maxRequestsPerSecond)
+
+    def test_forHost_lowerRateForSameHost_lowestRateUsed(self):
+        with RateLimiter.forHost("lower.example.com", 100) as rateLimiter:
+            with RateLimiter.forHost("lower.example.com", 10) as sameHostRateLimiter:
+                self.assertIs(rateLimiter, sameHostRateLimiter)
+                self.assertEqual(10, rateLimiter.maxRequestsPerSecond)
+
+                # 3 requests at 10 per second take at least 0.2 seconds
+                start = time.monotonic()
+                for _ in range(3):
+                    rateLimiter.wait()
+                self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+            # the lower rate is no longer used once its block ends
+            self.assertEqual(100, rateLimiter.maxRequestsPerSecond)
+
+        with self.assertRaises(ValueError):
+            with RateLimiter.forHost("lower.example.com", 0):
+                pass
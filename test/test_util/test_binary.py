@@ -0,0 +1,101 @@
+import mmap
+import os
+import tempfile
+import unittest
+
+from leeger.model.league import League
+from leeger.util.binary import LeagueBytesReader, leagueFromBytes, leagueToBytes
+from leeger.util.synthetic import generateLeague
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.league = generateLeague(
+            numberOfYears=3,
+            numberOfTeams=6,
+            numberOfRegularSeasonWeeks=4,
+            numberOfPlayoffTeams=4,
+            numberOfDivisions=2,
+            numberOfLeagueMedianYears=1,
+            multiWeekPlayoffs=True,
+            seed=0,
+        )
+
+    def test_leagueToBytesAndLeagueFromBytes(self):
+        leagueBytes = leagueToBytes(self.league)
+        league = leagueFromBytes(leagueBytes)
+
+        self.assertTrue(self.league.equals(league))
+        self.assertEqual(self.league.toJson(), league.toJson())
+        # every ID is only stored once
+        self.assertLess(len(leagueBytes), len(str(self.league.toJson())) / 3)
+
+    def test_leagueToBytes_scoreTooBig(self):
+        self.league.years[0].weeks[0].matchups[0].teamAScore = 2**60
+
+        with self.assertRaises(ValueError) as context:
+            leagueToBytes(self.league)
+        self.assertEqual(
+            f"Score {2**60} is too big to be stored exactly.", str(context.exception)
+        )
+
+    def test_LeagueBytesReader(self):
+        reader = LeagueBytesReader(leagueToBytes(self.league))
+
+        self.assertEqual(self.league.id, reader.leagueId)
+        self.assertEqual(self.league.name, reader.leagueName)
+        self.assertEqual(
+            [year.yearNumber for year in self.league.years], reader.yearNumbers
+        )
+        for owner, ownerDerived in zip(self.league.owners, reader.getOwners()):
+            self.assertTrue(owner.equals(ownerDerived))
+
+        lastYear = self.league.years[-1]
+        self.assertTrue(lastYear.equals(reader.getYear(lastYear.yearNumber)))
+
+        # only the given years are in the League, in League order
+        league = reader.getLeague(
+            yearNumbers=[lastYear.yearNumber, self.league.years[0].yearNumber]
+        )
+        self.assertEqual(
+            [self.league.years[0].yearNumber, lastYear.yearNumber],
+            [year.yearNumber for year in league.years],
+        )
+        self.assertIsInstance(league, League)
+        self.assertEqual(self.league.id, league.id)
+
+        with self.assertRaises(ValueError) as context:
+            reader.getYear(1900)
+        self.assertEqual(
+            "There is no year with year number 1900.", str(context.exception)
+        )
+
+    def test_LeagueBytesReader_mmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "league.bin")
+            with open(filePath, "wb") as file:
+                file.write(self.league.toBytes())
+            with open(filePath, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    reader = LeagueBytesReader(data)
+                    year = reader.getYear(self.league.years[1].yearNumber)
+                    del reader
+
+        self.assertTrue(self.league.years[1].equals(year))
+
+    def test_LeagueBytesReader_invalidData(self):
+        leagueBytes = leagueToBytes(self.league)
+
+        for data in (b"", b"JSON" + leagueBytes[4:]):
+            with self.subTest(data=data[:4]):
+                with self.assertRaises(ValueError) as context:
+                    LeagueBytesReader(data)
+                self.assertEqual(
+                    "Data is not in the binary League format.", str(context.exception)
+                )
+
+        with self.assertRaises(ValueError) as context:
+            LeagueBytesReader(leagueBytes[:4] + b"\x09\x00" + leagueBytes[6:])
+        self.assertEqual(
+            "Binary League format version 9 is not supported.", str(context.exception)
+        )
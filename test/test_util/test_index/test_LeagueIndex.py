@@ -0,0 +1,147 @@
+import copy
+import unittest
+
+from leeger.exception import DoesNotExistException
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.index import LeagueIndex, YearIndex
+from leeger.util.navigator import LeagueNavigator
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestLeagueIndex(unittest.TestCase):
+    def __getLeague(self) -> League:
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        teams2 = getTeamsFromOwners(owners)
+
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams1[1].id,
+            teamBId=teams1[0].id,
+            teamAScore=3,
+            teamBScore=4,
+            multiWeekMatchupId="1",
+        )
+        matchup3 = Matchup(
+            teamAId=teams1[1].id,
+            teamBId=teams1[0].id,
+            teamAScore=5,
+            teamBScore=6,
+            multiWeekMatchupId="1",
+        )
+        matchup4 = Matchup(
+            teamAId=teams2[0].id,
+            teamBId=teams2[1].id,
+            teamAScore=7,
+            teamBScore=8,
+            multiWeekMatchupId="1",
+        )
+
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[
+                Week(weekNumber=1, matchups=[matchup1]),
+                Week(weekNumber=2, matchups=[matchup2]),
+                Week(weekNumber=3, matchups=[matchup3]),
+            ],
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[Week(weekNumber=1, matchups=[matchup4])],
+        )
+        return League(name="TEST", owners=owners, years=[year1, year2])
+
+    def test_init_happyPath(self):
+        league = self.__getLeague()
+
+        leagueIndex = LeagueIndex(league)
+
+        self.assertEqual(league.id, leagueIndex.leagueId)
+        self.assertEqual([owner.id for owner in league.owners], leagueIndex.ownerIds)
+        self.assertEqual(4, len(leagueIndex))
+        self.assertEqual(2, len(leagueIndex.yearIndices))
+        self.assertEqual([2000, 2000, 2000, 2001], leagueIndex.yearNumbers.tolist())
+        self.assertEqual([1, 2, 3, 1], leagueIndex.weekNumbers.tolist())
+        self.assertEqual([0, 1, 1, 0], leagueIndex.teamAOwnerIndices.tolist())
+        self.assertEqual([1, 0, 0, 1], leagueIndex.teamBOwnerIndices.tolist())
+        self.assertEqual([1, 3, 5, 7], leagueIndex.teamAScores.tolist())
+        self.assertEqual([2, 4, 6, 8], leagueIndex.teamBScores.tolist())
+        # multi-week matchup IDs only need to be unique within a Year
+        self.assertEqual([-1, 0, 0, 1], leagueIndex.multiWeekMatchupIndices.tolist())
+
+    def test_init_noYears(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+        leagueIndex = LeagueIndex(League(name="TEST", owners=owners, years=[]))
+
+        self.assertEqual(0, len(leagueIndex))
+        self.assertEqual([], leagueIndex.yearNumbers.tolist())
+        self.assertEqual([], leagueIndex.getAllScores())
+
+    def test_isIndexFor(self):
+        league = self.__getLeague()
+
+        leagueIndex = LeagueIndex(league)
+
+        self.assertTrue(leagueIndex.isIndexFor(league))
+        self.assertFalse(leagueIndex.isIndexFor(self.__getLeague()))
+
+    def test_deepcopy_returnsSameIndex(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+
+        self.assertIs(leagueIndex, copy.deepcopy(leagueIndex))
+
+    def test_getYearIndex(self):
+        league = self.__getLeague()
+        leagueIndex = LeagueIndex(league)
+
+        response = leagueIndex.getYearIndex(2001)
+
+        self.assertIsInstance(response, YearIndex)
+        self.assertTrue(response.isIndexFor(league.years[1]))
+
+    def test_getYearIndex_yearDoesNotExist_raisesException(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            leagueIndex.getYearIndex(1999)
+        self.assertEqual(
+            "Year 1999 does not exist in the given League.", str(context.exception)
+        )
+
+    def test_getOwnerIdForTeamId(self):
+        league = self.__getLeague()
+        leagueIndex = LeagueIndex(league)
+
+        for year in league.years:
+            for team in year.teams:
+                self.assertEqual(team.ownerId, leagueIndex.getOwnerIdForTeamId(team.id))
+
+    def test_getOwnerIdForTeamId_teamDoesNotExist_raisesException(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            leagueIndex.getOwnerIdForTeamId("badId")
+        self.assertEqual(
+            "Team with ID badId does not exist in the given League.",
+            str(context.exception),
+        )
+
+    def test_getAllScores_matchesLeagueNavigator(self):
+        league = self.__getLeague()
+        leagueIndex = LeagueIndex(league)
+
+        self.assertEqual(
+            LeagueNavigator.getAllScoresInLeague(league), leagueIndex.getAllScores()
+        )
+        self.assertEqual(
+            LeagueNavigator.getAllScoresInLeague(
+                league, simplifyMultiWeekMatchups=True
+            ),
+            leagueIndex.getAllScores(simplifyMultiWeekMatchups=True),
+        )
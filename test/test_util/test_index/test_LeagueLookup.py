@@ -0,0 +1,84 @@
+import copy
+import unittest
+
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Year import Year
+from leeger.util.index import LeagueLookup
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestLeagueLookup(unittest.TestCase):
+    def __getLeague(self) -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(3)
+        teamsB = getTeamsFromOwners(owners)
+        return League(
+            name="TEST",
+            owners=owners,
+            years=[
+                Year(yearNumber=2000, teams=teamsA, weeks=list()),
+                Year(yearNumber=2001, teams=teamsB, weeks=list()),
+            ],
+        )
+
+    def test_getTeamAndYear_happyPath(self):
+        league = self.__getLeague()
+
+        for year in league.years:
+            for team in year.teams:
+                foundTeam, foundYear = LeagueLookup.getTeamAndYear(league, team.id)
+                self.assertIs(team, foundTeam)
+                self.assertIs(year, foundYear)
+        self.assertIsNone(LeagueLookup.getTeamAndYear(league, "badId"))
+
+    def test_getOwner_happyPath(self):
+        league = self.__getLeague()
+
+        for owner in league.owners:
+            self.assertIs(owner, LeagueLookup.getOwner(league, owner.id))
+        self.assertIsNone(LeagueLookup.getOwner(league, "badId"))
+
+    def test_getYear_happyPath(self):
+        league = self.__getLeague()
+
+        self.assertIs(league.years[0], LeagueLookup.getYear(league, 2000))
+        self.assertIs(league.years[1], LeagueLookup.getYear(league, 2001))
+        self.assertIsNone(LeagueLookup.getYear(league, 1999))
+
+    def test_lookupIsKeptOnLeague(self):
+        league = self.__getLeague()
+
+        LeagueLookup.getOwner(league, league.owners[0].id)
+        lookup = getattr(league, LeagueLookup.ATTRIBUTE_NAME)
+        LeagueLookup.getTeamAndYear(league, league.years[1].teams[2].id)
+
+        self.assertIs(lookup, getattr(league, LeagueLookup.ATTRIBUTE_NAME))
+
+    def test_leagueChanged_lookupIsRebuilt(self):
+        league = self.__getLeague()
+        LeagueLookup.getOwner(league, league.owners[0].id)
+
+        newOwner = Owner(name="new")
+        league.owners.insert(0, newOwner)
+        removedOwner = league.owners.pop(1)
+        league.years[0].teams[0].id = "changedId"
+
+        self.assertIs(newOwner, LeagueLookup.getOwner(league, newOwner.id))
+        self.assertIsNone(LeagueLookup.getOwner(league, removedOwner.id))
+        self.assertIs(
+            league.years[0].teams[0],
+            LeagueLookup.getTeamAndYear(league, "changedId")[0],
+        )
+
+    def test_deepcopy_lookupFindsCopiedModels(self):
+        league = self.__getLeague()
+        LeagueLookup.getOwner(league, league.owners[0].id)
+
+        leagueCopy = copy.deepcopy(league)
+
+        teamCopy = leagueCopy.years[1].teams[0]
+        self.assertIs(teamCopy, LeagueLookup.getTeamAndYear(leagueCopy, teamCopy.id)[0])
+        self.assertIs(
+            leagueCopy.owners[0],
+            LeagueLookup.getOwner(leagueCopy, leagueCopy.owners[0].id),
+        )
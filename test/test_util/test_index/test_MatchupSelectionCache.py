@@ -0,0 +1,169 @@
+import copy
+import gc
+import unittest
+import weakref
+from unittest import mock
+
+from leeger.model.abstract.Fingerprinted import Fingerprinted
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.index import MatchupSelectionCache
+from leeger.util.navigator import YearNavigator
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestMatchupSelectionCache(unittest.TestCase):
+    def setUp(self):
+        MatchupSelectionCache.clear()
+
+    def tearDown(self):
+        MatchupSelectionCache.setMaxSize(512)
+        MatchupSelectionCache.clear()
+
+    @staticmethod
+    def __getYear() -> Year:
+        _, teams = getNDefaultOwnersAndTeams(2)
+        weeks = [
+            Week(
+                weekNumber=weekNumber,
+                matchups=[
+                    Matchup(
+                        teamAId=teams[0].id,
+                        teamBId=teams[1].id,
+                        teamAScore=weekNumber,
+                        teamBScore=2,
+                    )
+                ],
+            )
+            for weekNumber in range(1, 4)
+        ]
+        return Year(yearNumber=2000, teams=teams, weeks=weeks)
+
+    def test_get_sameYearAndFilters_selectionIsShared(self):
+        year = self.__getYear()
+        filters = YearFilters.getForYear(year)
+
+        selection1 = YearNavigator.getMatchupSelection(year, filters)
+        selection2 = YearNavigator.getMatchupSelection(
+            year, YearFilters.getForYear(year)
+        )
+
+        self.assertIsInstance(selection1, tuple)
+        self.assertIs(selection1, selection2)
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "size": 1, "maxSize": 512},
+            MatchupSelectionCache.getStats(),
+        )
+
+    def test_get_keptSelection_yearIsNotWalked(self):
+        year = self.__getYear()
+        filters = YearFilters.getForYear(year)
+        YearNavigator.getMatchupSelection(year, filters)
+
+        with mock.patch.object(
+            Fingerprinted,
+            "_Fingerprinted__getFingerprint",
+            autospec=True,
+            side_effect=Fingerprinted._Fingerprinted__getFingerprint,
+        ) as getFingerprint:
+            select = mock.Mock()
+            MatchupSelectionCache.get("matchups", year, filters, select)
+
+        # a hit costs a fingerprint lookup and a dict lookup, not a walk of the Year
+        select.assert_not_called()
+        self.assertEqual(0, getFingerprint.call_count)
+
+    def test_get_simplifiedMatchupsAreShared(self):
+        year = self.__getYear()
+        for week in year.weeks[1:]:
+            week.matchups[0].multiWeekMatchupId = "1"
+        filters = YearFilters.getForYear(year)
+
+        selection1 = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+        selection2 = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
+
+        self.assertIsInstance(selection1, list)
+        self.assertIsNot(selection1, selection2)
+        self.assertEqual(2, len(selection1))
+        # the simplified multi-week matchup is only built once
+        self.assertIs(selection1[1], selection2[1])
+
+    def test_get_differentFilters_differentSelection(self):
+        year = self.__getYear()
+
+        selection1 = YearNavigator.getMatchupSelection(
+            year, YearFilters.getForYear(year)
+        )
+        selection2 = YearNavigator.getMatchupSelection(
+            year, YearFilters.getForYear(year, weekNumberEnd=2)
+        )
+
+        self.assertEqual(3, len(selection1))
+        self.assertEqual(2, len(selection2))
+        self.assertEqual(2, MatchupSelectionCache.getStats()["misses"])
+
+    def test_get_yearChanged_selectedAgain(self):
+        year = self.__getYear()
+        filters = YearFilters.getForYear(year)
+        selection1 = YearNavigator.getMatchupSelection(year, filters)
+
+        year.weeks[0].matchups.clear()
+        selection2 = YearNavigator.getMatchupSelection(year, filters)
+
+        self.assertEqual(3, len(selection1))
+        self.assertEqual(2, len(selection2))
+
+    def test_get_copyOfYear_notShared(self):
+        year = self.__getYear()
+        yearCopy = copy.deepcopy(year)
+
+        selection1 = YearNavigator.getMatchupSelection(
+            year, YearFilters.getForYear(year)
+        )
+        selection2 = YearNavigator.getMatchupSelection(
+            yearCopy, YearFilters.getForYear(yearCopy)
+        )
+
+        self.assertIs(year.weeks[0].matchups[0], selection1[0])
+        self.assertIs(yearCopy.weeks[0].matchups[0], selection2[0])
+
+    def test_setMaxSize_leastRecentlyUsedDropped(self):
+        MatchupSelectionCache.setMaxSize(1)
+        year = self.__getYear()
+        filters1 = YearFilters.getForYear(year)
+        filters2 = YearFilters.getForYear(year, weekNumberEnd=2)
+
+        selection1 = YearNavigator.getMatchupSelection(year, filters1)
+        YearNavigator.getMatchupSelection(year, filters2)
+        selection3 = YearNavigator.getMatchupSelection(year, filters1)
+
+        self.assertIsNot(selection1, selection3)
+        self.assertEqual(
+            {"hits": 0, "misses": 3, "size": 1, "maxSize": 1},
+            MatchupSelectionCache.getStats(),
+        )
+
+    def test_setMaxSize_invalidSize_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            MatchupSelectionCache.setMaxSize(0)
+        self.assertEqual(
+            "'maxSize' must be an int that is at least 1.", str(context.exception)
+        )
+
+    def test_get_yearIsGarbageCollected_selectionsDropped(self):
+        year = self.__getYear()
+        YearNavigator.getMatchupSelection(year, YearFilters.getForYear(year))
+        YearNavigator.getMatchupSelection(
+            year, YearFilters.getForYear(year, weekNumberEnd=2)
+        )
+        matchupReference = weakref.ref(year.weeks[0].matchups[0])
+        self.assertEqual(2, MatchupSelectionCache.getStats()["size"])
+
+        del year
+        gc.collect()
+
+        # the kept selections do not keep the Matchups in memory
+        self.assertIsNone(matchupReference())
+        self.assertEqual(0, MatchupSelectionCache.getStats()["size"])
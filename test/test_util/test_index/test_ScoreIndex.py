@@ -0,0 +1,34 @@
+import unittest
+
+from leeger.util.index import ScoreIndex
+
+
+class TestScoreIndex(unittest.TestCase):
+    def test_getNumberOfScoresBeatAndTied_happyPath(self):
+        scoreIndex = ScoreIndex([3, 1.5, 2, 2, 5.25, 2.0])
+
+        response = scoreIndex.getNumberOfScoresBeatAndTied([3, 1.5, 2, 5.25, 2.0])
+
+        self.assertEqual(6, scoreIndex.numberOfScores)
+        self.assertEqual([(4, 0), (0, 0), (1, 2), (5, 0), (1, 2)], response)
+        for scoresBeat, scoresTied in response:
+            self.assertIsInstance(scoresBeat, int)
+            self.assertIsInstance(scoresTied, int)
+
+    def test_getNumberOfScoresBeatAndTied_sameAsScanningEveryScore(self):
+        scores = [100.1, 99.9, 100, 100.0, 0, 87.35, 100.1, 0.1 + 0.2, 0.3, 120]
+        scoreIndex = ScoreIndex(scores)
+
+        expected = list()
+        for score in scores:
+            scoresBeat = len([s for s in scores if score > s])
+            scoresTied = len([s for s in scores if score == s]) - 1
+            expected.append((scoresBeat, scoresTied))
+
+        self.assertEqual(expected, scoreIndex.getNumberOfScoresBeatAndTied(scores))
+
+    def test_getNumberOfScoresBeatAndTied_noScores(self):
+        scoreIndex = ScoreIndex([])
+
+        self.assertEqual(0, scoreIndex.numberOfScores)
+        self.assertEqual(list(), scoreIndex.getNumberOfScoresBeatAndTied(list()))
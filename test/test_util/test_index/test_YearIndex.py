@@ -0,0 +1,246 @@
+import copy
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter import YearFilters
+from leeger.model.league import YearSettings
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.index import YearIndex
+from leeger.util.navigator import YearNavigator
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearIndex(unittest.TestCase):
+    def __getYear(self, leagueMedianGames: bool = False) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(4)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=3, teamBScore=4
+        )
+        matchup3 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=5,
+            teamBScore=6,
+            matchupType=MatchupType.PLAYOFF,
+            multiWeekMatchupId="1",
+        )
+        matchup4 = Matchup(
+            teamAId=teams[2].id,
+            teamBId=teams[3].id,
+            teamAScore=7,
+            teamBScore=7,
+            teamAHasTiebreaker=True,
+            matchupType=MatchupType.PLAYOFF,
+        )
+        matchup5 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=9,
+            teamBScore=10,
+            matchupType=MatchupType.PLAYOFF,
+            multiWeekMatchupId="1",
+        )
+        matchup6 = Matchup(
+            teamAId=teams[2].id,
+            teamBId=teams[3].id,
+            teamAScore=11,
+            teamBScore=12,
+            matchupType=MatchupType.IGNORE,
+        )
+
+        week1 = Week(weekNumber=1, matchups=[matchup1, matchup2])
+        week2 = Week(weekNumber=2, matchups=[matchup3, matchup4])
+        week3 = Week(weekNumber=3, matchups=[matchup5, matchup6])
+
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[week1, week2, week3],
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+
+    def test_init_happyPath(self):
+        year = self.__getYear()
+
+        yearIndex = YearIndex(year)
+
+        self.assertEqual(year.id, yearIndex.yearId)
+        self.assertEqual(2000, yearIndex.yearNumber)
+        self.assertEqual(3, yearIndex.numberOfWeeks)
+        self.assertEqual(6, len(yearIndex))
+        self.assertEqual([team.id for team in year.teams], yearIndex.teamIds)
+        self.assertEqual([0, 0, 1, 1, 2, 2], yearIndex.weekIndices.tolist())
+        self.assertEqual([1, 1, 2, 2, 3, 3], yearIndex.weekNumbers.tolist())
+        self.assertEqual([0, 2, 0, 2, 0, 2], yearIndex.teamAIndices.tolist())
+        self.assertEqual([1, 3, 1, 3, 1, 3], yearIndex.teamBIndices.tolist())
+        self.assertEqual([1, 3, 5, 7, 9, 11], yearIndex.teamAScores.tolist())
+        self.assertEqual([2, 4, 6, 7, 10, 12], yearIndex.teamBScores.tolist())
+        self.assertEqual(
+            [False, False, False, True, False, False],
+            yearIndex.teamAHasTiebreaker.tolist(),
+        )
+        self.assertEqual(
+            [-1, -1, 0, -1, 0, -1], yearIndex.multiWeekMatchupIndices.tolist()
+        )
+        self.assertEqual(["1"], yearIndex.multiWeekMatchupIds)
+        self.assertEqual(
+            [YearIndex.MATCHUP_TYPES[code] for code in yearIndex.matchupTypes.tolist()],
+            [
+                MatchupType.REGULAR_SEASON,
+                MatchupType.REGULAR_SEASON,
+                MatchupType.PLAYOFF,
+                MatchupType.PLAYOFF,
+                MatchupType.PLAYOFF,
+                MatchupType.IGNORE,
+            ],
+        )
+
+    def test_isIndexFor(self):
+        year = self.__getYear()
+        otherYear = self.__getYear()
+
+        yearIndex = YearIndex(year)
+
+        self.assertTrue(yearIndex.isIndexFor(year))
+        self.assertFalse(yearIndex.isIndexFor(otherYear))
+
+    def test_deepcopy_returnsSameIndex(self):
+        yearIndex = YearIndex(self.__getYear())
+
+        self.assertIs(yearIndex, copy.deepcopy(yearIndex))
+        self.assertIs(yearIndex, copy.deepcopy({"yearIndex": yearIndex})["yearIndex"])
+
+    def test_getFilteredMatchups(self):
+        year = self.__getYear()
+        yearIndex = YearIndex(year)
+
+        response = yearIndex.getFilteredMatchups(
+            YearFilters(weekNumberStart=1, weekNumberEnd=3)
+        )
+        self.assertEqual(
+            [
+                year.weeks[0].matchups[0],
+                year.weeks[0].matchups[1],
+                year.weeks[1].matchups[0],
+                year.weeks[1].matchups[1],
+                year.weeks[2].matchups[0],
+            ],
+            response,
+        )
+
+        response = yearIndex.getFilteredMatchups(
+            YearFilters(weekNumberStart=2, weekNumberEnd=3, onlyPostSeason=True),
+            applyMultiWeekMatchupFilter=True,
+        )
+        self.assertEqual(
+            [
+                year.weeks[1].matchups[0],
+                year.weeks[1].matchups[1],
+                year.weeks[2].matchups[0],
+            ],
+            response,
+        )
+
+        response = yearIndex.getFilteredMatchups(
+            YearFilters(
+                weekNumberStart=2,
+                weekNumberEnd=3,
+                onlyPostSeason=True,
+                includeMultiWeekMatchups=False,
+            ),
+            applyMultiWeekMatchupFilter=True,
+        )
+        self.assertEqual([year.weeks[1].matchups[1]], response)
+
+    def test_getNumberOfGamesPlayed_matchesYearNavigator(self):
+        for leagueMedianGames in (False, True):
+            year = self.__getYear(leagueMedianGames=leagueMedianGames)
+            yearIndex = YearIndex(year)
+            for weekNumberStart, weekNumberEnd in ((1, 3), (1, 1), (2, 3), (3, 3)):
+                for onlyFilter in (
+                    dict(),
+                    {"onlyRegularSeason": True},
+                    {"onlyPostSeason": True},
+                    {"onlyChampionship": True},
+                ):
+                    yearFilters = YearFilters(
+                        weekNumberStart=weekNumberStart,
+                        weekNumberEnd=weekNumberEnd,
+                        **onlyFilter,
+                    )
+                    for countMultiWeekMatchupsAsOneGame in (False, True):
+                        for countLeagueMedianGamesAsTwoGames in (False, True):
+                            self.assertEqual(
+                                YearNavigator.getNumberOfGamesPlayed(
+                                    year,
+                                    yearFilters,
+                                    countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                                    countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+                                ),
+                                yearIndex.getNumberOfGamesPlayed(
+                                    yearFilters,
+                                    countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+                                    countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+                                ),
+                            )
+
+    def test_getAllScores_matchesYearNavigator(self):
+        year = self.__getYear()
+        yearIndex = YearIndex(year)
+
+        self.assertEqual(
+            YearNavigator.getAllScoresInYear(year), yearIndex.getAllScores()
+        )
+        self.assertEqual(
+            YearNavigator.getAllScoresInYear(year, simplifyMultiWeekMatchups=True),
+            yearIndex.getAllScores(simplifyMultiWeekMatchups=True),
+        )
+        self.assertEqual(
+            [1, 3, 7, 14, 2, 4, 7, 16],
+            yearIndex.getAllScores(simplifyMultiWeekMatchups=True),
+        )
+
+    def test_getMultiWeekMatchups_matchesYearNavigator(self):
+        year = self.__getYear()
+        yearIndex = YearIndex(year)
+        yearFilters = YearFilters.getForYear(year)
+
+        self.assertEqual(
+            YearNavigator.getAllMultiWeekMatchups(year, yearFilters),
+            yearIndex.getMultiWeekMatchups(yearFilters),
+        )
+
+    def test_getWeeklyScoreRanks(self):
+        year = self.__getYear()
+        yearIndex = YearIndex(year)
+
+        teamIndices, teamsOutscored, teamsTied, teamsInWeek = (
+            yearIndex.getWeeklyScoreRanks(YearFilters.getForYear(year))
+        )
+
+        # the ignored matchup in week 3 is not ranked
+        self.assertEqual([0, 1, 2, 3, 0, 1, 2, 3, 0, 1], teamIndices.tolist())
+        self.assertEqual([0, 1, 2, 3, 0, 1, 2, 2, 0, 1], teamsOutscored.tolist())
+        self.assertEqual([0, 0, 0, 0, 0, 0, 1, 1, 0, 0], teamsTied.tolist())
+        self.assertEqual([4, 4, 4, 4, 4, 4, 4, 4, 2, 2], teamsInWeek.tolist())
+
+    def test_getWeeklyScoreRanks_opponentScores(self):
+        year = self.__getYear()
+        yearIndex = YearIndex(year)
+
+        teamIndices, teamsOutscored, teamsTied, teamsInWeek = (
+            yearIndex.getWeeklyScoreRanks(
+                YearFilters.getForYear(year, weekNumberEnd=2), opponentScores=True
+            )
+        )
+
+        self.assertEqual([1, 0, 3, 2, 1, 0, 2, 3], teamIndices.tolist())
+        self.assertEqual([0, 1, 2, 3, 0, 1, 2, 2], teamsOutscored.tolist())
+        self.assertEqual([0, 0, 0, 0, 0, 0, 1, 1], teamsTied.tolist())
+        self.assertEqual([4, 4, 4, 4, 4, 4, 4, 4], teamsInWeek.tolist())
@@ -0,0 +1,43 @@
+import unittest
+
+from leeger.model.league.Division import Division
+from leeger.model.league.Team import Team
+from leeger.model.league.Year import Year
+from leeger.util.index import YearLookup
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearLookup(unittest.TestCase):
+    def test_getTeam_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = Year(yearNumber=2000, teams=teams, weeks=list())
+
+        for team in teams:
+            self.assertIs(team, YearLookup.getTeam(year, team.id))
+        self.assertIsNone(YearLookup.getTeam(year, "badId"))
+
+    def test_getDivision_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        divisions = [Division(name="d1"), Division(name="d2")]
+        year = Year(yearNumber=2000, teams=teams, weeks=list(), divisions=divisions)
+
+        for division in divisions:
+            self.assertIs(division, YearLookup.getDivision(year, division.id))
+        self.assertIsNone(YearLookup.getDivision(year, "badId"))
+
+    def test_yearChanged_lookupIsRebuilt(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        year = Year(yearNumber=2000, teams=teams, weeks=list())
+        firstTeam = teams[0]
+        YearLookup.getTeam(year, firstTeam.id)
+
+        newTeam = Team(ownerId=owners[0].id, name="new")
+        year.teams.insert(0, newTeam)
+        removedTeam = year.teams.pop()
+        newDivision = Division(name="d1")
+        year.divisions.append(newDivision)
+
+        self.assertIs(newTeam, YearLookup.getTeam(year, newTeam.id))
+        self.assertIs(firstTeam, YearLookup.getTeam(year, firstTeam.id))
+        self.assertIsNone(YearLookup.getTeam(year, removedTeam.id))
+        self.assertIs(newDivision, YearLookup.getDivision(year, newDivision.id))
@@ -0,0 +1,120 @@
+import io
+import json
+import unittest
+
+from leeger.util.json_stream import (
+    readLeagueJson,
+    readLeaguesJson,
+    writeLeagueJson,
+    writeLeaguesJson,
+)
+from leeger.util.synthetic import generateLeague
+
+
+class TestJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.league1 = generateLeague(
+            numberOfYears=6,
+            numberOfTeams=6,
+            numberOfRegularSeasonWeeks=4,
+            numberOfPlayoffTeams=4,
+            numberOfDivisions=2,
+            multiWeekPlayoffs=True,
+            seed=0,
+        )
+        self.league2 = generateLeague(
+            numberOfYears=2,
+            numberOfTeams=4,
+            numberOfRegularSeasonWeeks=3,
+            numberOfPlayoffTeams=2,
+            seed=1,
+        )
+
+    def test_writeLeagueJson(self):
+        file = io.StringIO()
+        writeLeagueJson(self.league1, file)
+
+        self.assertEqual(json.dumps(self.league1.toJson()), file.getvalue())
+
+    def test_writeLeaguesJson(self):
+        file = io.StringIO()
+        writeLeaguesJson(iter([self.league1, self.league2]), file)
+
+        self.assertEqual(
+            json.dumps([self.league1.toJson(), self.league2.toJson()]),
+            file.getvalue(),
+        )
+
+    def test_readLeagueJson(self):
+        leagueJson = json.dumps(self.league1.toJson(), indent=4)
+        # small chunks make every value span many reads
+        for chunkSize in (1, 7, 4096):
+            for file in (io.StringIO(leagueJson), io.BytesIO(leagueJson.encode())):
+                with self.subTest(chunkSize=chunkSize, file=type(file).__name__):
+                    streamedLeague = readLeagueJson(file, chunkSize=chunkSize)
+
+                    self.assertEqual(self.league1.id, streamedLeague.id)
+                    self.assertEqual(self.league1.name, streamedLeague.name)
+                    self.assertEqual(
+                        [owner.id for owner in self.league1.owners],
+                        [owner.id for owner in streamedLeague.owners],
+                    )
+                    # the first Year is read without reading the rest of the file
+                    self.assertTrue(
+                        self.league1.years[0].equals(next(streamedLeague.years))
+                    )
+                    self.assertLess(file.tell(), len(leagueJson) / 2)
+                    self.assertTrue(
+                        self.league1.equals(
+                            readLeagueJson(
+                                type(file)(file.getvalue()), chunkSize=chunkSize
+                            ).toLeague()
+                        )
+                    )
+
+    def test_readLeagueJson_yearsBeforeOtherFields(self):
+        leagueDict = self.league1.toJson()
+        leagueJson = json.dumps(
+            {"years": leagueDict["years"]}
+            | {key: value for key, value in leagueDict.items() if key != "years"}
+        )
+
+        league = readLeagueJson(io.StringIO(leagueJson), chunkSize=16).toLeague()
+
+        self.assertTrue(self.league1.equals(league))
+
+    def test_readLeagueJson_invalidJson(self):
+        leagueJson = json.dumps(self.league1.toJson())
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(readLeagueJson(io.StringIO(leagueJson[:-100])).years)
+
+        with self.assertRaises(ValueError) as context:
+            list(readLeagueJson(io.StringIO(leagueJson[:-2])).years)
+        self.assertEqual("Unexpected end of JSON.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            readLeagueJson(io.StringIO("[]"))
+        self.assertEqual("Expected '{' but found '['.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            readLeagueJson(io.StringIO(leagueJson), chunkSize=0)
+        self.assertEqual(
+            "'chunkSize' must be an int that is at least 1.", str(context.exception)
+        )
+
+    def test_readLeaguesJson(self):
+        file = io.StringIO()
+        writeLeaguesJson([self.league1, self.league2], file)
+        file.seek(0)
+
+        streamedLeagues = readLeaguesJson(file, chunkSize=64)
+        # Years that are not read are skipped
+        streamedLeague1 = next(streamedLeagues)
+        self.assertEqual(self.league1.id, streamedLeague1.id)
+        streamedLeague2 = next(streamedLeagues)
+        self.assertTrue(self.league2.equals(streamedLeague2.toLeague()))
+        with self.assertRaises(StopIteration):
+            next(streamedLeagues)
+
+        self.assertEqual(list(), list(readLeaguesJson(io.StringIO(" [ ] "))))
@@ -280,6 +280,72 @@ class TestLeagueNavigator(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_getTeamById_leagueChangedAfterLookup(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=list())
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=list())
+
+        league = League(name="TEST", owners=owners, years=[yearA, yearB])
+
+        self.assertIs(teamsB[1], LeagueNavigator.getTeamById(league, teamsB[1].id))
+
+        # Teams and Years move after they have been looked up
+        newTeam = Team(ownerId=owners[0].id, name="new")
+        yearB.teams.insert(0, newTeam)
+        league.years.reverse()
+
+        self.assertIs(teamsB[1], LeagueNavigator.getTeamById(league, teamsB[1].id))
+        self.assertIs(newTeam, LeagueNavigator.getTeamById(league, newTeam.id))
+        self.assertIs(yearA, LeagueNavigator.getYearByYearNumber(league, 2000))
+
+        # Teams are removed after they have been looked up
+        removedTeam = yearA.teams.pop(0)
+
+        with self.assertRaises(DoesNotExistException):
+            LeagueNavigator.getTeamById(league, removedTeam.id)
+
+    def test_getYearByTeamId_happyPath(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=list())
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=list())
+
+        league = League(name="TEST", owners=owners, years=[yearA, yearB])
+
+        self.assertIs(yearA, LeagueNavigator.getYearByTeamId(league, teamsA[1].id))
+        self.assertIs(yearB, LeagueNavigator.getYearByTeamId(league, teamsB[0].id))
+
+    def test_getYearByTeamId_teamIdNotFound_raisesException(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        year = Year(yearNumber=2000, teams=teams, weeks=list())
+        league = League(name="TEST", owners=owners, years=[year])
+
+        with self.assertRaises(DoesNotExistException) as context:
+            LeagueNavigator.getYearByTeamId(league, "imABadID")
+        self.assertEqual(
+            "Team with ID imABadID does not exist in the given League.",
+            str(context.exception),
+        )
+
+    def test_getOwnerIdByTeamId_happyPath(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=list())
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=list())
+
+        league = League(name="TEST", owners=owners, years=[yearA, yearB])
+
+        self.assertEqual(
+            owners[0].id, LeagueNavigator.getOwnerIdByTeamId(league, teamsA[0].id)
+        )
+        self.assertEqual(
+            owners[1].id, LeagueNavigator.getOwnerIdByTeamId(league, teamsB[1].id)
+        )
+
     def test_getNumberOfGamesPlayed_happyPath(self):
         owners, teamsA = getNDefaultOwnersAndTeams(2)
         teamsB = getTeamsFromOwners(owners)
@@ -10,6 +10,7 @@ from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
+from leeger.util.index import YearIndex
 from leeger.util.navigator.YearNavigator import YearNavigator
 from test.helper.prototypes import getNDefaultOwnersAndTeams
 
@@ -125,6 +126,36 @@ class TestYearNavigator(unittest.TestCase):
         self.assertEqual(2, response[teams[0].id])
         self.assertEqual(2, response[teams[1].id])
 
+    def test_getNumberOfGamesPlayed_yearIndexGiven(self):
+        _, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+        week2 = Week(weekNumber=2, matchups=[matchup2])
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+        otherYear = Year(yearNumber=2000, teams=teams, weeks=[week1])
+
+        yearFilters = YearFilters(weekNumberStart=1, weekNumberEnd=2)
+        response = YearNavigator.getNumberOfGamesPlayed(
+            year, yearFilters, yearIndex=YearIndex(year)
+        )
+
+        self.assertEqual({teams[0].id: 2, teams[1].id: 2}, response)
+
+        # an index built from a different Year is ignored
+        response = YearNavigator.getNumberOfGamesPlayed(
+            year, yearFilters, yearIndex=YearIndex(otherYear)
+        )
+
+        self.assertEqual({teams[0].id: 2, teams[1].id: 2}, response)
+
     def test_getNumberOfGamesPlayed_countLeagueMedianGamesAsTwoGames_countsLeagueMedianGamesAsTwoGames(
         self,
     ):
@@ -1,5 +1,6 @@
 import unittest
 
+from leeger.enum.MatchupType import MatchupType
 from leeger.model.league import YearSettings
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -7,7 +8,7 @@ from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
 from leeger.model.stat.YearStatSheet import YearStatSheet
-from test.helper.prototypes import getNDefaultOwnersAndTeams
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
 
 
 class TestStatSheet(unittest.TestCase):
@@ -236,3 +237,105 @@ class TestStatSheet(unittest.TestCase):
         self.assertIsInstance(yearStatSheet.leagueMedianWins, dict)
         self.assertIsInstance(yearStatSheet.totalGames, dict)
         self.assertIsInstance(yearStatSheet.opponentLeagueMedianWins, dict)
+
+    def test_leagueStatSheet_sameResultWithAndWithoutLeagueIndex(self):
+        from leeger.util.stat_sheet import leagueStatSheet
+
+        owners, teams1 = getNDefaultOwnersAndTeams(4)
+        teams2 = getTeamsFromOwners(owners)
+
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams1[0].id,
+                            teamBId=teams1[1].id,
+                            teamAScore=1.5,
+                            teamBScore=2,
+                        ),
+                        Matchup(
+                            teamAId=teams1[2].id,
+                            teamBId=teams1[3].id,
+                            teamAScore=3,
+                            teamBScore=3,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams1[0].id,
+                            teamBId=teams1[2].id,
+                            teamAScore=4,
+                            teamBScore=5.25,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams1[0].id,
+                            teamBId=teams1[2].id,
+                            teamAScore=6,
+                            teamBScore=2,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+            ],
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2[0].id,
+                            teamBId=teams2[3].id,
+                            teamAScore=10,
+                            teamBScore=9,
+                        ),
+                        Matchup(
+                            teamAId=teams2[1].id,
+                            teamBId=teams2[2].id,
+                            teamAScore=8,
+                            teamBScore=11,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2[0].id,
+                            teamBId=teams2[2].id,
+                            teamAScore=7,
+                            teamBScore=12,
+                            matchupType=MatchupType.CHAMPIONSHIP,
+                        )
+                    ],
+                ),
+            ],
+            yearSettings=YearSettings(leagueMedianGames=True),
+        )
+        league = League(name="TEST", owners=owners, years=[year1, year2])
+
+        self.assertEqual(
+            leagueStatSheet(league, leagueIndex=None),
+            leagueStatSheet(league),
+        )
+        self.assertEqual(
+            leagueStatSheet(league, leagueIndex=None, yearNumberStart=2001),
+            leagueStatSheet(league, yearNumberStart=2001),
+        )
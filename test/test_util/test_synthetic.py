@@ -0,0 +1,108 @@
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.util.navigator import LeagueNavigator
+from leeger.util.synthetic import generateLeague
+from leeger.validate import leagueValidation
+
+
+class TestSynthetic(unittest.TestCase):
+    def test_generateLeague_defaults(self):
+        league = generateLeague()
+
+        leagueValidation.runAllChecks(league)
+        self.assertEqual(3, len(league.years))
+        self.assertEqual(10, len(league.owners))
+        for year in league.years:
+            self.assertEqual(10, len(year.teams))
+            # 13 regular season weeks + 2 playoff rounds
+            self.assertEqual(15, len(year.weeks))
+            self.assertEqual(
+                MatchupType.CHAMPIONSHIP, year.weeks[-1].matchups[0].matchupType
+            )
+            self.assertFalse(year.yearSettings.leagueMedianGames)
+            self.assertEqual(list(), year.divisions)
+
+    def test_generateLeague_everyOption(self):
+        league = generateLeague(
+            numberOfYears=4,
+            numberOfTeams=12,
+            numberOfRegularSeasonWeeks=10,
+            numberOfPlayoffTeams=8,
+            numberOfDivisions=3,
+            numberOfLeagueMedianYears=2,
+            multiWeekPlayoffs=True,
+            firstYearNumber=2010,
+            seed=1,
+        )
+
+        leagueValidation.runAllChecks(league)
+        self.assertEqual([2010, 2011, 2012, 2013], [y.yearNumber for y in league.years])
+        self.assertEqual(
+            [False, False, True, True],
+            [y.yearSettings.leagueMedianGames for y in league.years],
+        )
+        for year in league.years:
+            self.assertEqual(3, len(year.divisions))
+            # 10 regular season weeks + 3 playoff rounds of 2 weeks each
+            self.assertEqual(16, len(year.weeks))
+            self.assertEqual(4, len(year.weeks[10].matchups))
+            playoffMatchups = [
+                matchup for week in year.weeks[10:] for matchup in week.matchups
+            ]
+            self.assertTrue(
+                all(
+                    matchup.multiWeekMatchupId is not None
+                    for matchup in playoffMatchups
+                )
+            )
+
+    def test_generateLeague_sameSeed_sameLeague(self):
+        league1 = generateLeague(seed=5)
+        league2 = generateLeague(seed=5)
+        league3 = generateLeague(seed=6)
+
+        self.assertEqual(
+            LeagueNavigator.getAllScoresInLeague(league1),
+            LeagueNavigator.getAllScoresInLeague(league2),
+        )
+        self.assertNotEqual(
+            LeagueNavigator.getAllScoresInLeague(league1),
+            LeagueNavigator.getAllScoresInLeague(league3),
+        )
+
+    def test_generateLeague_noPlayoffs(self):
+        league = generateLeague(numberOfTeams=2, numberOfPlayoffTeams=0)
+
+        leagueValidation.runAllChecks(league)
+        for year in league.years:
+            self.assertEqual(13, len(year.weeks))
+            self.assertTrue(all(week.isRegularSeasonWeek for week in year.weeks))
+
+    def test_generateLeague_invalidOptions_raisesException(self):
+        for kwargs, message in (
+            ({"numberOfYears": 0}, "'numberOfYears' must be at least 1."),
+            (
+                {"numberOfTeams": 3},
+                "'numberOfTeams' must be an even number that is at least 2.",
+            ),
+            (
+                {"numberOfRegularSeasonWeeks": 0},
+                "'numberOfRegularSeasonWeeks' must be at least 1.",
+            ),
+            (
+                {"numberOfPlayoffTeams": 6},
+                "'numberOfPlayoffTeams' must be 0 or a power of 2 that is at least 2 and at most 'numberOfTeams'.",
+            ),
+            (
+                {"numberOfDivisions": 11},
+                "'numberOfDivisions' must be between 0 and 'numberOfTeams' (inclusive).",
+            ),
+            (
+                {"numberOfLeagueMedianYears": 4},
+                "'numberOfLeagueMedianYears' must be between 0 and 'numberOfYears' (inclusive).",
+            ),
+        ):
+            with self.assertRaises(ValueError) as context:
+                generateLeague(**kwargs)
+            self.assertEqual(message, str(context.exception))